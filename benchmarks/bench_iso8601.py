@@ -0,0 +1,82 @@
+"""
+Micro-benchmark for the ISO 8601 cursor helpers in libs/utils.py.
+
+Compares the per-record `datetime.strptime(...).timestamp()` conversion that the
+incremental readers used to do with tracking the latest timestamp as a string
+and converting it once per batch.
+
+Usage:
+    python benchmarks/bench_iso8601.py [--records N] [--repeat R]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from libs.utils import iso8601_to_epoch, latest_iso8601  # noqa: E402
+
+
+def make_timestamps(count: int) -> list:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        (start + timedelta(seconds=i * 7)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        for i in range(count)
+    ]
+
+
+def strptime_per_record(values: list) -> int:
+    last_time = 0
+    for value in values:
+        record_time = int(datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").timestamp())
+        if record_time > last_time:
+            last_time = record_time
+    return last_time
+
+
+def fast_per_record(values: list) -> int:
+    last_time = 0
+    for value in values:
+        record_time = int(iso8601_to_epoch(value))
+        if record_time > last_time:
+            last_time = record_time
+    return last_time
+
+
+def latest_string(values: list) -> int:
+    latest = None
+    for value in values:
+        latest = latest_iso8601(latest, value)
+    return int(iso8601_to_epoch(latest))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    values = make_timestamps(args.records)
+    expected = int(iso8601_to_epoch(values[-1]))
+
+    cases = [
+        ("strptime per record", strptime_per_record),
+        ("iso8601_to_epoch per record", fast_per_record),
+        ("latest_iso8601 + one parse", latest_string),
+    ]
+    baseline = None
+    for name, func in cases:
+        assert func(values) == expected, name
+        best = min(timeit.repeat(lambda: func(values), number=1, repeat=args.repeat))
+        baseline = baseline or best
+        print(
+            f"{name:<30} {best * 1000:9.1f} ms  "
+            f"{args.records / best:12,.0f} rec/s  {baseline / best:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
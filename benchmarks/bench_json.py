@@ -0,0 +1,115 @@
+"""
+Micro-benchmark for the JSON decoding helpers in libs/utils.py.
+
+Records the response bodies that each connector fixture in
+tests/mock_api_fixtures.py serves for its first batch, then decodes them with
+`response.json()` (which builds a `str` first), the standard library from
+bytes, and every fast backend that is installed. Mixpanel export bodies are
+JSONL and are decoded line by line, like the connector does.
+
+Usage:
+    python benchmarks/bench_json.py [--records N] [--repeat R] [--cases a,b]
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+import time
+import timeit
+from unittest import mock
+
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from libs.utils import JSON_BACKENDS, select_json_backend  # noqa: E402
+from tests.mock_api_fixtures import FIXTURES  # noqa: E402
+from tests.mock_api_server import MockAPIServer  # noqa: E402
+
+JSONL_CASES = {"mixpanel.events"}
+
+
+def record_payloads(case: str, records: int) -> list:
+    """Bodies of the GET requests made while reading the first batch of `case`."""
+    fixture = FIXTURES[case]
+    module = importlib.import_module(f"sources.{fixture.connector}.{fixture.connector}")
+    with MockAPIServer() as server, mock.patch.object(
+        time, "sleep"
+    ), contextlib.redirect_stdout(io.StringIO()):
+        fixture.install(server, records)
+        connector = module.LakeflowConnect(fixture.options(server.base_url))
+        batch, _ = connector.read_table(fixture.table, {}, fixture.table_options)
+        for _ in batch:
+            pass
+        return [
+            requests.get(f"{server.base_url}{path}").content
+            for method, path in list(server.requests)
+            if method == "GET"
+        ]
+
+
+def make_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response._content = body
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def decoders() -> list:
+    cases = [
+        ("response.json()", lambda body: make_response(body).json()),
+        ("json.loads(bytes)", json.loads),
+    ]
+    for name in JSON_BACKENDS[:-1]:
+        backend, loads = select_json_backend(name)
+        if backend == name:
+            cases.append((name, loads))
+    return cases
+
+
+def decode_all(loads, payloads: list, jsonl: bool) -> None:
+    for body in payloads:
+        if jsonl:
+            for line in body.strip().split(b"\n"):
+                loads(line)
+        else:
+            loads(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cases", default=",".join(sorted(FIXTURES)))
+    args = parser.parse_args()
+
+    for case in args.cases.split(","):
+        payloads = record_payloads(case, args.records)
+        size = sum(len(body) for body in payloads)
+        print(f"{case}: {len(payloads)} responses, {size / 1e6:.1f} MB")
+        baseline = None
+        for name, loads in decoders():
+            jsonl = case in JSONL_CASES
+            if name == "response.json()" and jsonl:
+                # Export bodies are JSONL; the connector never called .json().
+                continue
+            best = min(
+                timeit.repeat(
+                    lambda: decode_all(loads, payloads, jsonl),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            baseline = baseline or best
+            print(
+                f"  {name:<20} {best * 1000:9.1f} ms  "
+                f"{size / best / 1e6:8.1f} MB/s  {baseline / best:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
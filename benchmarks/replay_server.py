@@ -0,0 +1,50 @@
+"""
+Local HTTP replay server for the offline connector benchmarks.
+
+Serves the mock endpoints of every fixture in tests/mock_api_fixtures.py
+(GitHub issues, Stripe customers, HubSpot contacts, Zendesk tickets, Mixpanel
+events and CatAPI votes) from one server, with each API's own pagination and
+incremental filters, so that `read_table` can be driven end to end without
+credentials. Encoded pages are cached, so repeated runs measure the connector
+rather than the server.
+
+Usage:
+    python benchmarks/replay_server.py [--port P] [--records N] [--latency S]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tests.mock_api_fixtures import FIXTURES  # noqa: E402
+from tests.mock_api_server import MockAPIServer  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="0 picks a free port")
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds added to every response (default: 0)")
+    args = parser.parse_args()
+
+    server = MockAPIServer(
+        latency=args.latency, cache_responses=True, host=args.host, port=args.port
+    )
+    for fixture in FIXTURES.values():
+        fixture.install(server, args.records)
+    # The benchmark runner reads the address from the first line of output.
+    print(server.base_url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
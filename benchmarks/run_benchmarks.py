@@ -0,0 +1,304 @@
+"""
+Offline throughput benchmarks for the connectors.
+
+Starts the local replay server (benchmarks/replay_server.py) and drives each
+connector's `read_table` against it the way the streaming reader does:
+starting from an empty offset and reading batch after batch until the offset
+stops moving. Every case runs in two modes:
+
+    read   records are only pulled out of `read_table`
+    parse  records are also converted with `parse_value` against the table
+           schema, i.e. the full path taken by the Spark reader
+
+Each run happens in a fresh process so that peak RSS and CPU time belong to
+that run alone; one unmeasured warm-up run per case comes first. Results are
+written as JSON and can be compared against the output of an earlier commit
+with `--compare`.
+
+Client-side pacing sleeps (e.g. Stripe's 0.1s between pages) are skipped by
+default and reported as `skipped_sleep_seconds`; pass `--keep-sleeps` to keep
+them.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--records N] [--repeat R]
+        [--cases github.issues,stripe.customers] [--modes read,parse]
+        [--output results.json] [--compare baseline.json]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, REPO_ROOT)
+
+from libs.metrics import timed_rows  # noqa: E402
+from libs.utils import parse_value  # noqa: E402
+from tests.mock_api_fixtures import FIXTURES  # noqa: E402
+
+# One case per fixture served by the replay server, e.g. "github.issues".
+CASES = FIXTURES
+
+MODES = ("read", "parse")
+
+# Metrics compared by --compare, and whether higher is better.
+COMPARED_METRICS = (
+    ("records_per_sec", True),
+    ("bytes_per_sec", True),
+    ("cpu_seconds", False),
+    ("peak_rss_mb", False),
+)
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return rss / divisor
+
+
+def run_case(case: str, mode: str, base_url: str, max_batches: int, keep_sleeps: bool):
+    """Run one case in this process and return its measurements."""
+    fixture = CASES[case]
+    table, table_options = fixture.table, fixture.table_options
+    module = importlib.import_module(f"sources.{fixture.connector}.{fixture.connector}")
+    connector = module.LakeflowConnect(fixture.options(base_url))
+    options = {**table_options, "tableName": table}
+
+    skipped_sleep = [0.0]
+    if not keep_sleeps:
+        def skip_sleep(seconds):
+            skipped_sleep[0] += seconds
+
+        time.sleep = skip_sleep
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        # Schema discovery may itself call the API; keep it out of the timings.
+        schema = connector.get_table_schema(table, table_options)
+        connector.metrics.collect()
+        if mode == "parse":
+            convert = lambda record: parse_value(record, schema)  # noqa: E731
+        else:
+            convert = lambda record: record  # noqa: E731
+
+        baseline_rss_mb = _max_rss_mb()
+        started_cpu = time.process_time()
+        started = time.perf_counter()
+
+        batches = 0
+        offset = {}
+        while batches < max_batches:
+            batch_started = time.perf_counter()
+            records, next_offset = connector.read_table(table, offset, options)
+            batch_records = 0
+            for _ in timed_rows(
+                records,
+                convert,
+                connector.metrics,
+                time.perf_counter() - batch_started,
+            ):
+                batch_records += 1
+            batches += 1
+            if not batch_records or next_offset == offset:
+                break
+            offset = next_offset
+
+        wall_seconds = time.perf_counter() - started
+        cpu_seconds = time.process_time() - started_cpu
+
+    metrics = connector.metrics.collect()
+    return {
+        "case": case,
+        "mode": mode,
+        "batches": batches,
+        "records": metrics["records"],
+        "requests": metrics["requests"],
+        "bytes_downloaded": metrics["bytes_downloaded"],
+        "wall_seconds": round(wall_seconds, 4),
+        "cpu_seconds": round(cpu_seconds, 4),
+        "read_seconds": metrics["read_seconds"],
+        "parse_seconds": metrics["parse_seconds"],
+        "records_per_sec": round(metrics["records"] / wall_seconds, 1),
+        "bytes_per_sec": round(metrics["bytes_downloaded"] / wall_seconds, 1),
+        "peak_rss_mb": round(_max_rss_mb(), 1),
+        "rss_growth_mb": round(_max_rss_mb() - baseline_rss_mb, 1),
+        "skipped_sleep_seconds": round(skipped_sleep[0], 2),
+    }
+
+
+def _run_worker(args, case: str, mode: str, base_url: str) -> dict:
+    command = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "--worker",
+        case,
+        mode,
+        base_url,
+        "--max-batches",
+        str(args.max_batches),
+    ]
+    if args.keep_sleeps:
+        command.append("--keep-sleeps")
+    completed = subprocess.run(command, capture_output=True, text=True, cwd=REPO_ROOT)
+    if completed.returncode != 0:
+        raise RuntimeError(f"{case} ({mode}) failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _median_result(runs: list) -> dict:
+    """Combine repeated runs: medians for timings, maxima for memory."""
+    result = dict(runs[0])
+    for key in ("wall_seconds", "cpu_seconds", "read_seconds", "parse_seconds",
+                "records_per_sec", "bytes_per_sec"):
+        result[key] = round(statistics.median(run[key] for run in runs), 4)
+    for key in ("peak_rss_mb", "rss_growth_mb"):
+        result[key] = max(run[key] for run in runs)
+    result["repeat"] = len(runs)
+    return result
+
+
+def _start_server(records: int):
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "replay_server.py"),
+            "--records",
+            str(records),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    base_url = server.stdout.readline().strip()
+    if not base_url:
+        server.kill()
+        raise RuntimeError("Replay server failed to start")
+    return server, base_url
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _print_results(results: list) -> None:
+    header = (
+        f"{'case':<18} {'mode':<6} {'records':>8} {'rec/s':>10} "
+        f"{'MB/s':>8} {'cpu s':>8} {'parse s':>8} {'rss MB':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print(
+            f"{result['case']:<18} {result['mode']:<6} {result['records']:>8} "
+            f"{result['records_per_sec']:>10.0f} "
+            f"{result['bytes_per_sec'] / 1e6:>8.2f} {result['cpu_seconds']:>8.2f} "
+            f"{result['parse_seconds']:>8.2f} {result['peak_rss_mb']:>8.1f}"
+        )
+
+
+def _print_comparison(results: list, baseline: dict) -> None:
+    previous = {(r["case"], r["mode"]): r for r in baseline.get("results", [])}
+    print(f"\nCompared with {baseline.get('commit', 'baseline')} (new / old):")
+    for result in results:
+        old = previous.get((result["case"], result["mode"]))
+        if old is None:
+            continue
+        changes = []
+        for metric, higher_is_better in COMPARED_METRICS:
+            if not old.get(metric):
+                continue
+            ratio = result[metric] / old[metric]
+            better = ratio > 1 if higher_is_better else ratio < 1
+            marker = "+" if better else "-" if ratio != 1 else " "
+            changes.append(f"{metric} {ratio:.2f}x{marker}")
+        print(f"  {result['case']:<18} {result['mode']:<6} " + "  ".join(changes))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline connector throughput benchmarks")
+    parser.add_argument("--records", type=int, default=20000,
+                        help="records served per table (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per case and mode; medians are reported (default: 3)")
+    parser.add_argument("--cases", default=",".join(CASES),
+                        help="comma-separated cases (default: all)")
+    parser.add_argument("--modes", default=",".join(MODES),
+                        help="comma-separated modes: read, parse (default: both)")
+    parser.add_argument("--max-batches", type=int, default=50,
+                        help="upper bound on read_table calls per run (default: 50)")
+    parser.add_argument("--keep-sleeps", action="store_true",
+                        help="keep the connectors' client-side pacing sleeps")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare with")
+    parser.add_argument("--worker", nargs=3, metavar=("CASE", "MODE", "URL"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        case, mode, base_url = args.worker
+        result = run_case(case, mode, base_url, args.max_batches, args.keep_sleeps)
+        print(json.dumps(result))
+        return
+
+    cases = [case for case in args.cases.split(",") if case]
+    modes = [mode for mode in args.modes.split(",") if mode]
+    for case in cases:
+        if case not in CASES:
+            parser.error(f"unknown case {case!r}; expected one of {', '.join(CASES)}")
+    for mode in modes:
+        if mode not in MODES:
+            parser.error(f"unknown mode {mode!r}; expected one of {', '.join(MODES)}")
+
+    server, base_url = _start_server(args.records)
+    try:
+        results = []
+        for case in cases:
+            # An unmeasured run fills the server's page cache, so that every
+            # measured run reads the same pre-encoded responses.
+            _run_worker(args, case, modes[0], base_url)
+            for mode in modes:
+                runs = [
+                    _run_worker(args, case, mode, base_url)
+                    for _ in range(max(1, args.repeat))
+                ]
+                results.append(_median_result(runs))
+    finally:
+        server.terminate()
+        server.wait()
+
+    report = {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "records_per_table": args.records,
+        "keep_sleeps": args.keep_sleeps,
+        "results": results,
+    }
+    _print_results(results)
+    if args.compare:
+        with open(args.compare) as f:
+            _print_comparison(results, json.load(f))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
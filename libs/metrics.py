@@ -0,0 +1,230 @@
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Any, Iterable, Iterator
+from urllib.parse import urlparse
+
+
+# Directory the metrics line of every read is appended to, one `<table>.jsonl`
+# file per table. `_lakeflow_metrics` reads the lines back, so it must be
+# shared by the executors and the reader (e.g. a volume) to see every read.
+METRICS_PATH_OPTION = "lakeflow.metrics.path"
+DEFAULT_METRICS_PATH = os.path.join(tempfile.gettempdir(), "lakeflow_metrics")
+
+# Upper bounds (in milliseconds) of the request latency histogram buckets; the
+# last bucket counts everything slower than the largest bound.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Path segments that look like identifiers are collapsed so that per-endpoint
+# statistics do not grow with the number of records (e.g. /tickets/{id}/comments).
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,}|[A-Za-z]+_[A-Za-z0-9]{8,})$")
+
+
+def endpoint_name(url: str) -> str:
+    """Return the path of a request URL with identifier segments replaced by {id}."""
+    path = urlparse(url).path or "/"
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+class ReadMetrics:
+    """
+    Counters describing the work done by a connector for one read.
+
+    Connectors report HTTP traffic by registering `on_response` as a requests
+    response hook (see `attach_metrics`) and call `record_retry` whenever they
+    retry a request. The shared read path adds the records emitted and the time
+    spent reading from the connector versus converting records to rows, then
+    takes a snapshot per micro-batch with `collect`.
+
+    Counters may be updated from several threads at once.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset()
+
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled; each process gets its own.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _reset(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.errors = 0
+        self.bytes_downloaded = 0
+        self.fetch_seconds = 0.0
+        self.records = 0
+        self.read_seconds = 0.0
+        self.parse_seconds = 0.0
+        self.endpoints = {}
+
+    def on_response(self, response, *args, **kwargs):
+        """requests response hook recording one HTTP round trip."""
+        elapsed = response.elapsed.total_seconds()
+        content_length = response.headers.get("Content-Length")
+        try:
+            size = int(content_length)
+        except (TypeError, ValueError):
+            size = len(response.content or b"")
+        endpoint = endpoint_name(response.url)
+        elapsed_ms = elapsed * 1000
+
+        with self._lock:
+            self.requests += 1
+            self.bytes_downloaded += size
+            self.fetch_seconds += elapsed
+            if response.status_code == 429:
+                self.throttled += 1
+            elif response.status_code >= 400:
+                self.errors += 1
+
+            stats = self.endpoints.get(endpoint)
+            if stats is None:
+                stats = {
+                    "requests": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                }
+                self.endpoints[endpoint] = stats
+            stats["requests"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            bucket = len(LATENCY_BUCKETS_MS)
+            for index, bound in enumerate(LATENCY_BUCKETS_MS):
+                if elapsed_ms <= bound:
+                    bucket = index
+                    break
+            stats["buckets"][bucket] += 1
+        return response
+
+    def record_retry(self) -> None:
+        """Count a request that is about to be retried."""
+        with self._lock:
+            self.retries += 1
+
+    def record_read(self, records: int, read_seconds: float, parse_seconds: float):
+        """Add the records emitted by a read and where its time went."""
+        with self._lock:
+            self.records += records
+            self.read_seconds += read_seconds
+            self.parse_seconds += parse_seconds
+
+    def collect(self) -> dict:
+        """Return the counters gathered so far and start counting from zero."""
+        with self._lock:
+            snapshot = {
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "errors": self.errors,
+                "bytes_downloaded": self.bytes_downloaded,
+                "records": self.records,
+                "read_seconds": round(self.read_seconds, 6),
+                "fetch_seconds": round(self.fetch_seconds, 6),
+                "parse_seconds": round(self.parse_seconds, 6),
+                "endpoints": [
+                    {
+                        "endpoint": endpoint,
+                        "requests": stats["requests"],
+                        "total_ms": round(stats["total_ms"], 3),
+                        "max_ms": round(stats["max_ms"], 3),
+                        "buckets": list(stats["buckets"]),
+                    }
+                    for endpoint, stats in sorted(self.endpoints.items())
+                ],
+            }
+            self._reset()
+        return snapshot
+
+
+def attach_metrics(session, metrics: ReadMetrics) -> None:
+    """Report every response received through a requests session to `metrics`."""
+    session.hooks["response"].append(metrics.on_response)
+
+
+def timed_rows(
+    records: Iterable[Any],
+    convert,
+    metrics: ReadMetrics,
+    read_seconds: float,
+    on_complete=None,
+) -> Iterator[Any]:
+    """
+    Convert records lazily while measuring conversion time.
+
+    `read_seconds` is the time already spent producing `records`; time spent
+    pulling further records out of a lazy iterator is added to it. Once the
+    records are exhausted the totals are added to `metrics` and
+    `on_complete` (if given) is called.
+    """
+    count = 0
+    parse_seconds = 0.0
+    iterator = iter(records)
+    perf_counter = time.perf_counter
+    while True:
+        started = perf_counter()
+        try:
+            record = next(iterator)
+        except StopIteration:
+            read_seconds += perf_counter() - started
+            break
+        converted = perf_counter()
+        row = convert(record)
+        parse_seconds += perf_counter() - converted
+        read_seconds += converted - started
+        count += 1
+        yield row
+    metrics.record_read(count, read_seconds, parse_seconds)
+    if on_complete is not None:
+        on_complete()
+
+
+def _metrics_file(directory: str, table_name: str) -> str:
+    return os.path.join(directory, f"{table_name}.jsonl".replace(os.sep, "_"))
+
+
+def append_metrics_line(directory: str, table_name: str, line: dict) -> None:
+    """
+    Append one metrics line to the log of `table_name` in `directory`.
+
+    The line is written with a single call so concurrent readers of the same
+    table do not interleave their lines. Failing to write is ignored: metrics
+    must never fail the read itself.
+    """
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(_metrics_file(directory, table_name), "a") as f:
+            f.write(json.dumps(line, default=str) + "\n")
+    except OSError:
+        pass
+
+
+def read_metrics_lines(directory: str, table_name: str) -> list[dict]:
+    """Return the metrics lines logged for `table_name`, oldest first."""
+    try:
+        with open(_metrics_file(directory, table_name)) as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return []
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            # A line cut short by a read that died while writing it.
+            continue
+    return records
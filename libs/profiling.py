@@ -0,0 +1,167 @@
+import cProfile
+import json
+import os
+import pstats
+import re
+import tempfile
+import time
+import uuid
+from typing import Any, Iterable, Iterator, Optional
+
+
+# Set to "true" to profile every read and dump the profiles.
+PROFILE_OPTION = "lakeflow.profile"
+# Directory the profiles are written to; it must be writable by the executors.
+PROFILE_PATH_OPTION = "lakeflow.profile.path"
+DEFAULT_PROFILE_PATH = os.path.join(tempfile.gettempdir(), "lakeflow_profiles")
+
+# Functions whose cumulative time makes up each category of the breakdown, as
+# (file name suffix or None for any file, function name pattern). C functions
+# have the file name "~". Whatever is not in a category is time spent in the
+# connector's own code.
+PROFILE_CATEGORIES = {
+    "fetch_seconds": [("requests/sessions.py", r"send")],
+    "json_decode_seconds": [
+        ("json/decoder.py", r"decode"),
+        ("~", r"<orjson\.loads>"),
+        ("~", r"<msgspec\..*decode>"),
+    ],
+    "parse_seconds": [(None, r"parse_value")],
+}
+
+# Number of functions listed in the JSON summary of a profile.
+_TOP_FUNCTIONS = 30
+
+
+def profile_breakdown(stats: pstats.Stats, total_seconds: float) -> dict:
+    """
+    Split the profiled time into fetching, JSON decoding, `parse_value`
+    conversion and the connector's own code (`connector_seconds`).
+    """
+    breakdown = {category: 0.0 for category in PROFILE_CATEGORIES}
+    for (filename, _, function), (_, _, _, cumulative, _) in stats.stats.items():
+        normalized = filename.replace(os.sep, "/")
+        for category, functions in PROFILE_CATEGORIES.items():
+            for suffix, name in functions:
+                if re.fullmatch(name, function) and (
+                    suffix is None or normalized.endswith(suffix)
+                ):
+                    breakdown[category] += cumulative
+    breakdown["connector_seconds"] = max(total_seconds - sum(breakdown.values()), 0.0)
+    breakdown["total_seconds"] = total_seconds
+    return {key: round(value, 6) for key, value in breakdown.items()}
+
+
+class ReadProfiler:
+    """
+    Profiles one read with cProfile when `lakeflow.profile` is enabled.
+
+    Use the profiler as a context manager around the `read_table` call and
+    pass the rows returned to Spark through `rows`, which profiles pulling
+    (and converting) every record. Once the rows are exhausted the profile is
+    written to `lakeflow.profile.path` as `<name>.prof` (load it with
+    `pstats` or snakeviz) with a `<name>.json` summary holding the time
+    breakdown and the most expensive functions, and the summary is printed
+    as a JSON line with `"event": "lakeflow_connect_profile"`.
+
+    When profiling is disabled every method is a pass-through.
+    """
+
+    def __init__(self, options: dict, read_kind: str, **context) -> None:
+        self.enabled = str(options.get(PROFILE_OPTION, "false")).lower() == "true"
+        self.directory = options.get(PROFILE_PATH_OPTION) or DEFAULT_PROFILE_PATH
+        self.table_name = options.get("tableName")
+        self.read_kind = read_kind
+        self.context = context
+        self.seconds = 0.0
+        self._profile = cProfile.Profile() if self.enabled else None
+        self._started = None
+
+    def __enter__(self) -> "ReadProfiler":
+        if self.enabled:
+            self._started = time.perf_counter()
+            self._profile.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.enabled:
+            self._profile.disable()
+            self.seconds += time.perf_counter() - self._started
+
+    def rows(self, rows: Iterable[Any]) -> Iterable[Any]:
+        """Profile iterating `rows`, then write the profile."""
+        if not self.enabled:
+            return rows
+        return self._profiled_rows(rows)
+
+    def _profiled_rows(self, rows: Iterable[Any]) -> Iterator[Any]:
+        iterator = iter(rows)
+        while True:
+            with self:
+                try:
+                    row = next(iterator)
+                except StopIteration:
+                    break
+            yield row
+        self.dump()
+
+    def _file_prefix(self) -> str:
+        parts = [self.table_name or "table", self.read_kind]
+        partition = _partition_id()
+        if partition is not None:
+            parts.append(f"p{partition}")
+        parts += [time.strftime("%Y%m%dT%H%M%S"), uuid.uuid4().hex[:8]]
+        name = "-".join(str(part) for part in parts)
+        return os.path.join(self.directory, name.replace(os.sep, "_"))
+
+    def dump(self) -> Optional[dict]:
+        """Write the profile and its summary; returns the summary."""
+        if not self.enabled:
+            return None
+        stats = pstats.Stats(self._profile)
+        summary = {
+            "event": "lakeflow_connect_profile",
+            "table": self.table_name,
+            "read": self.read_kind,
+            **self.context,
+            **profile_breakdown(stats, self.seconds),
+            "top_functions": [
+                {
+                    "function": f"{filename}:{line}({function})",
+                    "calls": calls,
+                    "tottime": round(own, 6),
+                    "cumtime": round(cumulative, 6),
+                }
+                for (filename, line, function), (_, calls, own, cumulative, _) in sorted(
+                    stats.stats.items(), key=lambda item: item[1][3], reverse=True
+                )[:_TOP_FUNCTIONS]
+            ],
+        }
+        prefix = self._file_prefix()
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            stats.dump_stats(f"{prefix}.prof")
+            with open(f"{prefix}.json", "w") as f:
+                json.dump(summary, f, indent=2, default=str)
+            summary["path"] = f"{prefix}.prof"
+        except OSError as e:
+            # Profiling must never fail the read itself.
+            summary["error"] = f"Could not write profile to {self.directory}: {e}"
+        print(
+            json.dumps(
+                {k: v for k, v in summary.items() if k != "top_functions"},
+                default=str,
+            )
+        )
+        return summary
+
+
+def _partition_id() -> Optional[int]:
+    """The Spark partition being read, when running inside a task."""
+    try:
+        from pyspark import TaskContext
+
+        context = TaskContext.get()
+    except Exception:
+        return None
+    return context.partitionId() if context is not None else None
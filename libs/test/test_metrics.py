@@ -0,0 +1,182 @@
+"""
+Tests for the read metrics in libs/metrics.py
+"""
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+import requests
+
+from libs.metrics import (
+    LATENCY_BUCKETS_MS,
+    ReadMetrics,
+    append_metrics_line,
+    attach_metrics,
+    endpoint_name,
+    read_metrics_lines,
+    timed_rows,
+)
+
+
+def make_response(url, status_code=200, elapsed_ms=10, body=b"{}", headers=None):
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.elapsed = timedelta(milliseconds=elapsed_ms)
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+class TestEndpointName:
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://x.zendesk.com/api/v2/tickets.json", "/api/v2/tickets.json"),
+            (
+                "https://x.zendesk.com/api/v2/tickets/12345/comments.json?page=2",
+                "/api/v2/tickets/{id}/comments.json",
+            ),
+            (
+                "https://api.stripe.com/v1/customers/cus_NffrFeUfNV2Hib",
+                "/v1/customers/{id}",
+            ),
+            ("https://api.github.com/repos/octo/hello/issues", "/repos/octo/hello/issues"),
+            ("https://api.thecatapi.com", "/"),
+        ],
+    )
+    def test_endpoint_name(self, url, expected):
+        assert endpoint_name(url) == expected
+
+
+class TestReadMetrics:
+    def test_on_response_counts_requests_bytes_and_latency(self):
+        metrics = ReadMetrics()
+        metrics.on_response(make_response("https://h/a", elapsed_ms=40, body=b"abc"))
+        metrics.on_response(
+            make_response(
+                "https://h/a",
+                elapsed_ms=300,
+                body=b"",
+                headers={"Content-Length": "1000"},
+            )
+        )
+        metrics.on_response(make_response("https://h/b", status_code=429))
+        metrics.on_response(make_response("https://h/b", status_code=500))
+
+        snapshot = metrics.collect()
+
+        assert snapshot["requests"] == 4
+        assert snapshot["throttled"] == 1
+        assert snapshot["errors"] == 1
+        assert snapshot["bytes_downloaded"] == 3 + 1000 + 2 + 2
+        assert snapshot["fetch_seconds"] == pytest.approx(0.36)
+        endpoint_a = snapshot["endpoints"][0]
+        assert endpoint_a["endpoint"] == "/a"
+        assert endpoint_a["requests"] == 2
+        assert endpoint_a["max_ms"] == pytest.approx(300)
+        assert len(endpoint_a["buckets"]) == len(LATENCY_BUCKETS_MS) + 1
+        assert endpoint_a["buckets"][0] == 1  # <= 50ms
+        assert endpoint_a["buckets"][LATENCY_BUCKETS_MS.index(500)] == 1
+
+    def test_collect_resets_counters(self):
+        metrics = ReadMetrics()
+        metrics.on_response(make_response("https://h/a"))
+        metrics.record_retry()
+        metrics.record_read(5, 1.5, 0.5)
+
+        first = metrics.collect()
+        second = metrics.collect()
+
+        assert first["retries"] == 1
+        assert first["records"] == 5
+        assert first["read_seconds"] == 1.5
+        assert first["parse_seconds"] == 0.5
+        assert second["requests"] == 0
+        assert second["records"] == 0
+        assert second["endpoints"] == []
+
+    def test_concurrent_updates(self):
+        metrics = ReadMetrics()
+        response = make_response("https://h/a")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: metrics.on_response(response), range(400)))
+
+        assert metrics.collect()["requests"] == 400
+
+    def test_pickle_round_trip(self):
+        metrics = ReadMetrics()
+        metrics.record_retry()
+
+        restored = pickle.loads(pickle.dumps(metrics))
+        restored.record_retry()
+
+        assert restored.collect()["retries"] == 2
+
+    def test_attach_metrics_registers_response_hook(self):
+        session = requests.Session()
+        metrics = ReadMetrics()
+
+        attach_metrics(session, metrics)
+
+        assert metrics.on_response in session.hooks["response"]
+
+
+class TestTimedRows:
+    def test_converts_lazily_and_records_totals(self):
+        metrics = ReadMetrics()
+        completed = []
+
+        rows = timed_rows(
+            iter([1, 2, 3]),
+            lambda x: x * 10,
+            metrics,
+            read_seconds=2.0,
+            on_complete=lambda: completed.append(True),
+        )
+
+        assert not completed
+        assert list(rows) == [10, 20, 30]
+        assert completed == [True]
+        snapshot = metrics.collect()
+        assert snapshot["records"] == 3
+        assert snapshot["read_seconds"] >= 2.0
+        assert snapshot["parse_seconds"] >= 0.0
+
+    def test_empty_records(self):
+        metrics = ReadMetrics()
+
+        assert list(timed_rows([], str, metrics, read_seconds=0.0)) == []
+        assert metrics.collect()["records"] == 0
+
+
+class TestMetricsLog:
+    def test_lines_are_read_back_per_table_in_order(self, tmp_path):
+        directory = str(tmp_path / "metrics")
+
+        assert read_metrics_lines(directory, "tickets") == []
+        append_metrics_line(directory, "tickets", {"records": 1})
+        append_metrics_line(directory, "users", {"records": 2})
+        append_metrics_line(directory, "tickets", {"records": 3})
+
+        assert read_metrics_lines(directory, "tickets") == [
+            {"records": 1},
+            {"records": 3},
+        ]
+        assert read_metrics_lines(directory, "users") == [{"records": 2}]
+
+    def test_a_truncated_line_is_skipped(self, tmp_path):
+        append_metrics_line(str(tmp_path), "tickets", {"records": 1})
+        with open(tmp_path / "tickets.jsonl", "a") as f:
+            f.write('{"records": ')
+
+        assert read_metrics_lines(str(tmp_path), "tickets") == [{"records": 1}]
+
+    def test_write_failures_are_ignored(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        append_metrics_line(str(blocker), "tickets", {"records": 1})
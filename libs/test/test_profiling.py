@@ -0,0 +1,89 @@
+"""
+Tests for the opt-in read profiling in libs/profiling.py
+"""
+
+import json
+import os
+import pstats
+
+from libs.profiling import (
+    PROFILE_OPTION,
+    PROFILE_PATH_OPTION,
+    ReadProfiler,
+)
+
+
+def parse_value(record):
+    return tuple(sorted(record.items()))
+
+
+def read_table(count):
+    payload = json.dumps([{"id": i, "name": f"name-{i}"} for i in range(count)])
+    return iter(json.loads(payload))
+
+
+def profile_read(options, count=200):
+    profiler = ReadProfiler(options, "batch", start_offset={"cursor": 1})
+    with profiler:
+        records = read_table(count)
+    rows = list(profiler.rows(map(parse_value, records)))
+    return profiler, rows
+
+
+class TestReadProfiler:
+    def test_disabled_is_a_pass_through(self, tmp_path):
+        options = {"tableName": "users", PROFILE_PATH_OPTION: str(tmp_path)}
+        profiler = ReadProfiler(options, "batch")
+        rows = iter([1, 2, 3])
+
+        with profiler:
+            pass
+
+        assert profiler.rows(rows) is rows
+        assert profiler.dump() is None
+        assert os.listdir(tmp_path) == []
+
+    def test_writes_profile_and_summary(self, tmp_path, capsys):
+        options = {
+            "tableName": "users",
+            PROFILE_OPTION: "True",
+            PROFILE_PATH_OPTION: str(tmp_path / "profiles"),
+        }
+
+        profiler, rows = profile_read(options)
+
+        assert len(rows) == 200
+        files = sorted(os.listdir(tmp_path / "profiles"))
+        assert len(files) == 2
+        summary_file, prof = (tmp_path / "profiles" / name for name in files)
+        assert prof.name.startswith("users-batch-") and prof.suffix == ".prof"
+        assert summary_file.suffix == ".json"
+        pstats.Stats(str(prof))
+
+        summary = json.loads(summary_file.read_text())
+        assert summary["table"] == "users"
+        assert summary["read"] == "batch"
+        assert summary["start_offset"] == {"cursor": 1}
+        assert summary["json_decode_seconds"] > 0
+        assert summary["parse_seconds"] > 0
+        assert summary["fetch_seconds"] == 0
+        assert summary["total_seconds"] >= (
+            summary["json_decode_seconds"] + summary["parse_seconds"]
+        )
+        assert summary["top_functions"]
+
+        event = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert event["event"] == "lakeflow_connect_profile"
+        assert event["path"] == str(prof)
+        assert "top_functions" not in event
+
+    def test_unwritable_path_does_not_fail_the_read(self, tmp_path, capsys):
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_text("")
+        options = {PROFILE_OPTION: "true", PROFILE_PATH_OPTION: str(blocker)}
+
+        _, rows = profile_read(options, count=10)
+
+        assert len(rows) == 10
+        event = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert "Could not write profile" in event["error"]
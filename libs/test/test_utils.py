@@ -1,14 +1,25 @@
 """
-Tests for the parse_value function in libs/utils.py
+Tests for the helpers in libs/utils.py
 
-This module tests the conversion of JSON/dict values to PySpark-compatible data types.
+This module tests the conversion of JSON/dict values to PySpark-compatible data types
+and the ISO 8601 cursor helpers shared by the connectors.
 """
 
+import json
+
 import pytest
+import requests
 from datetime import datetime, date
 from decimal import Decimal
 
 from pyspark.sql import Row
+from pyspark.sql.datasource import (
+    EqualTo,
+    GreaterThanOrEqual,
+    In,
+    IsNull,
+    StringContains,
+)
 from pyspark.sql.types import (
     StructType,
     StructField,
@@ -26,7 +37,25 @@ from pyspark.sql.types import (
     DataType,
 )
 
-from libs.utils import parse_value
+from libs.utils import (
+    JSON_BACKENDS,
+    PROJECTION_OPTION,
+    PUSHED_FILTERS_OPTION,
+    epoch_to_iso8601,
+    is_utc_iso8601,
+    iso8601_to_epoch,
+    json_loads,
+    latest_iso8601,
+    matches_filters,
+    parse_value,
+    projected_fields,
+    projection_paths,
+    prune_schema,
+    pushed_filters,
+    response_json,
+    select_json_backend,
+    to_pushed_filter,
+)
 
 
 # =============================================================================
@@ -653,3 +682,197 @@ class TestErrorCases:
         with pytest.raises(ValueError):
             parse_value("invalid-timestamp", TimestampType())
 
+
+
+# =============================================================================
+# Tests for ISO 8601 cursor helpers
+# =============================================================================
+class TestIso8601Helpers:
+    """Test the timestamp helpers used for incremental cursors."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("2024-01-15T10:30:00Z", 1705314600.0),
+            ("1970-01-01T00:00:00Z", 0.0),
+            ("2024-01-15T10:30:00.250Z", 1705314600.25),
+            ("2024-01-15T12:30:00+02:00", 1705314600.0),
+            ("2024-01-15T10:30:00", 1705314600.0),
+            ("2024-01-15 10:30:00", 1705314600.0),
+        ],
+    )
+    def test_iso8601_to_epoch(self, value, expected):
+        assert iso8601_to_epoch(value) == expected
+
+    def test_iso8601_to_epoch_matches_datetime(self):
+        value = "2023-07-04T23:59:59Z"
+        expected = datetime.fromisoformat("2023-07-04T23:59:59+00:00").timestamp()
+        assert iso8601_to_epoch(value) == expected
+
+    @pytest.mark.parametrize(
+        "value", [None, "", "not-a-date", "2024-13-45T99:99:99Z", 1705314600]
+    )
+    def test_iso8601_to_epoch_invalid(self, value):
+        assert iso8601_to_epoch(value) is None
+
+    def test_is_utc_iso8601(self):
+        assert is_utc_iso8601("2024-01-15T10:30:00Z")
+        assert not is_utc_iso8601("2024-01-15T10:30:00.000Z")
+        assert not is_utc_iso8601("2024-01-15T10:30:00+00:00")
+        assert not is_utc_iso8601(None)
+
+    def test_epoch_to_iso8601_round_trip(self):
+        assert epoch_to_iso8601(1705314600) == "2024-01-15T10:30:00Z"
+        assert epoch_to_iso8601(iso8601_to_epoch("2024-02-29T00:00:00Z") - 1) == (
+            "2024-02-28T23:59:59Z"
+        )
+
+    def test_latest_iso8601(self):
+        assert latest_iso8601(None, "2024-01-15T10:30:00Z") == "2024-01-15T10:30:00Z"
+        assert (
+            latest_iso8601("2024-01-15T10:30:00Z", "2024-01-15T10:29:59Z")
+            == "2024-01-15T10:30:00Z"
+        )
+        assert (
+            latest_iso8601("2024-01-15T10:30:00Z", "2024-01-15T10:30:00.500Z")
+            == "2024-01-15T10:30:00.500Z"
+        )
+        assert (
+            latest_iso8601("2024-01-15T10:30:00Z", "2024-01-15T11:00:00+02:00")
+            == "2024-01-15T10:30:00Z"
+        )
+
+    def test_latest_iso8601_ignores_invalid(self):
+        assert latest_iso8601(None, None) is None
+        assert latest_iso8601(None, "garbage") is None
+        assert latest_iso8601("2024-01-15T10:30:00Z", "garbage") == (
+            "2024-01-15T10:30:00Z"
+        )
+
+
+# =============================================================================
+# Tests for the JSON decoding helpers
+# =============================================================================
+class TestJsonHelpers:
+    """Test the pluggable JSON backend used to decode API responses."""
+
+    DOCUMENT = '{"id": 1, "name": "caf\u00e9", "tags": ["a", null], "ok": true, "x": 1.5}'
+
+    @pytest.mark.parametrize("data", [DOCUMENT, DOCUMENT.encode("utf-8")])
+    def test_json_loads_matches_stdlib(self, data):
+        assert json_loads(data) == json.loads(self.DOCUMENT)
+
+    def test_json_loads_accepts_what_stdlib_accepts(self):
+        assert json_loads(b"[NaN]")[0] != json_loads(b"[NaN]")[0]
+        assert json_loads(b"[Infinity]") == [float("inf")]
+
+    def test_json_loads_raises_stdlib_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            json_loads(b'{"id": ')
+
+    def test_response_json_decodes_bytes(self):
+        response = requests.Response()
+        response._content = self.DOCUMENT.encode("utf-8")
+        assert response_json(response) == json.loads(self.DOCUMENT)
+
+    @pytest.mark.parametrize("name", JSON_BACKENDS)
+    def test_select_json_backend_falls_back(self, name):
+        backend, loads = select_json_backend(name)
+        assert JSON_BACKENDS.index(backend) >= JSON_BACKENDS.index(name)
+        assert loads(self.DOCUMENT.encode("utf-8")) == json.loads(self.DOCUMENT)
+
+    def test_select_json_backend_unknown(self):
+        with pytest.raises(ValueError):
+            select_json_backend("simdjson")
+
+
+# =============================================================================
+# Tests for filter pushdown helpers
+# =============================================================================
+class TestPushedFilters:
+    """Test the conversion and evaluation of pushed-down Spark filters."""
+
+    def test_to_pushed_filter(self):
+        assert to_pushed_filter(EqualTo(("state",), "open")) == ("state", "=", "open")
+        assert to_pushed_filter(GreaterThanOrEqual(("created",), 100)) == (
+            "created",
+            ">=",
+            100,
+        )
+        assert to_pushed_filter(In(("event",), ("a", "b"))) == ("event", "in", ["a", "b"])
+        assert to_pushed_filter(EqualTo(("properties", "$city"), "Paris")) == (
+            "properties.$city",
+            "=",
+            "Paris",
+        )
+        assert to_pushed_filter(IsNull(("state",))) is None
+        assert to_pushed_filter(StringContains(("title",), "bug")) is None
+        assert to_pushed_filter(EqualTo(("a.b",), 1)) is None
+        assert to_pushed_filter(EqualTo(("day",), date(2024, 1, 1))) is None
+
+    def test_pushed_filters_round_trip(self):
+        filters = [("updated_at", ">=", "2024-01-01T00:00:00Z"), ("id", "in", [1, 2])]
+        options = {PUSHED_FILTERS_OPTION: json.dumps(filters)}
+        assert pushed_filters(options) == filters
+        assert pushed_filters({}) == []
+        assert pushed_filters(None) == []
+
+    def test_matches_filters(self):
+        row = Row(id=5, state="open", properties=Row(city="Paris"), closed_at=None)
+        assert matches_filters(row, [])
+        assert matches_filters(row, [("id", ">", 4), ("id", "<=", 5), ("state", "=", "open")])
+        assert matches_filters(row, [("properties.city", "in", ["Paris", "Rome"])])
+        assert not matches_filters(row, [("id", ">=", 6)])
+        assert not matches_filters(row, [("state", "=", "closed")])
+        assert not matches_filters(row, [("closed_at", "<", "2024")])
+
+
+# =============================================================================
+# Tests for column projection helpers
+# =============================================================================
+class TestProjection:
+    """Test schema pruning and the projection handed to connectors."""
+
+    SCHEMA = StructType(
+        [
+            StructField("id", LongType(), False),
+            StructField("name", StringType(), True),
+            StructField(
+                "properties",
+                StructType(
+                    [
+                        StructField("email", StringType(), True),
+                        StructField("city", StringType(), True),
+                    ]
+                ),
+                True,
+            ),
+        ]
+    )
+
+    def test_prune_schema_keeps_schema_order(self):
+        pruned = prune_schema(self.SCHEMA, ["properties.city", "id"])
+        assert pruned.fieldNames() == ["id", "properties"]
+        assert pruned["properties"].dataType.fieldNames() == ["city"]
+        assert prune_schema(self.SCHEMA, ["properties.city", "properties"]) == (
+            prune_schema(self.SCHEMA, ["properties"])
+        )
+
+    @pytest.mark.parametrize("column", ["missing", "name.first", "properties.zip"])
+    def test_prune_schema_rejects_unknown_columns(self, column):
+        with pytest.raises(ValueError, match="Unknown column"):
+            prune_schema(self.SCHEMA, [column])
+
+    def test_projection_paths(self):
+        assert projection_paths(self.SCHEMA, self.SCHEMA) is None
+        pruned = prune_schema(self.SCHEMA, ["id", "properties.email"])
+        assert projection_paths(pruned, self.SCHEMA) == ["id", "properties.email"]
+        pruned = prune_schema(self.SCHEMA, ["name", "properties"])
+        assert projection_paths(pruned, self.SCHEMA) == ["name", "properties"]
+
+    def test_projected_fields(self):
+        options = {PROJECTION_OPTION: json.dumps(["id", "properties.email"])}
+        assert projected_fields(options, "properties") == {"email"}
+        assert projected_fields(options, "id") is None
+        assert projected_fields(options, "name") == set()
+        assert projected_fields({}, "name") is None
@@ -1,8 +1,12 @@
 from pyspark.sql import Row
 from pyspark.sql.types import *
 from decimal import Decimal
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, Tuple, Union
+import calendar
+import json
+import os
+import time
 
 
 def parse_value(value: Any, field_type: DataType) -> Any:
@@ -138,3 +142,359 @@ def parse_value(value: Any, field_type: DataType) -> Any:
         raise ValueError(
             f"Error converting '{value}' ({type(value)}) to {field_type}: {str(e)}"
         )
+
+
+# Length of the fixed `YYYY-MM-DDTHH:MM:SSZ` layout used by most APIs for cursors.
+_UTC_ISO8601_LENGTH = 20
+
+# Parsed values of timestamps that do not use the fixed layout. Kept as a plain
+# bounded dict (rather than functools.lru_cache) so it pickles with the
+# generated source.
+_ISO8601_CACHE: dict = {}
+_ISO8601_CACHE_SIZE = 4096
+
+
+def is_utc_iso8601(value: Any) -> bool:
+    """
+    Check whether a value uses the fixed `YYYY-MM-DDTHH:MM:SSZ` layout.
+
+    Timestamps in this layout sort lexicographically in time order, so they can
+    be compared as strings without parsing.
+    """
+    return (
+        isinstance(value, str)
+        and len(value) == _UTC_ISO8601_LENGTH
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] == "T"
+        and value[13] == ":"
+        and value[16] == ":"
+        and value[19] == "Z"
+    )
+
+
+def iso8601_to_epoch(value: Any) -> Optional[float]:
+    """
+    Convert an ISO 8601 timestamp string to seconds since the epoch.
+
+    The fixed `YYYY-MM-DDTHH:MM:SSZ` layout is converted by slicing; other
+    layouts (fractional seconds, offsets, space separator) go through
+    `datetime.fromisoformat` and are cached. Timestamps without an offset are
+    taken to be UTC. Returns None for values that cannot be parsed.
+    """
+    if is_utc_iso8601(value):
+        try:
+            fields = (
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+            )
+        except ValueError:
+            return None
+        # calendar.timegm normalizes out-of-range fields instead of rejecting them.
+        if not (
+            1 <= fields[1] <= 12
+            and 1 <= fields[2]
+            and (
+                fields[2] <= 28
+                or fields[2] <= calendar.monthrange(fields[0], fields[1])[1]
+            )
+            and fields[3] < 24
+            and fields[4] < 60
+            and fields[5] < 60
+        ):
+            return None
+        return float(calendar.timegm(fields))
+
+    if not isinstance(value, str) or not value:
+        return None
+
+    cached = _ISO8601_CACHE.get(value)
+    if cached is not None:
+        return cached
+
+    text = value[:-1] + "+00:00" if value.endswith("Z") else value
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    epoch = parsed.timestamp()
+
+    if len(_ISO8601_CACHE) >= _ISO8601_CACHE_SIZE:
+        _ISO8601_CACHE.clear()
+    _ISO8601_CACHE[value] = epoch
+    return epoch
+
+
+def epoch_to_iso8601(seconds: float) -> str:
+    """Format seconds since the epoch in the `YYYY-MM-DDTHH:MM:SSZ` layout."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
+
+
+def latest_iso8601(current: Optional[str], candidate: Any) -> Optional[str]:
+    """
+    Return the later of two ISO 8601 timestamps, ignoring unparseable values.
+
+    Intended for tracking a cursor over many records: when both values use the
+    fixed UTC layout they are compared as strings, otherwise they are parsed.
+    """
+    if not isinstance(candidate, str) or not candidate:
+        return current
+    if current is None:
+        return candidate if iso8601_to_epoch(candidate) is not None else current
+    if is_utc_iso8601(current) and is_utc_iso8601(candidate):
+        return candidate if candidate > current else current
+    candidate_epoch = iso8601_to_epoch(candidate)
+    if candidate_epoch is None:
+        return current
+    current_epoch = iso8601_to_epoch(current)
+    if current_epoch is None or candidate_epoch > current_epoch:
+        return candidate
+    return current
+
+
+# JSON backends in order of preference. Set the LAKEFLOW_JSON_BACKEND
+# environment variable to one of these names to force a backend.
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+
+def select_json_backend(
+    preferred: Optional[str] = None,
+) -> Tuple[str, Callable[[Union[bytes, str]], Any]]:
+    """
+    Return the name and `loads` function of the fastest installed JSON decoder.
+
+    orjson and msgspec are used when importable; the standard library is the
+    fallback. All three accept `bytes` as well as `str`. `preferred` skips
+    the backends listed before it.
+    """
+    candidates = JSON_BACKENDS
+    if preferred:
+        if preferred not in JSON_BACKENDS:
+            raise ValueError(
+                f"Unknown JSON backend '{preferred}', expected one of {JSON_BACKENDS}"
+            )
+        candidates = JSON_BACKENDS[JSON_BACKENDS.index(preferred):]
+    for name in candidates:
+        try:
+            if name == "orjson":
+                import orjson
+
+                return name, orjson.loads
+            if name == "msgspec":
+                import msgspec
+
+                return name, msgspec.json.decode
+        except ImportError:
+            continue
+    return "json", json.loads
+
+
+JSON_BACKEND, _json_decode = select_json_backend(
+    os.environ.get("LAKEFLOW_JSON_BACKEND")
+)
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document with the fastest available backend.
+
+    Documents the fast backends reject (such as `NaN` literals or malformed
+    input) are retried with the standard library, so the accepted input and
+    the `json.JSONDecodeError` raised match `json.loads`. Note that orjson
+    decodes integers wider than 64 bits as floats.
+    """
+    try:
+        return _json_decode(data)
+    except Exception:
+        if _json_decode is json.loads:
+            raise
+        return json.loads(data)
+
+
+def response_json(response) -> Any:
+    """
+    Decode a `requests` response body straight from its bytes.
+
+    Replaces `response.json()`, which first decodes the body to `str` and
+    then parses it with the standard library.
+    """
+    return json_loads(response.content)
+
+
+# Table option through which the batch reader hands the filters it pushed
+# down to `read_table`, as a JSON list of `[column, op, value]` triples.
+PUSHED_FILTERS_OPTION = "lakeflow.pushedFilters"
+
+# Spark data source filter classes that can be pushed down, by class name.
+_PUSHED_FILTER_OPS = {
+    "EqualTo": "=",
+    "GreaterThan": ">",
+    "GreaterThanOrEqual": ">=",
+    "LessThan": "<",
+    "LessThanOrEqual": "<=",
+    "In": "in",
+}
+
+
+def to_pushed_filter(spark_filter: Any) -> Optional[Tuple[str, str, Any]]:
+    """
+    Convert a `pyspark.sql.datasource.Filter` to a `(column, op, value)` triple.
+
+    Nested columns are joined with dots, e.g. `properties.$city`. Returns
+    None for filters that cannot be pushed down: other filter classes,
+    column names containing dots, and values that are not JSON scalars.
+    """
+    op = _PUSHED_FILTER_OPS.get(type(spark_filter).__name__)
+    if op is None:
+        return None
+    attribute = tuple(spark_filter.attribute)
+    if not attribute or any("." in name for name in attribute):
+        return None
+    values = spark_filter.value if op == "in" else (spark_filter.value,)
+    if not all(isinstance(value, (str, int, float, bool)) for value in values):
+        return None
+    value = list(values) if op == "in" else values[0]
+    return ".".join(attribute), op, value
+
+
+def pushed_filters(table_options: Optional[dict]) -> list:
+    """
+    Return the `(column, op, value)` filters pushed down to a read.
+
+    Connectors use them to narrow their API requests. They do not have to
+    apply them exactly: the batch reader drops the rows that do not match.
+    """
+    value = (table_options or {}).get(PUSHED_FILTERS_OPTION)
+    if not value:
+        return []
+    return [tuple(pushed) for pushed in json.loads(value)]
+
+
+def matches_filters(row: Any, filters: list) -> bool:
+    """Whether a parsed row satisfies every `(column, op, value)` filter."""
+    for column, op, value in filters:
+        field = row
+        for name in column.split("."):
+            field = None if field is None else field[name]
+        if field is None:
+            return False
+        if op == "=":
+            matched = field == value
+        elif op == ">":
+            matched = field > value
+        elif op == ">=":
+            matched = field >= value
+        elif op == "<":
+            matched = field < value
+        elif op == "<=":
+            matched = field <= value
+        elif op == "in":
+            matched = field in value
+        else:
+            raise ValueError(f"Unsupported filter operator {op!r}")
+        if not matched:
+            return False
+    return True
+
+
+# Table option listing the columns a batch read returns, comma-separated;
+# nested struct fields are written as `parent.field`.
+COLUMNS_OPTION = "lakeflow.columns"
+# Table option through which the batch reader hands the columns it needs to
+# `read_table`, as a JSON list of column paths.
+PROJECTION_OPTION = "lakeflow.projection"
+
+
+def prune_schema(schema: StructType, columns: list) -> StructType:
+    """
+    Keep only `columns` of `schema`, in schema order.
+
+    A column is a top-level name or a `parent.field` path into a struct
+    column. Unknown columns raise a ValueError.
+    """
+    selected = {}
+    for column in columns:
+        name, _, sub = column.partition(".")
+        if name not in schema.fieldNames():
+            raise ValueError(f"Unknown column '{column}'")
+        if not sub:
+            selected[name] = None
+            continue
+        data_type = schema[name].dataType
+        if not isinstance(data_type, StructType) or sub not in data_type.fieldNames():
+            raise ValueError(f"Unknown column '{column}'")
+        if name not in selected or selected[name] is not None:
+            selected.setdefault(name, set()).add(sub)
+
+    fields = []
+    for field in schema.fields:
+        if field.name not in selected:
+            continue
+        subfields = selected[field.name]
+        if subfields is None:
+            fields.append(field)
+        else:
+            fields.append(
+                StructField(
+                    field.name,
+                    StructType([f for f in field.dataType.fields if f.name in subfields]),
+                    field.nullable,
+                    field.metadata,
+                )
+            )
+    return StructType(fields)
+
+
+def projection_paths(schema: StructType, full_schema: StructType) -> Optional[list]:
+    """
+    Describe a pruned `schema` as column paths of `full_schema`.
+
+    Returns None when nothing was pruned. Struct columns whose fields were
+    pruned are listed field by field as `parent.field`.
+    """
+    if schema == full_schema:
+        return None
+    paths = []
+    for field in schema.fields:
+        full_type = (
+            full_schema[field.name].dataType
+            if field.name in full_schema.fieldNames()
+            else None
+        )
+        if (
+            isinstance(field.dataType, StructType)
+            and isinstance(full_type, StructType)
+            and field.dataType != full_type
+        ):
+            paths.extend(f"{field.name}.{sub}" for sub in field.dataType.fieldNames())
+        else:
+            paths.append(field.name)
+    return paths
+
+
+def projected_fields(table_options: Optional[dict], column: str) -> Optional[set]:
+    """
+    Fields of `column` a read has to return.
+
+    None means the whole column (or no projection was pushed down); an
+    empty set means the column is not read at all. For a struct column, the
+    set holds the names of its selected fields.
+    """
+    value = (table_options or {}).get(PROJECTION_OPTION)
+    if not value:
+        return None
+    fields = set()
+    for path in json.loads(value):
+        name, _, sub = path.partition(".")
+        if name != column:
+            continue
+        if not sub:
+            return None
+        fields.add(sub)
+    return fields
@@ -1,9 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from pyspark import pipelines as sdp
 from pyspark.sql.functions import col, expr
 from libs.spec_parser import SpecParser
 
 
+# Upper bound on concurrent schema lookups while planning the pipeline.
+_PLANNING_MAX_WORKERS = 16
+
+# Table option listing the tables read from one sweep of this table.
+_CO_READ_OPTION = "lakeflow.coRead"
+# Pseudo-table the co-read tables are streamed from, one row per record.
+_CO_READ_TABLE = "_lakeflow_co_read"
+
+
+def _with_schema(reader, schema):
+    """Apply a resolved schema to a reader, if there is one."""
+    return reader.schema(schema) if schema is not None else reader
+
+
+def _read_stream(
+    spark,
+    connection_name: str,
+    source_table: str,
+    table_config: dict[str, str],
+    schema=None,
+    co_read_view: str = None,
+):
+    """Stream a source table, or its rows of a co-read view"""
+    if co_read_view is not None:
+        return (
+            spark.readStream.table(co_read_view)
+            .where(col("tableName") == source_table)
+            .select(f"{source_table}.*")
+        )
+    return (
+        _with_schema(spark.readStream.format("lakeflow_connect"), schema)
+        .option("databricks.connection", connection_name)
+        .option("tableName", source_table)
+        .options(**table_config)
+        .load()
+    )
+
+
+def _create_co_read_view(
+    spark,
+    connection_name: str,
+    view_name: str,
+    table_names: List[str],
+    table_config: dict[str, str],
+) -> None:
+    """Create the view that streams several tables from one sweep of the first"""
+
+    @sdp.view(name=view_name)
+    def v():
+        return (
+            spark.readStream.format("lakeflow_connect")
+            .option("databricks.connection", connection_name)
+            .option("tableName", _CO_READ_TABLE)
+            .option("tableNameList", ",".join(table_names))
+            .options(**table_config)
+            .load()
+        )
+
+
 def _create_cdc_table(
     spark,
     connection_name: str,
@@ -14,17 +74,15 @@ def _create_cdc_table(
     scd_type: str,
     view_name: str,
     table_config: dict[str, str],
+    schema=None,
+    co_read_view: str = None,
 ) -> None:
     """Create CDC table using streaming and apply_changes"""
 
     @sdp.view(name=view_name)
     def v():
-        return (
-            spark.readStream.format("lakeflow_connect")
-            .option("databricks.connection", connection_name)
-            .option("tableName", source_table)
-            .options(**table_config)
-            .load()
+        return _read_stream(
+            spark, connection_name, source_table, table_config, schema, co_read_view
         )
 
     sdp.create_streaming_table(name=destination_table)
@@ -46,13 +104,14 @@ def _create_snapshot_table(
     scd_type: str,
     view_name: str,
     table_config: dict[str, str],
+    schema=None,
 ) -> None:
     """Create snapshot table using batch read and apply_changes_from_snapshot"""
 
     @sdp.view(name=view_name)
     def snapshot_view():
         return (
-            spark.read.format("lakeflow_connect")
+            _with_schema(spark.read.format("lakeflow_connect"), schema)
             .option("databricks.connection", connection_name)
             .option("tableName", source_table)
             .options(**table_config)
@@ -75,6 +134,8 @@ def _create_append_table(
     destination_table: str,
     view_name: str,
     table_config: dict[str, str],
+    schema=None,
+    co_read_view: str = None,
 ) -> None:
     """Create append table using streaming without apply_changes"""
 
@@ -82,12 +143,8 @@ def _create_append_table(
 
     @sdp.append_flow(name=view_name, target=destination_table)
     def af():
-        return (
-            spark.readStream.format("lakeflow_connect")
-            .option("databricks.connection", connection_name)
-            .option("tableName", source_table)
-            .options(**table_config)
-            .load()
+        return _read_stream(
+            spark, connection_name, source_table, table_config, schema, co_read_view
         )
 
 
@@ -113,6 +170,98 @@ def _get_table_metadata(spark, connection_name: str, table_list: list[str]) -> d
     return metadata
 
 
+def _get_table_schema(
+    spark, connection_name: str, table: str, table_config: dict[str, str]
+):
+    """Resolve the schema of one source table without reading any data"""
+    return (
+        spark.read.format("lakeflow_connect")
+        .option("databricks.connection", connection_name)
+        .option("tableName", table)
+        .options(**table_config)
+        .load()
+        .schema
+    )
+
+
+def _get_table_schemas(
+    spark, connection_name: str, table_configs: dict[str, dict[str, str]]
+) -> dict:
+    """Resolve the schemas of all source tables concurrently"""
+    tables = list(table_configs)
+    if not tables:
+        return {}
+    max_workers = min(len(tables), _PLANNING_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        schemas = executor.map(
+            lambda table: _get_table_schema(
+                spark, connection_name, table, table_configs[table]
+            ),
+            tables,
+        )
+        return dict(zip(tables, schemas))
+
+
+def _co_read_groups(
+    table_list: List[str], table_configs: dict[str, dict[str, str]]
+) -> tuple[dict[str, List[str]], List[str]]:
+    """
+    Group the tables read together through the `lakeflow.coRead` option.
+
+    Returns the groups, each keyed by the swept table and listing it first,
+    and the problems that make the grouping invalid.
+    """
+    groups = {}
+    problems = []
+    grouped = set()
+    for table in table_list:
+        value = table_configs[table].get(_CO_READ_OPTION, "")
+        members = [m.strip() for m in value.split(",") if m.strip()]
+        if not members:
+            continue
+        groups[table] = [table] + list(dict.fromkeys(members))
+        for member in groups[table]:
+            if member != table and member not in table_configs:
+                problems.append(
+                    f"{table}: co-read table {member!r} is not in the pipeline spec"
+                )
+            elif member in grouped:
+                problems.append(f"{member}: read by more than one co-read")
+            grouped.add(member)
+    return groups, problems
+
+
+def _validate_table_plan(
+    table: str,
+    ingestion_type: str,
+    primary_keys: List[str],
+    sequence_by: str,
+    schema,
+) -> List[str]:
+    """Return the problems that would make the flow for a table fail"""
+    problems = []
+    if ingestion_type not in ("cdc", "snapshot", "append"):
+        problems.append(f"{table}: unsupported ingestion_type {ingestion_type!r}")
+        return problems
+    if ingestion_type in ("cdc", "snapshot") and not primary_keys:
+        problems.append(f"{table}: primary_keys are required for {ingestion_type}")
+    if ingestion_type == "cdc" and not sequence_by:
+        problems.append(f"{table}: sequence_by (or a cursor_field) is required for cdc")
+
+    if schema is None:
+        return problems
+    columns = set(schema.fieldNames())
+    for key in primary_keys or []:
+        if key.split(".")[0] not in columns:
+            problems.append(f"{table}: primary key {key!r} is not in the table schema")
+    if ingestion_type == "cdc" and sequence_by:
+        if sequence_by.split(".")[0] not in columns:
+            problems.append(
+                f"{table}: sequence_by column {sequence_by!r} is not in the table schema"
+            )
+    return problems
+
+
 def ingest(spark, pipeline_spec: dict) -> None:
     """Ingest a list of tables"""
 
@@ -121,16 +270,32 @@ def ingest(spark, pipeline_spec: dict) -> None:
     connection_name = spec.connection_name()
     table_list = spec.get_table_list()
 
-    metadata = _get_table_metadata(spark, connection_name, table_list)
+    table_configs = {
+        table: spec.get_table_configuration(table) for table in table_list
+    }
 
-    def _ingest_table(table: str) -> None:
-        """Helper function to ingest a single table"""
+    # Planning: resolve metadata and schemas for all tables up front, in
+    # parallel, so every flow starts from an already-resolved schema.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        metadata_future = executor.submit(
+            _get_table_metadata, spark, connection_name, table_list
+        )
+        schemas = _get_table_schemas(spark, connection_name, table_configs)
+        metadata = metadata_future.result()
+
+    # Tables read from one sweep of another table, keyed by table.
+    co_read_groups, problems = _co_read_groups(table_list, table_configs)
+    co_read_views = {
+        member: table + "_co_read"
+        for table, members in co_read_groups.items()
+        for member in members
+    }
+
+    plans = {}
+    for table in table_list:
         primary_keys = metadata[table].get("primary_keys")
         cursor_field = metadata[table].get("cursor_field")
         ingestion_type = metadata[table].get("ingestion_type", "cdc")
-        view_name = table + "_staging"
-        table_config = spec.get_table_configuration(table)
-        destination_table = spec.get_full_destination_table_name(table)
 
         # Override parameters with spec values if available
         primary_keys = spec.get_primary_keys(table) or primary_keys
@@ -140,6 +305,44 @@ def ingest(spark, pipeline_spec: dict) -> None:
             ingestion_type = "append"
         scd_type = "2" if scd_type_raw == "SCD_TYPE_2" else "1"
 
+        schema = schemas.get(table)
+        if table in co_read_views and ingestion_type == "snapshot":
+            problems.append(
+                f"{table}: co-read tables are streamed, so they cannot be "
+                "ingested as snapshots"
+            )
+        problems.extend(
+            _validate_table_plan(
+                table, ingestion_type, primary_keys, sequence_by, schema
+            )
+        )
+        plans[table] = (ingestion_type, primary_keys, sequence_by, scd_type, schema)
+
+    if problems:
+        raise ValueError(
+            "Invalid pipeline spec:\n" + "\n".join(f"  - {p}" for p in problems)
+        )
+
+    for table, members in co_read_groups.items():
+        _create_co_read_view(
+            spark,
+            connection_name,
+            co_read_views[table],
+            members,
+            table_configs[table],
+        )
+
+    def _ingest_table(table: str) -> None:
+        """Helper function to ingest a single table"""
+        ingestion_type, primary_keys, sequence_by, scd_type, schema = plans[table]
+        view_name = table + "_staging"
+        table_config = table_configs[table]
+        destination_table = spec.get_full_destination_table_name(table)
+        # Co-read tables stream their rows of the shared sweep.
+        co_read = {}
+        if table in co_read_views:
+            co_read["co_read_view"] = co_read_views[table]
+
         if ingestion_type == "cdc":
             _create_cdc_table(
                 spark,
@@ -151,6 +354,8 @@ def ingest(spark, pipeline_spec: dict) -> None:
                 scd_type,
                 view_name,
                 table_config,
+                schema,
+                **co_read,
             )
         elif ingestion_type == "snapshot":
             _create_snapshot_table(
@@ -162,6 +367,7 @@ def ingest(spark, pipeline_spec: dict) -> None:
                 scd_type,
                 view_name,
                 table_config,
+                schema,
             )
         elif ingestion_type == "append":
             _create_append_table(
@@ -171,6 +377,8 @@ def ingest(spark, pipeline_spec: dict) -> None:
                 destination_table,
                 view_name,
                 table_config,
+                schema,
+                **co_read,
             )
 
     for table_name in table_list:
@@ -1,24 +1,156 @@
 from pyspark.sql.types import *
 from pyspark.sql.datasource import (
     DataSource,
+    DataSourceStreamReader,
     SimpleDataSourceStreamReader,
     DataSourceReader,
+    InputPartition,
 )
+from datetime import datetime, timezone
 from typing import Iterator
+import json
+import time
+from libs.metrics import (
+    DEFAULT_METRICS_PATH,
+    METRICS_PATH_OPTION,
+    ReadMetrics,
+    append_metrics_line,
+    read_metrics_lines,
+    timed_rows,
+)
+from libs.profiling import ReadProfiler
+from libs.utils import (
+    COLUMNS_OPTION,
+    PROJECTION_OPTION,
+    PUSHED_FILTERS_OPTION,
+    matches_filters,
+    projection_paths,
+    prune_schema,
+    to_pushed_filter,
+)
 from sources.interface.lakeflow_connect import LakeflowConnect
 
 
 METADATA_TABLE = "_lakeflow_metadata"
+METRICS_TABLE = "_lakeflow_metrics"
 TABLE_NAME = "tableName"
 TABLE_NAME_LIST = "tableNameList"
+# Set to "false" to stop logging (and saving) a metrics line per micro-batch.
+METRICS_LOG_OPTION = "lakeflow.metrics"
+# Set to "true" to read micro-batches with LakeflowPartitionedStreamReader.
+PARTITIONED_STREAM_OPTION = "lakeflow.partitionedStream"
+# Connector methods a partitioned stream needs.
+PARTITIONED_STREAM_METHODS = ("latest_offset", "partition_offsets", "read_offset_range")
+# Pseudo-table that reads the tables in `tableNameList` from one sweep of the
+# first one, through the connector's `read_co_read`.
+CO_READ_TABLE = "_lakeflow_co_read"
+
+METRICS_SCHEMA = StructType(
+    [
+        StructField("tableName", StringType(), False),
+        StructField("requests", LongType(), True),
+        StructField("retries", LongType(), True),
+        StructField("throttled", LongType(), True),
+        StructField("errors", LongType(), True),
+        StructField("bytes_downloaded", LongType(), True),
+        StructField("records", LongType(), True),
+        StructField("read_seconds", DoubleType(), True),
+        StructField("fetch_seconds", DoubleType(), True),
+        StructField("parse_seconds", DoubleType(), True),
+        StructField(
+            "endpoints",
+            ArrayType(
+                StructType(
+                    [
+                        StructField("endpoint", StringType(), True),
+                        StructField("requests", LongType(), True),
+                        StructField("total_ms", DoubleType(), True),
+                        StructField("max_ms", DoubleType(), True),
+                        StructField("buckets", ArrayType(LongType()), True),
+                    ]
+                )
+            ),
+            True,
+        ),
+        StructField("logged_at", TimestampType(), True),
+        StructField("start_offset", StringType(), True),
+        StructField("end_offset", StringType(), True),
+    ]
+)
+
+
+def _log_metrics(options: dict[str, str], metrics: dict, **context) -> None:
+    """
+    Print the metrics of one read as a single JSON line, and append it to the
+    table's metrics log for `_lakeflow_metrics`.
+    """
+    if options.get(METRICS_LOG_OPTION, "true").lower() == "false":
+        return
+    line = {
+        "event": "lakeflow_connect_metrics",
+        "table": options.get(TABLE_NAME),
+        "logged_at": datetime.now(timezone.utc).isoformat(),
+        **context,
+        **metrics,
+    }
+    append_metrics_line(
+        options.get(METRICS_PATH_OPTION) or DEFAULT_METRICS_PATH,
+        options.get(TABLE_NAME),
+        line,
+    )
+    print(json.dumps(line, default=str))
+
+
+def co_read_schema(table_schemas: dict) -> StructType:
+    """
+    Schema of the co-read pseudo-table: the name of the table a row belongs
+    to, then one struct column per table holding its records.
+    """
+    return StructType(
+        [StructField(TABLE_NAME, StringType(), False)]
+        + [
+            StructField(table, schema, True)
+            for table, schema in table_schemas.items()
+        ]
+    )
+
+
+class LakeflowCoRead:
+    """
+    Reads the co-read pseudo-table through a connector's `read_co_read`.
+
+    `read_co_read(table_names, start_offset, table_options)` returns
+    `(table_name, record)` pairs and one offset for the whole sweep. Each pair
+    becomes a row of `co_read_schema`, so the readers can treat the sweep as
+    a single table.
+    """
+
+    def __init__(self, lakeflow_connect: LakeflowConnect, table_names: list[str]):
+        if not hasattr(lakeflow_connect, "read_co_read"):
+            raise ValueError(
+                f"{CO_READ_TABLE} needs a connector that implements read_co_read"
+            )
+        if not table_names:
+            raise ValueError(f"{CO_READ_TABLE} needs a {TABLE_NAME_LIST}")
+        self.lakeflow_connect = lakeflow_connect
+        self.table_names = table_names
+
+    def read_table(
+        self, table_name: str, start_offset: dict, table_options: dict[str, str]
+    ) -> (Iterator[dict], dict):
+        records, offset = self.lakeflow_connect.read_co_read(
+            self.table_names, start_offset, table_options
+        )
+        return ({TABLE_NAME: name, name: record} for name, record in records), offset
 
 
 class LakeflowStreamReader(SimpleDataSourceStreamReader):
     """
     Implements a data source stream reader for Lakeflow Connect.
-    Currently, only the simpleStreamReader is implemented, which uses a
-    more generic protocol suitable for most data sources that support
-    incremental loading.
+    This is the default simpleStreamReader, which uses a more generic
+    protocol suitable for most data sources that support incremental
+    loading. Every micro-batch is read by a single reader on the driver;
+    see LakeflowPartitionedStreamReader for connectors that can split one.
     """
 
     def __init__(
@@ -26,20 +158,36 @@ class LakeflowStreamReader(SimpleDataSourceStreamReader):
         options: dict[str, str],
         schema: StructType,
         lakeflow_connect: LakeflowConnect,
+        metrics: ReadMetrics,
     ):
         self.options = options
         self.lakeflow_connect = lakeflow_connect
         self.schema = schema
+        self.metrics = metrics
 
     def initialOffset(self):
         return {}
 
     def read(self, start: dict) -> (Iterator[tuple], dict):
-        records, offset = self.lakeflow_connect.read_table(
-            self.options["tableName"], start, self.options
+        profiler = ReadProfiler(self.options, "stream", start_offset=start)
+        started = time.perf_counter()
+        with profiler:
+            records, offset = self.lakeflow_connect.read_table(
+                self.options["tableName"], start, self.options
+            )
+        rows = timed_rows(
+            records,
+            lambda x: parse_value(x, self.schema),
+            self.metrics,
+            time.perf_counter() - started,
+            on_complete=lambda: _log_metrics(
+                self.options,
+                self.metrics.collect(),
+                start_offset=start,
+                end_offset=offset,
+            ),
         )
-        rows = map(lambda x: parse_value(x, self.schema), records)
-        return rows, offset
+        return profiler.rows(rows), offset
 
     def readBetweenOffsets(self, start: dict, end: dict) -> Iterator[tuple]:
         # TODO: This does not ensure the records returned are identical across repeated calls.
@@ -50,33 +198,208 @@ class LakeflowStreamReader(SimpleDataSourceStreamReader):
         return self.read(start)[0]
 
 
+class LakeflowPartitionedStreamReader(DataSourceStreamReader):
+    """
+    Stream reader that splits every micro-batch into partitions read by the
+    executors in parallel.
+
+    Used instead of LakeflowStreamReader when the `lakeflow.partitionedStream`
+    option is `true`. The driver only plans: the connector's `latest_offset`
+    picks the end offset of the next micro-batch without reading records, and
+    `partition_offsets` splits the range between two offsets into independent
+    `(start, end)` pairs (per repository, per time window, ...). Each
+    executor then reads one pair with `read_offset_range`.
+    """
+
+    def __init__(
+        self,
+        options: dict[str, str],
+        schema: StructType,
+        lakeflow_connect: LakeflowConnect,
+        metrics: ReadMetrics,
+    ):
+        self.options = options
+        self.schema = schema
+        self.lakeflow_connect = lakeflow_connect
+        self.metrics = metrics
+        self.table_name = options[TABLE_NAME]
+        # Last planned offset, the start of the next micro-batch on runtimes
+        # that call latestOffset() without one.
+        self.latest = None
+
+    def initialOffset(self):
+        return {}
+
+    def latestOffset(self, start: dict = None, limit=None) -> dict:
+        if start is None:
+            start = self.latest if self.latest is not None else self.initialOffset()
+        self.latest = self.lakeflow_connect.latest_offset(
+            self.table_name, start, self.options
+        )
+        return self.latest
+
+    def partitions(self, start: dict, end: dict):
+        return [
+            InputPartition({"start": part_start, "end": part_end})
+            for part_start, part_end in self.lakeflow_connect.partition_offsets(
+                self.table_name, start, end, self.options
+            )
+        ]
+
+    def read(self, partition) -> Iterator[tuple]:
+        start, end = partition.value["start"], partition.value["end"]
+        profiler = ReadProfiler(self.options, "stream", start_offset=start)
+        started = time.perf_counter()
+        with profiler:
+            records = self.lakeflow_connect.read_offset_range(
+                self.table_name, start, end, self.options
+            )
+        rows = timed_rows(
+            records,
+            lambda x: parse_value(x, self.schema),
+            self.metrics,
+            time.perf_counter() - started,
+            on_complete=lambda: _log_metrics(
+                self.options,
+                self.metrics.collect(),
+                start_offset=start,
+                end_offset=end,
+            ),
+        )
+        return profiler.rows(rows)
+
+    def commit(self, end: dict) -> None:
+        pass
+
+
 class LakeflowBatchReader(DataSourceReader):
     def __init__(
         self,
         options: dict[str, str],
         schema: StructType,
         lakeflow_connect: LakeflowConnect,
+        metrics: ReadMetrics,
     ):
         self.options = options
         self.schema = schema
         self.lakeflow_connect = lakeflow_connect
+        self.metrics = metrics
         self.table_name = options[TABLE_NAME]
+        # `(column, op, value)` filters accepted by `pushFilters`
+        self.pushed_filters = []
+        # Columns read when `lakeflow.columns` pruned `schema`, else None.
+        # Without the option the table's schema is not looked up again: for
+        # some connectors that costs API calls (e.g. HubSpot property
+        # discovery), and a schema given by the user is passed through as is.
+        self.projection = None
+        if self.table_name not in (
+            METADATA_TABLE,
+            METRICS_TABLE,
+            CO_READ_TABLE,
+        ) and options.get(COLUMNS_OPTION):
+            self.projection = projection_paths(
+                schema, lakeflow_connect.get_table_schema(self.table_name, options)
+            )
+
+    def pushFilters(self, filters):
+        """
+        Push down the filters the connector can turn into API parameters.
+
+        Connectors opt in with `supported_filters(table_name, table_options)`,
+        which maps column names to the operators they accept. Accepted
+        filters are passed to `read_table` in the `lakeflow.pushedFilters`
+        option so the connector can narrow its requests, and rows that do
+        not match them are dropped after parsing. The other filters are
+        returned to Spark.
+        """
+        supported_filters = getattr(self.lakeflow_connect, "supported_filters", None)
+        if supported_filters is None or self.table_name in (
+            METADATA_TABLE,
+            METRICS_TABLE,
+        ):
+            return filters
+        supported = supported_filters(self.table_name, self.options) or {}
+        unhandled = []
+        for spark_filter in filters:
+            pushed = to_pushed_filter(spark_filter)
+            if pushed is not None and pushed[1] in supported.get(pushed[0], ()):
+                self.pushed_filters.append(pushed)
+            else:
+                unhandled.append(spark_filter)
+        return unhandled
+
+    def partitions(self):
+        # Metadata lookups can each cost API calls, so give every table its
+        # own partition; resolution then takes as long as the slowest table
+        # rather than the sum of all of them.
+        if self.table_name in (METADATA_TABLE, METRICS_TABLE):
+            table_names = self._metadata_table_names()
+            if table_names:
+                return [InputPartition(table) for table in table_names]
+        return [InputPartition(None)]
 
     def read(self, partition):
         all_records = []
-        if self.table_name == METADATA_TABLE:
-            all_records = self._read_table_metadata()
-        else:
+        if self.table_name in (METADATA_TABLE, METRICS_TABLE):
+            table_names = self._metadata_table_names()
+            if partition is not None and partition.value is not None:
+                table_names = [partition.value]
+            if self.table_name == METRICS_TABLE:
+                all_records = self._read_table_metrics(table_names)
+            else:
+                all_records = self._read_table_metadata(table_names)
+            return iter(map(lambda x: parse_value(x, self.schema), all_records))
+
+        options = dict(self.options)
+        if self.pushed_filters:
+            options[PUSHED_FILTERS_OPTION] = json.dumps(self.pushed_filters)
+        if self.projection is not None:
+            options[PROJECTION_OPTION] = json.dumps(self.projection)
+        profiler = ReadProfiler(self.options, "batch")
+        started = time.perf_counter()
+        with profiler:
             all_records, _ = self.lakeflow_connect.read_table(
-                self.table_name, None, self.options
+                self.table_name, None, options
             )
+        rows = timed_rows(
+            all_records,
+            lambda x: parse_value(x, self.schema),
+            self.metrics,
+            time.perf_counter() - started,
+            on_complete=lambda: _log_metrics(self.options, self.metrics.collect()),
+        )
+        if self.pushed_filters:
+            rows = (row for row in rows if matches_filters(row, self.pushed_filters))
+        return profiler.rows(rows)
 
-        rows = map(lambda x: parse_value(x, self.schema), all_records)
-        return iter(rows)
-
-    def _read_table_metadata(self):
+    def _metadata_table_names(self) -> list[str]:
         table_name_list = self.options.get(TABLE_NAME_LIST, "")
-        table_names = [o.strip() for o in table_name_list.split(",") if o.strip()]
+        return [o.strip() for o in table_name_list.split(",") if o.strip()]
+
+    def _read_table_metrics(self, table_names: list[str]):
+        """
+        Return the metrics logged by the reads of each table, one row per
+        micro-batch (or batch read), oldest first. Nothing is read from the
+        source; stream offsets are returned as JSON strings.
+        """
+        directory = self.options.get(METRICS_PATH_OPTION) or DEFAULT_METRICS_PATH
+        all_records = []
+        for table in table_names:
+            for line in read_metrics_lines(directory, table):
+                all_records.append(
+                    {
+                        **line,
+                        "tableName": table,
+                        **{
+                            key: json.dumps(line[key])
+                            for key in ("start_offset", "end_offset")
+                            if key in line
+                        },
+                    }
+                )
+        return all_records
+
+    def _read_table_metadata(self, table_names: list[str]):
         all_records = []
         for table in table_names:
             metadata = self.lakeflow_connect.read_table_metadata(table, self.options)
@@ -88,6 +411,11 @@ class LakeflowSource(DataSource):
     def __init__(self, options):
         self.options = options
         self.lakeflow_connect = LakeflowConnect(options)
+        # Connectors that instrument their HTTP calls expose a `metrics`
+        # attribute; the others still get record and timing counters.
+        self.metrics = getattr(self.lakeflow_connect, "metrics", None)
+        if not isinstance(self.metrics, ReadMetrics):
+            self.metrics = ReadMetrics()
 
     @classmethod
     def name(cls):
@@ -104,15 +432,67 @@ class LakeflowSource(DataSource):
                     StructField("ingestion_type", StringType(), True),
                 ]
             )
+        elif table == METRICS_TABLE:
+            return METRICS_SCHEMA
+        elif table == CO_READ_TABLE:
+            return co_read_schema(
+                {
+                    name: self.lakeflow_connect.get_table_schema(name, self.options)
+                    for name in self._table_name_list()
+                }
+            )
         else:
             # Assuming the LakeflowConnect interface uses get_table_schema, not get_table_details
-            return self.lakeflow_connect.get_table_schema(table, self.options)
+            schema = self.lakeflow_connect.get_table_schema(table, self.options)
+            columns = self.options.get(COLUMNS_OPTION)
+            if columns:
+                schema = prune_schema(
+                    schema, [c.strip() for c in columns.split(",") if c.strip()]
+                )
+            return schema
 
     def reader(self, schema: StructType):
-        return LakeflowBatchReader(self.options, schema, self.lakeflow_connect)
+        return LakeflowBatchReader(
+            self.options, schema, self._table_reader(), self.metrics
+        )
+
+    def streamReader(self, schema: StructType):
+        # Without the option, the base class raises the not-implemented error
+        # that makes Spark fall back to simpleStreamReader.
+        if self.options.get(PARTITIONED_STREAM_OPTION, "false").lower() != "true":
+            return super().streamReader(schema)
+        if self.options[TABLE_NAME] == CO_READ_TABLE:
+            raise ValueError(
+                f"{PARTITIONED_STREAM_OPTION} does not apply to {CO_READ_TABLE}"
+            )
+        missing = [
+            method
+            for method in PARTITIONED_STREAM_METHODS
+            if not hasattr(self.lakeflow_connect, method)
+        ]
+        if missing:
+            raise ValueError(
+                f"{PARTITIONED_STREAM_OPTION} is set, but the connector does not "
+                f"implement {', '.join(missing)}"
+            )
+        return LakeflowPartitionedStreamReader(
+            self.options, schema, self.lakeflow_connect, self.metrics
+        )
 
     def simpleStreamReader(self, schema: StructType):
-        return LakeflowStreamReader(self.options, schema, self.lakeflow_connect)
+        return LakeflowStreamReader(
+            self.options, schema, self._table_reader(), self.metrics
+        )
+
+    def _table_name_list(self) -> list[str]:
+        table_name_list = self.options.get(TABLE_NAME_LIST, "")
+        return [o.strip() for o in table_name_list.split(",") if o.strip()]
+
+    def _table_reader(self):
+        """The object whose `read_table` serves `tableName`."""
+        if self.options[TABLE_NAME] == CO_READ_TABLE:
+            return LakeflowCoRead(self.lakeflow_connect, self._table_name_list())
+        return self.lakeflow_connect
 
 
 spark.dataSource.register(LakeflowSource)
@@ -0,0 +1,254 @@
+"""
+Tests for the readers in pipeline/lakeflow_python_source.py.
+
+The module is meant to be merged into a connector source (see
+scripts/merge_python_source.py), so it is executed here with a stand-in
+`spark` session and an in-memory connector. It is loaded at import time, before
+test_ingestion_pipeline.py replaces the pyspark modules with mocks.
+"""
+
+import json
+import os
+from unittest.mock import Mock
+
+import pytest
+from pyspark.errors import PySparkNotImplementedError
+from pyspark.sql.types import LongType, StringType, StructField, StructType
+
+from libs.utils import parse_value
+
+SOURCE = os.path.join(os.path.dirname(__file__), "..", "lakeflow_python_source.py")
+
+SCHEMA = StructType(
+    [
+        StructField("id", LongType(), False),
+        StructField("name", StringType(), True),
+    ]
+)
+
+
+def load_pipeline_source() -> dict:
+    namespace = {"spark": Mock(), "parse_value": parse_value}
+    with open(SOURCE) as source:
+        exec(compile(source.read(), SOURCE, "exec"), namespace)
+    namespace["LakeflowConnect"] = FakeConnector
+    return namespace
+
+
+class FakeConnector:
+    """In-memory connector that records the calls the readers make."""
+
+    def __init__(self, options):
+        self.options = options
+        self.calls = []
+
+    def list_tables(self):
+        return ["a", "b", "c"]
+
+    def get_table_schema(self, table_name, table_options):
+        self.calls.append(("get_table_schema", table_name))
+        return SCHEMA
+
+    def read_table_metadata(self, table_name, table_options):
+        self.calls.append(("read_table_metadata", table_name))
+        return {
+            "primary_keys": ["id"],
+            "cursor_field": "id",
+            "ingestion_type": "cdc",
+        }
+
+    def read_table(self, table_name, start_offset, table_options):
+        self.calls.append(("read_table", table_name))
+        self.read_options = table_options
+        return iter([{"id": 1, "name": table_name}]), {}
+
+
+class FakePartitionedConnector(FakeConnector):
+    """Connector whose stream offsets count records, two per partition."""
+
+    def latest_offset(self, table_name, start_offset, table_options):
+        self.calls.append(("latest_offset", table_name))
+        return {"n": start_offset.get("n", 0) + 4}
+
+    def partition_offsets(self, table_name, start_offset, end_offset, table_options):
+        bounds = range(start_offset.get("n", 0), end_offset["n"] + 1, 2)
+        return [({"n": low}, {"n": high}) for low, high in zip(bounds, bounds[1:])]
+
+    def read_offset_range(self, table_name, start_offset, end_offset, table_options):
+        self.calls.append(("read_offset_range", start_offset["n"]))
+        return iter(
+            {"id": n, "name": table_name}
+            for n in range(start_offset["n"], end_offset["n"])
+        )
+
+
+class FakeCoReadConnector(FakeConnector):
+    """Connector whose sweep of table `a` also returns a record of `b`."""
+
+    def read_co_read(self, table_names, start_offset, table_options):
+        self.calls.append(("read_co_read", tuple(table_names)))
+        return [("a", {"id": 1, "name": "x"}), ("b", {"id": 2, "name": "y"})], {
+            "n": 1
+        }
+
+
+PIPELINE = load_pipeline_source()
+
+
+def make_source(**options):
+    return PIPELINE["LakeflowSource"](options)
+
+
+class TestMetadataPartitions:
+    def test_each_table_is_read_in_its_own_partition(self):
+        source = make_source(
+            tableName=PIPELINE["METADATA_TABLE"], tableNameList="a, b,c"
+        )
+        reader = source.reader(source.schema())
+
+        partitions = reader.partitions()
+
+        assert [partition.value for partition in partitions] == ["a", "b", "c"]
+        rows = list(reader.read(partitions[1]))
+        assert [row[0] for row in rows] == ["b"]
+        assert rows[0][1] == ["id"]
+        assert source.lakeflow_connect.calls == [("read_table_metadata", "b")]
+
+    def test_metrics_are_the_lines_logged_by_earlier_reads(self, tmp_path):
+        path = {PIPELINE["METRICS_PATH_OPTION"]: str(tmp_path)}
+        batch = make_source(tableName="a", **path)
+        batch_reader = batch.reader(batch.schema())
+        list(batch_reader.read(batch_reader.partitions()[0]))
+        stream = make_source(tableName="a", **path).simpleStreamReader(SCHEMA)
+        list(stream.read({"n": 0})[0])
+        source = make_source(
+            tableName=PIPELINE["METRICS_TABLE"], tableNameList="a,b", **path
+        )
+        reader = source.reader(source.schema())
+
+        partitions = reader.partitions()
+        rows = list(reader.read(partitions[0]))
+
+        assert [partition.value for partition in partitions] == ["a", "b"]
+        assert [(row[0], row[6]) for row in rows] == [("a", 1), ("a", 1)]
+        assert [(row.start_offset, row.end_offset) for row in rows] == [
+            (None, None),
+            ('{"n": 0}', "{}"),
+        ]
+        assert rows[0].logged_at <= rows[1].logged_at
+        # The metrics table never reads the source.
+        assert source.lakeflow_connect.calls == []
+        assert list(reader.read(partitions[1])) == []
+
+    def test_without_a_table_list_one_partition_reads_nothing(self):
+        source = make_source(tableName=PIPELINE["METADATA_TABLE"])
+        reader = source.reader(source.schema())
+
+        (partition,) = reader.partitions()
+
+        assert partition.value is None
+        assert list(reader.read(partition)) == []
+
+
+class TestBatchProjection:
+    def test_without_columns_the_schema_is_not_looked_up_again(self):
+        source = make_source(tableName="a")
+        reader = source.reader(StructType([SCHEMA["id"]]))
+
+        rows = list(reader.read(reader.partitions()[0]))
+
+        assert rows == [(1,)]
+        assert source.lakeflow_connect.calls == [("read_table", "a")]
+        assert PIPELINE["PROJECTION_OPTION"] not in source.lakeflow_connect.read_options
+
+    def test_columns_pass_the_projection_to_the_connector(self):
+        source = make_source(tableName="a", **{PIPELINE["COLUMNS_OPTION"]: "name"})
+        reader = source.reader(source.schema())
+
+        rows = list(reader.read(reader.partitions()[0]))
+
+        assert rows == [("a",)]
+        assert source.lakeflow_connect.read_options[
+            PIPELINE["PROJECTION_OPTION"]
+        ] == json.dumps(["name"])
+
+
+class TestPartitionedStream:
+    def test_without_the_option_spark_falls_back_to_the_simple_reader(self):
+        source = make_source(tableName="a")
+
+        with pytest.raises(PySparkNotImplementedError):
+            source.streamReader(SCHEMA)
+        assert isinstance(
+            source.simpleStreamReader(SCHEMA), PIPELINE["LakeflowStreamReader"]
+        )
+
+    def test_option_requires_the_connector_methods(self):
+        source = make_source(
+            tableName="a", **{PIPELINE["PARTITIONED_STREAM_OPTION"]: "true"}
+        )
+
+        with pytest.raises(ValueError, match="latest_offset"):
+            source.streamReader(SCHEMA)
+
+    def test_partitioned_reader_plans_ranges_and_reads_each_one(self):
+        options = {"tableName": "a", PIPELINE["PARTITIONED_STREAM_OPTION"]: "true"}
+        source = make_source(**options)
+        source.lakeflow_connect = FakePartitionedConnector(options)
+        reader = source.streamReader(SCHEMA)
+        assert isinstance(reader, PIPELINE["LakeflowPartitionedStreamReader"])
+
+        # Runtimes without admission control call latestOffset() bare.
+        assert reader.latestOffset() == {"n": 4}
+        assert reader.latestOffset() == {"n": 8}
+        assert reader.latestOffset({"n": 0}, None) == {"n": 4}
+
+        partitions = reader.partitions({"n": 0}, {"n": 4})
+        rows = [list(reader.read(partition)) for partition in partitions]
+
+        assert [partition.value for partition in partitions] == [
+            {"start": {"n": 0}, "end": {"n": 2}},
+            {"start": {"n": 2}, "end": {"n": 4}},
+        ]
+        assert rows == [[(0, "a"), (1, "a")], [(2, "a"), (3, "a")]]
+        assert ("read_table", "a") not in source.lakeflow_connect.calls
+
+
+class TestCoRead:
+    def make_co_read_source(self, connector_class, **options):
+        options = {
+            "tableName": PIPELINE["CO_READ_TABLE"],
+            "tableNameList": "a,b",
+            **options,
+        }
+        source = make_source(**options)
+        source.lakeflow_connect = connector_class(options)
+        return source
+
+    def test_schema_has_a_struct_column_per_table(self):
+        source = self.make_co_read_source(FakeCoReadConnector)
+
+        schema = source.schema()
+
+        assert schema.fieldNames() == ["tableName", "a", "b"]
+        assert schema["a"].dataType == SCHEMA
+
+    def test_one_sweep_becomes_rows_of_every_table(self):
+        source = self.make_co_read_source(FakeCoReadConnector)
+        reader = source.simpleStreamReader(source.schema())
+
+        rows, offset = reader.read({})
+        rows = list(rows)
+
+        assert offset == {"n": 1}
+        assert [(row[0], row[1], row[2]) for row in rows] == [
+            ("a", (1, "x"), None),
+            ("b", None, (2, "y")),
+        ]
+        assert source.lakeflow_connect.calls.count(("read_co_read", ("a", "b"))) == 1
+
+    def test_connector_must_implement_read_co_read(self):
+        source = self.make_co_read_source(FakeConnector)
+
+        with pytest.raises(ValueError, match="read_co_read"):
+            source.simpleStreamReader(SCHEMA)
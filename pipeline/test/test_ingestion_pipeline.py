@@ -24,7 +24,32 @@ sys.modules["pyspark.sql"] = mock_pyspark.sql
 sys.modules["pyspark.sql.functions"] = mock_pyspark.sql.functions
 
 # Now import the module under test
-from pipeline.ingestion_pipeline import ingest
+from pipeline.ingestion_pipeline import ingest, _get_table_schemas
+
+
+# Every column referenced as a primary key or sequence_by in these tests.
+SCHEMA_COLUMNS = [
+    "user_id",
+    "tenant_id",
+    "updated_at",
+    "created_at",
+    "order_id",
+    "modified_at",
+    "event_id",
+    "timestamp",
+    "custom_timestamp",
+    "custom_field",
+    "id",
+    "composite_key_1",
+    "composite_key_2",
+]
+
+
+def make_schema(columns):
+    """Create a stand-in for a StructType with the given top-level columns."""
+    schema = Mock()
+    schema.fieldNames.return_value = list(columns)
+    return schema
 
 
 @pytest.fixture
@@ -33,6 +58,23 @@ def mock_spark():
     return Mock()
 
 
+@pytest.fixture(autouse=True)
+def table_schemas():
+    """Resolved schemas returned by _get_table_schemas, one per table."""
+    schemas = {}
+
+    def resolve(spark, connection_name, table_configs):
+        for table in table_configs:
+            schemas.setdefault(table, make_schema(SCHEMA_COLUMNS))
+        return {table: schemas[table] for table in table_configs}
+
+    with patch(
+        "pipeline.ingestion_pipeline._get_table_schemas", side_effect=resolve
+    ) as mock_schemas:
+        mock_schemas.schemas = schemas
+        yield mock_schemas
+
+
 @pytest.fixture
 def base_metadata():
     """Base metadata returned by _get_table_metadata."""
@@ -58,7 +100,9 @@ def base_metadata():
 class TestIngestCDC:
     """Test CDC ingestion scenarios."""
 
-    def test_cdc_ingestion_with_default_scd_type(self, mock_spark, base_metadata):
+    def test_cdc_ingestion_with_default_scd_type(
+        self, mock_spark, base_metadata, table_schemas
+    ):
         """Test CDC ingestion with default SCD type (1)."""
         spec = {
             "connection_name": "test_connection",
@@ -96,6 +140,7 @@ class TestIngestCDC:
                 "1",  # default scd_type
                 "users_staging",  # view_name
                 {},  # table_config
+                table_schemas.schemas["users"],  # resolved schema
             )
 
     def test_cdc_ingestion_with_scd_type_2(self, mock_spark, base_metadata):
@@ -182,7 +227,9 @@ class TestIngestCDC:
 class TestIngestSnapshot:
     """Test snapshot ingestion scenarios."""
 
-    def test_snapshot_ingestion_with_default_scd_type(self, mock_spark, base_metadata):
+    def test_snapshot_ingestion_with_default_scd_type(
+        self, mock_spark, base_metadata, table_schemas
+    ):
         """Test snapshot ingestion with default SCD type."""
         spec = {
             "connection_name": "test_connection",
@@ -212,6 +259,7 @@ class TestIngestSnapshot:
                 "1",  # default scd_type
                 "orders_staging",  # view_name
                 {},  # table_config
+                table_schemas.schemas["orders"],  # resolved schema
             )
 
     def test_snapshot_ingestion_with_scd_type_2(self, mock_spark, base_metadata):
@@ -243,7 +291,9 @@ class TestIngestSnapshot:
 class TestIngestAppend:
     """Test append-only ingestion scenarios."""
 
-    def test_append_ingestion_from_metadata(self, mock_spark, base_metadata):
+    def test_append_ingestion_from_metadata(
+        self, mock_spark, base_metadata, table_schemas
+    ):
         """Test append ingestion when ingestion_type is 'append' in metadata."""
         spec = {
             "connection_name": "test_connection",
@@ -271,6 +321,7 @@ class TestIngestAppend:
                 "events",  # destination_table (defaults to source_table)
                 "events_staging",  # view_name
                 {},  # table_config
+                table_schemas.schemas["events"],  # resolved schema
             )
 
     def test_append_ingestion_from_scd_type_append_only(
@@ -720,3 +771,248 @@ class TestDestinationTable:
             assert (
                 mock_cdc.call_args[0][3] == "`my_catalog`.`my_schema`.`users`"
             )  # destination_table
+
+
+class TestPlanning:
+    """Test the planning stage that resolves schemas and validates tables."""
+
+    def test_schemas_resolved_for_all_tables(
+        self, mock_spark, base_metadata, table_schemas
+    ):
+        """Test that schemas are resolved once, for all tables, with their configs."""
+        spec = {
+            "connection_name": "test_connection",
+            "objects": [
+                {
+                    "table": {
+                        "source_table": "users",
+                        "table_configuration": {"page_size": "50"},
+                    }
+                },
+                {
+                    "table": {
+                        "source_table": "orders",
+                        "table_configuration": {},
+                    }
+                },
+            ],
+        }
+
+        with patch(
+            "pipeline.ingestion_pipeline._get_table_metadata",
+            return_value=base_metadata,
+        ), patch("pipeline.ingestion_pipeline._create_cdc_table"), patch(
+            "pipeline.ingestion_pipeline._create_snapshot_table"
+        ):
+            ingest(mock_spark, spec)
+
+        table_schemas.assert_called_once_with(
+            mock_spark,
+            "test_connection",
+            {"users": {"page_size": "50"}, "orders": {}},
+        )
+
+    def test_get_table_schemas_reads_each_table(self):
+        """Test that _get_table_schemas returns the schema of each table's reader."""
+        spark = MagicMock()
+        loaded = {}
+
+        def load_for(table):
+            frame = Mock()
+            frame.schema = f"schema_of_{table}"
+            loaded[table] = frame
+            return frame
+
+        reader = spark.read.format.return_value.option.return_value
+        reader.option.side_effect = lambda key, value: Mock(
+            **{"options.return_value.load.side_effect": lambda: load_for(value)}
+        )
+
+        schemas = _get_table_schemas(spark, "conn", {"a": {}, "b": {"x": "1"}})
+
+        assert schemas == {"a": "schema_of_a", "b": "schema_of_b"}
+        assert _get_table_schemas(spark, "conn", {}) == {}
+
+    def test_missing_primary_keys_fails_before_creating_flows(self, mock_spark):
+        """Test that all invalid tables are reported before any flow is created."""
+        metadata = {
+            "users": {"cursor_field": "updated_at", "ingestion_type": "cdc"},
+            "orders": {"ingestion_type": "snapshot"},
+            "events": {"primary_keys": ["event_id"], "ingestion_type": "append"},
+        }
+        spec = {
+            "connection_name": "test_connection",
+            "objects": [
+                {"table": {"source_table": t, "table_configuration": {}}}
+                for t in ("events", "users", "orders")
+            ],
+        }
+
+        with patch(
+            "pipeline.ingestion_pipeline._get_table_metadata",
+            return_value=metadata,
+        ), patch(
+            "pipeline.ingestion_pipeline._create_append_table"
+        ) as mock_append, pytest.raises(ValueError) as exc_info:
+            ingest(mock_spark, spec)
+
+        message = str(exc_info.value)
+        assert "users: primary_keys are required for cdc" in message
+        assert "orders: primary_keys are required for snapshot" in message
+        mock_append.assert_not_called()
+
+    def test_cdc_requires_sequence_by(self, mock_spark):
+        """Test that a cdc table without cursor_field or sequence_by is rejected."""
+        metadata = {"users": {"primary_keys": ["user_id"], "ingestion_type": "cdc"}}
+        spec = {
+            "connection_name": "test_connection",
+            "objects": [
+                {"table": {"source_table": "users", "table_configuration": {}}}
+            ],
+        }
+
+        with patch(
+            "pipeline.ingestion_pipeline._get_table_metadata",
+            return_value=metadata,
+        ), pytest.raises(ValueError, match="sequence_by"):
+            ingest(mock_spark, spec)
+
+    def test_columns_must_exist_in_schema(
+        self, mock_spark, base_metadata, table_schemas
+    ):
+        """Test that primary keys and sequence_by are checked against the schema."""
+        table_schemas.schemas["users"] = make_schema(["user_id", "name"])
+        spec = {
+            "connection_name": "test_connection",
+            "objects": [
+                {"table": {"source_table": "users", "table_configuration": {}}}
+            ],
+        }
+
+        with patch(
+            "pipeline.ingestion_pipeline._get_table_metadata",
+            return_value=base_metadata,
+        ), patch(
+            "pipeline.ingestion_pipeline._create_cdc_table"
+        ) as mock_cdc, pytest.raises(
+            ValueError, match="'updated_at' is not in the table schema"
+        ):
+            ingest(mock_spark, spec)
+
+        mock_cdc.assert_not_called()
+
+    def test_unsupported_ingestion_type(self, mock_spark):
+        """Test that an unknown ingestion_type is rejected."""
+        metadata = {"users": {"primary_keys": ["user_id"], "ingestion_type": "merge"}}
+        spec = {
+            "connection_name": "test_connection",
+            "objects": [
+                {"table": {"source_table": "users", "table_configuration": {}}}
+            ],
+        }
+
+        with patch(
+            "pipeline.ingestion_pipeline._get_table_metadata",
+            return_value=metadata,
+        ), pytest.raises(ValueError, match="unsupported ingestion_type 'merge'"):
+            ingest(mock_spark, spec)
+
+
+class TestCoRead:
+    """Test tables read from one sweep of another table."""
+
+    def test_co_read_tables_stream_from_one_view(
+        self, mock_spark, base_metadata, table_schemas
+    ):
+        """Test that the co-read view is created once and feeds every table."""
+        spec = {
+            "connection_name": "test_connection",
+            "objects": [
+                {
+                    "table": {
+                        "source_table": "users",
+                        "table_configuration": {"lakeflow.coRead": "events"},
+                    }
+                },
+                {"table": {"source_table": "events", "table_configuration": {}}},
+            ],
+        }
+
+        with patch(
+            "pipeline.ingestion_pipeline._get_table_metadata",
+            return_value=base_metadata,
+        ), patch(
+            "pipeline.ingestion_pipeline._create_co_read_view"
+        ) as mock_view, patch(
+            "pipeline.ingestion_pipeline._create_cdc_table"
+        ) as mock_cdc, patch(
+            "pipeline.ingestion_pipeline._create_append_table"
+        ) as mock_append:
+            ingest(mock_spark, spec)
+
+        mock_view.assert_called_once_with(
+            mock_spark,
+            "test_connection",
+            "users_co_read",
+            ["users", "events"],
+            {"lakeflow.coRead": "events"},
+        )
+        assert mock_cdc.call_args.kwargs == {"co_read_view": "users_co_read"}
+        assert mock_append.call_args.kwargs == {"co_read_view": "users_co_read"}
+        assert mock_append.call_args[0][2] == "events"
+
+    def test_co_read_tables_must_be_in_the_spec_and_read_once(
+        self, mock_spark, base_metadata
+    ):
+        """Test that unknown and doubly co-read tables are rejected."""
+        spec = {
+            "connection_name": "test_connection",
+            "objects": [
+                {
+                    "table": {
+                        "source_table": "users",
+                        "table_configuration": {"lakeflow.coRead": "events,tickets"},
+                    }
+                },
+                {
+                    "table": {
+                        "source_table": "events",
+                        "table_configuration": {"lakeflow.coRead": "users"},
+                    }
+                },
+            ],
+        }
+
+        with patch(
+            "pipeline.ingestion_pipeline._get_table_metadata",
+            return_value=base_metadata,
+        ), patch(
+            "pipeline.ingestion_pipeline._create_co_read_view"
+        ) as mock_view, pytest.raises(ValueError) as exc_info:
+            ingest(mock_spark, spec)
+
+        message = str(exc_info.value)
+        assert "users: co-read table 'tickets' is not in the pipeline spec" in message
+        assert "events: read by more than one co-read" in message
+        mock_view.assert_not_called()
+
+    def test_snapshot_tables_cannot_be_co_read(self, mock_spark, base_metadata):
+        """Test that a snapshot table in a co-read is rejected."""
+        spec = {
+            "connection_name": "test_connection",
+            "objects": [
+                {
+                    "table": {
+                        "source_table": "users",
+                        "table_configuration": {"lakeflow.coRead": "orders"},
+                    }
+                },
+                {"table": {"source_table": "orders", "table_configuration": {}}},
+            ],
+        }
+
+        with patch(
+            "pipeline.ingestion_pipeline._get_table_metadata",
+            return_value=base_metadata,
+        ), pytest.raises(ValueError, match="orders: co-read tables are streamed"):
+            ingest(mock_spark, spec)
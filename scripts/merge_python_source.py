@@ -5,7 +5,8 @@ Due to current limitations, the Spark Declarative Pipeline (SDP) does not
 support module imports for Python Data Source implementations.
 
 This script combines:
-1. libs/utils.py (parsing utilities)
+1. libs/utils.py (parsing utilities), libs/metrics.py (read metrics) and
+   libs/profiling.py (opt-in read profiling)
 2. sources/{source_name}/{source_name}.py (source connector implementation)
 3. pipeline/lakeflow_python_source.py (PySpark data source registration)
 
@@ -119,7 +120,7 @@ def deduplicate_imports(import_lists: List[List[str]]) -> List[str]:
     """
     # Imports to skip (internal imports that won't work in merged file)
     skip_patterns = [
-        "from libs.utils import",
+        "from libs.",
         "from pipeline.lakeflow_python_source import",
         "from sources.",
     ]
@@ -203,6 +204,16 @@ def deduplicate_imports(import_lists: List[List[str]]) -> List[str]:
         "copy",
         "pickle",
         "decimal",
+        "concurrent",
+        "threading",
+        "urllib",
+        "calendar",
+        "hashlib",
+        "zlib",
+        "cProfile",
+        "pstats",
+        "tempfile",
+        "uuid",
     }
 
     def get_base_module(module_name):
@@ -299,6 +310,8 @@ def merge_files(source_name: str, output_path: Optional[Path] = None) -> str:
 
     # Define file paths
     utils_path = project_root / "libs" / "utils.py"
+    metrics_path = project_root / "libs" / "metrics.py"
+    profiling_path = project_root / "libs" / "profiling.py"
     source_path = project_root / "sources" / source_name / f"{source_name}.py"
     lakeflow_source_path = project_root / "pipeline" / "lakeflow_python_source.py"
 
@@ -314,12 +327,16 @@ def merge_files(source_name: str, output_path: Optional[Path] = None) -> str:
     # Verify all files exist
     print(f"Merging files for source: {source_name}", file=sys.stderr)
     print(f"- utils.py: {utils_path}", file=sys.stderr)
+    print(f"- metrics.py: {metrics_path}", file=sys.stderr)
+    print(f"- profiling.py: {profiling_path}", file=sys.stderr)
     print(f"- {source_name}.py: {source_path}", file=sys.stderr)
     print(f"- lakeflow_python_source.py: {lakeflow_source_path}", file=sys.stderr)
 
     try:
         # Read all files
         utils_content = read_file_content(utils_path)
+        metrics_content = read_file_content(metrics_path)
+        profiling_content = read_file_content(profiling_path)
         source_content = read_file_content(source_path)
         lakeflow_source_content = read_file_content(lakeflow_source_path)
     except FileNotFoundError as e:
@@ -328,11 +345,21 @@ def merge_files(source_name: str, output_path: Optional[Path] = None) -> str:
 
     # Extract imports and code from each file
     utils_imports, utils_code = extract_imports_and_code(utils_content)
+    metrics_imports, metrics_code = extract_imports_and_code(metrics_content)
+    profiling_imports, profiling_code = extract_imports_and_code(profiling_content)
     source_imports, source_code = extract_imports_and_code(source_content)
     lakeflow_imports, lakeflow_code = extract_imports_and_code(lakeflow_source_content)
 
     # Deduplicate and organize all imports
-    all_imports = deduplicate_imports([utils_imports, source_imports, lakeflow_imports])
+    all_imports = deduplicate_imports(
+        [
+            utils_imports,
+            metrics_imports,
+            profiling_imports,
+            source_imports,
+            lakeflow_imports,
+        ]
+    )
 
     # Build the merged content
     merged_lines = []
@@ -376,6 +403,32 @@ def merge_files(source_name: str, output_path: Optional[Path] = None) -> str:
     merged_lines.append("")
     merged_lines.append("")
 
+    # Section 1b: libs/metrics.py code
+    merged_lines.append("    " + "#" * 56)
+    merged_lines.append("    # libs/metrics.py")
+    merged_lines.append("    " + "#" * 56)
+    merged_lines.append("")
+    for line in metrics_code.strip().split("\n"):
+        if line.strip():
+            merged_lines.append("    " + line)
+        else:
+            merged_lines.append("")
+    merged_lines.append("")
+    merged_lines.append("")
+
+    # Section 1c: libs/profiling.py code
+    merged_lines.append("    " + "#" * 56)
+    merged_lines.append("    # libs/profiling.py")
+    merged_lines.append("    " + "#" * 56)
+    merged_lines.append("")
+    for line in profiling_code.strip().split("\n"):
+        if line.strip():
+            merged_lines.append("    " + line)
+        else:
+            merged_lines.append("")
+    merged_lines.append("")
+    merged_lines.append("")
+
     # Section 2: sources/{source_name}/{source_name}.py code
     merged_lines.append("    " + "#" * 56)
     merged_lines.append(f"    # sources/{source_name}/{source_name}.py")
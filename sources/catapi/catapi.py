@@ -1,5 +1,9 @@
 import requests
-from typing import Iterator, Any, Dict, List
+import base64
+import hashlib
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Any, Callable, Dict, List
 from pyspark.sql.types import (
     StructType,
     StructField,
@@ -8,6 +12,14 @@ from pyspark.sql.types import (
     ArrayType,
 )
 
+from libs.metrics import ReadMetrics, attach_metrics
+from libs.utils import (
+    iso8601_to_epoch,
+    latest_iso8601,
+    pushed_filters,
+    response_json,
+)
+
 
 class LakeflowConnect:
     def __init__(self, options: dict[str, str]) -> None:
@@ -32,6 +44,9 @@ class LakeflowConnect:
                 "Content-Type": "application/json",
             }
         )
+        # Request, byte and latency counters reported per micro-batch
+        self.metrics = ReadMetrics()
+        attach_metrics(self._session, self.metrics)
 
         # Supported tables
         self.supported_tables = [
@@ -344,6 +359,30 @@ class LakeflowConnect:
                 "ingestion_type": "cdc",
             }
 
+    def supported_filters(
+        self, table_name: str, table_options: dict[str, str]
+    ) -> dict[str, tuple[str, ...]]:
+        """
+        Filters of batch queries that map to Cat API query parameters.
+
+        An equality on `sub_id` becomes the `sub_id` parameter of `votes` and
+        `favourites` unless the table already sets one.
+        """
+        if table_name in ("votes", "favourites") and not table_options.get("sub_id"):
+            return {"sub_id": ("=",)}
+        return {}
+
+    @staticmethod
+    def _sub_id(table_options: dict[str, str]) -> str | None:
+        """The `sub_id` option, or the value of a pushed-down `sub_id` filter."""
+        sub_id = table_options.get("sub_id")
+        if sub_id:
+            return sub_id
+        for column, op, value in pushed_filters(table_options):
+            if column == "sub_id" and op == "=":
+                return value
+        return None
+
     def read_table(
         self, table_name: str, start_offset: dict, table_options: dict[str, str]
     ) -> (Iterator[dict], dict):
@@ -368,24 +407,6 @@ class LakeflowConnect:
         self, start_offset: dict, table_options: dict[str, str]
     ) -> (Iterator[dict], dict):
         """Internal implementation for reading the `images` table."""
-        # Get pagination parameters
-        limit = 100  # Maximum allowed by API
-        try:
-            limit = int(table_options.get("limit", 100))
-        except (TypeError, ValueError):
-            limit = 100
-        limit = max(1, min(limit, 100))
-
-        # Get starting page from offset
-        page = 0
-        if start_offset and isinstance(start_offset, dict):
-            page = start_offset.get("page", 0)
-        try:
-            page = int(page)
-        except (TypeError, ValueError):
-            page = 0
-        page = max(0, page)
-
         # Optional filter parameters
         breed_id = table_options.get("breed_id")
         category_ids = table_options.get("category_ids")
@@ -395,11 +416,7 @@ class LakeflowConnect:
         order = table_options.get("order", "ASC")  # Use ASC for consistent ordering
 
         # Build request parameters
-        params = {
-            "limit": limit,
-            "page": page,
-            "order": order,
-        }
+        params = {"order": order}
         if breed_id:
             params["breed_id"] = breed_id
         if category_ids:
@@ -411,55 +428,23 @@ class LakeflowConnect:
         if has_breeds is not None:
             params["has_breeds"] = has_breeds
 
-        url = f"{self.base_url}/images/search"
-        records: list[dict[str, Any]] = []
-
-        # Make API request
-        response = self._session.get(url, params=params, timeout=30)
-        if response.status_code != 200:
-            raise RuntimeError(
-                f"CatAPI error for images: {response.status_code} {response.text}"
-            )
-
-        images = response.json() or []
-        if not isinstance(images, list):
-            raise ValueError(
-                f"Unexpected response format for images: {type(images).__name__}"
-            )
-
-        # Process records - ensure nested structures are properly handled
-        for image in images:
+        def prepare_record(image: dict) -> dict:
             record: dict[str, Any] = dict(image)
-            
-            # Ensure breeds array exists (can be empty)
+            # Ensure breeds and categories arrays exist (can be empty)
             if "breeds" not in record:
                 record["breeds"] = None
-            
-            # Ensure categories array exists (can be empty)
             if "categories" not in record:
                 record["categories"] = None
-            
-            records.append(record)
+            return record
 
-        # Determine next offset
-        # If we got fewer records than requested (or empty), we've reached the end
-        # Return the same offset to signal completion (per interface contract)
-        if len(images) == 0 or len(images) < limit:
-            # No more pages - return the same offset to signal end
-            # If start_offset was None, use current page; otherwise return start_offset
-            if start_offset:
-                next_offset = start_offset
-            else:
-                next_offset = {"page": page}
-        else:
-            # More pages might exist
-            next_offset = {"page": page + 1}
-
-        def record_iterator():
-            for record in records:
-                yield record
-
-        return record_iterator(), next_offset
+        return self._read_paged(
+            "images",
+            "images/search",
+            params,
+            start_offset,
+            table_options,
+            prepare_record,
+        )
 
     def _read_breeds(
         self, start_offset: dict, table_options: dict[str, str]
@@ -473,7 +458,7 @@ class LakeflowConnect:
                 f"CatAPI error for breeds: {response.status_code} {response.text}"
             )
 
-        breeds = response.json() or []
+        breeds = response_json(response) or []
         if not isinstance(breeds, list):
             raise ValueError(
                 f"Unexpected response format for breeds: {type(breeds).__name__}"
@@ -503,7 +488,7 @@ class LakeflowConnect:
                 f"CatAPI error for categories: {response.status_code} {response.text}"
             )
 
-        categories = response.json() or []
+        categories = response_json(response) or []
         if not isinstance(categories, list):
             raise ValueError(
                 f"Unexpected response format for categories: {type(categories).__name__}"
@@ -525,13 +510,70 @@ class LakeflowConnect:
         self, start_offset: dict, table_options: dict[str, str]
     ) -> (Iterator[dict], dict):
         """Internal implementation for reading the `votes` table."""
-        # Get pagination parameters
-        limit = 100  # Maximum allowed by API
-        try:
-            limit = int(table_options.get("limit", 100))
-        except (TypeError, ValueError):
-            limit = 100
-        limit = max(1, min(limit, 100))
+        params = {}
+        sub_id = self._sub_id(table_options)
+        if sub_id:
+            params["sub_id"] = sub_id
+
+        read = self._incremental_reader(table_options)
+        return read("votes", "votes", params, start_offset, table_options)
+
+    def _read_favourites(
+        self, start_offset: dict, table_options: dict[str, str]
+    ) -> (Iterator[dict], dict):
+        """Internal implementation for reading the `favourites` table."""
+        params = {}
+        sub_id = self._sub_id(table_options)
+        if sub_id:
+            params["sub_id"] = sub_id
+
+        def prepare_record(favourite: dict) -> dict:
+            record: dict[str, Any] = dict(favourite)
+            # Ensure image struct exists (can be None)
+            if "image" not in record:
+                record["image"] = None
+            return record
+
+        read = self._incremental_reader(table_options)
+        return read(
+            "favourites",
+            "favourites",
+            params,
+            start_offset,
+            table_options,
+            prepare_record,
+        )
+
+    def _incremental_reader(self, table_options: dict[str, str]) -> Callable:
+        """Pick the reader for votes and favourites from `incremental_mode`."""
+        incremental_mode = table_options.get("incremental_mode", "page")
+        if incremental_mode == "page":
+            return self._read_paged
+        if incremental_mode == "watermark":
+            return self._read_watermark
+        raise ValueError(
+            f"Invalid incremental_mode {incremental_mode!r}; expected 'page' or 'watermark'."
+        )
+
+    def _read_paged(
+        self,
+        table_name: str,
+        path: str,
+        params: dict[str, Any],
+        start_offset: dict,
+        table_options: dict[str, str],
+        prepare_record: Callable[[dict], dict] = dict,
+    ) -> (Iterator[dict], dict):
+        """
+        Read a page-numbered endpoint, up to `max_pages_per_batch` pages per call.
+
+        Pages are requested `max_workers` at a time so the next pages are
+        already in flight while the current one is processed. A page with
+        fewer than `limit` records marks the end of the data; the offset then
+        stays on that page so later batches pick up records appended to it.
+        Otherwise the offset is the page after the last one read.
+        """
+        limit, max_pages_per_batch, max_workers = self._paging_options(table_options)
 
         # Get starting page from offset
         page = 0
@@ -543,47 +585,158 @@ class LakeflowConnect:
             page = 0
         page = max(0, page)
 
-        # Optional filter parameter
-        sub_id = table_options.get("sub_id")
-
-        params = {
-            "limit": limit,
-            "page": page,
-        }
-        if sub_id:
-            params["sub_id"] = sub_id
-
-        url = f"{self.base_url}/votes"
         records: list[dict[str, Any]] = []
+        next_page = page
+        last_page = None
+
+        for page_number, items in self._iter_pages(
+            table_name, path, params, limit, page, max_pages_per_batch, max_workers
+        ):
+            records.extend(prepare_record(item) for item in items)
+            if len(items) < limit:
+                last_page = page_number
+                break
+            next_page = page_number + 1
 
-        response = self._session.get(url, params=params, timeout=30)
-        if response.status_code != 200:
-            raise RuntimeError(
-                f"CatAPI error for votes: {response.status_code} {response.text}"
-            )
+        # Determine next offset
+        if last_page is None:
+            # More pages might exist
+            next_offset = {"page": next_page}
+        elif last_page == page and start_offset:
+            # Nothing beyond the starting page - return the same offset to
+            # signal completion (per interface contract)
+            next_offset = start_offset
+        else:
+            next_offset = {"page": last_page}
 
-        votes = response.json() or []
-        if not isinstance(votes, list):
-            raise ValueError(
-                f"Unexpected response format for votes: {type(votes).__name__}"
-            )
+        def record_iterator():
+            for record in records:
+                yield record
 
-        for vote in votes:
-            record: dict[str, Any] = dict(vote)
-            records.append(record)
+        return record_iterator(), next_offset
 
-        # Determine next offset
-        # If we got fewer records than requested (or empty), we've reached the end
-        # Return the same offset to signal completion (per interface contract)
-        if len(votes) == 0 or len(votes) < limit:
-            # No more pages - return the same offset to signal end
-            if start_offset:
-                next_offset = start_offset
-            else:
-                next_offset = {"page": page}
+    def _read_watermark(
+        self,
+        table_name: str,
+        path: str,
+        params: dict[str, Any],
+        start_offset: dict,
+        table_options: dict[str, str],
+        prepare_record: Callable[[dict], dict] = dict,
+    ) -> (Iterator[dict], dict):
+        """
+        Read only the records created since the last batch.
+
+        The endpoint is scanned newest first. Records older than the
+        `created_at` high-watermark minus `lookback_seconds` were emitted by
+        earlier batches, so the scan stops at the first page that reaches
+        them. Only records inside the lookback window (created at or before
+        the watermark) are checked against a Bloom filter of the ids already
+        emitted, which is stored in the offset. Newer records are always
+        emitted, so a false positive of the filter cannot drop them.
+
+        If `max_pages_per_batch` runs out before the scan reaches old data,
+        the offset records the page to continue from (`scan`) and the
+        watermark only moves once the scan completes. The scan also keeps
+        the oldest `created_at` it emitted and the ids emitted at that time.
+        Records pushed onto the following pages by new ones are newer than
+        that, or among those ids, and are skipped.
+        """
+        limit, max_pages_per_batch, max_workers = self._paging_options(table_options)
+        try:
+            lookback_seconds = int(table_options.get("lookback_seconds", 300))
+        except (TypeError, ValueError):
+            lookback_seconds = 300
+        lookback_seconds = max(0, lookback_seconds)
+
+        start_offset = start_offset if isinstance(start_offset, dict) else {}
+        watermark = start_offset.get("created_at")
+        seen = _SeenIds.from_offset(start_offset.get("seen"))
+        scan = start_offset.get("scan") or {}
+        page = int(scan.get("page", 0))
+        scan_max_created_at = scan.get("max_created_at")
+        # Oldest `created_at` emitted by the scan so far, and the ids emitted at it
+        floor_created_at = scan.get("min_created_at")
+        floor = iso8601_to_epoch(floor_created_at)
+        floor_ids = set(scan.get("min_ids") or [])
+
+        horizon = None
+        watermark_epoch = iso8601_to_epoch(watermark)
+        if watermark_epoch is not None:
+            horizon = watermark_epoch - lookback_seconds
+
+        records: list[dict[str, Any]] = []
+        scan_complete = False
+
+        for page_number, items in self._iter_pages(
+            table_name,
+            path,
+            {**params, "order": "DESC"},
+            limit,
+            page,
+            max_pages_per_batch,
+            max_workers,
+        ):
+            reached_old_records = False
+            page_floor, page_floor_ids = floor, set(floor_ids)
+            page_floor_created_at = floor_created_at
+            for item in items:
+                created_at = item.get("created_at")
+                created_epoch = iso8601_to_epoch(created_at)
+                record_id = item.get("id")
+                if created_epoch is None:
+                    # Cannot be placed in time; fall back on the filter.
+                    if seen.contains(record_id):
+                        continue
+                else:
+                    if horizon is not None and created_epoch < horizon:
+                        reached_old_records = True
+                        continue
+                    if floor is not None and (
+                        created_epoch > floor
+                        or (created_epoch == floor and record_id in floor_ids)
+                    ):
+                        # Emitted on an earlier page of this scan
+                        continue
+                    if (
+                        watermark_epoch is not None
+                        and created_epoch <= watermark_epoch
+                        and seen.contains(record_id)
+                    ):
+                        continue
+                    if page_floor is None or created_epoch < page_floor:
+                        page_floor, page_floor_ids = created_epoch, set()
+                        page_floor_created_at = created_at
+                    if created_epoch == page_floor:
+                        page_floor_ids.add(record_id)
+                seen.add(record_id)
+                records.append(prepare_record(item))
+                scan_max_created_at = latest_iso8601(scan_max_created_at, created_at)
+
+            floor, floor_ids = page_floor, page_floor_ids
+            floor_created_at = page_floor_created_at
+            page = page_number + 1
+            if reached_old_records or len(items) < limit:
+                scan_complete = True
+                break
+
+        next_offset = {"seen": seen.to_offset()}
+        if scan_complete:
+            next_watermark = latest_iso8601(watermark, scan_max_created_at)
         else:
-            # More pages might exist
-            next_offset = {"page": page + 1}
+            next_watermark = watermark
+            next_offset["scan"] = {"page": page}
+            if scan_max_created_at:
+                next_offset["scan"]["max_created_at"] = scan_max_created_at
+            if floor_created_at is not None:
+                next_offset["scan"]["min_created_at"] = floor_created_at
+                next_offset["scan"]["min_ids"] = sorted(floor_ids, key=str)
+        if next_watermark:
+            next_offset["created_at"] = next_watermark
+
+        if not records and scan_complete and start_offset and "scan" not in start_offset:
+            # Nothing new - return the same offset to signal completion
+            next_offset = start_offset
 
         def record_iterator():
             for record in records:
@@ -591,11 +744,9 @@ class LakeflowConnect:
 
         return record_iterator(), next_offset
 
-    def _read_favourites(
-        self, start_offset: dict, table_options: dict[str, str]
-    ) -> (Iterator[dict], dict):
-        """Internal implementation for reading the `favourites` table."""
-        # Get pagination parameters
+    @staticmethod
+    def _paging_options(table_options: dict[str, str]) -> tuple[int, int, int]:
+        """Parse `limit`, `max_pages_per_batch` and `max_workers` table options."""
         limit = 100  # Maximum allowed by API
         try:
             limit = int(table_options.get("limit", 100))
@@ -603,66 +754,136 @@ class LakeflowConnect:
             limit = 100
         limit = max(1, min(limit, 100))
 
-        # Get starting page from offset
-        page = 0
-        if start_offset and isinstance(start_offset, dict):
-            page = start_offset.get("page", 0)
         try:
-            page = int(page)
+            max_pages_per_batch = int(table_options.get("max_pages_per_batch", 10))
         except (TypeError, ValueError):
-            page = 0
-        page = max(0, page)
-
-        # Optional filter parameter
-        sub_id = table_options.get("sub_id")
+            max_pages_per_batch = 10
+        max_pages_per_batch = max(1, max_pages_per_batch)
 
-        params = {
-            "limit": limit,
-            "page": page,
-        }
-        if sub_id:
-            params["sub_id"] = sub_id
+        try:
+            max_workers = int(table_options.get("max_workers", 4))
+        except (TypeError, ValueError):
+            max_workers = 4
+        max_workers = max(1, min(max_workers, max_pages_per_batch))
+
+        return limit, max_pages_per_batch, max_workers
+
+    def _iter_pages(
+        self,
+        table_name: str,
+        path: str,
+        params: dict[str, Any],
+        limit: int,
+        first_page: int,
+        max_pages: int,
+        max_workers: int,
+    ) -> Iterator[tuple[int, list]]:
+        """
+        Yield `(page_number, items)` for up to `max_pages` pages, in order.
 
-        url = f"{self.base_url}/favourites"
-        records: list[dict[str, Any]] = []
+        Pages are requested `max_workers` at a time ahead of the consumer. The
+        caller stops the iteration once it has seen the last page; pages read
+        ahead of that point are discarded.
+        """
+        url = f"{self.base_url}/{path}"
 
-        response = self._session.get(url, params=params, timeout=30)
-        if response.status_code != 200:
-            raise RuntimeError(
-                f"CatAPI error for favourites: {response.status_code} {response.text}"
+        def fetch_page(page_number: int) -> list:
+            response = self._session.get(
+                url,
+                params={**params, "limit": limit, "page": page_number},
+                timeout=30,
             )
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"CatAPI error for {table_name}: {response.status_code} {response.text}"
+                )
+
+            items = response_json(response) or []
+            if not isinstance(items, list):
+                raise ValueError(
+                    f"Unexpected response format for {table_name}: {type(items).__name__}"
+                )
+            return items
+
+        end_page = first_page + max_pages
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for window_start in range(first_page, end_page, max_workers):
+                window = range(window_start, min(window_start + max_workers, end_page))
+                pages = executor.map(fetch_page, window)
+                for page_number, items in zip(window, pages):
+                    yield page_number, items
+
+
+class _SeenIds:
+    """
+    Bloom filter of recently emitted record ids, small enough to keep in an offset.
+
+    Two generations of `CAPACITY` ids each are kept; once the current one is
+    full it replaces the previous one, so the ids that are forgotten are the
+    oldest. With this sizing the false positive rate of both generations
+    together stays below 1%.
+    """
+
+    CAPACITY = 2048
+    BITS = 24576
+    HASHES = 7
+
+    def __init__(
+        self,
+        current: bytearray = None,
+        previous: bytearray = None,
+        count: int = 0,
+    ):
+        self.current = current or bytearray(self.BITS // 8)
+        self.previous = previous
+        self.count = count
+
+    @classmethod
+    def from_offset(cls, state: dict) -> "_SeenIds":
+        if not state:
+            return cls()
+
+        def decode(value):
+            if not value:
+                return None
+            return bytearray(zlib.decompress(base64.b64decode(value)))
+
+        return cls(
+            decode(state.get("current")),
+            decode(state.get("previous")),
+            int(state.get("count", 0)),
+        )
 
-        favourites = response.json() or []
-        if not isinstance(favourites, list):
-            raise ValueError(
-                f"Unexpected response format for favourites: {type(favourites).__name__}"
-            )
-
-        for favourite in favourites:
-            record: dict[str, Any] = dict(favourite)
-            
-            # Ensure image struct exists (can be None)
-            if "image" not in record:
-                record["image"] = None
-            
-            records.append(record)
-
-        # Determine next offset
-        # If we got fewer records than requested (or empty), we've reached the end
-        # Return the same offset to signal completion (per interface contract)
-        if len(favourites) == 0 or len(favourites) < limit:
-            # No more pages - return the same offset to signal end
-            if start_offset:
-                next_offset = start_offset
-            else:
-                next_offset = {"page": page}
-        else:
-            # More pages might exist
-            next_offset = {"page": page + 1}
-
-        def record_iterator():
-            for record in records:
-                yield record
-
-        return record_iterator(), next_offset
-
+    def to_offset(self) -> dict:
+        def encode(bits):
+            return base64.b64encode(zlib.compress(bytes(bits))).decode("ascii")
+
+        state = {"current": encode(self.current), "count": self.count}
+        if self.previous is not None:
+            state["previous"] = encode(self.previous)
+        return state
+
+    def _positions(self, record_id) -> list[int]:
+        digest = hashlib.blake2b(str(record_id).encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.BITS for i in range(self.HASHES)]
+
+    @staticmethod
+    def _has(bits: bytearray, positions: list[int]) -> bool:
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in positions)
+
+    def contains(self, record_id) -> bool:
+        positions = self._positions(record_id)
+        if self._has(self.current, positions):
+            return True
+        return self.previous is not None and self._has(self.previous, positions)
+
+    def add(self, record_id) -> None:
+        if self.count >= self.CAPACITY:
+            self.previous = self.current
+            self.current = bytearray(self.BITS // 8)
+            self.count = 0
+        for p in self._positions(record_id):
+            self.current[p >> 3] |= 1 << (p & 7)
+        self.count += 1
@@ -0,0 +1,178 @@
+"""
+Offline load tests for the CatAPI connector against the mock API server.
+"""
+
+import json
+
+from libs.utils import epoch_to_iso8601
+from tests.mock_api_fixtures import FIXTURES, record_time
+from tests.mock_api_server import MockAPIServer, PageNumberPagination
+from sources.catapi.catapi import LakeflowConnect, _SeenIds
+
+FIXTURE = FIXTURES["catapi.votes"]
+
+
+def test_pages_are_read_ahead_concurrently():
+    with MockAPIServer(latency=0.05) as server:
+        FIXTURE.install(server, 1000)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+
+        records, offset = connector.read_table(
+            "votes", {}, {"limit": "100", "max_workers": "4"}
+        )
+        records = list(records)
+
+        assert [r["id"] for r in records] == list(range(1, 1001))
+        assert offset == {"page": 10}
+        assert 1 < server.max_in_flight <= 4
+
+
+def test_pages_keep_their_order_and_stop_at_the_first_short_page():
+    # The first page answers last, so read-ahead pages arrive out of order.
+    latency = lambda request: 0.1 if request.query.get("page") == "0" else 0  # noqa: E731
+    with MockAPIServer(latency=latency) as server:
+        FIXTURE.install(server, 250)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        table_options = {"limit": "100", "max_workers": "4"}
+
+        records, offset = connector.read_table("votes", {}, table_options)
+
+        assert [r["id"] for r in records] == list(range(1, 251))
+        # Page 2 is short, so the offset stays on it for records appended later.
+        assert offset == {"page": 2}
+
+        records, next_offset = connector.read_table("votes", offset, table_options)
+        assert [r["id"] for r in records] == list(range(201, 251))
+        assert next_offset == offset
+
+
+def test_page_budget_ends_the_batch_on_the_next_page():
+    with MockAPIServer() as server:
+        FIXTURE.install(server, 1000)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        table_options = {"limit": "100", "max_pages_per_batch": "3"}
+
+        records, offset = connector.read_table("votes", {}, table_options)
+        assert [r["id"] for r in records] == list(range(1, 301))
+        assert offset == {"page": 3}
+
+        records, offset = connector.read_table("votes", offset, table_options)
+        assert [r["id"] for r in records] == list(range(301, 601))
+        assert offset == {"page": 6}
+
+
+def test_watermark_mode_reads_newest_first_and_stops_at_the_horizon():
+    with MockAPIServer() as server:
+        FIXTURE.install(server, 500)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        table_options = {"incremental_mode": "watermark", "limit": "100"}
+
+        records, offset = connector.read_table("votes", {}, table_options)
+        assert len({r["id"] for r in records}) == 500
+
+        records, next_offset = connector.read_table("votes", offset, table_options)
+        assert list(records) == []
+        assert next_offset == offset
+
+
+def vote(index):
+    return {"id": index + 1, "created_at": epoch_to_iso8601(record_time(index))}
+
+
+def install_votes(server, count):
+    """Serve `count` votes from a list that tests can append new votes to."""
+    votes = [vote(index) for index in range(count)]
+    server.collection(r"/v1/votes", votes, PageNumberPagination())
+    return votes
+
+
+def read_ids(connector, offset, table_options):
+    records, offset = connector.read_table("votes", offset, table_options)
+    return [record["id"] for record in records], offset
+
+
+def test_watermark_mode_resumes_with_only_the_new_votes():
+    with MockAPIServer() as server:
+        votes = install_votes(server, 500)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        table_options = {"incremental_mode": "watermark", "limit": "100"}
+
+        ids, offset = read_ids(connector, {}, table_options)
+        assert sorted(ids) == list(range(1, 501))
+        assert offset["created_at"] == votes[-1]["created_at"]
+
+        votes.extend(vote(index) for index in range(500, 530))
+        ids, offset = read_ids(connector, offset, table_options)
+        assert sorted(ids) == list(range(501, 531))
+        assert offset["created_at"] == votes[-1]["created_at"]
+
+
+def test_bloom_filter_is_only_consulted_inside_the_lookback_window(monkeypatch):
+    # Every id looks already seen: only votes up to the watermark may be dropped.
+    monkeypatch.setattr(_SeenIds, "contains", lambda self, record_id: True)
+    with MockAPIServer() as server:
+        votes = install_votes(server, 300)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        table_options = {"incremental_mode": "watermark", "limit": "100"}
+
+        ids, offset = read_ids(connector, {}, table_options)
+        assert len(ids) == 300
+
+        votes.extend(vote(index) for index in range(300, 310))
+        ids, _ = read_ids(connector, offset, table_options)
+        assert sorted(ids) == list(range(301, 311))
+
+
+def test_votes_pushed_onto_later_pages_during_a_scan_are_emitted_once():
+    with MockAPIServer() as server:
+        votes = install_votes(server, 500)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        table_options = {
+            "incremental_mode": "watermark",
+            "limit": "100",
+            "max_pages_per_batch": "1",
+        }
+
+        ids, offset = read_ids(connector, {}, table_options)
+        assert ids == list(range(500, 400, -1))
+        assert offset["scan"]["min_ids"] == [401]
+
+        # New votes push the tail of the first page onto the second.
+        votes.extend(vote(index) for index in range(500, 520))
+        emitted = list(ids)
+        for _ in range(8):
+            ids, offset = read_ids(connector, offset, table_options)
+            emitted.extend(ids)
+        assert sorted(emitted) == list(range(1, 521))
+
+
+class TestSeenIds:
+    def test_round_trips_through_the_offset(self):
+        seen = _SeenIds()
+        for record_id in range(100):
+            seen.add(record_id)
+
+        restored = _SeenIds.from_offset(json.loads(json.dumps(seen.to_offset())))
+
+        assert all(restored.contains(record_id) for record_id in range(100))
+        assert restored.count == 100
+        assert not _SeenIds.from_offset(None).contains(1)
+
+    def test_false_positive_rate_stays_below_one_percent(self):
+        seen = _SeenIds()
+        for record_id in range(2 * _SeenIds.CAPACITY):
+            seen.add(f"seen-{record_id}")
+
+        false_positives = sum(seen.contains(f"new-{i}") for i in range(20_000))
+
+        assert false_positives / 20_000 < 0.01
+
+    def test_forgets_the_oldest_generation(self):
+        seen = _SeenIds()
+        for record_id in range(3 * _SeenIds.CAPACITY):
+            seen.add(record_id)
+
+        recent = range(2 * _SeenIds.CAPACITY, 3 * _SeenIds.CAPACITY)
+        assert all(seen.contains(record_id) for record_id in recent)
+        forgotten = sum(seen.contains(i) for i in range(_SeenIds.CAPACITY))
+        assert forgotten / _SeenIds.CAPACITY < 0.05
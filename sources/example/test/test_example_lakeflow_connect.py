@@ -17,12 +17,14 @@ def test_example_connector():
     parent_dir = Path(__file__).parent.parent
     config_path = parent_dir / "configs" / "dev_config.json"
     table_config_path = parent_dir / "configs" / "dev_table_config.json"
+    performance_config_path = parent_dir / "configs" / "dev_performance_config.json"
 
     config = load_config(config_path)
     table_config = load_config(table_config_path)
+    performance_config = load_config(performance_config_path)
 
-    # Create tester with the config
-    tester = LakeflowConnectTester(config, table_config)
+    # Create tester with the config and the performance thresholds
+    tester = LakeflowConnectTester(config, table_config, performance_config)
 
     # Run all tests
     report = tester.run_all_tests()
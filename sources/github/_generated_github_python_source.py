@@ -5,12 +5,41 @@
 # Do not edit manually. Make changes to the source files instead.
 # ==============================================================================
 
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Iterator
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlparse
+import cProfile
+import calendar
+import json
+import os
+import pstats
+import re
+import tempfile
+import threading
+import time
+import uuid
 
 from pyspark.sql import Row
-from pyspark.sql.datasource import DataSource, DataSourceReader, SimpleDataSourceStreamReader
+from pyspark.sql.datasource import (
+    DataSource,
+    DataSourceReader,
+    DataSourceStreamReader,
+    InputPartition,
+    SimpleDataSourceStreamReader,
+)
+from types import MappingProxyType
 from pyspark.sql.types import *
 import requests
 
@@ -157,33 +186,1410 @@ def register_lakeflow_source(spark):
             )
 
 
+    # Length of the fixed `YYYY-MM-DDTHH:MM:SSZ` layout used by most APIs for cursors.
+    _UTC_ISO8601_LENGTH = 20
+
+    # Parsed values of timestamps that do not use the fixed layout. Kept as a plain
+    # bounded dict (rather than functools.lru_cache) so it pickles with the
+    # generated source.
+    _ISO8601_CACHE: dict = {}
+    _ISO8601_CACHE_SIZE = 4096
+
+
+    def is_utc_iso8601(value: Any) -> bool:
+        """
+        Check whether a value uses the fixed `YYYY-MM-DDTHH:MM:SSZ` layout.
+
+        Timestamps in this layout sort lexicographically in time order, so they can
+        be compared as strings without parsing.
+        """
+        return (
+            isinstance(value, str)
+            and len(value) == _UTC_ISO8601_LENGTH
+            and value[4] == "-"
+            and value[7] == "-"
+            and value[10] == "T"
+            and value[13] == ":"
+            and value[16] == ":"
+            and value[19] == "Z"
+        )
+
+
+    def iso8601_to_epoch(value: Any) -> Optional[float]:
+        """
+        Convert an ISO 8601 timestamp string to seconds since the epoch.
+
+        The fixed `YYYY-MM-DDTHH:MM:SSZ` layout is converted by slicing; other
+        layouts (fractional seconds, offsets, space separator) go through
+        `datetime.fromisoformat` and are cached. Timestamps without an offset are
+        taken to be UTC. Returns None for values that cannot be parsed.
+        """
+        if is_utc_iso8601(value):
+            try:
+                fields = (
+                    int(value[0:4]),
+                    int(value[5:7]),
+                    int(value[8:10]),
+                    int(value[11:13]),
+                    int(value[14:16]),
+                    int(value[17:19]),
+                )
+            except ValueError:
+                return None
+            # calendar.timegm normalizes out-of-range fields instead of rejecting them.
+            if not (
+                1 <= fields[1] <= 12
+                and 1 <= fields[2]
+                and (
+                    fields[2] <= 28
+                    or fields[2] <= calendar.monthrange(fields[0], fields[1])[1]
+                )
+                and fields[3] < 24
+                and fields[4] < 60
+                and fields[5] < 60
+            ):
+                return None
+            return float(calendar.timegm(fields))
+
+        if not isinstance(value, str) or not value:
+            return None
+
+        cached = _ISO8601_CACHE.get(value)
+        if cached is not None:
+            return cached
+
+        text = value[:-1] + "+00:00" if value.endswith("Z") else value
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        epoch = parsed.timestamp()
+
+        if len(_ISO8601_CACHE) >= _ISO8601_CACHE_SIZE:
+            _ISO8601_CACHE.clear()
+        _ISO8601_CACHE[value] = epoch
+        return epoch
+
+
+    def epoch_to_iso8601(seconds: float) -> str:
+        """Format seconds since the epoch in the `YYYY-MM-DDTHH:MM:SSZ` layout."""
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
+
+
+    def latest_iso8601(current: Optional[str], candidate: Any) -> Optional[str]:
+        """
+        Return the later of two ISO 8601 timestamps, ignoring unparseable values.
+
+        Intended for tracking a cursor over many records: when both values use the
+        fixed UTC layout they are compared as strings, otherwise they are parsed.
+        """
+        if not isinstance(candidate, str) or not candidate:
+            return current
+        if current is None:
+            return candidate if iso8601_to_epoch(candidate) is not None else current
+        if is_utc_iso8601(current) and is_utc_iso8601(candidate):
+            return candidate if candidate > current else current
+        candidate_epoch = iso8601_to_epoch(candidate)
+        if candidate_epoch is None:
+            return current
+        current_epoch = iso8601_to_epoch(current)
+        if current_epoch is None or candidate_epoch > current_epoch:
+            return candidate
+        return current
+
+
+    # JSON backends in order of preference. Set the LAKEFLOW_JSON_BACKEND
+    # environment variable to one of these names to force a backend.
+    JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+
+    def select_json_backend(
+        preferred: Optional[str] = None,
+    ) -> Tuple[str, Callable[[Union[bytes, str]], Any]]:
+        """
+        Return the name and `loads` function of the fastest installed JSON decoder.
+
+        orjson and msgspec are used when importable; the standard library is the
+        fallback. All three accept `bytes` as well as `str`. `preferred` skips
+        the backends listed before it.
+        """
+        candidates = JSON_BACKENDS
+        if preferred:
+            if preferred not in JSON_BACKENDS:
+                raise ValueError(
+                    f"Unknown JSON backend '{preferred}', expected one of {JSON_BACKENDS}"
+                )
+            candidates = JSON_BACKENDS[JSON_BACKENDS.index(preferred):]
+        for name in candidates:
+            try:
+                if name == "orjson":
+                    import orjson
+
+                    return name, orjson.loads
+                if name == "msgspec":
+                    import msgspec
+
+                    return name, msgspec.json.decode
+            except ImportError:
+                continue
+        return "json", json.loads
+
+
+    JSON_BACKEND, _json_decode = select_json_backend(
+        os.environ.get("LAKEFLOW_JSON_BACKEND")
+    )
+
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document with the fastest available backend.
+
+        Documents the fast backends reject (such as `NaN` literals or malformed
+        input) are retried with the standard library, so the accepted input and
+        the `json.JSONDecodeError` raised match `json.loads`. Note that orjson
+        decodes integers wider than 64 bits as floats.
+        """
+        try:
+            return _json_decode(data)
+        except Exception:
+            if _json_decode is json.loads:
+                raise
+            return json.loads(data)
+
+
+    def response_json(response) -> Any:
+        """
+        Decode a `requests` response body straight from its bytes.
+
+        Replaces `response.json()`, which first decodes the body to `str` and
+        then parses it with the standard library.
+        """
+        return json_loads(response.content)
+
+
+    # Table option through which the batch reader hands the filters it pushed
+    # down to `read_table`, as a JSON list of `[column, op, value]` triples.
+    PUSHED_FILTERS_OPTION = "lakeflow.pushedFilters"
+
+    # Spark data source filter classes that can be pushed down, by class name.
+    _PUSHED_FILTER_OPS = {
+        "EqualTo": "=",
+        "GreaterThan": ">",
+        "GreaterThanOrEqual": ">=",
+        "LessThan": "<",
+        "LessThanOrEqual": "<=",
+        "In": "in",
+    }
+
+
+    def to_pushed_filter(spark_filter: Any) -> Optional[Tuple[str, str, Any]]:
+        """
+        Convert a `pyspark.sql.datasource.Filter` to a `(column, op, value)` triple.
+
+        Nested columns are joined with dots, e.g. `properties.$city`. Returns
+        None for filters that cannot be pushed down: other filter classes,
+        column names containing dots, and values that are not JSON scalars.
+        """
+        op = _PUSHED_FILTER_OPS.get(type(spark_filter).__name__)
+        if op is None:
+            return None
+        attribute = tuple(spark_filter.attribute)
+        if not attribute or any("." in name for name in attribute):
+            return None
+        values = spark_filter.value if op == "in" else (spark_filter.value,)
+        if not all(isinstance(value, (str, int, float, bool)) for value in values):
+            return None
+        value = list(values) if op == "in" else values[0]
+        return ".".join(attribute), op, value
+
+
+    def pushed_filters(table_options: Optional[dict]) -> list:
+        """
+        Return the `(column, op, value)` filters pushed down to a read.
+
+        Connectors use them to narrow their API requests. They do not have to
+        apply them exactly: the batch reader drops the rows that do not match.
+        """
+        value = (table_options or {}).get(PUSHED_FILTERS_OPTION)
+        if not value:
+            return []
+        return [tuple(pushed) for pushed in json.loads(value)]
+
+
+    def matches_filters(row: Any, filters: list) -> bool:
+        """Whether a parsed row satisfies every `(column, op, value)` filter."""
+        for column, op, value in filters:
+            field = row
+            for name in column.split("."):
+                field = None if field is None else field[name]
+            if field is None:
+                return False
+            if op == "=":
+                matched = field == value
+            elif op == ">":
+                matched = field > value
+            elif op == ">=":
+                matched = field >= value
+            elif op == "<":
+                matched = field < value
+            elif op == "<=":
+                matched = field <= value
+            elif op == "in":
+                matched = field in value
+            else:
+                raise ValueError(f"Unsupported filter operator {op!r}")
+            if not matched:
+                return False
+        return True
+
+
+    # Table option listing the columns a batch read returns, comma-separated;
+    # nested struct fields are written as `parent.field`.
+    COLUMNS_OPTION = "lakeflow.columns"
+    # Table option through which the batch reader hands the columns it needs to
+    # `read_table`, as a JSON list of column paths.
+    PROJECTION_OPTION = "lakeflow.projection"
+
+
+    def prune_schema(schema: StructType, columns: list) -> StructType:
+        """
+        Keep only `columns` of `schema`, in schema order.
+
+        A column is a top-level name or a `parent.field` path into a struct
+        column. Unknown columns raise a ValueError.
+        """
+        selected = {}
+        for column in columns:
+            name, _, sub = column.partition(".")
+            if name not in schema.fieldNames():
+                raise ValueError(f"Unknown column '{column}'")
+            if not sub:
+                selected[name] = None
+                continue
+            data_type = schema[name].dataType
+            if not isinstance(data_type, StructType) or sub not in data_type.fieldNames():
+                raise ValueError(f"Unknown column '{column}'")
+            if name not in selected or selected[name] is not None:
+                selected.setdefault(name, set()).add(sub)
+
+        fields = []
+        for field in schema.fields:
+            if field.name not in selected:
+                continue
+            subfields = selected[field.name]
+            if subfields is None:
+                fields.append(field)
+            else:
+                fields.append(
+                    StructField(
+                        field.name,
+                        StructType([f for f in field.dataType.fields if f.name in subfields]),
+                        field.nullable,
+                        field.metadata,
+                    )
+                )
+        return StructType(fields)
+
+
+    def projection_paths(schema: StructType, full_schema: StructType) -> Optional[list]:
+        """
+        Describe a pruned `schema` as column paths of `full_schema`.
+
+        Returns None when nothing was pruned. Struct columns whose fields were
+        pruned are listed field by field as `parent.field`.
+        """
+        if schema == full_schema:
+            return None
+        paths = []
+        for field in schema.fields:
+            full_type = (
+                full_schema[field.name].dataType
+                if field.name in full_schema.fieldNames()
+                else None
+            )
+            if (
+                isinstance(field.dataType, StructType)
+                and isinstance(full_type, StructType)
+                and field.dataType != full_type
+            ):
+                paths.extend(f"{field.name}.{sub}" for sub in field.dataType.fieldNames())
+            else:
+                paths.append(field.name)
+        return paths
+
+
+    def projected_fields(table_options: Optional[dict], column: str) -> Optional[set]:
+        """
+        Fields of `column` a read has to return.
+
+        None means the whole column (or no projection was pushed down); an
+        empty set means the column is not read at all. For a struct column, the
+        set holds the names of its selected fields.
+        """
+        value = (table_options or {}).get(PROJECTION_OPTION)
+        if not value:
+            return None
+        fields = set()
+        for path in json.loads(value):
+            name, _, sub = path.partition(".")
+            if name != column:
+                continue
+            if not sub:
+                return None
+            fields.add(sub)
+        return fields
+
+
+    ########################################################
+    # libs/metrics.py
+    ########################################################
+
+    METRICS_PATH_OPTION = "lakeflow.metrics.path"
+    DEFAULT_METRICS_PATH = os.path.join(tempfile.gettempdir(), "lakeflow_metrics")
+
+    # Upper bounds (in milliseconds) of the request latency histogram buckets; the
+    # last bucket counts everything slower than the largest bound.
+    LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    # Path segments that look like identifiers are collapsed so that per-endpoint
+    # statistics do not grow with the number of records (e.g. /tickets/{id}/comments).
+    _ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,}|[A-Za-z]+_[A-Za-z0-9]{8,})$")
+
+
+    def endpoint_name(url: str) -> str:
+        """Return the path of a request URL with identifier segments replaced by {id}."""
+        path = urlparse(url).path or "/"
+        return "/".join(
+            "{id}" if _ID_SEGMENT.match(segment) else segment
+            for segment in path.split("/")
+        )
+
+
+    class ReadMetrics:
+        """
+        Counters describing the work done by a connector for one read.
+
+        Connectors report HTTP traffic by registering `on_response` as a requests
+        response hook (see `attach_metrics`) and call `record_retry` whenever they
+        retry a request. The shared read path adds the records emitted and the time
+        spent reading from the connector versus converting records to rows, then
+        takes a snapshot per micro-batch with `collect`.
+
+        Counters may be updated from several threads at once.
+        """
+
+        def __init__(self) -> None:
+            self._lock = threading.Lock()
+            self._reset()
+
+        def __getstate__(self) -> dict:
+            # Locks cannot be pickled; each process gets its own.
+            state = self.__dict__.copy()
+            del state["_lock"]
+            return state
+
+        def __setstate__(self, state: dict) -> None:
+            self.__dict__.update(state)
+            self._lock = threading.Lock()
+
+        def _reset(self) -> None:
+            self.requests = 0
+            self.retries = 0
+            self.throttled = 0
+            self.errors = 0
+            self.bytes_downloaded = 0
+            self.fetch_seconds = 0.0
+            self.records = 0
+            self.read_seconds = 0.0
+            self.parse_seconds = 0.0
+            self.endpoints = {}
+
+        def on_response(self, response, *args, **kwargs):
+            """requests response hook recording one HTTP round trip."""
+            elapsed = response.elapsed.total_seconds()
+            content_length = response.headers.get("Content-Length")
+            try:
+                size = int(content_length)
+            except (TypeError, ValueError):
+                size = len(response.content or b"")
+            endpoint = endpoint_name(response.url)
+            elapsed_ms = elapsed * 1000
+
+            with self._lock:
+                self.requests += 1
+                self.bytes_downloaded += size
+                self.fetch_seconds += elapsed
+                if response.status_code == 429:
+                    self.throttled += 1
+                elif response.status_code >= 400:
+                    self.errors += 1
+
+                stats = self.endpoints.get(endpoint)
+                if stats is None:
+                    stats = {
+                        "requests": 0,
+                        "total_ms": 0.0,
+                        "max_ms": 0.0,
+                        "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                    }
+                    self.endpoints[endpoint] = stats
+                stats["requests"] += 1
+                stats["total_ms"] += elapsed_ms
+                stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+                bucket = len(LATENCY_BUCKETS_MS)
+                for index, bound in enumerate(LATENCY_BUCKETS_MS):
+                    if elapsed_ms <= bound:
+                        bucket = index
+                        break
+                stats["buckets"][bucket] += 1
+            return response
+
+        def record_retry(self) -> None:
+            """Count a request that is about to be retried."""
+            with self._lock:
+                self.retries += 1
+
+        def record_read(self, records: int, read_seconds: float, parse_seconds: float):
+            """Add the records emitted by a read and where its time went."""
+            with self._lock:
+                self.records += records
+                self.read_seconds += read_seconds
+                self.parse_seconds += parse_seconds
+
+        def collect(self) -> dict:
+            """Return the counters gathered so far and start counting from zero."""
+            with self._lock:
+                snapshot = {
+                    "requests": self.requests,
+                    "retries": self.retries,
+                    "throttled": self.throttled,
+                    "errors": self.errors,
+                    "bytes_downloaded": self.bytes_downloaded,
+                    "records": self.records,
+                    "read_seconds": round(self.read_seconds, 6),
+                    "fetch_seconds": round(self.fetch_seconds, 6),
+                    "parse_seconds": round(self.parse_seconds, 6),
+                    "endpoints": [
+                        {
+                            "endpoint": endpoint,
+                            "requests": stats["requests"],
+                            "total_ms": round(stats["total_ms"], 3),
+                            "max_ms": round(stats["max_ms"], 3),
+                            "buckets": list(stats["buckets"]),
+                        }
+                        for endpoint, stats in sorted(self.endpoints.items())
+                    ],
+                }
+                self._reset()
+            return snapshot
+
+
+    def attach_metrics(session, metrics: ReadMetrics) -> None:
+        """Report every response received through a requests session to `metrics`."""
+        session.hooks["response"].append(metrics.on_response)
+
+
+    def timed_rows(
+        records: Iterable[Any],
+        convert,
+        metrics: ReadMetrics,
+        read_seconds: float,
+        on_complete=None,
+    ) -> Iterator[Any]:
+        """
+        Convert records lazily while measuring conversion time.
+
+        `read_seconds` is the time already spent producing `records`; time spent
+        pulling further records out of a lazy iterator is added to it. Once the
+        records are exhausted the totals are added to `metrics` and
+        `on_complete` (if given) is called.
+        """
+        count = 0
+        parse_seconds = 0.0
+        iterator = iter(records)
+        perf_counter = time.perf_counter
+        while True:
+            started = perf_counter()
+            try:
+                record = next(iterator)
+            except StopIteration:
+                read_seconds += perf_counter() - started
+                break
+            converted = perf_counter()
+            row = convert(record)
+            parse_seconds += perf_counter() - converted
+            read_seconds += converted - started
+            count += 1
+            yield row
+        metrics.record_read(count, read_seconds, parse_seconds)
+        if on_complete is not None:
+            on_complete()
+
+
+    def _metrics_file(directory: str, table_name: str) -> str:
+        return os.path.join(directory, f"{table_name}.jsonl".replace(os.sep, "_"))
+
+
+    def append_metrics_line(directory: str, table_name: str, line: dict) -> None:
+        """
+        Append one metrics line to the log of `table_name` in `directory`.
+
+        The line is written with a single call so concurrent readers of the same
+        table do not interleave their lines. Failing to write is ignored: metrics
+        must never fail the read itself.
+        """
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(_metrics_file(directory, table_name), "a") as f:
+                f.write(json.dumps(line, default=str) + "\n")
+        except OSError:
+            pass
+
+
+    def read_metrics_lines(directory: str, table_name: str) -> list[dict]:
+        """Return the metrics lines logged for `table_name`, oldest first."""
+        try:
+            with open(_metrics_file(directory, table_name)) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # A line cut short by a read that died while writing it.
+                continue
+        return records
+
+
+    ########################################################
+    # libs/profiling.py
+    ########################################################
+
+    PROFILE_OPTION = "lakeflow.profile"
+    # Directory the profiles are written to; it must be writable by the executors.
+    PROFILE_PATH_OPTION = "lakeflow.profile.path"
+    DEFAULT_PROFILE_PATH = os.path.join(tempfile.gettempdir(), "lakeflow_profiles")
+
+    # Functions whose cumulative time makes up each category of the breakdown, as
+    # (file name suffix or None for any file, function name pattern). C functions
+    # have the file name "~". Whatever is not in a category is time spent in the
+    # connector's own code.
+    PROFILE_CATEGORIES = {
+        "fetch_seconds": [("requests/sessions.py", r"send")],
+        "json_decode_seconds": [
+            ("json/decoder.py", r"decode"),
+            ("~", r"<orjson\.loads>"),
+            ("~", r"<msgspec\..*decode>"),
+        ],
+        "parse_seconds": [(None, r"parse_value")],
+    }
+
+    # Number of functions listed in the JSON summary of a profile.
+    _TOP_FUNCTIONS = 30
+
+
+    def profile_breakdown(stats: pstats.Stats, total_seconds: float) -> dict:
+        """
+        Split the profiled time into fetching, JSON decoding, `parse_value`
+        conversion and the connector's own code (`connector_seconds`).
+        """
+        breakdown = {category: 0.0 for category in PROFILE_CATEGORIES}
+        for (filename, _, function), (_, _, _, cumulative, _) in stats.stats.items():
+            normalized = filename.replace(os.sep, "/")
+            for category, functions in PROFILE_CATEGORIES.items():
+                for suffix, name in functions:
+                    if re.fullmatch(name, function) and (
+                        suffix is None or normalized.endswith(suffix)
+                    ):
+                        breakdown[category] += cumulative
+        breakdown["connector_seconds"] = max(total_seconds - sum(breakdown.values()), 0.0)
+        breakdown["total_seconds"] = total_seconds
+        return {key: round(value, 6) for key, value in breakdown.items()}
+
+
+    class ReadProfiler:
+        """
+        Profiles one read with cProfile when `lakeflow.profile` is enabled.
+
+        Use the profiler as a context manager around the `read_table` call and
+        pass the rows returned to Spark through `rows`, which profiles pulling
+        (and converting) every record. Once the rows are exhausted the profile is
+        written to `lakeflow.profile.path` as `<name>.prof` (load it with
+        `pstats` or snakeviz) with a `<name>.json` summary holding the time
+        breakdown and the most expensive functions, and the summary is printed
+        as a JSON line with `"event": "lakeflow_connect_profile"`.
+
+        When profiling is disabled every method is a pass-through.
+        """
+
+        def __init__(self, options: dict, read_kind: str, **context) -> None:
+            self.enabled = str(options.get(PROFILE_OPTION, "false")).lower() == "true"
+            self.directory = options.get(PROFILE_PATH_OPTION) or DEFAULT_PROFILE_PATH
+            self.table_name = options.get("tableName")
+            self.read_kind = read_kind
+            self.context = context
+            self.seconds = 0.0
+            self._profile = cProfile.Profile() if self.enabled else None
+            self._started = None
+
+        def __enter__(self) -> "ReadProfiler":
+            if self.enabled:
+                self._started = time.perf_counter()
+                self._profile.enable()
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            if self.enabled:
+                self._profile.disable()
+                self.seconds += time.perf_counter() - self._started
+
+        def rows(self, rows: Iterable[Any]) -> Iterable[Any]:
+            """Profile iterating `rows`, then write the profile."""
+            if not self.enabled:
+                return rows
+            return self._profiled_rows(rows)
+
+        def _profiled_rows(self, rows: Iterable[Any]) -> Iterator[Any]:
+            iterator = iter(rows)
+            while True:
+                with self:
+                    try:
+                        row = next(iterator)
+                    except StopIteration:
+                        break
+                yield row
+            self.dump()
+
+        def _file_prefix(self) -> str:
+            parts = [self.table_name or "table", self.read_kind]
+            partition = _partition_id()
+            if partition is not None:
+                parts.append(f"p{partition}")
+            parts += [time.strftime("%Y%m%dT%H%M%S"), uuid.uuid4().hex[:8]]
+            name = "-".join(str(part) for part in parts)
+            return os.path.join(self.directory, name.replace(os.sep, "_"))
+
+        def dump(self) -> Optional[dict]:
+            """Write the profile and its summary; returns the summary."""
+            if not self.enabled:
+                return None
+            stats = pstats.Stats(self._profile)
+            summary = {
+                "event": "lakeflow_connect_profile",
+                "table": self.table_name,
+                "read": self.read_kind,
+                **self.context,
+                **profile_breakdown(stats, self.seconds),
+                "top_functions": [
+                    {
+                        "function": f"{filename}:{line}({function})",
+                        "calls": calls,
+                        "tottime": round(own, 6),
+                        "cumtime": round(cumulative, 6),
+                    }
+                    for (filename, line, function), (_, calls, own, cumulative, _) in sorted(
+                        stats.stats.items(), key=lambda item: item[1][3], reverse=True
+                    )[:_TOP_FUNCTIONS]
+                ],
+            }
+            prefix = self._file_prefix()
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                stats.dump_stats(f"{prefix}.prof")
+                with open(f"{prefix}.json", "w") as f:
+                    json.dump(summary, f, indent=2, default=str)
+                summary["path"] = f"{prefix}.prof"
+            except OSError as e:
+                # Profiling must never fail the read itself.
+                summary["error"] = f"Could not write profile to {self.directory}: {e}"
+            print(
+                json.dumps(
+                    {k: v for k, v in summary.items() if k != "top_functions"},
+                    default=str,
+                )
+            )
+            return summary
+
+
+    def _partition_id() -> Optional[int]:
+        """The Spark partition being read, when running inside a task."""
+        try:
+            from pyspark import TaskContext
+
+            context = TaskContext.get()
+        except Exception:
+            return None
+        return context.partitionId() if context is not None else None
+
+
     ########################################################
     # sources/github/github.py
     ########################################################
 
+    REPO_SCOPED_TABLES = (
+        "issues",
+        "pull_requests",
+        "comments",
+        "commits",
+        "assignees",
+        "branches",
+        "collaborators",
+        "reviews",
+    )
+
+    # Tables a partitioned stream splits per repository, with the path of their
+    # `since`-filtered endpoint under `/repos/{owner}/{repo}/`.
+    PARTITIONED_STREAM_TABLES = {
+        "issues": "issues",
+        "comments": "issues/comments",
+    }
+
+
+    def _build_table_schemas() -> dict[str, StructType]:
+        """Build the Spark schema of every GitHub table."""
+        # Nested `user` / `assignee` struct schema
+        user_struct = StructType(
+            [
+                StructField("login", StringType(), True),
+                StructField("id", LongType(), True),
+                StructField("node_id", StringType(), True),
+                StructField("type", StringType(), True),
+                StructField("site_admin", BooleanType(), True),
+            ]
+        )
+
+        # Nested `label` struct schema
+        label_struct = StructType(
+            [
+                StructField("id", LongType(), True),
+                StructField("node_id", StringType(), True),
+                StructField("name", StringType(), True),
+                StructField("color", StringType(), True),
+                StructField("description", StringType(), True),
+                StructField("default", BooleanType(), True),
+            ]
+        )
+
+        # Nested `milestone` struct schema (subset of fields)
+        milestone_struct = StructType(
+            [
+                StructField("id", LongType(), True),
+                StructField("number", LongType(), True),
+                StructField("title", StringType(), True),
+                StructField("description", StringType(), True),
+                StructField("state", StringType(), True),
+                StructField("created_at", StringType(), True),
+                StructField("updated_at", StringType(), True),
+                StructField("due_on", StringType(), True),
+            ]
+        )
+
+        # For `pull_request` and `reactions` we use MapType to keep the schema
+        # flexible while preserving nested structure without flattening.
+        pull_request_struct = MapType(StringType(), StringType(), True)
+        reactions_struct = MapType(StringType(), StringType(), True)
+
+        # Common nested structs used across multiple tables
+        permissions_struct = StructType(
+            [
+                StructField("admin", BooleanType(), True),
+                StructField("push", BooleanType(), True),
+                StructField("pull", BooleanType(), True),
+            ]
+        )
+
+        license_struct = StructType(
+            [
+                StructField("key", StringType(), True),
+                StructField("name", StringType(), True),
+                StructField("spdx_id", StringType(), True),
+                StructField("url", StringType(), True),
+                StructField("node_id", StringType(), True),
+            ]
+        )
+
+        template_repository_struct = StructType(
+            [
+                StructField("id", LongType(), True),
+                StructField("node_id", StringType(), True),
+                StructField("name", StringType(), True),
+                StructField("full_name", StringType(), True),
+            ]
+        )
+
+        # Primary `issues` table schema
+        issues_schema = StructType(
+            [
+                StructField("id", LongType(), False),
+                StructField("node_id", StringType(), True),
+                StructField("number", LongType(), False),
+                StructField("repository_owner", StringType(), False),
+                StructField("repository_name", StringType(), False),
+                StructField("title", StringType(), True),
+                StructField("body", StringType(), True),
+                StructField("state", StringType(), True),
+                StructField("locked", BooleanType(), True),
+                StructField("comments", LongType(), True),
+                StructField("created_at", StringType(), True),
+                StructField("updated_at", StringType(), True),
+                StructField("closed_at", StringType(), True),
+                StructField("author_association", StringType(), True),
+                StructField("url", StringType(), True),
+                StructField("html_url", StringType(), True),
+                StructField("labels_url", StringType(), True),
+                StructField("comments_url", StringType(), True),
+                StructField("events_url", StringType(), True),
+                StructField("timeline_url", StringType(), True),
+                StructField("state_reason", StringType(), True),
+                StructField("user", user_struct, True),
+                StructField("assignee", user_struct, True),
+                StructField("assignees", ArrayType(user_struct, True), True),
+                StructField("labels", ArrayType(label_struct, True), True),
+                StructField("milestone", milestone_struct, True),
+                StructField("pull_request", pull_request_struct, True),
+                StructField("reactions", reactions_struct, True),
+            ]
+        )
+
+        # `repositories` snapshot metadata schema
+        repositories_schema = StructType(
+            [
+                StructField("id", LongType(), False),
+                StructField("node_id", StringType(), True),
+                StructField("repository_owner", StringType(), False),
+                StructField("repository_name", StringType(), False),
+                StructField("name", StringType(), True),
+                StructField("full_name", StringType(), True),
+                StructField("owner", user_struct, True),
+                StructField("private", BooleanType(), True),
+                StructField("html_url", StringType(), True),
+                StructField("description", StringType(), True),
+                StructField("fork", BooleanType(), True),
+                StructField("url", StringType(), True),
+                StructField("archive_url", StringType(), True),
+                StructField("assignees_url", StringType(), True),
+                StructField("blobs_url", StringType(), True),
+                StructField("branches_url", StringType(), True),
+                StructField("collaborators_url", StringType(), True),
+                StructField("comments_url", StringType(), True),
+                StructField("commits_url", StringType(), True),
+                StructField("compare_url", StringType(), True),
+                StructField("contents_url", StringType(), True),
+                StructField("contributors_url", StringType(), True),
+                StructField("deployments_url", StringType(), True),
+                StructField("downloads_url", StringType(), True),
+                StructField("events_url", StringType(), True),
+                StructField("forks_url", StringType(), True),
+                StructField("git_commits_url", StringType(), True),
+                StructField("git_refs_url", StringType(), True),
+                StructField("git_tags_url", StringType(), True),
+                StructField("git_url", StringType(), True),
+                StructField("issue_comment_url", StringType(), True),
+                StructField("issue_events_url", StringType(), True),
+                StructField("issues_url", StringType(), True),
+                StructField("keys_url", StringType(), True),
+                StructField("labels_url", StringType(), True),
+                StructField("languages_url", StringType(), True),
+                StructField("merges_url", StringType(), True),
+                StructField("milestones_url", StringType(), True),
+                StructField("notifications_url", StringType(), True),
+                StructField("pulls_url", StringType(), True),
+                StructField("releases_url", StringType(), True),
+                StructField("ssh_url", StringType(), True),
+                StructField("stargazers_url", StringType(), True),
+                StructField("statuses_url", StringType(), True),
+                StructField("subscribers_url", StringType(), True),
+                StructField("subscription_url", StringType(), True),
+                StructField("tags_url", StringType(), True),
+                StructField("teams_url", StringType(), True),
+                StructField("trees_url", StringType(), True),
+                StructField("clone_url", StringType(), True),
+                StructField("mirror_url", StringType(), True),
+                StructField("hooks_url", StringType(), True),
+                StructField("svn_url", StringType(), True),
+                StructField("homepage", StringType(), True),
+                StructField("language", StringType(), True),
+                StructField("forks_count", LongType(), True),
+                StructField("stargazers_count", LongType(), True),
+                StructField("watchers_count", LongType(), True),
+                StructField("size", LongType(), True),
+                StructField("default_branch", StringType(), True),
+                StructField("open_issues_count", LongType(), True),
+                StructField("is_template", BooleanType(), True),
+                StructField("topics", ArrayType(StringType(), True), True),
+                StructField("has_issues", BooleanType(), True),
+                StructField("has_projects", BooleanType(), True),
+                StructField("has_wiki", BooleanType(), True),
+                StructField("has_pages", BooleanType(), True),
+                StructField("has_downloads", BooleanType(), True),
+                StructField("archived", BooleanType(), True),
+                StructField("disabled", BooleanType(), True),
+                StructField("visibility", StringType(), True),
+                StructField("pushed_at", StringType(), True),
+                StructField("created_at", StringType(), True),
+                StructField("updated_at", StringType(), True),
+                StructField("permissions", permissions_struct, True),
+                StructField("allow_rebase_merge", BooleanType(), True),
+                StructField(
+                    "template_repository", template_repository_struct, True
+                ),
+                StructField("temp_clone_token", StringType(), True),
+                StructField("allow_squash_merge", BooleanType(), True),
+                StructField("allow_merge_commit", BooleanType(), True),
+                StructField("subscribers_count", LongType(), True),
+                StructField("network_count", LongType(), True),
+                StructField("license", license_struct, True),
+            ]
+        )
+
+        # `pull_requests` cdc table schema
+        pull_requests_schema = StructType(
+            [
+                StructField("id", LongType(), False),
+                StructField("node_id", StringType(), True),
+                StructField("number", LongType(), False),
+                StructField("repository_owner", StringType(), False),
+                StructField("repository_name", StringType(), False),
+                StructField("state", StringType(), True),
+                StructField("title", StringType(), True),
+                StructField("body", StringType(), True),
+                StructField("draft", BooleanType(), True),
+                StructField("created_at", StringType(), True),
+                StructField("updated_at", StringType(), True),
+                StructField("closed_at", StringType(), True),
+                StructField("merged_at", StringType(), True),
+                StructField("merge_commit_sha", StringType(), True),
+                StructField("user", user_struct, True),
+                StructField(
+                    "base", MapType(StringType(), StringType(), True), True
+                ),
+                StructField(
+                    "head", MapType(StringType(), StringType(), True), True
+                ),
+                StructField("html_url", StringType(), True),
+                StructField("url", StringType(), True),
+            ]
+        )
+
+        # `comments` cdc table schema (issue comments)
+        comments_schema = StructType(
+            [
+                StructField("id", LongType(), False),
+                StructField("node_id", StringType(), True),
+                StructField("repository_owner", StringType(), False),
+                StructField("repository_name", StringType(), False),
+                StructField("issue_url", StringType(), True),
+                StructField("html_url", StringType(), True),
+                StructField("body", StringType(), True),
+                StructField("user", user_struct, True),
+                StructField("created_at", StringType(), True),
+                StructField("updated_at", StringType(), True),
+                StructField("author_association", StringType(), True),
+            ]
+        )
+
+        # `commits` append-only table schema
+        commits_schema = StructType(
+            [
+                StructField("sha", StringType(), False),
+                StructField("node_id", StringType(), True),
+                StructField("repository_owner", StringType(), False),
+                StructField("repository_name", StringType(), False),
+                StructField("commit_message", StringType(), True),
+                StructField("commit_author_name", StringType(), True),
+                StructField("commit_author_email", StringType(), True),
+                StructField("commit_author_date", StringType(), True),
+                StructField("commit_committer_name", StringType(), True),
+                StructField("commit_committer_email", StringType(), True),
+                StructField("commit_committer_date", StringType(), True),
+                StructField("html_url", StringType(), True),
+                StructField("url", StringType(), True),
+                StructField("author", user_struct, True),
+                StructField("committer", user_struct, True),
+            ]
+        )
+
+        # `users` snapshot metadata schema
+        users_schema = StructType(
+            [
+                StructField("id", LongType(), False),
+                StructField("login", StringType(), False),
+                StructField("node_id", StringType(), True),
+                StructField("type", StringType(), True),
+                StructField("site_admin", BooleanType(), True),
+                StructField("name", StringType(), True),
+                StructField("company", StringType(), True),
+                StructField("blog", StringType(), True),
+                StructField("location", StringType(), True),
+                StructField("email", StringType(), True),
+                StructField("created_at", StringType(), True),
+                StructField("updated_at", StringType(), True),
+            ]
+        )
+
+        # `organizations` snapshot metadata schema
+        # The organizations table now reflects the shape of the
+        # `GET /user/orgs` response without expanding each org via
+        # `GET /orgs/{org}`. This avoids additional permissions that
+        # may be required for the detail endpoint while still exposing
+        # the most useful summary metadata.
+        orgs_schema = StructType(
+            [
+                StructField("id", LongType(), False),
+                StructField("login", StringType(), False),
+                StructField("node_id", StringType(), True),
+                StructField("url", StringType(), True),
+                StructField("repos_url", StringType(), True),
+                StructField("events_url", StringType(), True),
+                StructField("hooks_url", StringType(), True),
+                StructField("issues_url", StringType(), True),
+                StructField("members_url", StringType(), True),
+                StructField("public_members_url", StringType(), True),
+                StructField("avatar_url", StringType(), True),
+                StructField("description", StringType(), True),
+            ]
+        )
+
+        # `teams` snapshot metadata schema
+        teams_schema = StructType(
+            [
+                StructField("id", LongType(), False),
+                StructField("node_id", StringType(), True),
+                StructField("organization_login", StringType(), False),
+                StructField("name", StringType(), True),
+                StructField("slug", StringType(), True),
+                StructField("description", StringType(), True),
+                StructField("privacy", StringType(), True),
+                StructField("permission", StringType(), True),
+            ]
+        )
+
+        # `assignees` snapshot metadata schema
+        assignees_schema = StructType(
+            [
+                StructField("repository_owner", StringType(), False),
+                StructField("repository_name", StringType(), False),
+                StructField("login", StringType(), False),
+                StructField("id", LongType(), False),
+                StructField("node_id", StringType(), True),
+                StructField("type", StringType(), True),
+                StructField("site_admin", BooleanType(), True),
+            ]
+        )
+
+        # `collaborators` snapshot metadata schema
+        collaborators_schema = StructType(
+            [
+                StructField("repository_owner", StringType(), False),
+                StructField("repository_name", StringType(), False),
+                StructField("login", StringType(), False),
+                StructField("id", LongType(), False),
+                StructField("node_id", StringType(), True),
+                StructField("type", StringType(), True),
+                StructField("site_admin", BooleanType(), True),
+                StructField("permissions", permissions_struct, True),
+            ]
+        )
+
+        # `branches` snapshot metadata schema
+        commit_ref_struct = StructType(
+            [
+                StructField("sha", StringType(), True),
+                StructField("url", StringType(), True),
+            ]
+        )
+        branches_schema = StructType(
+            [
+                StructField("repository_owner", StringType(), False),
+                StructField("repository_name", StringType(), False),
+                StructField("name", StringType(), False),
+                StructField("commit", commit_ref_struct, True),
+                StructField("protected", BooleanType(), True),
+                StructField("protection_url", StringType(), True),
+            ]
+        )
+
+        # `reviews` append-only table schema
+        reviews_schema = StructType(
+            [
+                StructField("id", LongType(), False),
+                StructField("node_id", StringType(), True),
+                StructField("repository_owner", StringType(), False),
+                StructField("repository_name", StringType(), False),
+                StructField("pull_number", LongType(), False),
+                StructField("state", StringType(), True),
+                StructField("body", StringType(), True),
+                StructField("user", user_struct, True),
+                StructField("commit_id", StringType(), True),
+                StructField("submitted_at", StringType(), True),
+                StructField("html_url", StringType(), True),
+            ]
+        )
+
+        return {
+            "issues": issues_schema,
+            "repositories": repositories_schema,
+            "pull_requests": pull_requests_schema,
+            "comments": comments_schema,
+            "commits": commits_schema,
+            "users": users_schema,
+            "organizations": orgs_schema,
+            "teams": teams_schema,
+            "assignees": assignees_schema,
+            "collaborators": collaborators_schema,
+            "branches": branches_schema,
+            "reviews": reviews_schema,
+        }
+
+
+    # Read-only table schemas, built on first use and then reused by every
+    # connector in the process (the schemas are static). Each process that reads
+    # builds its own copy. Use `_table_schemas()` rather than this directly.
+    _TABLE_SCHEMAS: Mapping[str, StructType] | None = None
+
+
+    def _table_schemas() -> Mapping[str, StructType]:
+        """Return the schema of every GitHub table, building them on first use."""
+        global _TABLE_SCHEMAS
+        if _TABLE_SCHEMAS is None:
+            _TABLE_SCHEMAS = MappingProxyType(_build_table_schemas())
+        return _TABLE_SCHEMAS
+
+
+    class RateLimitBudget:
+        """
+        Tracks a token's primary rate limit from GitHub's `X-RateLimit-*` headers.
+
+        The headers report the quota left for the token across every client
+        using it, so each connector instance sees the budget shared by all the
+        tables of a pipeline. While more than `pace_below` of the hourly limit is
+        left, requests go out unthrottled. Below that, the remaining requests are
+        spread evenly until the limit resets. Reads of snapshot tables stop once
+        only `reserve` requests are left and wait for the reset, which keeps
+        the rest of the quota for incremental tables.
+
+        `wait` may be called from several threads at once.
+        """
+
+        def __init__(self, reserve: int = 500, pace_below: float = 0.5) -> None:
+            self.reserve = reserve
+            self.pace_below = pace_below
+            self.limit = None
+            self.remaining = None
+            self.reset_at = None
+            self.blocked_until = 0.0
+            self._next_slot = 0.0
+            self._lock = threading.Lock()
+
+        def __getstate__(self) -> dict:
+            # Locks cannot be pickled; each process gets its own.
+            state = self.__dict__.copy()
+            del state["_lock"]
+            return state
+
+        def __setstate__(self, state: dict) -> None:
+            self.__dict__.update(state)
+            self._lock = threading.Lock()
+
+        def update(self, response: requests.Response) -> None:
+            """Record the quota reported by a response, if it reports one."""
+            headers = response.headers
+            if headers.get("X-RateLimit-Resource", "core") != "core":
+                # Search and GraphQL quotas are separate from the REST one.
+                return
+            try:
+                remaining = int(headers["X-RateLimit-Remaining"])
+                reset_at = int(headers["X-RateLimit-Reset"])
+                limit = int(headers.get("X-RateLimit-Limit", 0)) or None
+            except (KeyError, TypeError, ValueError):
+                return
+            with self._lock:
+                if self.reset_at is None or reset_at > self.reset_at:
+                    # A new rate limit window has started.
+                    self.reset_at = reset_at
+                    self.remaining = remaining
+                elif reset_at == self.reset_at:
+                    # Responses of concurrent requests may arrive out of order.
+                    self.remaining = min(self.remaining, remaining)
+                self.limit = limit or self.limit
+
+        def block(self, seconds: float) -> None:
+            """Send nothing for `seconds`, e.g. after a rate-limited response."""
+            with self._lock:
+                self.blocked_until = max(self.blocked_until, time.time() + seconds)
+
+        def available(self) -> float:
+            """
+            Requests that can be sent right away: infinite while the quota is not
+            known yet, -1 while blocked or exhausted.
+            """
+            with self._lock:
+                now = time.time()
+                if self.blocked_until > now:
+                    return -1
+                if self.remaining is None or self.reset_at is None or now >= self.reset_at:
+                    return float("inf")
+                return self.remaining if self.remaining > 0 else -1
+
+        def delay(self, low_priority: bool = False) -> float:
+            """
+            Reserve the next request and return how long to wait before sending it.
+            """
+            with self._lock:
+                now = time.time()
+                if self.blocked_until > now:
+                    return self.blocked_until - now
+                if self.remaining is None or self.reset_at is None or now >= self.reset_at:
+                    return 0.0
+                until_reset = self.reset_at - now + 1
+                if self.remaining <= 0 or (low_priority and self.remaining <= self.reserve):
+                    return until_reset
+                self.remaining -= 1
+                if self.limit and self.remaining >= self.limit * self.pace_below:
+                    return 0.0
+                interval = until_reset / (self.remaining + 1)
+                slot = max(now, self._next_slot)
+                self._next_slot = slot + interval
+                return slot - now
+
+        def retry_delay(self, response: requests.Response) -> float | None:
+            """
+            Seconds to wait before retrying a rate-limited response, or None if
+            the response was not rate limited.
+            """
+            if response.status_code not in (403, 429):
+                return None
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    return max(1.0, float(retry_after))
+                except ValueError:
+                    return 60.0
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                try:
+                    reset_at = int(response.headers["X-RateLimit-Reset"])
+                except (KeyError, ValueError):
+                    return 60.0
+                return max(1.0, reset_at - time.time() + 1)
+            if response.status_code == 429 or "rate limit" in response.text.lower():
+                # Secondary rate limits without Retry-After: wait at least a minute.
+                return 60.0
+            return None
+
+
+    class TokenPool:
+        """
+        Tokens requests are spread over, each with its own `RateLimitBudget`.
+
+        `acquire` hands out the token with the most quota left that has fewer
+        than `max_in_flight` requests running, blocking until one frees up, so
+        throughput grows with the number of tokens configured.
+        """
+
+        def __init__(
+            self,
+            tokens: list[str],
+            max_in_flight: int = 10,
+            reserve: int = 500,
+            pace_below: float = 0.5,
+        ) -> None:
+            self.tokens = tokens
+            self.max_in_flight = max(1, max_in_flight)
+            self.budgets = [
+                RateLimitBudget(reserve=reserve, pace_below=pace_below) for _ in tokens
+            ]
+            self.in_flight = [0] * len(tokens)
+            self._available = threading.Condition()
+
+        def __getstate__(self) -> dict:
+            # Conditions cannot be pickled; each process gets its own.
+            state = self.__dict__.copy()
+            del state["_available"]
+            return state
+
+        def __setstate__(self, state: dict) -> None:
+            self.__dict__.update(state)
+            self._available = threading.Condition()
+
+        def acquire(self) -> int:
+            """Return the index of the token to send the next request with."""
+            with self._available:
+                while True:
+                    free = [
+                        index
+                        for index, running in enumerate(self.in_flight)
+                        if running < self.max_in_flight
+                    ]
+                    if free:
+                        index = max(
+                            free,
+                            key=lambda i: (self.budgets[i].available(), -self.in_flight[i]),
+                        )
+                        self.in_flight[index] += 1
+                        return index
+                    self._available.wait()
+
+        def release(self, index: int) -> None:
+            """Mark a request sent with token `index` as finished."""
+            with self._available:
+                self.in_flight[index] -= 1
+                self._available.notify()
+
+
     class LakeflowConnect:
+        # Upper bound on the windows of a commits backfill plan.
+        MAX_BACKFILL_WINDOWS = 200
+
         def __init__(self, options: dict[str, str]) -> None:
             """
             Initialize the GitHub connector with connection-level options.
 
             Expected options:
                 - token: Personal access token used for GitHub REST API authentication.
+                - tokens (optional): Comma-separated personal access or GitHub App
+                  installation tokens to spread requests over, used with or
+                  instead of `token`.
+                - max_concurrent_requests_per_token (optional): Requests in flight
+                  per token at most. Defaults to 10.
                 - base_url (optional): Override for GitHub API base URL. Defaults to https://api.github.com.
+                - max_retries (optional): Times a rate-limited request is retried
+                  after waiting for the limit to reset. Defaults to 3.
+                - rate_limit_reserve (optional): Requests left in the hourly quota
+                  at which snapshot tables wait for the reset, keeping the rest for
+                  incremental tables. Defaults to 500.
+                - rate_limit_pace_below (optional): Fraction of the hourly quota
+                  below which requests are spread evenly until the reset.
+                  Defaults to 0.5.
             """
-            token = options.get("token")
-            if not token:
-                raise ValueError("GitHub connector requires 'token' in options")
+            tokens = [options.get("token")] + str(options.get("tokens") or "").split(",")
+            tokens = list(dict.fromkeys(t.strip() for t in tokens if t and t.strip()))
+            if not tokens:
+                raise ValueError("GitHub connector requires 'token' or 'tokens' in options")
 
             self.base_url = options.get("base_url", "https://api.github.com").rstrip("/")
 
-            # Configure a session with proper headers for GitHub REST API v3
+            # Configure a session with proper headers for GitHub REST API v3; the
+            # Authorization header is set per request by `_get`.
             self._session = requests.Session()
-            self._session.headers.update(
-                {
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                }
+            self._session.headers.update({"Accept": "application/vnd.github+json"})
+            # Request, byte and latency counters reported per micro-batch
+            self.metrics = ReadMetrics()
+            attach_metrics(self._session, self.metrics)
+            # Number of times a rate-limited (403/429) request is retried
+            self.max_retries = int(options.get("max_retries", 3))
+            self.token_pool = TokenPool(
+                tokens,
+                max_in_flight=int(options.get("max_concurrent_requests_per_token", 10)),
+                reserve=int(options.get("rate_limit_reserve", 500)),
+                pace_below=float(options.get("rate_limit_pace_below", 0.5)),
             )
+            # Whether the table being read gives way to incremental tables when
+            # the quota runs low (set per read_table call).
+            self._low_priority = False
 
         def list_tables(self) -> list[str]:
             """
@@ -212,413 +1618,13 @@ def register_lakeflow_source(spark):
             Fetch the schema of a table.
 
             The schema is static and derived from the GitHub REST API documentation
-            and connector design for the `issues` object.
-            """
-            # Nested `user` / `assignee` struct schema
-            user_struct = StructType(
-                [
-                    StructField("login", StringType(), True),
-                    StructField("id", LongType(), True),
-                    StructField("node_id", StringType(), True),
-                    StructField("type", StringType(), True),
-                    StructField("site_admin", BooleanType(), True),
-                ]
-            )
-
-            # Nested `label` struct schema
-            label_struct = StructType(
-                [
-                    StructField("id", LongType(), True),
-                    StructField("node_id", StringType(), True),
-                    StructField("name", StringType(), True),
-                    StructField("color", StringType(), True),
-                    StructField("description", StringType(), True),
-                    StructField("default", BooleanType(), True),
-                ]
-            )
-
-            # Nested `milestone` struct schema (subset of fields)
-            milestone_struct = StructType(
-                [
-                    StructField("id", LongType(), True),
-                    StructField("number", LongType(), True),
-                    StructField("title", StringType(), True),
-                    StructField("description", StringType(), True),
-                    StructField("state", StringType(), True),
-                    StructField("created_at", StringType(), True),
-                    StructField("updated_at", StringType(), True),
-                    StructField("due_on", StringType(), True),
-                ]
-            )
-
-            # For `pull_request` and `reactions` we use MapType to keep the schema
-            # flexible while preserving nested structure without flattening.
-            pull_request_struct = MapType(StringType(), StringType(), True)
-            reactions_struct = MapType(StringType(), StringType(), True)
-
-            # Common nested structs used across multiple tables
-            permissions_struct = StructType(
-                [
-                    StructField("admin", BooleanType(), True),
-                    StructField("push", BooleanType(), True),
-                    StructField("pull", BooleanType(), True),
-                ]
-            )
-
-            license_struct = StructType(
-                [
-                    StructField("key", StringType(), True),
-                    StructField("name", StringType(), True),
-                    StructField("spdx_id", StringType(), True),
-                    StructField("url", StringType(), True),
-                    StructField("node_id", StringType(), True),
-                ]
-            )
-
-            template_repository_struct = StructType(
-                [
-                    StructField("id", LongType(), True),
-                    StructField("node_id", StringType(), True),
-                    StructField("name", StringType(), True),
-                    StructField("full_name", StringType(), True),
-                ]
-            )
-
-            # Primary `issues` table schema
-            issues_schema = StructType(
-                [
-                    StructField("id", LongType(), False),
-                    StructField("node_id", StringType(), True),
-                    StructField("number", LongType(), False),
-                    StructField("repository_owner", StringType(), False),
-                    StructField("repository_name", StringType(), False),
-                    StructField("title", StringType(), True),
-                    StructField("body", StringType(), True),
-                    StructField("state", StringType(), True),
-                    StructField("locked", BooleanType(), True),
-                    StructField("comments", LongType(), True),
-                    StructField("created_at", StringType(), True),
-                    StructField("updated_at", StringType(), True),
-                    StructField("closed_at", StringType(), True),
-                    StructField("author_association", StringType(), True),
-                    StructField("url", StringType(), True),
-                    StructField("html_url", StringType(), True),
-                    StructField("labels_url", StringType(), True),
-                    StructField("comments_url", StringType(), True),
-                    StructField("events_url", StringType(), True),
-                    StructField("timeline_url", StringType(), True),
-                    StructField("state_reason", StringType(), True),
-                    StructField("user", user_struct, True),
-                    StructField("assignee", user_struct, True),
-                    StructField("assignees", ArrayType(user_struct, True), True),
-                    StructField("labels", ArrayType(label_struct, True), True),
-                    StructField("milestone", milestone_struct, True),
-                    StructField("pull_request", pull_request_struct, True),
-                    StructField("reactions", reactions_struct, True),
-                ]
-            )
-
-            if table_name == "issues":
-                return issues_schema
-
-            # `repositories` snapshot metadata schema
-            if table_name == "repositories":
-                repositories_schema = StructType(
-                    [
-                        StructField("id", LongType(), False),
-                        StructField("node_id", StringType(), True),
-                        StructField("repository_owner", StringType(), False),
-                        StructField("repository_name", StringType(), False),
-                        StructField("name", StringType(), True),
-                        StructField("full_name", StringType(), True),
-                        StructField("owner", user_struct, True),
-                        StructField("private", BooleanType(), True),
-                        StructField("html_url", StringType(), True),
-                        StructField("description", StringType(), True),
-                        StructField("fork", BooleanType(), True),
-                        StructField("url", StringType(), True),
-                        StructField("archive_url", StringType(), True),
-                        StructField("assignees_url", StringType(), True),
-                        StructField("blobs_url", StringType(), True),
-                        StructField("branches_url", StringType(), True),
-                        StructField("collaborators_url", StringType(), True),
-                        StructField("comments_url", StringType(), True),
-                        StructField("commits_url", StringType(), True),
-                        StructField("compare_url", StringType(), True),
-                        StructField("contents_url", StringType(), True),
-                        StructField("contributors_url", StringType(), True),
-                        StructField("deployments_url", StringType(), True),
-                        StructField("downloads_url", StringType(), True),
-                        StructField("events_url", StringType(), True),
-                        StructField("forks_url", StringType(), True),
-                        StructField("git_commits_url", StringType(), True),
-                        StructField("git_refs_url", StringType(), True),
-                        StructField("git_tags_url", StringType(), True),
-                        StructField("git_url", StringType(), True),
-                        StructField("issue_comment_url", StringType(), True),
-                        StructField("issue_events_url", StringType(), True),
-                        StructField("issues_url", StringType(), True),
-                        StructField("keys_url", StringType(), True),
-                        StructField("labels_url", StringType(), True),
-                        StructField("languages_url", StringType(), True),
-                        StructField("merges_url", StringType(), True),
-                        StructField("milestones_url", StringType(), True),
-                        StructField("notifications_url", StringType(), True),
-                        StructField("pulls_url", StringType(), True),
-                        StructField("releases_url", StringType(), True),
-                        StructField("ssh_url", StringType(), True),
-                        StructField("stargazers_url", StringType(), True),
-                        StructField("statuses_url", StringType(), True),
-                        StructField("subscribers_url", StringType(), True),
-                        StructField("subscription_url", StringType(), True),
-                        StructField("tags_url", StringType(), True),
-                        StructField("teams_url", StringType(), True),
-                        StructField("trees_url", StringType(), True),
-                        StructField("clone_url", StringType(), True),
-                        StructField("mirror_url", StringType(), True),
-                        StructField("hooks_url", StringType(), True),
-                        StructField("svn_url", StringType(), True),
-                        StructField("homepage", StringType(), True),
-                        StructField("language", StringType(), True),
-                        StructField("forks_count", LongType(), True),
-                        StructField("stargazers_count", LongType(), True),
-                        StructField("watchers_count", LongType(), True),
-                        StructField("size", LongType(), True),
-                        StructField("default_branch", StringType(), True),
-                        StructField("open_issues_count", LongType(), True),
-                        StructField("is_template", BooleanType(), True),
-                        StructField("topics", ArrayType(StringType(), True), True),
-                        StructField("has_issues", BooleanType(), True),
-                        StructField("has_projects", BooleanType(), True),
-                        StructField("has_wiki", BooleanType(), True),
-                        StructField("has_pages", BooleanType(), True),
-                        StructField("has_downloads", BooleanType(), True),
-                        StructField("archived", BooleanType(), True),
-                        StructField("disabled", BooleanType(), True),
-                        StructField("visibility", StringType(), True),
-                        StructField("pushed_at", StringType(), True),
-                        StructField("created_at", StringType(), True),
-                        StructField("updated_at", StringType(), True),
-                        StructField("permissions", permissions_struct, True),
-                        StructField("allow_rebase_merge", BooleanType(), True),
-                        StructField(
-                            "template_repository", template_repository_struct, True
-                        ),
-                        StructField("temp_clone_token", StringType(), True),
-                        StructField("allow_squash_merge", BooleanType(), True),
-                        StructField("allow_merge_commit", BooleanType(), True),
-                        StructField("subscribers_count", LongType(), True),
-                        StructField("network_count", LongType(), True),
-                        StructField("license", license_struct, True),
-                    ]
-                )
-                return repositories_schema
-
-            # `pull_requests` cdc table schema
-            if table_name == "pull_requests":
-                pull_requests_schema = StructType(
-                    [
-                        StructField("id", LongType(), False),
-                        StructField("node_id", StringType(), True),
-                        StructField("number", LongType(), False),
-                        StructField("repository_owner", StringType(), False),
-                        StructField("repository_name", StringType(), False),
-                        StructField("state", StringType(), True),
-                        StructField("title", StringType(), True),
-                        StructField("body", StringType(), True),
-                        StructField("draft", BooleanType(), True),
-                        StructField("created_at", StringType(), True),
-                        StructField("updated_at", StringType(), True),
-                        StructField("closed_at", StringType(), True),
-                        StructField("merged_at", StringType(), True),
-                        StructField("merge_commit_sha", StringType(), True),
-                        StructField("user", user_struct, True),
-                        StructField(
-                            "base", MapType(StringType(), StringType(), True), True
-                        ),
-                        StructField(
-                            "head", MapType(StringType(), StringType(), True), True
-                        ),
-                        StructField("html_url", StringType(), True),
-                        StructField("url", StringType(), True),
-                    ]
-                )
-                return pull_requests_schema
-
-            # `comments` cdc table schema (issue comments)
-            if table_name == "comments":
-                comments_schema = StructType(
-                    [
-                        StructField("id", LongType(), False),
-                        StructField("node_id", StringType(), True),
-                        StructField("repository_owner", StringType(), False),
-                        StructField("repository_name", StringType(), False),
-                        StructField("issue_url", StringType(), True),
-                        StructField("html_url", StringType(), True),
-                        StructField("body", StringType(), True),
-                        StructField("user", user_struct, True),
-                        StructField("created_at", StringType(), True),
-                        StructField("updated_at", StringType(), True),
-                        StructField("author_association", StringType(), True),
-                    ]
-                )
-                return comments_schema
-
-            # `commits` append-only table schema
-            if table_name == "commits":
-                commits_schema = StructType(
-                    [
-                        StructField("sha", StringType(), False),
-                        StructField("node_id", StringType(), True),
-                        StructField("repository_owner", StringType(), False),
-                        StructField("repository_name", StringType(), False),
-                        StructField("commit_message", StringType(), True),
-                        StructField("commit_author_name", StringType(), True),
-                        StructField("commit_author_email", StringType(), True),
-                        StructField("commit_author_date", StringType(), True),
-                        StructField("commit_committer_name", StringType(), True),
-                        StructField("commit_committer_email", StringType(), True),
-                        StructField("commit_committer_date", StringType(), True),
-                        StructField("html_url", StringType(), True),
-                        StructField("url", StringType(), True),
-                        StructField("author", user_struct, True),
-                        StructField("committer", user_struct, True),
-                    ]
-                )
-                return commits_schema
-
-            # `users` snapshot metadata schema
-            if table_name == "users":
-                users_schema = StructType(
-                    [
-                        StructField("id", LongType(), False),
-                        StructField("login", StringType(), False),
-                        StructField("node_id", StringType(), True),
-                        StructField("type", StringType(), True),
-                        StructField("site_admin", BooleanType(), True),
-                        StructField("name", StringType(), True),
-                        StructField("company", StringType(), True),
-                        StructField("blog", StringType(), True),
-                        StructField("location", StringType(), True),
-                        StructField("email", StringType(), True),
-                        StructField("created_at", StringType(), True),
-                        StructField("updated_at", StringType(), True),
-                    ]
-                )
-                return users_schema
-
-            # `organizations` snapshot metadata schema
-            if table_name == "organizations":
-                # The organizations table now reflects the shape of the
-                # `GET /user/orgs` response without expanding each org via
-                # `GET /orgs/{org}`. This avoids additional permissions that
-                # may be required for the detail endpoint while still exposing
-                # the most useful summary metadata.
-                orgs_schema = StructType(
-                    [
-                        StructField("id", LongType(), False),
-                        StructField("login", StringType(), False),
-                        StructField("node_id", StringType(), True),
-                        StructField("url", StringType(), True),
-                        StructField("repos_url", StringType(), True),
-                        StructField("events_url", StringType(), True),
-                        StructField("hooks_url", StringType(), True),
-                        StructField("issues_url", StringType(), True),
-                        StructField("members_url", StringType(), True),
-                        StructField("public_members_url", StringType(), True),
-                        StructField("avatar_url", StringType(), True),
-                        StructField("description", StringType(), True),
-                    ]
-                )
-                return orgs_schema
-
-            # `teams` snapshot metadata schema
-            if table_name == "teams":
-                teams_schema = StructType(
-                    [
-                        StructField("id", LongType(), False),
-                        StructField("node_id", StringType(), True),
-                        StructField("organization_login", StringType(), False),
-                        StructField("name", StringType(), True),
-                        StructField("slug", StringType(), True),
-                        StructField("description", StringType(), True),
-                        StructField("privacy", StringType(), True),
-                        StructField("permission", StringType(), True),
-                    ]
-                )
-                return teams_schema
-
-            # `assignees` snapshot metadata schema
-            if table_name == "assignees":
-                assignees_schema = StructType(
-                    [
-                        StructField("repository_owner", StringType(), False),
-                        StructField("repository_name", StringType(), False),
-                        StructField("login", StringType(), False),
-                        StructField("id", LongType(), False),
-                        StructField("node_id", StringType(), True),
-                        StructField("type", StringType(), True),
-                        StructField("site_admin", BooleanType(), True),
-                    ]
-                )
-                return assignees_schema
-
-            # `collaborators` snapshot metadata schema
-            if table_name == "collaborators":
-                collaborators_schema = StructType(
-                    [
-                        StructField("repository_owner", StringType(), False),
-                        StructField("repository_name", StringType(), False),
-                        StructField("login", StringType(), False),
-                        StructField("id", LongType(), False),
-                        StructField("node_id", StringType(), True),
-                        StructField("type", StringType(), True),
-                        StructField("site_admin", BooleanType(), True),
-                        StructField("permissions", permissions_struct, True),
-                    ]
-                )
-                return collaborators_schema
-
-            # `branches` snapshot metadata schema
-            if table_name == "branches":
-                commit_ref_struct = StructType(
-                    [
-                        StructField("sha", StringType(), True),
-                        StructField("url", StringType(), True),
-                    ]
-                )
-                branches_schema = StructType(
-                    [
-                        StructField("repository_owner", StringType(), False),
-                        StructField("repository_name", StringType(), False),
-                        StructField("name", StringType(), False),
-                        StructField("commit", commit_ref_struct, True),
-                        StructField("protected", BooleanType(), True),
-                        StructField("protection_url", StringType(), True),
-                    ]
-                )
-                return branches_schema
-
-            # `reviews` append-only table schema
-            if table_name == "reviews":
-                reviews_schema = StructType(
-                    [
-                        StructField("id", LongType(), False),
-                        StructField("node_id", StringType(), True),
-                        StructField("repository_owner", StringType(), False),
-                        StructField("repository_name", StringType(), False),
-                        StructField("pull_number", LongType(), False),
-                        StructField("state", StringType(), True),
-                        StructField("body", StringType(), True),
-                        StructField("user", user_struct, True),
-                        StructField("commit_id", StringType(), True),
-                        StructField("submitted_at", StringType(), True),
-                        StructField("html_url", StringType(), True),
-                    ]
-                )
-                return reviews_schema
-
-            raise ValueError(f"Unsupported table: {table_name!r}")
+            and connector design for the `issues` object. All schemas are built
+            on the first call and reused afterwards.
+            """
+            table_schemas = _table_schemas()
+            if table_name not in table_schemas:
+                raise ValueError(f"Unsupported table: {table_name!r}")
+            return table_schemas[table_name]
 
         def read_table_metadata(
             self, table_name: str, table_options: dict[str, str]
@@ -655,7 +1661,13 @@ def register_lakeflow_source(spark):
                     "ingestion_type": "cdc",
                 }
             if table_name == "commits":
-                # Append-only stream keyed by immutable sha
+                # Append-only stream keyed by immutable sha. Forks share shas, so
+                # a multi-repository read also keys on the repository.
+                if self._is_multi_repo(table_options):
+                    return {
+                        "primary_keys": ["repository_owner", "repository_name", "sha"],
+                        "ingestion_type": "append",
+                    }
                 return {
                     "primary_keys": ["sha"],
                     "ingestion_type": "append",
@@ -698,6 +1710,39 @@ def register_lakeflow_source(spark):
 
             raise ValueError(f"Unsupported table: {table_name!r}")
 
+        def supported_filters(
+            self, table_name: str, table_options: dict[str, str]
+        ) -> dict[str, tuple[str, ...]]:
+            """
+            Filters of batch queries that narrow the GitHub requests.
+
+            `updated_at` lower bounds become the `since` parameter of `issues`
+            and `comments` (`/pulls` ignores `since`). An equality on `state` becomes the `state`
+            parameter of `issues` and `pull_requests` unless the table already
+            sets one.
+            """
+            supported = {}
+            if table_name in ("issues", "comments"):
+                supported["updated_at"] = (">", ">=")
+            if table_name in ("issues", "pull_requests") and table_options.get(
+                "state", "all"
+            ) == "all":
+                supported["state"] = ("=",)
+            return supported
+
+        def _apply_pushed_filters(self, table_options: dict[str, str]) -> dict[str, str]:
+            """Fold pushed-down filters into the `start_date` and `state` options."""
+            table_options = dict(table_options)
+            for column, op, value in pushed_filters(table_options):
+                if column == "updated_at" and op in (">", ">="):
+                    since = iso8601_to_epoch(value)
+                    start_date = iso8601_to_epoch(table_options.get("start_date"))
+                    if since is not None and (start_date is None or since > start_date):
+                        table_options["start_date"] = epoch_to_iso8601(since)
+                elif column == "state" and op == "=" and value in ("open", "closed"):
+                    table_options["state"] = value
+            return table_options
+
         def read_table(
             self, table_name: str, start_offset: dict, table_options: dict[str, str]
         ) -> (Iterator[dict], dict):
@@ -710,45 +1755,411 @@ def register_lakeflow_source(spark):
                 - Paginates using GitHub's `Link` header until all pages are read or
                   a batch limit (if provided via table_options) is reached.
 
-            Other tables follow similar patterns based on their documented endpoints.
+            Other tables follow similar patterns based on their documented endpoints.
+
+            Required table_options for `issues`:
+                - owner: Repository owner (user or organization).
+                - repo: Repository name.
+
+            Instead of `owner`/`repo`, every repository-scoped table accepts:
+                - repos: Comma-separated `owner/name` list (bare names use `owner`).
+                - org: Organization whose repositories are all read.
+              The repositories are read concurrently (`max_workers`, default 4)
+              and the offset keeps one cursor per repository.
+
+            Optional table_options:
+                - state: Issue state filter (default: "all").
+                - per_page: Page size (max 100, default 100).
+                - start_date: Initial ISO 8601 timestamp for first run if no start_offset is provided.
+                - lookback_seconds: Lookback window applied when computing next cursor (default: 300).
+                - max_pages_per_batch: Optional safety limit on pages per read_table call.
+            """
+            self._low_priority = (
+                self.read_table_metadata(table_name, table_options)["ingestion_type"]
+                == "snapshot"
+            )
+            table_options = self._apply_pushed_filters(table_options)
+            if table_name in REPO_SCOPED_TABLES and self._is_multi_repo(table_options):
+                return self._read_multi_repo(table_name, start_offset, table_options)
+            if table_name == "issues":
+                return self._read_issues(start_offset, table_options)
+            if table_name == "repositories":
+                return self._read_repositories(start_offset, table_options)
+            if table_name == "pull_requests":
+                return self._read_pull_requests(start_offset, table_options)
+            if table_name == "comments":
+                return self._read_comments(start_offset, table_options)
+            if table_name == "commits":
+                return self._read_commits(start_offset, table_options)
+            if table_name == "assignees":
+                return self._read_assignees(start_offset, table_options)
+            if table_name == "branches":
+                return self._read_branches(start_offset, table_options)
+            if table_name == "collaborators":
+                return self._read_collaborators(start_offset, table_options)
+            if table_name == "organizations":
+                return self._read_organizations(start_offset, table_options)
+            if table_name == "teams":
+                return self._read_teams(start_offset, table_options)
+            if table_name == "users":
+                return self._read_users(start_offset, table_options)
+            if table_name == "reviews":
+                return self._read_reviews(start_offset, table_options)
+
+            raise ValueError(f"Unsupported table: {table_name!r}")
+
+        def read_co_read(
+            self, table_names: list[str], start_offset: dict, table_options: dict[str, str]
+        ) -> (Iterator[tuple], dict):
+            """
+            Read `issues` and `pull_requests` from one sweep of the issues list.
+
+            GET /repos/{owner}/{repo}/issues also returns pull requests, marked by
+            a `pull_request` key. Every record of one `issues` sweep is returned
+            as an `issues` row, unchanged, and the pull requests in it (the ones
+            updated since the cursor) are fetched in full from
+            GET /repos/{owner}/{repo}/pulls/{number} for the `pull_requests`
+            rows, instead of paging through /pulls as well. Records are returned
+            as `(table_name, record)` pairs; the offset is the issues offset.
+            Only a single `owner`/`repo` is supported.
+            """
+            if list(table_names) != ["issues", "pull_requests"]:
+                raise ValueError(
+                    f"GitHub co-reads 'issues' followed by 'pull_requests', got {table_names}"
+                )
+            table_options = self._apply_pushed_filters(table_options or {})
+            if self._is_multi_repo(table_options):
+                raise ValueError(
+                    "GitHub co-reads need a single 'owner' and 'repo', not 'repos' or 'org'"
+                )
+
+            self._low_priority = False
+            issues, offset = self._read_issues(start_offset, table_options)
+            issues = list(issues)
+            numbers = [
+                issue["number"]
+                for issue in issues
+                if issue.get("pull_request") and issue.get("number") is not None
+            ]
+            pull_requests = self._fetch_pull_requests(
+                table_options["owner"], table_options["repo"], numbers, table_options
+            )
+
+            records = [("issues", issue) for issue in issues]
+            records.extend(("pull_requests", pr) for pr in pull_requests)
+            return records, offset
+
+        def latest_offset(
+            self, table_name: str, start_offset: dict, table_options: dict[str, str]
+        ) -> dict:
+            """
+            Plan the end offset of a partitioned stream micro-batch.
+
+            Supported for `issues` and `comments`. Every repository of the read
+            (`owner`/`repo`, `repos` or `org`) moves its cursor to the current
+            time minus `lookback_seconds`, so records updated more recently,
+            whose updates may not be listed yet, are left to a later micro-batch.
+            The offset has the form `{"repos": {"owner/name": {"cursor": ...}}}`.
+            If no cursor moves, the start offset is returned.
+            """
+            self._check_partitioned_stream_table(table_name)
+            try:
+                lookback_seconds = int(table_options.get("lookback_seconds", 300))
+            except (TypeError, ValueError):
+                lookback_seconds = 300
+            until = time.time() - lookback_seconds
+
+            start_repos = {}
+            if start_offset and isinstance(start_offset, dict):
+                start_repos = start_offset.get("repos") or {}
+
+            end_repos = {}
+            for full_name in self._stream_repos(table_name, table_options):
+                start = start_repos.get(full_name) or {}
+                cursor_epoch = iso8601_to_epoch(start.get("cursor"))
+                if cursor_epoch is not None and cursor_epoch >= until:
+                    end_repos[full_name] = start
+                else:
+                    end_repos[full_name] = {"cursor": epoch_to_iso8601(until)}
+
+            if start_offset and end_repos == start_repos:
+                return start_offset
+            return {"repos": end_repos}
+
+        def partition_offsets(
+            self,
+            table_name: str,
+            start_offset: dict,
+            end_offset: dict,
+            table_options: dict[str, str],
+        ) -> list[tuple[dict, dict]]:
+            """
+            Split a partitioned stream micro-batch into one partition per repository.
+
+            Each partition is a `({"repo": ..., "cursor": ...}, {"repo": ...,
+            "cursor": ...})` pair; a start without a cursor reads from
+            `start_date`. Repositories whose cursor did not move are skipped.
+            """
+            self._check_partitioned_stream_table(table_name)
+            start_repos = {}
+            if start_offset and isinstance(start_offset, dict):
+                start_repos = start_offset.get("repos") or {}
+
+            partitions = []
+            for full_name, end in ((end_offset or {}).get("repos") or {}).items():
+                start = start_repos.get(full_name) or {}
+                if start.get("cursor") == end.get("cursor"):
+                    continue
+                partitions.append(
+                    (
+                        {"repo": full_name, "cursor": start.get("cursor")},
+                        {"repo": full_name, "cursor": end.get("cursor")},
+                    )
+                )
+            return partitions
+
+        def read_offset_range(
+            self,
+            table_name: str,
+            start_offset: dict,
+            end_offset: dict,
+            table_options: dict[str, str],
+        ) -> Iterator[dict]:
+            """
+            Read the records of one repository updated between two cursors.
+
+            Records updated at or after the start cursor (or `start_date`) and
+            before the end cursor are yielded as their pages arrive. Pages are
+            requested in ascending `updated_at` order, so the read stops at the
+            first record past the end cursor. Consecutive micro-batches share a
+            cursor as end and start, so every record is read once.
+            """
+            self._check_partitioned_stream_table(table_name)
+            owner, repo = start_offset["repo"].split("/", 1)
+            since = start_offset.get("cursor") or table_options.get("start_date")
+            until = iso8601_to_epoch(end_offset.get("cursor"))
+
+            try:
+                per_page = int(table_options.get("per_page", 100))
+            except (TypeError, ValueError):
+                per_page = 100
+            per_page = max(1, min(per_page, 100))
+
+            next_url: str | None = (
+                f"{self.base_url}/repos/{owner}/{repo}/"
+                f"{PARTITIONED_STREAM_TABLES[table_name]}"
+            )
+            next_params = {"per_page": per_page, "sort": "updated", "direction": "asc"}
+            if table_name == "issues":
+                next_params["state"] = table_options.get("state", "all")
+            if since:
+                next_params["since"] = since
+
+            while next_url:
+                response = self._get(next_url, params=next_params)
+                if response.status_code != 200:
+                    raise RuntimeError(
+                        f"GitHub API error for {table_name}: "
+                        f"{response.status_code} {response.text}"
+                    )
+
+                items = response_json(response) or []
+                if not isinstance(items, list):
+                    raise ValueError(
+                        f"Unexpected response format for {table_name}: {type(items).__name__}"
+                    )
+
+                for item in items:
+                    updated_at = iso8601_to_epoch(item.get("updated_at"))
+                    if until is not None and updated_at is not None and updated_at >= until:
+                        return
+                    record: dict[str, Any] = dict(item)
+                    record["repository_owner"] = owner
+                    record["repository_name"] = repo
+                    yield record
+
+                next_url = self._extract_next_link(response.headers.get("Link", ""))
+                next_params = None
+
+        @staticmethod
+        def _check_partitioned_stream_table(table_name: str) -> None:
+            if table_name not in PARTITIONED_STREAM_TABLES:
+                raise ValueError(
+                    f"Table {table_name!r} does not support partitioned streaming; "
+                    f"supported tables: {sorted(PARTITIONED_STREAM_TABLES)}"
+                )
+
+        def _stream_repos(
+            self, table_name: str, table_options: dict[str, str]
+        ) -> list[str]:
+            """List the `owner/name` repositories of a partitioned stream."""
+            if self._is_multi_repo(table_options):
+                return self._resolve_repos(table_name, table_options)
+            owner = table_options.get("owner")
+            repo = table_options.get("repo")
+            if not owner or not repo:
+                raise ValueError(
+                    f"table_configuration for {table_name!r} must include non-empty "
+                    "'owner' and 'repo', or 'repos' or 'org'"
+                )
+            return [f"{owner}/{repo}"]
+
+        def _get(self, url: str, params: dict | None = None) -> requests.Response:
+            """
+            Issue a GET request within the rate limit budget of the token pool.
+
+            Each request uses the token with the most quota left and is paced by
+            that token's budget. A response rejected by a primary or secondary
+            rate limit (403/429) blocks its token until the limit resets (or for
+            the Retry-After interval) and is retried, up to `max_retries` times,
+            with another token, or with the same one once it is unblocked. The
+            final response is handed back to the caller.
+            """
+            for attempt in range(self.max_retries + 1):
+                index = self.token_pool.acquire()
+                budget = self.token_pool.budgets[index]
+                try:
+                    wait = budget.delay(self._low_priority)
+                    if wait > 0:
+                        time.sleep(wait)
+                    response = self._session.get(
+                        url,
+                        params=params,
+                        headers={"Authorization": f"Bearer {self.token_pool.tokens[index]}"},
+                        timeout=30,
+                    )
+                finally:
+                    self.token_pool.release(index)
+                budget.update(response)
+                retry_after = budget.retry_delay(response)
+                if retry_after is None or attempt == self.max_retries:
+                    return response
+                self.metrics.record_retry()
+                budget.block(retry_after)
+            return response
+
+        @staticmethod
+        def _is_multi_repo(table_options: dict[str, str]) -> bool:
+            """Whether a repository-scoped table is read from several repositories."""
+            return bool(
+                table_options.get("repos")
+                or (table_options.get("org") and not table_options.get("repo"))
+            )
+
+        def _read_multi_repo(
+            self, table_name: str, start_offset: dict, table_options: dict[str, str]
+        ) -> (Iterator[dict], dict):
+            """
+            Read a repository-scoped table from every repository in `repos` or `org`.
+
+            Each repository is read by the single-repository reader with its own
+            cursor, `max_workers` repositories at a time over the shared session.
+            The offset has the form `{"repos": {"owner/name": <offset>}}`;
+            repositories that have not returned a cursor yet are left out.
+            """
+            repos = self._resolve_repos(table_name, table_options)
+
+            try:
+                max_workers = int(table_options.get("max_workers", 4))
+            except (TypeError, ValueError):
+                max_workers = 4
+            max_workers = max(1, min(max_workers, len(repos)))
+
+            repo_offsets = {}
+            if start_offset and isinstance(start_offset, dict):
+                repo_offsets = start_offset.get("repos") or {}
+
+            read_repo_table = getattr(self, f"_read_{table_name}")
+
+            def read_repo(full_name: str):
+                owner, repo = full_name.split("/", 1)
+                records, offset = read_repo_table(
+                    repo_offsets.get(full_name) or {},
+                    {**table_options, "owner": owner, "repo": repo},
+                )
+                return records, offset
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(read_repo, repos))
+
+            next_offsets = {
+                full_name: offset
+                for full_name, (_, offset) in zip(repos, results)
+                if offset
+            }
+            if next_offsets:
+                next_offset = {"repos": next_offsets}
+            else:
+                next_offset = start_offset or {}
+
+            return chain.from_iterable(records for records, _ in results), next_offset
+
+        def _resolve_repos(
+            self, table_name: str, table_options: dict[str, str]
+        ) -> list[str]:
+            """
+            List the `owner/name` repositories a multi-repository read covers.
+
+            `repos` entries without an owner use the `owner` option. With `org`,
+            the organization's repositories are listed via GET /orgs/{org}/repos.
+            """
+            repos_option = table_options.get("repos")
+            if repos_option:
+                default_owner = table_options.get("owner")
+                repos = []
+                for entry in str(repos_option).split(","):
+                    entry = entry.strip().strip("/")
+                    if not entry:
+                        continue
+                    if "/" not in entry:
+                        if not default_owner:
+                            raise ValueError(
+                                f"table_configuration for {table_name!r}: repository "
+                                f"{entry!r} in 'repos' needs an owner ('owner/name') "
+                                "or an 'owner' option"
+                            )
+                        entry = f"{default_owner}/{entry}"
+                    if entry not in repos:
+                        repos.append(entry)
+            else:
+                repos = self._list_org_repos(table_options["org"])
+
+            if not repos:
+                raise ValueError(
+                    f"table_configuration for {table_name!r} did not resolve to any repository"
+                )
+            return repos
+
+        def _list_org_repos(self, org: str) -> list[str]:
+            """Return `owner/name` for every repository of an organization."""
+            repos: list[str] = []
+            next_url: str | None = f"{self.base_url}/orgs/{org}/repos"
+            next_params = {"per_page": 100, "type": "all"}
 
-            Required table_options for `issues`:
-                - owner: Repository owner (user or organization).
-                - repo: Repository name.
+            while next_url:
+                response = self._get(next_url, params=next_params)
+                if response.status_code != 200:
+                    raise RuntimeError(
+                        f"GitHub API error for repositories of org {org!r}: "
+                        f"{response.status_code} {response.text}"
+                    )
 
-            Optional table_options:
-                - state: Issue state filter (default: "all").
-                - per_page: Page size (max 100, default 100).
-                - start_date: Initial ISO 8601 timestamp for first run if no start_offset is provided.
-                - lookback_seconds: Lookback window applied when computing next cursor (default: 300).
-                - max_pages_per_batch: Optional safety limit on pages per read_table call.
-            """
-            if table_name == "issues":
-                return self._read_issues(start_offset, table_options)
-            if table_name == "repositories":
-                return self._read_repositories(start_offset, table_options)
-            if table_name == "pull_requests":
-                return self._read_pull_requests(start_offset, table_options)
-            if table_name == "comments":
-                return self._read_comments(start_offset, table_options)
-            if table_name == "commits":
-                return self._read_commits(start_offset, table_options)
-            if table_name == "assignees":
-                return self._read_assignees(start_offset, table_options)
-            if table_name == "branches":
-                return self._read_branches(start_offset, table_options)
-            if table_name == "collaborators":
-                return self._read_collaborators(start_offset, table_options)
-            if table_name == "organizations":
-                return self._read_organizations(start_offset, table_options)
-            if table_name == "teams":
-                return self._read_teams(start_offset, table_options)
-            if table_name == "users":
-                return self._read_users(start_offset, table_options)
-            if table_name == "reviews":
-                return self._read_reviews(start_offset, table_options)
+                repo_objs = response_json(response) or []
+                if not isinstance(repo_objs, list):
+                    raise ValueError(
+                        f"Unexpected response format for repositories: {type(repo_objs).__name__}"
+                    )
 
-            raise ValueError(f"Unsupported table: {table_name!r}")
+                for repo_obj in repo_objs:
+                    owner_obj = repo_obj.get("owner") or {}
+                    owner = owner_obj.get("login") or org
+                    if repo_obj.get("name"):
+                        repos.append(f"{owner}/{repo_obj['name']}")
+
+                next_url = self._extract_next_link(response.headers.get("Link", ""))
+                next_params = None
+
+            return repos
 
         def _read_issues(
             self, start_offset: dict, table_options: dict[str, str]
@@ -806,13 +2217,13 @@ def register_lakeflow_source(spark):
             next_params = params
 
             while next_url and pages_fetched < max_pages_per_batch:
-                response = self._session.get(next_url, params=next_params, timeout=30)
+                response = self._get(next_url, params=next_params)
                 if response.status_code != 200:
                     raise RuntimeError(
                         f"GitHub API error for issues: {response.status_code} {response.text}"
                     )
 
-                issues = response.json() or []
+                issues = response_json(response) or []
                 if not isinstance(issues, list):
                     raise ValueError(
                         f"Unexpected response format for issues: {type(issues).__name__}"
@@ -841,24 +2252,46 @@ def register_lakeflow_source(spark):
                 next_params = None
                 pages_fetched += 1
 
-            # Compute the next cursor with a small lookback window to avoid missing records
-            next_cursor = cursor
-            if max_updated_at:
-                try:
-                    dt = datetime.strptime(max_updated_at, "%Y-%m-%dT%H:%M:%SZ")
-                    dt_with_lookback = dt - timedelta(seconds=lookback_seconds)
-                    next_cursor = dt_with_lookback.strftime("%Y-%m-%dT%H:%M:%SZ")
-                except Exception:
-                    # Fallback: if parsing fails, just reuse the raw max_updated_at
-                    next_cursor = max_updated_at
+            # Compute the next cursor with a small lookback window to avoid missing
+            # records, dropping the records the previous batch already emitted.
+            return self._drop_lookback_repeats(
+                records, start_offset, cursor, max_updated_at, lookback_seconds
+            )
 
-            # If no new records, return the same offset to indicate end of stream for this batch
-            if not records and start_offset:
-                next_offset = start_offset
-            else:
-                next_offset = {"cursor": next_cursor} if next_cursor else {}
+        def _fetch_pull_requests(
+            self, owner: str, repo: str, numbers: list[int], table_options: dict[str, str]
+        ) -> list[dict[str, Any]]:
+            """
+            Fetch pull requests by number, `max_workers` (default 4) at a time.
 
-            return iter(records), next_offset
+            Pull requests deleted since the sweep (404) are skipped.
+            """
+            try:
+                max_workers = int(table_options.get("max_workers", 4))
+            except (TypeError, ValueError):
+                max_workers = 4
+            max_workers = max(1, max_workers)
+
+            def fetch(number: int) -> dict[str, Any] | None:
+                response = self._get(f"{self.base_url}/repos/{owner}/{repo}/pulls/{number}")
+                if response.status_code == 404:
+                    return None
+                if response.status_code != 200:
+                    raise RuntimeError(
+                        f"GitHub API error for pull_requests: {response.status_code} {response.text}"
+                    )
+                record: dict[str, Any] = dict(response_json(response))
+                record["repository_owner"] = owner
+                record["repository_name"] = repo
+                return record
+
+            # Drop repeated numbers (a pull request updated during the sweep can
+            # appear on two pages) while keeping the sweep order.
+            numbers = list(dict.fromkeys(numbers))
+            if not numbers:
+                return []
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(numbers))) as executor:
+                return [record for record in executor.map(fetch, numbers) if record]
 
         def _read_repositories(
             self, start_offset: dict, table_options: dict[str, str]
@@ -924,13 +2357,13 @@ def register_lakeflow_source(spark):
             next_params = params
 
             while next_url and pages_fetched < max_pages_per_batch:
-                response = self._session.get(next_url, params=next_params, timeout=30)
+                response = self._get(next_url, params=next_params)
                 if response.status_code != 200:
                     raise RuntimeError(
                         f"GitHub API error for repositories: {response.status_code} {response.text}"
                     )
 
-                repos = response.json() or []
+                repos = response_json(response) or []
                 if not isinstance(repos, list):
                     raise ValueError(
                         f"Unexpected response format for repositories: {type(repos).__name__}"
@@ -1014,13 +2447,13 @@ def register_lakeflow_source(spark):
             next_params = params
 
             while next_url and pages_fetched < max_pages_per_batch:
-                response = self._session.get(next_url, params=next_params, timeout=30)
+                response = self._get(next_url, params=next_params)
                 if response.status_code != 200:
                     raise RuntimeError(
                         f"GitHub API error for pull_requests: {response.status_code} {response.text}"
                     )
 
-                pull_requests = response.json() or []
+                pull_requests = response_json(response) or []
                 if not isinstance(pull_requests, list):
                     raise ValueError(
                         f"Unexpected response format for pull_requests: {type(pull_requests).__name__}"
@@ -1046,21 +2479,9 @@ def register_lakeflow_source(spark):
                 next_params = None
                 pages_fetched += 1
 
-            next_cursor = cursor
-            if max_updated_at:
-                try:
-                    dt = datetime.strptime(max_updated_at, "%Y-%m-%dT%H:%M:%SZ")
-                    dt_with_lookback = dt - timedelta(seconds=lookback_seconds)
-                    next_cursor = dt_with_lookback.strftime("%Y-%m-%dT%H:%M:%SZ")
-                except Exception:
-                    next_cursor = max_updated_at
-
-            if not records and start_offset:
-                next_offset = start_offset
-            else:
-                next_offset = {"cursor": next_cursor} if next_cursor else {}
-
-            return iter(records), next_offset
+            return self._drop_lookback_repeats(
+                records, start_offset, cursor, max_updated_at, lookback_seconds
+            )
 
         def _read_comments(
             self, start_offset: dict, table_options: dict[str, str]
@@ -1115,13 +2536,13 @@ def register_lakeflow_source(spark):
             next_params = params
 
             while next_url and pages_fetched < max_pages_per_batch:
-                response = self._session.get(next_url, params=next_params, timeout=30)
+                response = self._get(next_url, params=next_params)
                 if response.status_code != 200:
                     raise RuntimeError(
                         f"GitHub API error for comments: {response.status_code} {response.text}"
                     )
 
-                comments = response.json() or []
+                comments = response_json(response) or []
                 if not isinstance(comments, list):
                     raise ValueError(
                         f"Unexpected response format for comments: {type(comments).__name__}"
@@ -1147,21 +2568,9 @@ def register_lakeflow_source(spark):
                 next_params = None
                 pages_fetched += 1
 
-            next_cursor = cursor
-            if max_updated_at:
-                try:
-                    dt = datetime.strptime(max_updated_at, "%Y-%m-%dT%H:%M:%SZ")
-                    dt_with_lookback = dt - timedelta(seconds=lookback_seconds)
-                    next_cursor = dt_with_lookback.strftime("%Y-%m-%dT%H:%M:%SZ")
-                except Exception:
-                    next_cursor = max_updated_at
-
-            if not records and start_offset:
-                next_offset = start_offset
-            else:
-                next_offset = {"cursor": next_cursor} if next_cursor else {}
-
-            return iter(records), next_offset
+            return self._drop_lookback_repeats(
+                records, start_offset, cursor, max_updated_at, lookback_seconds
+            )
 
         def _read_commits(
             self, start_offset: dict, table_options: dict[str, str]
@@ -1169,6 +2578,12 @@ def register_lakeflow_source(spark):
             """
             Read the `commits` append-only table using:
                 GET /repos/{owner}/{repo}/commits
+
+            With the `backfill_window_days` option, the first read plans a
+            backfill of the history up to now instead: it is split into
+            `since`/`until` windows that are read `max_workers` at a time (see
+            `_read_commits_backfill`), after which reads continue incrementally
+            from the time the backfill was planned.
             """
             owner = table_options.get("owner")
             repo = table_options.get("repo")
@@ -1188,6 +2603,23 @@ def register_lakeflow_source(spark):
             except (TypeError, ValueError):
                 max_pages_per_batch = 50
 
+            backfill = None
+            if start_offset and isinstance(start_offset, dict):
+                backfill = start_offset.get("backfill")
+            if backfill is None and not (start_offset or {}).get("cursor"):
+                try:
+                    window_days = float(table_options.get("backfill_window_days", 0))
+                except (TypeError, ValueError):
+                    window_days = 0
+                if window_days > 0:
+                    backfill = self._plan_commits_backfill(
+                        owner, repo, table_options.get("start_date"), window_days
+                    )
+            if backfill is not None:
+                return self._read_commits_backfill(
+                    owner, repo, backfill, per_page, max_pages_per_batch, table_options
+                )
+
             cursor = None
             if start_offset and isinstance(start_offset, dict):
                 cursor = start_offset.get("cursor")
@@ -1209,46 +2641,27 @@ def register_lakeflow_source(spark):
             next_params = params
 
             while next_url and pages_fetched < max_pages_per_batch:
-                response = self._session.get(next_url, params=next_params, timeout=30)
+                response = self._get(next_url, params=next_params)
                 if response.status_code != 200:
                     raise RuntimeError(
                         f"GitHub API error for commits: {response.status_code} {response.text}"
                     )
 
-                commits = response.json() or []
+                commits = response_json(response) or []
                 if not isinstance(commits, list):
                     raise ValueError(
                         f"Unexpected response format for commits: {type(commits).__name__}"
                     )
 
                 for commit_obj in commits:
-                    commit_info = commit_obj.get("commit", {}) or {}
-                    commit_author = commit_info.get("author", {}) or {}
-                    commit_committer = commit_info.get("committer", {}) or {}
-
-                    record: dict[str, Any] = {
-                        "sha": commit_obj.get("sha"),
-                        "node_id": commit_obj.get("node_id"),
-                        "repository_owner": owner,
-                        "repository_name": repo,
-                        "commit_message": commit_info.get("message"),
-                        "commit_author_name": commit_author.get("name"),
-                        "commit_author_email": commit_author.get("email"),
-                        "commit_author_date": commit_author.get("date"),
-                        "commit_committer_name": commit_committer.get("name"),
-                        "commit_committer_email": commit_committer.get("email"),
-                        "commit_committer_date": commit_committer.get("date"),
-                        "html_url": commit_obj.get("html_url"),
-                        "url": commit_obj.get("url"),
-                        "author": commit_obj.get("author"),
-                        "committer": commit_obj.get("committer"),
-                    }
+                    record = self._commit_record(commit_obj, owner, repo)
                     records.append(record)
 
-                    author_date = record.get("commit_author_date")
-                    if isinstance(author_date, str):
-                        if max_commit_date is None or author_date > max_commit_date:
-                            max_commit_date = author_date
+                    # `since` filters on the committer date, as do the backfill windows.
+                    committed_at = record.get("commit_committer_date")
+                    if isinstance(committed_at, str):
+                        if max_commit_date is None or committed_at > max_commit_date:
+                            max_commit_date = committed_at
 
                 link_header = response.headers.get("Link", "")
                 next_link = self._extract_next_link(link_header)
@@ -1261,7 +2674,7 @@ def register_lakeflow_source(spark):
 
             next_cursor = cursor
             if max_commit_date:
-                # For commits we simply reuse the max commit author date as the next cursor.
+                # For commits we simply reuse the max committer date as the next cursor.
                 next_cursor = max_commit_date
 
             if not records and start_offset:
@@ -1271,6 +2684,174 @@ def register_lakeflow_source(spark):
 
             return iter(records), next_offset
 
+        @staticmethod
+        def _commit_record(commit_obj: dict, owner: str, repo: str) -> dict[str, Any]:
+            """Flatten a commit from the commits API into a `commits` record."""
+            commit_info = commit_obj.get("commit", {}) or {}
+            commit_author = commit_info.get("author", {}) or {}
+            commit_committer = commit_info.get("committer", {}) or {}
+
+            return {
+                "sha": commit_obj.get("sha"),
+                "node_id": commit_obj.get("node_id"),
+                "repository_owner": owner,
+                "repository_name": repo,
+                "commit_message": commit_info.get("message"),
+                "commit_author_name": commit_author.get("name"),
+                "commit_author_email": commit_author.get("email"),
+                "commit_author_date": commit_author.get("date"),
+                "commit_committer_name": commit_committer.get("name"),
+                "commit_committer_email": commit_committer.get("email"),
+                "commit_committer_date": commit_committer.get("date"),
+                "html_url": commit_obj.get("html_url"),
+                "url": commit_obj.get("url"),
+                "author": commit_obj.get("author"),
+                "committer": commit_obj.get("committer"),
+            }
+
+        def _plan_commits_backfill(
+            self, owner: str, repo: str, start_date: str | None, window_days: float
+        ) -> dict:
+            """
+            Split the commit history from `start_date` (or the repository's
+            creation) up to now into `since`/`until` windows of `window_days`.
+
+            Windows are widened if needed so the plan, which is stored in the
+            offset, has at most `MAX_BACKFILL_WINDOWS` of them.
+            """
+            until = epoch_to_iso8601(time.time())
+            since_epoch = iso8601_to_epoch(start_date) if start_date else None
+            if since_epoch is None:
+                response = self._get(f"{self.base_url}/repos/{owner}/{repo}")
+                if response.status_code != 200:
+                    raise RuntimeError(
+                        f"GitHub API error for repository {owner}/{repo}: "
+                        f"{response.status_code} {response.text}"
+                    )
+                repo_obj = response_json(response) or {}
+                since_epoch = iso8601_to_epoch(repo_obj.get("created_at"))
+                if since_epoch is None:
+                    raise ValueError(
+                        f"Cannot plan a commits backfill for {owner}/{repo}: the "
+                        "repository has no creation date; set 'start_date'"
+                    )
+
+            # `since` and `until` are both inclusive, so windows end a second
+            # before the next one (or the incremental tail) starts. Commits can
+            # predate the repository (imported history), so the first window is
+            # open-ended unless a start_date was given.
+            until_epoch = iso8601_to_epoch(until)
+            step = max(
+                1,
+                int(window_days * 86400),
+                -(-int(until_epoch - since_epoch) // self.MAX_BACKFILL_WINDOWS),
+            )
+            windows = []
+            window_start = int(since_epoch)
+            while window_start < until_epoch:
+                window_end = min(window_start + step, until_epoch)
+                windows.append(
+                    {
+                        "since": epoch_to_iso8601(window_start) if windows or start_date else None,
+                        "until": epoch_to_iso8601(window_end - 1),
+                    }
+                )
+                window_start = window_end
+            return {"windows": windows, "until": until}
+
+        def _read_commits_backfill(
+            self,
+            owner: str,
+            repo: str,
+            backfill: dict,
+            per_page: int,
+            max_pages_per_batch: int,
+            table_options: dict[str, str],
+        ) -> (Iterator[dict], dict):
+            """
+            Read the next `max_workers` windows of a commits backfill concurrently.
+
+            Each window is read newest first for up to `max_pages_per_batch`
+            pages. A window that is not finished is narrowed to the commits not
+            read yet: its `until` moves to the oldest committer date seen, and the
+            shas already read at that second are skipped next time. The offset
+            keeps the remaining windows as `{"backfill": {...}}` and becomes
+            `{"cursor": <planning time>}` once every window is read.
+            """
+            try:
+                max_workers = int(table_options.get("max_workers", 4))
+            except (TypeError, ValueError):
+                max_workers = 4
+            max_workers = max(1, max_workers)
+
+            windows = backfill.get("windows") or []
+            active, pending = windows[:max_workers], windows[max_workers:]
+            url = f"{self.base_url}/repos/{owner}/{repo}/commits"
+
+            def read_window(window: dict):
+                params = {"per_page": per_page, "until": window["until"]}
+                if window.get("since"):
+                    params["since"] = window["since"]
+                skip = set(window.get("skip") or ())
+
+                records: list[dict[str, Any]] = []
+                oldest: str | None = None
+                pages_fetched = 0
+                next_url: str | None = url
+                next_params = params
+
+                while next_url and pages_fetched < max_pages_per_batch:
+                    response = self._get(next_url, params=next_params)
+                    if response.status_code != 200:
+                        raise RuntimeError(
+                            f"GitHub API error for commits: {response.status_code} {response.text}"
+                        )
+
+                    commits = response_json(response) or []
+                    if not isinstance(commits, list):
+                        raise ValueError(
+                            f"Unexpected response format for commits: {type(commits).__name__}"
+                        )
+
+                    for commit_obj in commits:
+                        record = self._commit_record(commit_obj, owner, repo)
+                        if record["sha"] in skip:
+                            continue
+                        records.append(record)
+                        committed_at = record.get("commit_committer_date")
+                        if isinstance(committed_at, str) and (
+                            oldest is None or committed_at < oldest
+                        ):
+                            oldest = committed_at
+
+                    next_link = self._extract_next_link(response.headers.get("Link", ""))
+                    if not next_link:
+                        return records, None
+
+                    next_url = next_link
+                    next_params = None
+                    pages_fetched += 1
+
+                if oldest is None:
+                    return records, window
+                # Resume at the second of the oldest commit, minus what was read.
+                read_at_oldest = [
+                    r["sha"] for r in records if r.get("commit_committer_date") == oldest
+                ]
+                if oldest == window["until"]:
+                    read_at_oldest += list(skip)
+                return records, {**window, "until": oldest, "skip": read_at_oldest}
+
+            with ThreadPoolExecutor(max_workers=max(1, len(active))) as executor:
+                results = list(executor.map(read_window, active))
+
+            remaining = [window for _, window in results if window is not None] + pending
+            if remaining:
+                next_offset = {"backfill": {**backfill, "windows": remaining}}
+            else:
+                next_offset = {"cursor": backfill["until"]}
+            return chain.from_iterable(records for records, _ in results), next_offset
+
         def _read_assignees(
             self, start_offset: dict, table_options: dict[str, str]
         ) -> (Iterator[dict], dict):
@@ -1305,13 +2886,13 @@ def register_lakeflow_source(spark):
             next_params = params
 
             while next_url and pages_fetched < max_pages_per_batch:
-                response = self._session.get(next_url, params=next_params, timeout=30)
+                response = self._get(next_url, params=next_params)
                 if response.status_code != 200:
                     raise RuntimeError(
                         f"GitHub API error for assignees: {response.status_code} {response.text}"
                     )
 
-                assignees = response.json() or []
+                assignees = response_json(response) or []
                 if not isinstance(assignees, list):
                     raise ValueError(
                         f"Unexpected response format for assignees: {type(assignees).__name__}"
@@ -1374,13 +2955,13 @@ def register_lakeflow_source(spark):
             next_params = params
 
             while next_url and pages_fetched < max_pages_per_batch:
-                response = self._session.get(next_url, params=next_params, timeout=30)
+                response = self._get(next_url, params=next_params)
                 if response.status_code != 200:
                     raise RuntimeError(
                         f"GitHub API error for branches: {response.status_code} {response.text}"
                     )
 
-                branches = response.json() or []
+                branches = response_json(response) or []
                 if not isinstance(branches, list):
                     raise ValueError(
                         f"Unexpected response format for branches: {type(branches).__name__}"
@@ -1442,13 +3023,13 @@ def register_lakeflow_source(spark):
             next_params = params
 
             while next_url and pages_fetched < max_pages_per_batch:
-                response = self._session.get(next_url, params=next_params, timeout=30)
+                response = self._get(next_url, params=next_params)
                 if response.status_code != 200:
                     raise RuntimeError(
                         f"GitHub API error for collaborators: {response.status_code} {response.text}"
                     )
 
-                collaborators = response.json() or []
+                collaborators = response_json(response) or []
                 if not isinstance(collaborators, list):
                     raise ValueError(
                         f"Unexpected response format for collaborators: {type(collaborators).__name__}"
@@ -1515,13 +3096,13 @@ def register_lakeflow_source(spark):
             next_params = params
 
             while next_url and pages_fetched < max_pages_per_batch:
-                response = self._session.get(next_url, params=next_params, timeout=30)
+                response = self._get(next_url, params=next_params)
                 if response.status_code != 200:
                     raise RuntimeError(
                         f"GitHub API error for organizations: {response.status_code} {response.text}"
                     )
 
-                orgs = response.json() or []
+                orgs = response_json(response) or []
                 if not isinstance(orgs, list):
                     raise ValueError(
                         f"Unexpected response format for organizations list: {type(orgs).__name__}"
@@ -1599,13 +3180,13 @@ def register_lakeflow_source(spark):
             next_params = params
 
             while next_url and pages_fetched < max_pages_per_batch:
-                response = self._session.get(next_url, params=next_params, timeout=30)
+                response = self._get(next_url, params=next_params)
                 if response.status_code != 200:
                     raise RuntimeError(
                         f"GitHub API error for teams: {response.status_code} {response.text}"
                     )
 
-                teams = response.json() or []
+                teams = response_json(response) or []
                 if not isinstance(teams, list):
                     raise ValueError(
                         f"Unexpected response format for teams list: {type(teams).__name__}"
@@ -1621,7 +3202,7 @@ def register_lakeflow_source(spark):
                         continue
 
                     detail_url = f"{self.base_url}/orgs/{org_login}/teams/{team_slug}"
-                    detail_resp = self._session.get(detail_url, timeout=30)
+                    detail_resp = self._get(detail_url)
                     if detail_resp.status_code != 200:
                         raise RuntimeError(
                             "GitHub API error for team "
@@ -1629,7 +3210,7 @@ def register_lakeflow_source(spark):
                             f"{detail_resp.status_code} {detail_resp.text}"
                         )
 
-                    team_obj = detail_resp.json() or {}
+                    team_obj = response_json(detail_resp) or {}
                     if not isinstance(team_obj, dict):
                         raise ValueError(
                             "Unexpected response format for team detail: "
@@ -1664,13 +3245,13 @@ def register_lakeflow_source(spark):
             current authenticated user.
             """
             url = f"{self.base_url}/user"
-            response = self._session.get(url, timeout=30)
+            response = self._get(url)
             if response.status_code != 200:
                 raise RuntimeError(
                     f"GitHub API error for users: {response.status_code} {response.text}"
                 )
 
-            user_obj = response.json() or {}
+            user_obj = response_json(response) or {}
             if not isinstance(user_obj, dict):
                 raise ValueError(
                     f"Unexpected response format for user: {type(user_obj).__name__}"
@@ -1731,7 +3312,7 @@ def register_lakeflow_source(spark):
                 next_params = params
 
                 while next_url and pages_fetched < max_pages_per_batch:
-                    response = self._session.get(next_url, params=next_params, timeout=30)
+                    response = self._get(next_url, params=next_params)
                     if response.status_code != 200:
                         raise RuntimeError(
                             "GitHub API error for reviews "
@@ -1739,7 +3320,7 @@ def register_lakeflow_source(spark):
                             f"{response.status_code} {response.text}"
                         )
 
-                    reviews = response.json() or []
+                    reviews = response_json(response) or []
                     if not isinstance(reviews, list):
                         raise ValueError(
                             "Unexpected response format for reviews: "
@@ -1792,14 +3373,14 @@ def register_lakeflow_source(spark):
             next_params = params
 
             while next_url and pages_fetched < max_pages_per_batch:
-                response = self._session.get(next_url, params=next_params, timeout=30)
+                response = self._get(next_url, params=next_params)
                 if response.status_code != 200:
                     raise RuntimeError(
                         f"GitHub API error for pull_requests while discovering reviews: "
                         f"{response.status_code} {response.text}"
                     )
 
-                pull_requests = response.json() or []
+                pull_requests = response_json(response) or []
                 if not isinstance(pull_requests, list):
                     raise ValueError(
                         "Unexpected response format for pull_requests when discovering "
@@ -1824,6 +3405,69 @@ def register_lakeflow_source(spark):
             # cursor for reviews, so the offset is always an empty dict.
             return iter(records), {}
 
+        def _drop_lookback_repeats(
+            self,
+            records: list[dict[str, Any]],
+            start_offset: dict,
+            cursor: str | None,
+            max_updated_at: str | None,
+            lookback_seconds: int,
+        ) -> (Iterator[dict], dict):
+            """
+            Build the next offset of a cdc table read with a lookback window.
+
+            The next cursor is moved back by `lookback_seconds` so late updates
+            are not missed, which makes the next batch read the records of that
+            window again. The offset therefore keeps `seen`, the `updated_at` of
+            every record in the window by `id`, and records whose `id` and
+            `updated_at` match an entry of the start offset's `seen` are dropped
+            instead of being emitted twice. `seen` only covers the lookback
+            window, so it stays small.
+            """
+            seen = {}
+            if start_offset and isinstance(start_offset, dict):
+                seen = start_offset.get("seen") or {}
+            new_records = [
+                record
+                for record in records
+                if seen.get(str(record.get("id"))) != record.get("updated_at")
+                or record.get("updated_at") is None
+            ]
+
+            # If no new records, return the same offset to indicate end of stream for this batch
+            if not new_records and start_offset:
+                return iter(new_records), start_offset
+
+            next_cursor = cursor
+            if max_updated_at:
+                next_cursor = self._apply_lookback(max_updated_at, lookback_seconds)
+            if not next_cursor:
+                return iter(new_records), {}
+
+            next_offset = {"cursor": next_cursor}
+            window = {
+                str(record["id"]): record["updated_at"]
+                for record in records
+                if record.get("id") is not None
+                and isinstance(record.get("updated_at"), str)
+                and record["updated_at"] >= next_cursor
+            }
+            if window:
+                next_offset["seen"] = window
+            return iter(new_records), next_offset
+
+        @staticmethod
+        def _apply_lookback(cursor: str, lookback_seconds: int) -> str:
+            """
+            Move an ISO 8601 cursor back by `lookback_seconds`.
+
+            If the cursor cannot be parsed it is returned unchanged.
+            """
+            epoch = iso8601_to_epoch(cursor)
+            if epoch is None:
+                return cursor
+            return epoch_to_iso8601(epoch - lookback_seconds)
+
         @staticmethod
         def _extract_next_link(link_header: str | None) -> str | None:
             """
@@ -1849,16 +3493,125 @@ def register_lakeflow_source(spark):
     ########################################################
 
     METADATA_TABLE = "_lakeflow_metadata"
+    METRICS_TABLE = "_lakeflow_metrics"
     TABLE_NAME = "tableName"
     TABLE_NAME_LIST = "tableNameList"
+    # Set to "false" to stop logging (and saving) a metrics line per micro-batch.
+    METRICS_LOG_OPTION = "lakeflow.metrics"
+    # Set to "true" to read micro-batches with LakeflowPartitionedStreamReader.
+    PARTITIONED_STREAM_OPTION = "lakeflow.partitionedStream"
+    # Connector methods a partitioned stream needs.
+    PARTITIONED_STREAM_METHODS = ("latest_offset", "partition_offsets", "read_offset_range")
+    # Pseudo-table that reads the tables in `tableNameList` from one sweep of the
+    # first one, through the connector's `read_co_read`.
+    CO_READ_TABLE = "_lakeflow_co_read"
+
+    METRICS_SCHEMA = StructType(
+        [
+            StructField("tableName", StringType(), False),
+            StructField("requests", LongType(), True),
+            StructField("retries", LongType(), True),
+            StructField("throttled", LongType(), True),
+            StructField("errors", LongType(), True),
+            StructField("bytes_downloaded", LongType(), True),
+            StructField("records", LongType(), True),
+            StructField("read_seconds", DoubleType(), True),
+            StructField("fetch_seconds", DoubleType(), True),
+            StructField("parse_seconds", DoubleType(), True),
+            StructField(
+                "endpoints",
+                ArrayType(
+                    StructType(
+                        [
+                            StructField("endpoint", StringType(), True),
+                            StructField("requests", LongType(), True),
+                            StructField("total_ms", DoubleType(), True),
+                            StructField("max_ms", DoubleType(), True),
+                            StructField("buckets", ArrayType(LongType()), True),
+                        ]
+                    )
+                ),
+                True,
+            ),
+            StructField("logged_at", TimestampType(), True),
+            StructField("start_offset", StringType(), True),
+            StructField("end_offset", StringType(), True),
+        ]
+    )
+
+
+    def _log_metrics(options: dict[str, str], metrics: dict, **context) -> None:
+        """
+        Print the metrics of one read as a single JSON line, and append it to the
+        table's metrics log for `_lakeflow_metrics`.
+        """
+        if options.get(METRICS_LOG_OPTION, "true").lower() == "false":
+            return
+        line = {
+            "event": "lakeflow_connect_metrics",
+            "table": options.get(TABLE_NAME),
+            "logged_at": datetime.now(timezone.utc).isoformat(),
+            **context,
+            **metrics,
+        }
+        append_metrics_line(
+            options.get(METRICS_PATH_OPTION) or DEFAULT_METRICS_PATH,
+            options.get(TABLE_NAME),
+            line,
+        )
+        print(json.dumps(line, default=str))
+
+
+    def co_read_schema(table_schemas: dict) -> StructType:
+        """
+        Schema of the co-read pseudo-table: the name of the table a row belongs
+        to, then one struct column per table holding its records.
+        """
+        return StructType(
+            [StructField(TABLE_NAME, StringType(), False)]
+            + [
+                StructField(table, schema, True)
+                for table, schema in table_schemas.items()
+            ]
+        )
+
+
+    class LakeflowCoRead:
+        """
+        Reads the co-read pseudo-table through a connector's `read_co_read`.
+
+        `read_co_read(table_names, start_offset, table_options)` returns
+        `(table_name, record)` pairs and one offset for the whole sweep. Each pair
+        becomes a row of `co_read_schema`, so the readers can treat the sweep as
+        a single table.
+        """
+
+        def __init__(self, lakeflow_connect: LakeflowConnect, table_names: list[str]):
+            if not hasattr(lakeflow_connect, "read_co_read"):
+                raise ValueError(
+                    f"{CO_READ_TABLE} needs a connector that implements read_co_read"
+                )
+            if not table_names:
+                raise ValueError(f"{CO_READ_TABLE} needs a {TABLE_NAME_LIST}")
+            self.lakeflow_connect = lakeflow_connect
+            self.table_names = table_names
+
+        def read_table(
+            self, table_name: str, start_offset: dict, table_options: dict[str, str]
+        ) -> (Iterator[dict], dict):
+            records, offset = self.lakeflow_connect.read_co_read(
+                self.table_names, start_offset, table_options
+            )
+            return ({TABLE_NAME: name, name: record} for name, record in records), offset
 
 
     class LakeflowStreamReader(SimpleDataSourceStreamReader):
         """
         Implements a data source stream reader for Lakeflow Connect.
-        Currently, only the simpleStreamReader is implemented, which uses a
-        more generic protocol suitable for most data sources that support
-        incremental loading.
+        This is the default simpleStreamReader, which uses a more generic
+        protocol suitable for most data sources that support incremental
+        loading. Every micro-batch is read by a single reader on the driver;
+        see LakeflowPartitionedStreamReader for connectors that can split one.
         """
 
         def __init__(
@@ -1866,20 +3619,36 @@ def register_lakeflow_source(spark):
             options: dict[str, str],
             schema: StructType,
             lakeflow_connect: LakeflowConnect,
+            metrics: ReadMetrics,
         ):
             self.options = options
             self.lakeflow_connect = lakeflow_connect
             self.schema = schema
+            self.metrics = metrics
 
         def initialOffset(self):
             return {}
 
         def read(self, start: dict) -> (Iterator[tuple], dict):
-            records, offset = self.lakeflow_connect.read_table(
-                self.options["tableName"], start, self.options
+            profiler = ReadProfiler(self.options, "stream", start_offset=start)
+            started = time.perf_counter()
+            with profiler:
+                records, offset = self.lakeflow_connect.read_table(
+                    self.options["tableName"], start, self.options
+                )
+            rows = timed_rows(
+                records,
+                lambda x: parse_value(x, self.schema),
+                self.metrics,
+                time.perf_counter() - started,
+                on_complete=lambda: _log_metrics(
+                    self.options,
+                    self.metrics.collect(),
+                    start_offset=start,
+                    end_offset=offset,
+                ),
             )
-            rows = map(lambda x: parse_value(x, self.schema), records)
-            return rows, offset
+            return profiler.rows(rows), offset
 
         def readBetweenOffsets(self, start: dict, end: dict) -> Iterator[tuple]:
             # TODO: This does not ensure the records returned are identical across repeated calls.
@@ -1890,33 +3659,208 @@ def register_lakeflow_source(spark):
             return self.read(start)[0]
 
 
+    class LakeflowPartitionedStreamReader(DataSourceStreamReader):
+        """
+        Stream reader that splits every micro-batch into partitions read by the
+        executors in parallel.
+
+        Used instead of LakeflowStreamReader when the `lakeflow.partitionedStream`
+        option is `true`. The driver only plans: the connector's `latest_offset`
+        picks the end offset of the next micro-batch without reading records, and
+        `partition_offsets` splits the range between two offsets into independent
+        `(start, end)` pairs (per repository, per time window, ...). Each
+        executor then reads one pair with `read_offset_range`.
+        """
+
+        def __init__(
+            self,
+            options: dict[str, str],
+            schema: StructType,
+            lakeflow_connect: LakeflowConnect,
+            metrics: ReadMetrics,
+        ):
+            self.options = options
+            self.schema = schema
+            self.lakeflow_connect = lakeflow_connect
+            self.metrics = metrics
+            self.table_name = options[TABLE_NAME]
+            # Last planned offset, the start of the next micro-batch on runtimes
+            # that call latestOffset() without one.
+            self.latest = None
+
+        def initialOffset(self):
+            return {}
+
+        def latestOffset(self, start: dict = None, limit=None) -> dict:
+            if start is None:
+                start = self.latest if self.latest is not None else self.initialOffset()
+            self.latest = self.lakeflow_connect.latest_offset(
+                self.table_name, start, self.options
+            )
+            return self.latest
+
+        def partitions(self, start: dict, end: dict):
+            return [
+                InputPartition({"start": part_start, "end": part_end})
+                for part_start, part_end in self.lakeflow_connect.partition_offsets(
+                    self.table_name, start, end, self.options
+                )
+            ]
+
+        def read(self, partition) -> Iterator[tuple]:
+            start, end = partition.value["start"], partition.value["end"]
+            profiler = ReadProfiler(self.options, "stream", start_offset=start)
+            started = time.perf_counter()
+            with profiler:
+                records = self.lakeflow_connect.read_offset_range(
+                    self.table_name, start, end, self.options
+                )
+            rows = timed_rows(
+                records,
+                lambda x: parse_value(x, self.schema),
+                self.metrics,
+                time.perf_counter() - started,
+                on_complete=lambda: _log_metrics(
+                    self.options,
+                    self.metrics.collect(),
+                    start_offset=start,
+                    end_offset=end,
+                ),
+            )
+            return profiler.rows(rows)
+
+        def commit(self, end: dict) -> None:
+            pass
+
+
     class LakeflowBatchReader(DataSourceReader):
         def __init__(
             self,
             options: dict[str, str],
             schema: StructType,
             lakeflow_connect: LakeflowConnect,
+            metrics: ReadMetrics,
         ):
             self.options = options
             self.schema = schema
             self.lakeflow_connect = lakeflow_connect
+            self.metrics = metrics
             self.table_name = options[TABLE_NAME]
+            # `(column, op, value)` filters accepted by `pushFilters`
+            self.pushed_filters = []
+            # Columns read when `lakeflow.columns` pruned `schema`, else None.
+            # Without the option the table's schema is not looked up again: for
+            # some connectors that costs API calls (e.g. HubSpot property
+            # discovery), and a schema given by the user is passed through as is.
+            self.projection = None
+            if self.table_name not in (
+                METADATA_TABLE,
+                METRICS_TABLE,
+                CO_READ_TABLE,
+            ) and options.get(COLUMNS_OPTION):
+                self.projection = projection_paths(
+                    schema, lakeflow_connect.get_table_schema(self.table_name, options)
+                )
+
+        def pushFilters(self, filters):
+            """
+            Push down the filters the connector can turn into API parameters.
+
+            Connectors opt in with `supported_filters(table_name, table_options)`,
+            which maps column names to the operators they accept. Accepted
+            filters are passed to `read_table` in the `lakeflow.pushedFilters`
+            option so the connector can narrow its requests, and rows that do
+            not match them are dropped after parsing. The other filters are
+            returned to Spark.
+            """
+            supported_filters = getattr(self.lakeflow_connect, "supported_filters", None)
+            if supported_filters is None or self.table_name in (
+                METADATA_TABLE,
+                METRICS_TABLE,
+            ):
+                return filters
+            supported = supported_filters(self.table_name, self.options) or {}
+            unhandled = []
+            for spark_filter in filters:
+                pushed = to_pushed_filter(spark_filter)
+                if pushed is not None and pushed[1] in supported.get(pushed[0], ()):
+                    self.pushed_filters.append(pushed)
+                else:
+                    unhandled.append(spark_filter)
+            return unhandled
+
+        def partitions(self):
+            # Metadata lookups can each cost API calls, so give every table its
+            # own partition; resolution then takes as long as the slowest table
+            # rather than the sum of all of them.
+            if self.table_name in (METADATA_TABLE, METRICS_TABLE):
+                table_names = self._metadata_table_names()
+                if table_names:
+                    return [InputPartition(table) for table in table_names]
+            return [InputPartition(None)]
 
         def read(self, partition):
             all_records = []
-            if self.table_name == METADATA_TABLE:
-                all_records = self._read_table_metadata()
-            else:
+            if self.table_name in (METADATA_TABLE, METRICS_TABLE):
+                table_names = self._metadata_table_names()
+                if partition is not None and partition.value is not None:
+                    table_names = [partition.value]
+                if self.table_name == METRICS_TABLE:
+                    all_records = self._read_table_metrics(table_names)
+                else:
+                    all_records = self._read_table_metadata(table_names)
+                return iter(map(lambda x: parse_value(x, self.schema), all_records))
+
+            options = dict(self.options)
+            if self.pushed_filters:
+                options[PUSHED_FILTERS_OPTION] = json.dumps(self.pushed_filters)
+            if self.projection is not None:
+                options[PROJECTION_OPTION] = json.dumps(self.projection)
+            profiler = ReadProfiler(self.options, "batch")
+            started = time.perf_counter()
+            with profiler:
                 all_records, _ = self.lakeflow_connect.read_table(
-                    self.table_name, None, self.options
+                    self.table_name, None, options
                 )
+            rows = timed_rows(
+                all_records,
+                lambda x: parse_value(x, self.schema),
+                self.metrics,
+                time.perf_counter() - started,
+                on_complete=lambda: _log_metrics(self.options, self.metrics.collect()),
+            )
+            if self.pushed_filters:
+                rows = (row for row in rows if matches_filters(row, self.pushed_filters))
+            return profiler.rows(rows)
 
-            rows = map(lambda x: parse_value(x, self.schema), all_records)
-            return iter(rows)
-
-        def _read_table_metadata(self):
+        def _metadata_table_names(self) -> list[str]:
             table_name_list = self.options.get(TABLE_NAME_LIST, "")
-            table_names = [o.strip() for o in table_name_list.split(",") if o.strip()]
+            return [o.strip() for o in table_name_list.split(",") if o.strip()]
+
+        def _read_table_metrics(self, table_names: list[str]):
+            """
+            Return the metrics logged by the reads of each table, one row per
+            micro-batch (or batch read), oldest first. Nothing is read from the
+            source; stream offsets are returned as JSON strings.
+            """
+            directory = self.options.get(METRICS_PATH_OPTION) or DEFAULT_METRICS_PATH
+            all_records = []
+            for table in table_names:
+                for line in read_metrics_lines(directory, table):
+                    all_records.append(
+                        {
+                            **line,
+                            "tableName": table,
+                            **{
+                                key: json.dumps(line[key])
+                                for key in ("start_offset", "end_offset")
+                                if key in line
+                            },
+                        }
+                    )
+            return all_records
+
+        def _read_table_metadata(self, table_names: list[str]):
             all_records = []
             for table in table_names:
                 metadata = self.lakeflow_connect.read_table_metadata(table, self.options)
@@ -1928,6 +3872,11 @@ def register_lakeflow_source(spark):
         def __init__(self, options):
             self.options = options
             self.lakeflow_connect = LakeflowConnect(options)
+            # Connectors that instrument their HTTP calls expose a `metrics`
+            # attribute; the others still get record and timing counters.
+            self.metrics = getattr(self.lakeflow_connect, "metrics", None)
+            if not isinstance(self.metrics, ReadMetrics):
+                self.metrics = ReadMetrics()
 
         @classmethod
         def name(cls):
@@ -1944,15 +3893,67 @@ def register_lakeflow_source(spark):
                         StructField("ingestion_type", StringType(), True),
                     ]
                 )
+            elif table == METRICS_TABLE:
+                return METRICS_SCHEMA
+            elif table == CO_READ_TABLE:
+                return co_read_schema(
+                    {
+                        name: self.lakeflow_connect.get_table_schema(name, self.options)
+                        for name in self._table_name_list()
+                    }
+                )
             else:
                 # Assuming the LakeflowConnect interface uses get_table_schema, not get_table_details
-                return self.lakeflow_connect.get_table_schema(table, self.options)
+                schema = self.lakeflow_connect.get_table_schema(table, self.options)
+                columns = self.options.get(COLUMNS_OPTION)
+                if columns:
+                    schema = prune_schema(
+                        schema, [c.strip() for c in columns.split(",") if c.strip()]
+                    )
+                return schema
 
         def reader(self, schema: StructType):
-            return LakeflowBatchReader(self.options, schema, self.lakeflow_connect)
+            return LakeflowBatchReader(
+                self.options, schema, self._table_reader(), self.metrics
+            )
+
+        def streamReader(self, schema: StructType):
+            # Without the option, the base class raises the not-implemented error
+            # that makes Spark fall back to simpleStreamReader.
+            if self.options.get(PARTITIONED_STREAM_OPTION, "false").lower() != "true":
+                return super().streamReader(schema)
+            if self.options[TABLE_NAME] == CO_READ_TABLE:
+                raise ValueError(
+                    f"{PARTITIONED_STREAM_OPTION} does not apply to {CO_READ_TABLE}"
+                )
+            missing = [
+                method
+                for method in PARTITIONED_STREAM_METHODS
+                if not hasattr(self.lakeflow_connect, method)
+            ]
+            if missing:
+                raise ValueError(
+                    f"{PARTITIONED_STREAM_OPTION} is set, but the connector does not "
+                    f"implement {', '.join(missing)}"
+                )
+            return LakeflowPartitionedStreamReader(
+                self.options, schema, self.lakeflow_connect, self.metrics
+            )
 
         def simpleStreamReader(self, schema: StructType):
-            return LakeflowStreamReader(self.options, schema, self.lakeflow_connect)
+            return LakeflowStreamReader(
+                self.options, schema, self._table_reader(), self.metrics
+            )
+
+        def _table_name_list(self) -> list[str]:
+            table_name_list = self.options.get(TABLE_NAME_LIST, "")
+            return [o.strip() for o in table_name_list.split(",") if o.strip()]
+
+        def _table_reader(self):
+            """The object whose `read_table` serves `tableName`."""
+            if self.options[TABLE_NAME] == CO_READ_TABLE:
+                return LakeflowCoRead(self.lakeflow_connect, self._table_name_list())
+            return self.lakeflow_connect
 
 
     spark.dataSource.register(LakeflowSource)
@@ -1,6 +1,10 @@
 import requests
-from datetime import datetime, timedelta
-from typing import Iterator, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from types import MappingProxyType
+from typing import Iterator, Any, Mapping
 
 from pyspark.sql.types import (
     StructType,
@@ -12,30 +16,676 @@ from pyspark.sql.types import (
     MapType,
 )
 
+from libs.metrics import ReadMetrics, attach_metrics
+from libs.utils import (
+    epoch_to_iso8601,
+    iso8601_to_epoch,
+    pushed_filters,
+    response_json,
+)
+
+# Tables read from `/repos/{owner}/{repo}/...`. They accept either a single
+# `owner`/`repo` or several repositories through `repos` or `org`.
+REPO_SCOPED_TABLES = (
+    "issues",
+    "pull_requests",
+    "comments",
+    "commits",
+    "assignees",
+    "branches",
+    "collaborators",
+    "reviews",
+)
+
+# Tables a partitioned stream splits per repository, with the path of their
+# `since`-filtered endpoint under `/repos/{owner}/{repo}/`.
+PARTITIONED_STREAM_TABLES = {
+    "issues": "issues",
+    "comments": "issues/comments",
+}
+
+
+def _build_table_schemas() -> dict[str, StructType]:
+    """Build the Spark schema of every GitHub table."""
+    # Nested `user` / `assignee` struct schema
+    user_struct = StructType(
+        [
+            StructField("login", StringType(), True),
+            StructField("id", LongType(), True),
+            StructField("node_id", StringType(), True),
+            StructField("type", StringType(), True),
+            StructField("site_admin", BooleanType(), True),
+        ]
+    )
+
+    # Nested `label` struct schema
+    label_struct = StructType(
+        [
+            StructField("id", LongType(), True),
+            StructField("node_id", StringType(), True),
+            StructField("name", StringType(), True),
+            StructField("color", StringType(), True),
+            StructField("description", StringType(), True),
+            StructField("default", BooleanType(), True),
+        ]
+    )
+
+    # Nested `milestone` struct schema (subset of fields)
+    milestone_struct = StructType(
+        [
+            StructField("id", LongType(), True),
+            StructField("number", LongType(), True),
+            StructField("title", StringType(), True),
+            StructField("description", StringType(), True),
+            StructField("state", StringType(), True),
+            StructField("created_at", StringType(), True),
+            StructField("updated_at", StringType(), True),
+            StructField("due_on", StringType(), True),
+        ]
+    )
+
+    # For `pull_request` and `reactions` we use MapType to keep the schema
+    # flexible while preserving nested structure without flattening.
+    pull_request_struct = MapType(StringType(), StringType(), True)
+    reactions_struct = MapType(StringType(), StringType(), True)
+
+    # Common nested structs used across multiple tables
+    permissions_struct = StructType(
+        [
+            StructField("admin", BooleanType(), True),
+            StructField("push", BooleanType(), True),
+            StructField("pull", BooleanType(), True),
+        ]
+    )
+
+    license_struct = StructType(
+        [
+            StructField("key", StringType(), True),
+            StructField("name", StringType(), True),
+            StructField("spdx_id", StringType(), True),
+            StructField("url", StringType(), True),
+            StructField("node_id", StringType(), True),
+        ]
+    )
+
+    template_repository_struct = StructType(
+        [
+            StructField("id", LongType(), True),
+            StructField("node_id", StringType(), True),
+            StructField("name", StringType(), True),
+            StructField("full_name", StringType(), True),
+        ]
+    )
+
+    # Primary `issues` table schema
+    issues_schema = StructType(
+        [
+            StructField("id", LongType(), False),
+            StructField("node_id", StringType(), True),
+            StructField("number", LongType(), False),
+            StructField("repository_owner", StringType(), False),
+            StructField("repository_name", StringType(), False),
+            StructField("title", StringType(), True),
+            StructField("body", StringType(), True),
+            StructField("state", StringType(), True),
+            StructField("locked", BooleanType(), True),
+            StructField("comments", LongType(), True),
+            StructField("created_at", StringType(), True),
+            StructField("updated_at", StringType(), True),
+            StructField("closed_at", StringType(), True),
+            StructField("author_association", StringType(), True),
+            StructField("url", StringType(), True),
+            StructField("html_url", StringType(), True),
+            StructField("labels_url", StringType(), True),
+            StructField("comments_url", StringType(), True),
+            StructField("events_url", StringType(), True),
+            StructField("timeline_url", StringType(), True),
+            StructField("state_reason", StringType(), True),
+            StructField("user", user_struct, True),
+            StructField("assignee", user_struct, True),
+            StructField("assignees", ArrayType(user_struct, True), True),
+            StructField("labels", ArrayType(label_struct, True), True),
+            StructField("milestone", milestone_struct, True),
+            StructField("pull_request", pull_request_struct, True),
+            StructField("reactions", reactions_struct, True),
+        ]
+    )
+
+    # `repositories` snapshot metadata schema
+    repositories_schema = StructType(
+        [
+            StructField("id", LongType(), False),
+            StructField("node_id", StringType(), True),
+            StructField("repository_owner", StringType(), False),
+            StructField("repository_name", StringType(), False),
+            StructField("name", StringType(), True),
+            StructField("full_name", StringType(), True),
+            StructField("owner", user_struct, True),
+            StructField("private", BooleanType(), True),
+            StructField("html_url", StringType(), True),
+            StructField("description", StringType(), True),
+            StructField("fork", BooleanType(), True),
+            StructField("url", StringType(), True),
+            StructField("archive_url", StringType(), True),
+            StructField("assignees_url", StringType(), True),
+            StructField("blobs_url", StringType(), True),
+            StructField("branches_url", StringType(), True),
+            StructField("collaborators_url", StringType(), True),
+            StructField("comments_url", StringType(), True),
+            StructField("commits_url", StringType(), True),
+            StructField("compare_url", StringType(), True),
+            StructField("contents_url", StringType(), True),
+            StructField("contributors_url", StringType(), True),
+            StructField("deployments_url", StringType(), True),
+            StructField("downloads_url", StringType(), True),
+            StructField("events_url", StringType(), True),
+            StructField("forks_url", StringType(), True),
+            StructField("git_commits_url", StringType(), True),
+            StructField("git_refs_url", StringType(), True),
+            StructField("git_tags_url", StringType(), True),
+            StructField("git_url", StringType(), True),
+            StructField("issue_comment_url", StringType(), True),
+            StructField("issue_events_url", StringType(), True),
+            StructField("issues_url", StringType(), True),
+            StructField("keys_url", StringType(), True),
+            StructField("labels_url", StringType(), True),
+            StructField("languages_url", StringType(), True),
+            StructField("merges_url", StringType(), True),
+            StructField("milestones_url", StringType(), True),
+            StructField("notifications_url", StringType(), True),
+            StructField("pulls_url", StringType(), True),
+            StructField("releases_url", StringType(), True),
+            StructField("ssh_url", StringType(), True),
+            StructField("stargazers_url", StringType(), True),
+            StructField("statuses_url", StringType(), True),
+            StructField("subscribers_url", StringType(), True),
+            StructField("subscription_url", StringType(), True),
+            StructField("tags_url", StringType(), True),
+            StructField("teams_url", StringType(), True),
+            StructField("trees_url", StringType(), True),
+            StructField("clone_url", StringType(), True),
+            StructField("mirror_url", StringType(), True),
+            StructField("hooks_url", StringType(), True),
+            StructField("svn_url", StringType(), True),
+            StructField("homepage", StringType(), True),
+            StructField("language", StringType(), True),
+            StructField("forks_count", LongType(), True),
+            StructField("stargazers_count", LongType(), True),
+            StructField("watchers_count", LongType(), True),
+            StructField("size", LongType(), True),
+            StructField("default_branch", StringType(), True),
+            StructField("open_issues_count", LongType(), True),
+            StructField("is_template", BooleanType(), True),
+            StructField("topics", ArrayType(StringType(), True), True),
+            StructField("has_issues", BooleanType(), True),
+            StructField("has_projects", BooleanType(), True),
+            StructField("has_wiki", BooleanType(), True),
+            StructField("has_pages", BooleanType(), True),
+            StructField("has_downloads", BooleanType(), True),
+            StructField("archived", BooleanType(), True),
+            StructField("disabled", BooleanType(), True),
+            StructField("visibility", StringType(), True),
+            StructField("pushed_at", StringType(), True),
+            StructField("created_at", StringType(), True),
+            StructField("updated_at", StringType(), True),
+            StructField("permissions", permissions_struct, True),
+            StructField("allow_rebase_merge", BooleanType(), True),
+            StructField(
+                "template_repository", template_repository_struct, True
+            ),
+            StructField("temp_clone_token", StringType(), True),
+            StructField("allow_squash_merge", BooleanType(), True),
+            StructField("allow_merge_commit", BooleanType(), True),
+            StructField("subscribers_count", LongType(), True),
+            StructField("network_count", LongType(), True),
+            StructField("license", license_struct, True),
+        ]
+    )
+
+    # `pull_requests` cdc table schema
+    pull_requests_schema = StructType(
+        [
+            StructField("id", LongType(), False),
+            StructField("node_id", StringType(), True),
+            StructField("number", LongType(), False),
+            StructField("repository_owner", StringType(), False),
+            StructField("repository_name", StringType(), False),
+            StructField("state", StringType(), True),
+            StructField("title", StringType(), True),
+            StructField("body", StringType(), True),
+            StructField("draft", BooleanType(), True),
+            StructField("created_at", StringType(), True),
+            StructField("updated_at", StringType(), True),
+            StructField("closed_at", StringType(), True),
+            StructField("merged_at", StringType(), True),
+            StructField("merge_commit_sha", StringType(), True),
+            StructField("user", user_struct, True),
+            StructField(
+                "base", MapType(StringType(), StringType(), True), True
+            ),
+            StructField(
+                "head", MapType(StringType(), StringType(), True), True
+            ),
+            StructField("html_url", StringType(), True),
+            StructField("url", StringType(), True),
+        ]
+    )
+
+    # `comments` cdc table schema (issue comments)
+    comments_schema = StructType(
+        [
+            StructField("id", LongType(), False),
+            StructField("node_id", StringType(), True),
+            StructField("repository_owner", StringType(), False),
+            StructField("repository_name", StringType(), False),
+            StructField("issue_url", StringType(), True),
+            StructField("html_url", StringType(), True),
+            StructField("body", StringType(), True),
+            StructField("user", user_struct, True),
+            StructField("created_at", StringType(), True),
+            StructField("updated_at", StringType(), True),
+            StructField("author_association", StringType(), True),
+        ]
+    )
+
+    # `commits` append-only table schema
+    commits_schema = StructType(
+        [
+            StructField("sha", StringType(), False),
+            StructField("node_id", StringType(), True),
+            StructField("repository_owner", StringType(), False),
+            StructField("repository_name", StringType(), False),
+            StructField("commit_message", StringType(), True),
+            StructField("commit_author_name", StringType(), True),
+            StructField("commit_author_email", StringType(), True),
+            StructField("commit_author_date", StringType(), True),
+            StructField("commit_committer_name", StringType(), True),
+            StructField("commit_committer_email", StringType(), True),
+            StructField("commit_committer_date", StringType(), True),
+            StructField("html_url", StringType(), True),
+            StructField("url", StringType(), True),
+            StructField("author", user_struct, True),
+            StructField("committer", user_struct, True),
+        ]
+    )
+
+    # `users` snapshot metadata schema
+    users_schema = StructType(
+        [
+            StructField("id", LongType(), False),
+            StructField("login", StringType(), False),
+            StructField("node_id", StringType(), True),
+            StructField("type", StringType(), True),
+            StructField("site_admin", BooleanType(), True),
+            StructField("name", StringType(), True),
+            StructField("company", StringType(), True),
+            StructField("blog", StringType(), True),
+            StructField("location", StringType(), True),
+            StructField("email", StringType(), True),
+            StructField("created_at", StringType(), True),
+            StructField("updated_at", StringType(), True),
+        ]
+    )
+
+    # `organizations` snapshot metadata schema
+    # The organizations table now reflects the shape of the
+    # `GET /user/orgs` response without expanding each org via
+    # `GET /orgs/{org}`. This avoids additional permissions that
+    # may be required for the detail endpoint while still exposing
+    # the most useful summary metadata.
+    orgs_schema = StructType(
+        [
+            StructField("id", LongType(), False),
+            StructField("login", StringType(), False),
+            StructField("node_id", StringType(), True),
+            StructField("url", StringType(), True),
+            StructField("repos_url", StringType(), True),
+            StructField("events_url", StringType(), True),
+            StructField("hooks_url", StringType(), True),
+            StructField("issues_url", StringType(), True),
+            StructField("members_url", StringType(), True),
+            StructField("public_members_url", StringType(), True),
+            StructField("avatar_url", StringType(), True),
+            StructField("description", StringType(), True),
+        ]
+    )
+
+    # `teams` snapshot metadata schema
+    teams_schema = StructType(
+        [
+            StructField("id", LongType(), False),
+            StructField("node_id", StringType(), True),
+            StructField("organization_login", StringType(), False),
+            StructField("name", StringType(), True),
+            StructField("slug", StringType(), True),
+            StructField("description", StringType(), True),
+            StructField("privacy", StringType(), True),
+            StructField("permission", StringType(), True),
+        ]
+    )
+
+    # `assignees` snapshot metadata schema
+    assignees_schema = StructType(
+        [
+            StructField("repository_owner", StringType(), False),
+            StructField("repository_name", StringType(), False),
+            StructField("login", StringType(), False),
+            StructField("id", LongType(), False),
+            StructField("node_id", StringType(), True),
+            StructField("type", StringType(), True),
+            StructField("site_admin", BooleanType(), True),
+        ]
+    )
+
+    # `collaborators` snapshot metadata schema
+    collaborators_schema = StructType(
+        [
+            StructField("repository_owner", StringType(), False),
+            StructField("repository_name", StringType(), False),
+            StructField("login", StringType(), False),
+            StructField("id", LongType(), False),
+            StructField("node_id", StringType(), True),
+            StructField("type", StringType(), True),
+            StructField("site_admin", BooleanType(), True),
+            StructField("permissions", permissions_struct, True),
+        ]
+    )
+
+    # `branches` snapshot metadata schema
+    commit_ref_struct = StructType(
+        [
+            StructField("sha", StringType(), True),
+            StructField("url", StringType(), True),
+        ]
+    )
+    branches_schema = StructType(
+        [
+            StructField("repository_owner", StringType(), False),
+            StructField("repository_name", StringType(), False),
+            StructField("name", StringType(), False),
+            StructField("commit", commit_ref_struct, True),
+            StructField("protected", BooleanType(), True),
+            StructField("protection_url", StringType(), True),
+        ]
+    )
+
+    # `reviews` append-only table schema
+    reviews_schema = StructType(
+        [
+            StructField("id", LongType(), False),
+            StructField("node_id", StringType(), True),
+            StructField("repository_owner", StringType(), False),
+            StructField("repository_name", StringType(), False),
+            StructField("pull_number", LongType(), False),
+            StructField("state", StringType(), True),
+            StructField("body", StringType(), True),
+            StructField("user", user_struct, True),
+            StructField("commit_id", StringType(), True),
+            StructField("submitted_at", StringType(), True),
+            StructField("html_url", StringType(), True),
+        ]
+    )
+
+    return {
+        "issues": issues_schema,
+        "repositories": repositories_schema,
+        "pull_requests": pull_requests_schema,
+        "comments": comments_schema,
+        "commits": commits_schema,
+        "users": users_schema,
+        "organizations": orgs_schema,
+        "teams": teams_schema,
+        "assignees": assignees_schema,
+        "collaborators": collaborators_schema,
+        "branches": branches_schema,
+        "reviews": reviews_schema,
+    }
+
+
+# Read-only table schemas, built on first use and then reused by every
+# connector in the process (the schemas are static). Each process that reads
+# builds its own copy. Use `_table_schemas()` rather than this directly.
+_TABLE_SCHEMAS: Mapping[str, StructType] | None = None
+
+
+def _table_schemas() -> Mapping[str, StructType]:
+    """Return the schema of every GitHub table, building them on first use."""
+    global _TABLE_SCHEMAS
+    if _TABLE_SCHEMAS is None:
+        _TABLE_SCHEMAS = MappingProxyType(_build_table_schemas())
+    return _TABLE_SCHEMAS
+
+
+class RateLimitBudget:
+    """
+    Tracks a token's primary rate limit from GitHub's `X-RateLimit-*` headers.
+
+    The headers report the quota left for the token across every client
+    using it, so each connector instance sees the budget shared by all the
+    tables of a pipeline. While more than `pace_below` of the hourly limit is
+    left, requests go out unthrottled. Below that, the remaining requests are
+    spread evenly until the limit resets. Reads of snapshot tables stop once
+    only `reserve` requests are left and wait for the reset, which keeps
+    the rest of the quota for incremental tables.
+
+    `wait` may be called from several threads at once.
+    """
+
+    def __init__(self, reserve: int = 500, pace_below: float = 0.5) -> None:
+        self.reserve = reserve
+        self.pace_below = pace_below
+        self.limit = None
+        self.remaining = None
+        self.reset_at = None
+        self.blocked_until = 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled; each process gets its own.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def update(self, response: requests.Response) -> None:
+        """Record the quota reported by a response, if it reports one."""
+        headers = response.headers
+        if headers.get("X-RateLimit-Resource", "core") != "core":
+            # Search and GraphQL quotas are separate from the REST one.
+            return
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_at = int(headers["X-RateLimit-Reset"])
+            limit = int(headers.get("X-RateLimit-Limit", 0)) or None
+        except (KeyError, TypeError, ValueError):
+            return
+        with self._lock:
+            if self.reset_at is None or reset_at > self.reset_at:
+                # A new rate limit window has started.
+                self.reset_at = reset_at
+                self.remaining = remaining
+            elif reset_at == self.reset_at:
+                # Responses of concurrent requests may arrive out of order.
+                self.remaining = min(self.remaining, remaining)
+            self.limit = limit or self.limit
+
+    def block(self, seconds: float) -> None:
+        """Send nothing for `seconds`, e.g. after a rate-limited response."""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.time() + seconds)
+
+    def available(self) -> float:
+        """
+        Requests that can be sent right away: infinite while the quota is not
+        known yet, -1 while blocked or exhausted.
+        """
+        with self._lock:
+            now = time.time()
+            if self.blocked_until > now:
+                return -1
+            if self.remaining is None or self.reset_at is None or now >= self.reset_at:
+                return float("inf")
+            return self.remaining if self.remaining > 0 else -1
+
+    def delay(self, low_priority: bool = False) -> float:
+        """
+        Reserve the next request and return how long to wait before sending it.
+        """
+        with self._lock:
+            now = time.time()
+            if self.blocked_until > now:
+                return self.blocked_until - now
+            if self.remaining is None or self.reset_at is None or now >= self.reset_at:
+                return 0.0
+            until_reset = self.reset_at - now + 1
+            if self.remaining <= 0 or (low_priority and self.remaining <= self.reserve):
+                return until_reset
+            self.remaining -= 1
+            if self.limit and self.remaining >= self.limit * self.pace_below:
+                return 0.0
+            interval = until_reset / (self.remaining + 1)
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + interval
+            return slot - now
+
+    def retry_delay(self, response: requests.Response) -> float | None:
+        """
+        Seconds to wait before retrying a rate-limited response, or None if
+        the response was not rate limited.
+        """
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(1.0, float(retry_after))
+            except ValueError:
+                return 60.0
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                reset_at = int(response.headers["X-RateLimit-Reset"])
+            except (KeyError, ValueError):
+                return 60.0
+            return max(1.0, reset_at - time.time() + 1)
+        if response.status_code == 429 or "rate limit" in response.text.lower():
+            # Secondary rate limits without Retry-After: wait at least a minute.
+            return 60.0
+        return None
+
+
+class TokenPool:
+    """
+    Tokens requests are spread over, each with its own `RateLimitBudget`.
+
+    `acquire` hands out the token with the most quota left that has fewer
+    than `max_in_flight` requests running, blocking until one frees up, so
+    throughput grows with the number of tokens configured.
+    """
+
+    def __init__(
+        self,
+        tokens: list[str],
+        max_in_flight: int = 10,
+        reserve: int = 500,
+        pace_below: float = 0.5,
+    ) -> None:
+        self.tokens = tokens
+        self.max_in_flight = max(1, max_in_flight)
+        self.budgets = [
+            RateLimitBudget(reserve=reserve, pace_below=pace_below) for _ in tokens
+        ]
+        self.in_flight = [0] * len(tokens)
+        self._available = threading.Condition()
+
+    def __getstate__(self) -> dict:
+        # Conditions cannot be pickled; each process gets its own.
+        state = self.__dict__.copy()
+        del state["_available"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._available = threading.Condition()
+
+    def acquire(self) -> int:
+        """Return the index of the token to send the next request with."""
+        with self._available:
+            while True:
+                free = [
+                    index
+                    for index, running in enumerate(self.in_flight)
+                    if running < self.max_in_flight
+                ]
+                if free:
+                    index = max(
+                        free,
+                        key=lambda i: (self.budgets[i].available(), -self.in_flight[i]),
+                    )
+                    self.in_flight[index] += 1
+                    return index
+                self._available.wait()
+
+    def release(self, index: int) -> None:
+        """Mark a request sent with token `index` as finished."""
+        with self._available:
+            self.in_flight[index] -= 1
+            self._available.notify()
+
 
 class LakeflowConnect:
+    # Upper bound on the windows of a commits backfill plan.
+    MAX_BACKFILL_WINDOWS = 200
+
     def __init__(self, options: dict[str, str]) -> None:
         """
         Initialize the GitHub connector with connection-level options.
 
         Expected options:
             - token: Personal access token used for GitHub REST API authentication.
+            - tokens (optional): Comma-separated personal access or GitHub App
+              installation tokens to spread requests over, used with or
+              instead of `token`.
+            - max_concurrent_requests_per_token (optional): Requests in flight
+              per token at most. Defaults to 10.
             - base_url (optional): Override for GitHub API base URL. Defaults to https://api.github.com.
+            - max_retries (optional): Times a rate-limited request is retried
+              after waiting for the limit to reset. Defaults to 3.
+            - rate_limit_reserve (optional): Requests left in the hourly quota
+              at which snapshot tables wait for the reset, keeping the rest for
+              incremental tables. Defaults to 500.
+            - rate_limit_pace_below (optional): Fraction of the hourly quota
+              below which requests are spread evenly until the reset.
+              Defaults to 0.5.
         """
-        token = options.get("token")
-        if not token:
-            raise ValueError("GitHub connector requires 'token' in options")
+        tokens = [options.get("token")] + str(options.get("tokens") or "").split(",")
+        tokens = list(dict.fromkeys(t.strip() for t in tokens if t and t.strip()))
+        if not tokens:
+            raise ValueError("GitHub connector requires 'token' or 'tokens' in options")
 
         self.base_url = options.get("base_url", "https://api.github.com").rstrip("/")
 
-        # Configure a session with proper headers for GitHub REST API v3
+        # Configure a session with proper headers for GitHub REST API v3; the
+        # Authorization header is set per request by `_get`.
         self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/vnd.github+json",
-            }
+        self._session.headers.update({"Accept": "application/vnd.github+json"})
+        # Request, byte and latency counters reported per micro-batch
+        self.metrics = ReadMetrics()
+        attach_metrics(self._session, self.metrics)
+        # Number of times a rate-limited (403/429) request is retried
+        self.max_retries = int(options.get("max_retries", 3))
+        self.token_pool = TokenPool(
+            tokens,
+            max_in_flight=int(options.get("max_concurrent_requests_per_token", 10)),
+            reserve=int(options.get("rate_limit_reserve", 500)),
+            pace_below=float(options.get("rate_limit_pace_below", 0.5)),
         )
+        # Whether the table being read gives way to incremental tables when
+        # the quota runs low (set per read_table call).
+        self._low_priority = False
 
     def list_tables(self) -> list[str]:
         """
@@ -64,413 +714,13 @@ class LakeflowConnect:
         Fetch the schema of a table.
 
         The schema is static and derived from the GitHub REST API documentation
-        and connector design for the `issues` object.
-        """
-        # Nested `user` / `assignee` struct schema
-        user_struct = StructType(
-            [
-                StructField("login", StringType(), True),
-                StructField("id", LongType(), True),
-                StructField("node_id", StringType(), True),
-                StructField("type", StringType(), True),
-                StructField("site_admin", BooleanType(), True),
-            ]
-        )
-
-        # Nested `label` struct schema
-        label_struct = StructType(
-            [
-                StructField("id", LongType(), True),
-                StructField("node_id", StringType(), True),
-                StructField("name", StringType(), True),
-                StructField("color", StringType(), True),
-                StructField("description", StringType(), True),
-                StructField("default", BooleanType(), True),
-            ]
-        )
-
-        # Nested `milestone` struct schema (subset of fields)
-        milestone_struct = StructType(
-            [
-                StructField("id", LongType(), True),
-                StructField("number", LongType(), True),
-                StructField("title", StringType(), True),
-                StructField("description", StringType(), True),
-                StructField("state", StringType(), True),
-                StructField("created_at", StringType(), True),
-                StructField("updated_at", StringType(), True),
-                StructField("due_on", StringType(), True),
-            ]
-        )
-
-        # For `pull_request` and `reactions` we use MapType to keep the schema
-        # flexible while preserving nested structure without flattening.
-        pull_request_struct = MapType(StringType(), StringType(), True)
-        reactions_struct = MapType(StringType(), StringType(), True)
-
-        # Common nested structs used across multiple tables
-        permissions_struct = StructType(
-            [
-                StructField("admin", BooleanType(), True),
-                StructField("push", BooleanType(), True),
-                StructField("pull", BooleanType(), True),
-            ]
-        )
-
-        license_struct = StructType(
-            [
-                StructField("key", StringType(), True),
-                StructField("name", StringType(), True),
-                StructField("spdx_id", StringType(), True),
-                StructField("url", StringType(), True),
-                StructField("node_id", StringType(), True),
-            ]
-        )
-
-        template_repository_struct = StructType(
-            [
-                StructField("id", LongType(), True),
-                StructField("node_id", StringType(), True),
-                StructField("name", StringType(), True),
-                StructField("full_name", StringType(), True),
-            ]
-        )
-
-        # Primary `issues` table schema
-        issues_schema = StructType(
-            [
-                StructField("id", LongType(), False),
-                StructField("node_id", StringType(), True),
-                StructField("number", LongType(), False),
-                StructField("repository_owner", StringType(), False),
-                StructField("repository_name", StringType(), False),
-                StructField("title", StringType(), True),
-                StructField("body", StringType(), True),
-                StructField("state", StringType(), True),
-                StructField("locked", BooleanType(), True),
-                StructField("comments", LongType(), True),
-                StructField("created_at", StringType(), True),
-                StructField("updated_at", StringType(), True),
-                StructField("closed_at", StringType(), True),
-                StructField("author_association", StringType(), True),
-                StructField("url", StringType(), True),
-                StructField("html_url", StringType(), True),
-                StructField("labels_url", StringType(), True),
-                StructField("comments_url", StringType(), True),
-                StructField("events_url", StringType(), True),
-                StructField("timeline_url", StringType(), True),
-                StructField("state_reason", StringType(), True),
-                StructField("user", user_struct, True),
-                StructField("assignee", user_struct, True),
-                StructField("assignees", ArrayType(user_struct, True), True),
-                StructField("labels", ArrayType(label_struct, True), True),
-                StructField("milestone", milestone_struct, True),
-                StructField("pull_request", pull_request_struct, True),
-                StructField("reactions", reactions_struct, True),
-            ]
-        )
-
-        if table_name == "issues":
-            return issues_schema
-
-        # `repositories` snapshot metadata schema
-        if table_name == "repositories":
-            repositories_schema = StructType(
-                [
-                    StructField("id", LongType(), False),
-                    StructField("node_id", StringType(), True),
-                    StructField("repository_owner", StringType(), False),
-                    StructField("repository_name", StringType(), False),
-                    StructField("name", StringType(), True),
-                    StructField("full_name", StringType(), True),
-                    StructField("owner", user_struct, True),
-                    StructField("private", BooleanType(), True),
-                    StructField("html_url", StringType(), True),
-                    StructField("description", StringType(), True),
-                    StructField("fork", BooleanType(), True),
-                    StructField("url", StringType(), True),
-                    StructField("archive_url", StringType(), True),
-                    StructField("assignees_url", StringType(), True),
-                    StructField("blobs_url", StringType(), True),
-                    StructField("branches_url", StringType(), True),
-                    StructField("collaborators_url", StringType(), True),
-                    StructField("comments_url", StringType(), True),
-                    StructField("commits_url", StringType(), True),
-                    StructField("compare_url", StringType(), True),
-                    StructField("contents_url", StringType(), True),
-                    StructField("contributors_url", StringType(), True),
-                    StructField("deployments_url", StringType(), True),
-                    StructField("downloads_url", StringType(), True),
-                    StructField("events_url", StringType(), True),
-                    StructField("forks_url", StringType(), True),
-                    StructField("git_commits_url", StringType(), True),
-                    StructField("git_refs_url", StringType(), True),
-                    StructField("git_tags_url", StringType(), True),
-                    StructField("git_url", StringType(), True),
-                    StructField("issue_comment_url", StringType(), True),
-                    StructField("issue_events_url", StringType(), True),
-                    StructField("issues_url", StringType(), True),
-                    StructField("keys_url", StringType(), True),
-                    StructField("labels_url", StringType(), True),
-                    StructField("languages_url", StringType(), True),
-                    StructField("merges_url", StringType(), True),
-                    StructField("milestones_url", StringType(), True),
-                    StructField("notifications_url", StringType(), True),
-                    StructField("pulls_url", StringType(), True),
-                    StructField("releases_url", StringType(), True),
-                    StructField("ssh_url", StringType(), True),
-                    StructField("stargazers_url", StringType(), True),
-                    StructField("statuses_url", StringType(), True),
-                    StructField("subscribers_url", StringType(), True),
-                    StructField("subscription_url", StringType(), True),
-                    StructField("tags_url", StringType(), True),
-                    StructField("teams_url", StringType(), True),
-                    StructField("trees_url", StringType(), True),
-                    StructField("clone_url", StringType(), True),
-                    StructField("mirror_url", StringType(), True),
-                    StructField("hooks_url", StringType(), True),
-                    StructField("svn_url", StringType(), True),
-                    StructField("homepage", StringType(), True),
-                    StructField("language", StringType(), True),
-                    StructField("forks_count", LongType(), True),
-                    StructField("stargazers_count", LongType(), True),
-                    StructField("watchers_count", LongType(), True),
-                    StructField("size", LongType(), True),
-                    StructField("default_branch", StringType(), True),
-                    StructField("open_issues_count", LongType(), True),
-                    StructField("is_template", BooleanType(), True),
-                    StructField("topics", ArrayType(StringType(), True), True),
-                    StructField("has_issues", BooleanType(), True),
-                    StructField("has_projects", BooleanType(), True),
-                    StructField("has_wiki", BooleanType(), True),
-                    StructField("has_pages", BooleanType(), True),
-                    StructField("has_downloads", BooleanType(), True),
-                    StructField("archived", BooleanType(), True),
-                    StructField("disabled", BooleanType(), True),
-                    StructField("visibility", StringType(), True),
-                    StructField("pushed_at", StringType(), True),
-                    StructField("created_at", StringType(), True),
-                    StructField("updated_at", StringType(), True),
-                    StructField("permissions", permissions_struct, True),
-                    StructField("allow_rebase_merge", BooleanType(), True),
-                    StructField(
-                        "template_repository", template_repository_struct, True
-                    ),
-                    StructField("temp_clone_token", StringType(), True),
-                    StructField("allow_squash_merge", BooleanType(), True),
-                    StructField("allow_merge_commit", BooleanType(), True),
-                    StructField("subscribers_count", LongType(), True),
-                    StructField("network_count", LongType(), True),
-                    StructField("license", license_struct, True),
-                ]
-            )
-            return repositories_schema
-
-        # `pull_requests` cdc table schema
-        if table_name == "pull_requests":
-            pull_requests_schema = StructType(
-                [
-                    StructField("id", LongType(), False),
-                    StructField("node_id", StringType(), True),
-                    StructField("number", LongType(), False),
-                    StructField("repository_owner", StringType(), False),
-                    StructField("repository_name", StringType(), False),
-                    StructField("state", StringType(), True),
-                    StructField("title", StringType(), True),
-                    StructField("body", StringType(), True),
-                    StructField("draft", BooleanType(), True),
-                    StructField("created_at", StringType(), True),
-                    StructField("updated_at", StringType(), True),
-                    StructField("closed_at", StringType(), True),
-                    StructField("merged_at", StringType(), True),
-                    StructField("merge_commit_sha", StringType(), True),
-                    StructField("user", user_struct, True),
-                    StructField(
-                        "base", MapType(StringType(), StringType(), True), True
-                    ),
-                    StructField(
-                        "head", MapType(StringType(), StringType(), True), True
-                    ),
-                    StructField("html_url", StringType(), True),
-                    StructField("url", StringType(), True),
-                ]
-            )
-            return pull_requests_schema
-
-        # `comments` cdc table schema (issue comments)
-        if table_name == "comments":
-            comments_schema = StructType(
-                [
-                    StructField("id", LongType(), False),
-                    StructField("node_id", StringType(), True),
-                    StructField("repository_owner", StringType(), False),
-                    StructField("repository_name", StringType(), False),
-                    StructField("issue_url", StringType(), True),
-                    StructField("html_url", StringType(), True),
-                    StructField("body", StringType(), True),
-                    StructField("user", user_struct, True),
-                    StructField("created_at", StringType(), True),
-                    StructField("updated_at", StringType(), True),
-                    StructField("author_association", StringType(), True),
-                ]
-            )
-            return comments_schema
-
-        # `commits` append-only table schema
-        if table_name == "commits":
-            commits_schema = StructType(
-                [
-                    StructField("sha", StringType(), False),
-                    StructField("node_id", StringType(), True),
-                    StructField("repository_owner", StringType(), False),
-                    StructField("repository_name", StringType(), False),
-                    StructField("commit_message", StringType(), True),
-                    StructField("commit_author_name", StringType(), True),
-                    StructField("commit_author_email", StringType(), True),
-                    StructField("commit_author_date", StringType(), True),
-                    StructField("commit_committer_name", StringType(), True),
-                    StructField("commit_committer_email", StringType(), True),
-                    StructField("commit_committer_date", StringType(), True),
-                    StructField("html_url", StringType(), True),
-                    StructField("url", StringType(), True),
-                    StructField("author", user_struct, True),
-                    StructField("committer", user_struct, True),
-                ]
-            )
-            return commits_schema
-
-        # `users` snapshot metadata schema
-        if table_name == "users":
-            users_schema = StructType(
-                [
-                    StructField("id", LongType(), False),
-                    StructField("login", StringType(), False),
-                    StructField("node_id", StringType(), True),
-                    StructField("type", StringType(), True),
-                    StructField("site_admin", BooleanType(), True),
-                    StructField("name", StringType(), True),
-                    StructField("company", StringType(), True),
-                    StructField("blog", StringType(), True),
-                    StructField("location", StringType(), True),
-                    StructField("email", StringType(), True),
-                    StructField("created_at", StringType(), True),
-                    StructField("updated_at", StringType(), True),
-                ]
-            )
-            return users_schema
-
-        # `organizations` snapshot metadata schema
-        if table_name == "organizations":
-            # The organizations table now reflects the shape of the
-            # `GET /user/orgs` response without expanding each org via
-            # `GET /orgs/{org}`. This avoids additional permissions that
-            # may be required for the detail endpoint while still exposing
-            # the most useful summary metadata.
-            orgs_schema = StructType(
-                [
-                    StructField("id", LongType(), False),
-                    StructField("login", StringType(), False),
-                    StructField("node_id", StringType(), True),
-                    StructField("url", StringType(), True),
-                    StructField("repos_url", StringType(), True),
-                    StructField("events_url", StringType(), True),
-                    StructField("hooks_url", StringType(), True),
-                    StructField("issues_url", StringType(), True),
-                    StructField("members_url", StringType(), True),
-                    StructField("public_members_url", StringType(), True),
-                    StructField("avatar_url", StringType(), True),
-                    StructField("description", StringType(), True),
-                ]
-            )
-            return orgs_schema
-
-        # `teams` snapshot metadata schema
-        if table_name == "teams":
-            teams_schema = StructType(
-                [
-                    StructField("id", LongType(), False),
-                    StructField("node_id", StringType(), True),
-                    StructField("organization_login", StringType(), False),
-                    StructField("name", StringType(), True),
-                    StructField("slug", StringType(), True),
-                    StructField("description", StringType(), True),
-                    StructField("privacy", StringType(), True),
-                    StructField("permission", StringType(), True),
-                ]
-            )
-            return teams_schema
-
-        # `assignees` snapshot metadata schema
-        if table_name == "assignees":
-            assignees_schema = StructType(
-                [
-                    StructField("repository_owner", StringType(), False),
-                    StructField("repository_name", StringType(), False),
-                    StructField("login", StringType(), False),
-                    StructField("id", LongType(), False),
-                    StructField("node_id", StringType(), True),
-                    StructField("type", StringType(), True),
-                    StructField("site_admin", BooleanType(), True),
-                ]
-            )
-            return assignees_schema
-
-        # `collaborators` snapshot metadata schema
-        if table_name == "collaborators":
-            collaborators_schema = StructType(
-                [
-                    StructField("repository_owner", StringType(), False),
-                    StructField("repository_name", StringType(), False),
-                    StructField("login", StringType(), False),
-                    StructField("id", LongType(), False),
-                    StructField("node_id", StringType(), True),
-                    StructField("type", StringType(), True),
-                    StructField("site_admin", BooleanType(), True),
-                    StructField("permissions", permissions_struct, True),
-                ]
-            )
-            return collaborators_schema
-
-        # `branches` snapshot metadata schema
-        if table_name == "branches":
-            commit_ref_struct = StructType(
-                [
-                    StructField("sha", StringType(), True),
-                    StructField("url", StringType(), True),
-                ]
-            )
-            branches_schema = StructType(
-                [
-                    StructField("repository_owner", StringType(), False),
-                    StructField("repository_name", StringType(), False),
-                    StructField("name", StringType(), False),
-                    StructField("commit", commit_ref_struct, True),
-                    StructField("protected", BooleanType(), True),
-                    StructField("protection_url", StringType(), True),
-                ]
-            )
-            return branches_schema
-
-        # `reviews` append-only table schema
-        if table_name == "reviews":
-            reviews_schema = StructType(
-                [
-                    StructField("id", LongType(), False),
-                    StructField("node_id", StringType(), True),
-                    StructField("repository_owner", StringType(), False),
-                    StructField("repository_name", StringType(), False),
-                    StructField("pull_number", LongType(), False),
-                    StructField("state", StringType(), True),
-                    StructField("body", StringType(), True),
-                    StructField("user", user_struct, True),
-                    StructField("commit_id", StringType(), True),
-                    StructField("submitted_at", StringType(), True),
-                    StructField("html_url", StringType(), True),
-                ]
-            )
-            return reviews_schema
-
-        raise ValueError(f"Unsupported table: {table_name!r}")
+        and connector design for the `issues` object. All schemas are built
+        on the first call and reused afterwards.
+        """
+        table_schemas = _table_schemas()
+        if table_name not in table_schemas:
+            raise ValueError(f"Unsupported table: {table_name!r}")
+        return table_schemas[table_name]
 
     def read_table_metadata(
         self, table_name: str, table_options: dict[str, str]
@@ -507,7 +757,13 @@ class LakeflowConnect:
                 "ingestion_type": "cdc",
             }
         if table_name == "commits":
-            # Append-only stream keyed by immutable sha
+            # Append-only stream keyed by immutable sha. Forks share shas, so
+            # a multi-repository read also keys on the repository.
+            if self._is_multi_repo(table_options):
+                return {
+                    "primary_keys": ["repository_owner", "repository_name", "sha"],
+                    "ingestion_type": "append",
+                }
             return {
                 "primary_keys": ["sha"],
                 "ingestion_type": "append",
@@ -550,6 +806,39 @@ class LakeflowConnect:
 
         raise ValueError(f"Unsupported table: {table_name!r}")
 
+    def supported_filters(
+        self, table_name: str, table_options: dict[str, str]
+    ) -> dict[str, tuple[str, ...]]:
+        """
+        Filters of batch queries that narrow the GitHub requests.
+
+        `updated_at` lower bounds become the `since` parameter of `issues`
+        and `comments` (`/pulls` ignores `since`). An equality on `state` becomes the `state`
+        parameter of `issues` and `pull_requests` unless the table already
+        sets one.
+        """
+        supported = {}
+        if table_name in ("issues", "comments"):
+            supported["updated_at"] = (">", ">=")
+        if table_name in ("issues", "pull_requests") and table_options.get(
+            "state", "all"
+        ) == "all":
+            supported["state"] = ("=",)
+        return supported
+
+    def _apply_pushed_filters(self, table_options: dict[str, str]) -> dict[str, str]:
+        """Fold pushed-down filters into the `start_date` and `state` options."""
+        table_options = dict(table_options)
+        for column, op, value in pushed_filters(table_options):
+            if column == "updated_at" and op in (">", ">="):
+                since = iso8601_to_epoch(value)
+                start_date = iso8601_to_epoch(table_options.get("start_date"))
+                if since is not None and (start_date is None or since > start_date):
+                    table_options["start_date"] = epoch_to_iso8601(since)
+            elif column == "state" and op == "=" and value in ("open", "closed"):
+                table_options["state"] = value
+        return table_options
+
     def read_table(
         self, table_name: str, start_offset: dict, table_options: dict[str, str]
     ) -> (Iterator[dict], dict):
@@ -568,6 +857,12 @@ class LakeflowConnect:
             - owner: Repository owner (user or organization).
             - repo: Repository name.
 
+        Instead of `owner`/`repo`, every repository-scoped table accepts:
+            - repos: Comma-separated `owner/name` list (bare names use `owner`).
+            - org: Organization whose repositories are all read.
+          The repositories are read concurrently (`max_workers`, default 4)
+          and the offset keeps one cursor per repository.
+
         Optional table_options:
             - state: Issue state filter (default: "all").
             - per_page: Page size (max 100, default 100).
@@ -575,6 +870,13 @@ class LakeflowConnect:
             - lookback_seconds: Lookback window applied when computing next cursor (default: 300).
             - max_pages_per_batch: Optional safety limit on pages per read_table call.
         """
+        self._low_priority = (
+            self.read_table_metadata(table_name, table_options)["ingestion_type"]
+            == "snapshot"
+        )
+        table_options = self._apply_pushed_filters(table_options)
+        if table_name in REPO_SCOPED_TABLES and self._is_multi_repo(table_options):
+            return self._read_multi_repo(table_name, start_offset, table_options)
         if table_name == "issues":
             return self._read_issues(start_offset, table_options)
         if table_name == "repositories":
@@ -602,6 +904,359 @@ class LakeflowConnect:
 
         raise ValueError(f"Unsupported table: {table_name!r}")
 
+    def read_co_read(
+        self, table_names: list[str], start_offset: dict, table_options: dict[str, str]
+    ) -> (Iterator[tuple], dict):
+        """
+        Read `issues` and `pull_requests` from one sweep of the issues list.
+
+        GET /repos/{owner}/{repo}/issues also returns pull requests, marked by
+        a `pull_request` key. Every record of one `issues` sweep is returned
+        as an `issues` row, unchanged, and the pull requests in it (the ones
+        updated since the cursor) are fetched in full from
+        GET /repos/{owner}/{repo}/pulls/{number} for the `pull_requests`
+        rows, instead of paging through /pulls as well. Records are returned
+        as `(table_name, record)` pairs; the offset is the issues offset.
+        Only a single `owner`/`repo` is supported.
+        """
+        if list(table_names) != ["issues", "pull_requests"]:
+            raise ValueError(
+                f"GitHub co-reads 'issues' followed by 'pull_requests', got {table_names}"
+            )
+        table_options = self._apply_pushed_filters(table_options or {})
+        if self._is_multi_repo(table_options):
+            raise ValueError(
+                "GitHub co-reads need a single 'owner' and 'repo', not 'repos' or 'org'"
+            )
+
+        self._low_priority = False
+        issues, offset = self._read_issues(start_offset, table_options)
+        issues = list(issues)
+        numbers = [
+            issue["number"]
+            for issue in issues
+            if issue.get("pull_request") and issue.get("number") is not None
+        ]
+        pull_requests = self._fetch_pull_requests(
+            table_options["owner"], table_options["repo"], numbers, table_options
+        )
+
+        records = [("issues", issue) for issue in issues]
+        records.extend(("pull_requests", pr) for pr in pull_requests)
+        return records, offset
+
+    def latest_offset(
+        self, table_name: str, start_offset: dict, table_options: dict[str, str]
+    ) -> dict:
+        """
+        Plan the end offset of a partitioned stream micro-batch.
+
+        Supported for `issues` and `comments`. Every repository of the read
+        (`owner`/`repo`, `repos` or `org`) moves its cursor to the current
+        time minus `lookback_seconds`, so records updated more recently,
+        whose updates may not be listed yet, are left to a later micro-batch.
+        The offset has the form `{"repos": {"owner/name": {"cursor": ...}}}`.
+        If no cursor moves, the start offset is returned.
+        """
+        self._check_partitioned_stream_table(table_name)
+        try:
+            lookback_seconds = int(table_options.get("lookback_seconds", 300))
+        except (TypeError, ValueError):
+            lookback_seconds = 300
+        until = time.time() - lookback_seconds
+
+        start_repos = {}
+        if start_offset and isinstance(start_offset, dict):
+            start_repos = start_offset.get("repos") or {}
+
+        end_repos = {}
+        for full_name in self._stream_repos(table_name, table_options):
+            start = start_repos.get(full_name) or {}
+            cursor_epoch = iso8601_to_epoch(start.get("cursor"))
+            if cursor_epoch is not None and cursor_epoch >= until:
+                end_repos[full_name] = start
+            else:
+                end_repos[full_name] = {"cursor": epoch_to_iso8601(until)}
+
+        if start_offset and end_repos == start_repos:
+            return start_offset
+        return {"repos": end_repos}
+
+    def partition_offsets(
+        self,
+        table_name: str,
+        start_offset: dict,
+        end_offset: dict,
+        table_options: dict[str, str],
+    ) -> list[tuple[dict, dict]]:
+        """
+        Split a partitioned stream micro-batch into one partition per repository.
+
+        Each partition is a `({"repo": ..., "cursor": ...}, {"repo": ...,
+        "cursor": ...})` pair; a start without a cursor reads from
+        `start_date`. Repositories whose cursor did not move are skipped.
+        """
+        self._check_partitioned_stream_table(table_name)
+        start_repos = {}
+        if start_offset and isinstance(start_offset, dict):
+            start_repos = start_offset.get("repos") or {}
+
+        partitions = []
+        for full_name, end in ((end_offset or {}).get("repos") or {}).items():
+            start = start_repos.get(full_name) or {}
+            if start.get("cursor") == end.get("cursor"):
+                continue
+            partitions.append(
+                (
+                    {"repo": full_name, "cursor": start.get("cursor")},
+                    {"repo": full_name, "cursor": end.get("cursor")},
+                )
+            )
+        return partitions
+
+    def read_offset_range(
+        self,
+        table_name: str,
+        start_offset: dict,
+        end_offset: dict,
+        table_options: dict[str, str],
+    ) -> Iterator[dict]:
+        """
+        Read the records of one repository updated between two cursors.
+
+        Records updated at or after the start cursor (or `start_date`) and
+        before the end cursor are yielded as their pages arrive. Pages are
+        requested in ascending `updated_at` order, so the read stops at the
+        first record past the end cursor. Consecutive micro-batches share a
+        cursor as end and start, so every record is read once.
+        """
+        self._check_partitioned_stream_table(table_name)
+        owner, repo = start_offset["repo"].split("/", 1)
+        since = start_offset.get("cursor") or table_options.get("start_date")
+        until = iso8601_to_epoch(end_offset.get("cursor"))
+
+        try:
+            per_page = int(table_options.get("per_page", 100))
+        except (TypeError, ValueError):
+            per_page = 100
+        per_page = max(1, min(per_page, 100))
+
+        next_url: str | None = (
+            f"{self.base_url}/repos/{owner}/{repo}/"
+            f"{PARTITIONED_STREAM_TABLES[table_name]}"
+        )
+        next_params = {"per_page": per_page, "sort": "updated", "direction": "asc"}
+        if table_name == "issues":
+            next_params["state"] = table_options.get("state", "all")
+        if since:
+            next_params["since"] = since
+
+        while next_url:
+            response = self._get(next_url, params=next_params)
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"GitHub API error for {table_name}: "
+                    f"{response.status_code} {response.text}"
+                )
+
+            items = response_json(response) or []
+            if not isinstance(items, list):
+                raise ValueError(
+                    f"Unexpected response format for {table_name}: {type(items).__name__}"
+                )
+
+            for item in items:
+                updated_at = iso8601_to_epoch(item.get("updated_at"))
+                if until is not None and updated_at is not None and updated_at >= until:
+                    return
+                record: dict[str, Any] = dict(item)
+                record["repository_owner"] = owner
+                record["repository_name"] = repo
+                yield record
+
+            next_url = self._extract_next_link(response.headers.get("Link", ""))
+            next_params = None
+
+    @staticmethod
+    def _check_partitioned_stream_table(table_name: str) -> None:
+        if table_name not in PARTITIONED_STREAM_TABLES:
+            raise ValueError(
+                f"Table {table_name!r} does not support partitioned streaming; "
+                f"supported tables: {sorted(PARTITIONED_STREAM_TABLES)}"
+            )
+
+    def _stream_repos(
+        self, table_name: str, table_options: dict[str, str]
+    ) -> list[str]:
+        """List the `owner/name` repositories of a partitioned stream."""
+        if self._is_multi_repo(table_options):
+            return self._resolve_repos(table_name, table_options)
+        owner = table_options.get("owner")
+        repo = table_options.get("repo")
+        if not owner or not repo:
+            raise ValueError(
+                f"table_configuration for {table_name!r} must include non-empty "
+                "'owner' and 'repo', or 'repos' or 'org'"
+            )
+        return [f"{owner}/{repo}"]
+
+    def _get(self, url: str, params: dict | None = None) -> requests.Response:
+        """
+        Issue a GET request within the rate limit budget of the token pool.
+
+        Each request uses the token with the most quota left and is paced by
+        that token's budget. A response rejected by a primary or secondary
+        rate limit (403/429) blocks its token until the limit resets (or for
+        the Retry-After interval) and is retried, up to `max_retries` times,
+        with another token, or with the same one once it is unblocked. The
+        final response is handed back to the caller.
+        """
+        for attempt in range(self.max_retries + 1):
+            index = self.token_pool.acquire()
+            budget = self.token_pool.budgets[index]
+            try:
+                wait = budget.delay(self._low_priority)
+                if wait > 0:
+                    time.sleep(wait)
+                response = self._session.get(
+                    url,
+                    params=params,
+                    headers={"Authorization": f"Bearer {self.token_pool.tokens[index]}"},
+                    timeout=30,
+                )
+            finally:
+                self.token_pool.release(index)
+            budget.update(response)
+            retry_after = budget.retry_delay(response)
+            if retry_after is None or attempt == self.max_retries:
+                return response
+            self.metrics.record_retry()
+            budget.block(retry_after)
+        return response
+
+    @staticmethod
+    def _is_multi_repo(table_options: dict[str, str]) -> bool:
+        """Whether a repository-scoped table is read from several repositories."""
+        return bool(
+            table_options.get("repos")
+            or (table_options.get("org") and not table_options.get("repo"))
+        )
+
+    def _read_multi_repo(
+        self, table_name: str, start_offset: dict, table_options: dict[str, str]
+    ) -> (Iterator[dict], dict):
+        """
+        Read a repository-scoped table from every repository in `repos` or `org`.
+
+        Each repository is read by the single-repository reader with its own
+        cursor, `max_workers` repositories at a time over the shared session.
+        The offset has the form `{"repos": {"owner/name": <offset>}}`;
+        repositories that have not returned a cursor yet are left out.
+        """
+        repos = self._resolve_repos(table_name, table_options)
+
+        try:
+            max_workers = int(table_options.get("max_workers", 4))
+        except (TypeError, ValueError):
+            max_workers = 4
+        max_workers = max(1, min(max_workers, len(repos)))
+
+        repo_offsets = {}
+        if start_offset and isinstance(start_offset, dict):
+            repo_offsets = start_offset.get("repos") or {}
+
+        read_repo_table = getattr(self, f"_read_{table_name}")
+
+        def read_repo(full_name: str):
+            owner, repo = full_name.split("/", 1)
+            records, offset = read_repo_table(
+                repo_offsets.get(full_name) or {},
+                {**table_options, "owner": owner, "repo": repo},
+            )
+            return records, offset
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(read_repo, repos))
+
+        next_offsets = {
+            full_name: offset
+            for full_name, (_, offset) in zip(repos, results)
+            if offset
+        }
+        if next_offsets:
+            next_offset = {"repos": next_offsets}
+        else:
+            next_offset = start_offset or {}
+
+        return chain.from_iterable(records for records, _ in results), next_offset
+
+    def _resolve_repos(
+        self, table_name: str, table_options: dict[str, str]
+    ) -> list[str]:
+        """
+        List the `owner/name` repositories a multi-repository read covers.
+
+        `repos` entries without an owner use the `owner` option. With `org`,
+        the organization's repositories are listed via GET /orgs/{org}/repos.
+        """
+        repos_option = table_options.get("repos")
+        if repos_option:
+            default_owner = table_options.get("owner")
+            repos = []
+            for entry in str(repos_option).split(","):
+                entry = entry.strip().strip("/")
+                if not entry:
+                    continue
+                if "/" not in entry:
+                    if not default_owner:
+                        raise ValueError(
+                            f"table_configuration for {table_name!r}: repository "
+                            f"{entry!r} in 'repos' needs an owner ('owner/name') "
+                            "or an 'owner' option"
+                        )
+                    entry = f"{default_owner}/{entry}"
+                if entry not in repos:
+                    repos.append(entry)
+        else:
+            repos = self._list_org_repos(table_options["org"])
+
+        if not repos:
+            raise ValueError(
+                f"table_configuration for {table_name!r} did not resolve to any repository"
+            )
+        return repos
+
+    def _list_org_repos(self, org: str) -> list[str]:
+        """Return `owner/name` for every repository of an organization."""
+        repos: list[str] = []
+        next_url: str | None = f"{self.base_url}/orgs/{org}/repos"
+        next_params = {"per_page": 100, "type": "all"}
+
+        while next_url:
+            response = self._get(next_url, params=next_params)
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"GitHub API error for repositories of org {org!r}: "
+                    f"{response.status_code} {response.text}"
+                )
+
+            repo_objs = response_json(response) or []
+            if not isinstance(repo_objs, list):
+                raise ValueError(
+                    f"Unexpected response format for repositories: {type(repo_objs).__name__}"
+                )
+
+            for repo_obj in repo_objs:
+                owner_obj = repo_obj.get("owner") or {}
+                owner = owner_obj.get("login") or org
+                if repo_obj.get("name"):
+                    repos.append(f"{owner}/{repo_obj['name']}")
+
+            next_url = self._extract_next_link(response.headers.get("Link", ""))
+            next_params = None
+
+        return repos
+
     def _read_issues(
         self, start_offset: dict, table_options: dict[str, str]
     ) -> (Iterator[dict], dict):
@@ -658,13 +1313,13 @@ class LakeflowConnect:
         next_params = params
 
         while next_url and pages_fetched < max_pages_per_batch:
-            response = self._session.get(next_url, params=next_params, timeout=30)
+            response = self._get(next_url, params=next_params)
             if response.status_code != 200:
                 raise RuntimeError(
                     f"GitHub API error for issues: {response.status_code} {response.text}"
                 )
 
-            issues = response.json() or []
+            issues = response_json(response) or []
             if not isinstance(issues, list):
                 raise ValueError(
                     f"Unexpected response format for issues: {type(issues).__name__}"
@@ -693,24 +1348,46 @@ class LakeflowConnect:
             next_params = None
             pages_fetched += 1
 
-        # Compute the next cursor with a small lookback window to avoid missing records
-        next_cursor = cursor
-        if max_updated_at:
-            try:
-                dt = datetime.strptime(max_updated_at, "%Y-%m-%dT%H:%M:%SZ")
-                dt_with_lookback = dt - timedelta(seconds=lookback_seconds)
-                next_cursor = dt_with_lookback.strftime("%Y-%m-%dT%H:%M:%SZ")
-            except Exception:
-                # Fallback: if parsing fails, just reuse the raw max_updated_at
-                next_cursor = max_updated_at
+        # Compute the next cursor with a small lookback window to avoid missing
+        # records, dropping the records the previous batch already emitted.
+        return self._drop_lookback_repeats(
+            records, start_offset, cursor, max_updated_at, lookback_seconds
+        )
 
-        # If no new records, return the same offset to indicate end of stream for this batch
-        if not records and start_offset:
-            next_offset = start_offset
-        else:
-            next_offset = {"cursor": next_cursor} if next_cursor else {}
+    def _fetch_pull_requests(
+        self, owner: str, repo: str, numbers: list[int], table_options: dict[str, str]
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch pull requests by number, `max_workers` (default 4) at a time.
 
-        return iter(records), next_offset
+        Pull requests deleted since the sweep (404) are skipped.
+        """
+        try:
+            max_workers = int(table_options.get("max_workers", 4))
+        except (TypeError, ValueError):
+            max_workers = 4
+        max_workers = max(1, max_workers)
+
+        def fetch(number: int) -> dict[str, Any] | None:
+            response = self._get(f"{self.base_url}/repos/{owner}/{repo}/pulls/{number}")
+            if response.status_code == 404:
+                return None
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"GitHub API error for pull_requests: {response.status_code} {response.text}"
+                )
+            record: dict[str, Any] = dict(response_json(response))
+            record["repository_owner"] = owner
+            record["repository_name"] = repo
+            return record
+
+        # Drop repeated numbers (a pull request updated during the sweep can
+        # appear on two pages) while keeping the sweep order.
+        numbers = list(dict.fromkeys(numbers))
+        if not numbers:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(numbers))) as executor:
+            return [record for record in executor.map(fetch, numbers) if record]
 
     def _read_repositories(
         self, start_offset: dict, table_options: dict[str, str]
@@ -776,13 +1453,13 @@ class LakeflowConnect:
         next_params = params
 
         while next_url and pages_fetched < max_pages_per_batch:
-            response = self._session.get(next_url, params=next_params, timeout=30)
+            response = self._get(next_url, params=next_params)
             if response.status_code != 200:
                 raise RuntimeError(
                     f"GitHub API error for repositories: {response.status_code} {response.text}"
                 )
 
-            repos = response.json() or []
+            repos = response_json(response) or []
             if not isinstance(repos, list):
                 raise ValueError(
                     f"Unexpected response format for repositories: {type(repos).__name__}"
@@ -866,13 +1543,13 @@ class LakeflowConnect:
         next_params = params
 
         while next_url and pages_fetched < max_pages_per_batch:
-            response = self._session.get(next_url, params=next_params, timeout=30)
+            response = self._get(next_url, params=next_params)
             if response.status_code != 200:
                 raise RuntimeError(
                     f"GitHub API error for pull_requests: {response.status_code} {response.text}"
                 )
 
-            pull_requests = response.json() or []
+            pull_requests = response_json(response) or []
             if not isinstance(pull_requests, list):
                 raise ValueError(
                     f"Unexpected response format for pull_requests: {type(pull_requests).__name__}"
@@ -898,21 +1575,9 @@ class LakeflowConnect:
             next_params = None
             pages_fetched += 1
 
-        next_cursor = cursor
-        if max_updated_at:
-            try:
-                dt = datetime.strptime(max_updated_at, "%Y-%m-%dT%H:%M:%SZ")
-                dt_with_lookback = dt - timedelta(seconds=lookback_seconds)
-                next_cursor = dt_with_lookback.strftime("%Y-%m-%dT%H:%M:%SZ")
-            except Exception:
-                next_cursor = max_updated_at
-
-        if not records and start_offset:
-            next_offset = start_offset
-        else:
-            next_offset = {"cursor": next_cursor} if next_cursor else {}
-
-        return iter(records), next_offset
+        return self._drop_lookback_repeats(
+            records, start_offset, cursor, max_updated_at, lookback_seconds
+        )
 
     def _read_comments(
         self, start_offset: dict, table_options: dict[str, str]
@@ -967,13 +1632,13 @@ class LakeflowConnect:
         next_params = params
 
         while next_url and pages_fetched < max_pages_per_batch:
-            response = self._session.get(next_url, params=next_params, timeout=30)
+            response = self._get(next_url, params=next_params)
             if response.status_code != 200:
                 raise RuntimeError(
                     f"GitHub API error for comments: {response.status_code} {response.text}"
                 )
 
-            comments = response.json() or []
+            comments = response_json(response) or []
             if not isinstance(comments, list):
                 raise ValueError(
                     f"Unexpected response format for comments: {type(comments).__name__}"
@@ -999,21 +1664,9 @@ class LakeflowConnect:
             next_params = None
             pages_fetched += 1
 
-        next_cursor = cursor
-        if max_updated_at:
-            try:
-                dt = datetime.strptime(max_updated_at, "%Y-%m-%dT%H:%M:%SZ")
-                dt_with_lookback = dt - timedelta(seconds=lookback_seconds)
-                next_cursor = dt_with_lookback.strftime("%Y-%m-%dT%H:%M:%SZ")
-            except Exception:
-                next_cursor = max_updated_at
-
-        if not records and start_offset:
-            next_offset = start_offset
-        else:
-            next_offset = {"cursor": next_cursor} if next_cursor else {}
-
-        return iter(records), next_offset
+        return self._drop_lookback_repeats(
+            records, start_offset, cursor, max_updated_at, lookback_seconds
+        )
 
     def _read_commits(
         self, start_offset: dict, table_options: dict[str, str]
@@ -1021,6 +1674,12 @@ class LakeflowConnect:
         """
         Read the `commits` append-only table using:
             GET /repos/{owner}/{repo}/commits
+
+        With the `backfill_window_days` option, the first read plans a
+        backfill of the history up to now instead: it is split into
+        `since`/`until` windows that are read `max_workers` at a time (see
+        `_read_commits_backfill`), after which reads continue incrementally
+        from the time the backfill was planned.
         """
         owner = table_options.get("owner")
         repo = table_options.get("repo")
@@ -1040,6 +1699,23 @@ class LakeflowConnect:
         except (TypeError, ValueError):
             max_pages_per_batch = 50
 
+        backfill = None
+        if start_offset and isinstance(start_offset, dict):
+            backfill = start_offset.get("backfill")
+        if backfill is None and not (start_offset or {}).get("cursor"):
+            try:
+                window_days = float(table_options.get("backfill_window_days", 0))
+            except (TypeError, ValueError):
+                window_days = 0
+            if window_days > 0:
+                backfill = self._plan_commits_backfill(
+                    owner, repo, table_options.get("start_date"), window_days
+                )
+        if backfill is not None:
+            return self._read_commits_backfill(
+                owner, repo, backfill, per_page, max_pages_per_batch, table_options
+            )
+
         cursor = None
         if start_offset and isinstance(start_offset, dict):
             cursor = start_offset.get("cursor")
@@ -1061,46 +1737,27 @@ class LakeflowConnect:
         next_params = params
 
         while next_url and pages_fetched < max_pages_per_batch:
-            response = self._session.get(next_url, params=next_params, timeout=30)
+            response = self._get(next_url, params=next_params)
             if response.status_code != 200:
                 raise RuntimeError(
                     f"GitHub API error for commits: {response.status_code} {response.text}"
                 )
 
-            commits = response.json() or []
+            commits = response_json(response) or []
             if not isinstance(commits, list):
                 raise ValueError(
                     f"Unexpected response format for commits: {type(commits).__name__}"
                 )
 
             for commit_obj in commits:
-                commit_info = commit_obj.get("commit", {}) or {}
-                commit_author = commit_info.get("author", {}) or {}
-                commit_committer = commit_info.get("committer", {}) or {}
-
-                record: dict[str, Any] = {
-                    "sha": commit_obj.get("sha"),
-                    "node_id": commit_obj.get("node_id"),
-                    "repository_owner": owner,
-                    "repository_name": repo,
-                    "commit_message": commit_info.get("message"),
-                    "commit_author_name": commit_author.get("name"),
-                    "commit_author_email": commit_author.get("email"),
-                    "commit_author_date": commit_author.get("date"),
-                    "commit_committer_name": commit_committer.get("name"),
-                    "commit_committer_email": commit_committer.get("email"),
-                    "commit_committer_date": commit_committer.get("date"),
-                    "html_url": commit_obj.get("html_url"),
-                    "url": commit_obj.get("url"),
-                    "author": commit_obj.get("author"),
-                    "committer": commit_obj.get("committer"),
-                }
+                record = self._commit_record(commit_obj, owner, repo)
                 records.append(record)
 
-                author_date = record.get("commit_author_date")
-                if isinstance(author_date, str):
-                    if max_commit_date is None or author_date > max_commit_date:
-                        max_commit_date = author_date
+                # `since` filters on the committer date, as do the backfill windows.
+                committed_at = record.get("commit_committer_date")
+                if isinstance(committed_at, str):
+                    if max_commit_date is None or committed_at > max_commit_date:
+                        max_commit_date = committed_at
 
             link_header = response.headers.get("Link", "")
             next_link = self._extract_next_link(link_header)
@@ -1113,7 +1770,7 @@ class LakeflowConnect:
 
         next_cursor = cursor
         if max_commit_date:
-            # For commits we simply reuse the max commit author date as the next cursor.
+            # For commits we simply reuse the max committer date as the next cursor.
             next_cursor = max_commit_date
 
         if not records and start_offset:
@@ -1123,6 +1780,174 @@ class LakeflowConnect:
 
         return iter(records), next_offset
 
+    @staticmethod
+    def _commit_record(commit_obj: dict, owner: str, repo: str) -> dict[str, Any]:
+        """Flatten a commit from the commits API into a `commits` record."""
+        commit_info = commit_obj.get("commit", {}) or {}
+        commit_author = commit_info.get("author", {}) or {}
+        commit_committer = commit_info.get("committer", {}) or {}
+
+        return {
+            "sha": commit_obj.get("sha"),
+            "node_id": commit_obj.get("node_id"),
+            "repository_owner": owner,
+            "repository_name": repo,
+            "commit_message": commit_info.get("message"),
+            "commit_author_name": commit_author.get("name"),
+            "commit_author_email": commit_author.get("email"),
+            "commit_author_date": commit_author.get("date"),
+            "commit_committer_name": commit_committer.get("name"),
+            "commit_committer_email": commit_committer.get("email"),
+            "commit_committer_date": commit_committer.get("date"),
+            "html_url": commit_obj.get("html_url"),
+            "url": commit_obj.get("url"),
+            "author": commit_obj.get("author"),
+            "committer": commit_obj.get("committer"),
+        }
+
+    def _plan_commits_backfill(
+        self, owner: str, repo: str, start_date: str | None, window_days: float
+    ) -> dict:
+        """
+        Split the commit history from `start_date` (or the repository's
+        creation) up to now into `since`/`until` windows of `window_days`.
+
+        Windows are widened if needed so the plan, which is stored in the
+        offset, has at most `MAX_BACKFILL_WINDOWS` of them.
+        """
+        until = epoch_to_iso8601(time.time())
+        since_epoch = iso8601_to_epoch(start_date) if start_date else None
+        if since_epoch is None:
+            response = self._get(f"{self.base_url}/repos/{owner}/{repo}")
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"GitHub API error for repository {owner}/{repo}: "
+                    f"{response.status_code} {response.text}"
+                )
+            repo_obj = response_json(response) or {}
+            since_epoch = iso8601_to_epoch(repo_obj.get("created_at"))
+            if since_epoch is None:
+                raise ValueError(
+                    f"Cannot plan a commits backfill for {owner}/{repo}: the "
+                    "repository has no creation date; set 'start_date'"
+                )
+
+        # `since` and `until` are both inclusive, so windows end a second
+        # before the next one (or the incremental tail) starts. Commits can
+        # predate the repository (imported history), so the first window is
+        # open-ended unless a start_date was given.
+        until_epoch = iso8601_to_epoch(until)
+        step = max(
+            1,
+            int(window_days * 86400),
+            -(-int(until_epoch - since_epoch) // self.MAX_BACKFILL_WINDOWS),
+        )
+        windows = []
+        window_start = int(since_epoch)
+        while window_start < until_epoch:
+            window_end = min(window_start + step, until_epoch)
+            windows.append(
+                {
+                    "since": epoch_to_iso8601(window_start) if windows or start_date else None,
+                    "until": epoch_to_iso8601(window_end - 1),
+                }
+            )
+            window_start = window_end
+        return {"windows": windows, "until": until}
+
+    def _read_commits_backfill(
+        self,
+        owner: str,
+        repo: str,
+        backfill: dict,
+        per_page: int,
+        max_pages_per_batch: int,
+        table_options: dict[str, str],
+    ) -> (Iterator[dict], dict):
+        """
+        Read the next `max_workers` windows of a commits backfill concurrently.
+
+        Each window is read newest first for up to `max_pages_per_batch`
+        pages. A window that is not finished is narrowed to the commits not
+        read yet: its `until` moves to the oldest committer date seen, and the
+        shas already read at that second are skipped next time. The offset
+        keeps the remaining windows as `{"backfill": {...}}` and becomes
+        `{"cursor": <planning time>}` once every window is read.
+        """
+        try:
+            max_workers = int(table_options.get("max_workers", 4))
+        except (TypeError, ValueError):
+            max_workers = 4
+        max_workers = max(1, max_workers)
+
+        windows = backfill.get("windows") or []
+        active, pending = windows[:max_workers], windows[max_workers:]
+        url = f"{self.base_url}/repos/{owner}/{repo}/commits"
+
+        def read_window(window: dict):
+            params = {"per_page": per_page, "until": window["until"]}
+            if window.get("since"):
+                params["since"] = window["since"]
+            skip = set(window.get("skip") or ())
+
+            records: list[dict[str, Any]] = []
+            oldest: str | None = None
+            pages_fetched = 0
+            next_url: str | None = url
+            next_params = params
+
+            while next_url and pages_fetched < max_pages_per_batch:
+                response = self._get(next_url, params=next_params)
+                if response.status_code != 200:
+                    raise RuntimeError(
+                        f"GitHub API error for commits: {response.status_code} {response.text}"
+                    )
+
+                commits = response_json(response) or []
+                if not isinstance(commits, list):
+                    raise ValueError(
+                        f"Unexpected response format for commits: {type(commits).__name__}"
+                    )
+
+                for commit_obj in commits:
+                    record = self._commit_record(commit_obj, owner, repo)
+                    if record["sha"] in skip:
+                        continue
+                    records.append(record)
+                    committed_at = record.get("commit_committer_date")
+                    if isinstance(committed_at, str) and (
+                        oldest is None or committed_at < oldest
+                    ):
+                        oldest = committed_at
+
+                next_link = self._extract_next_link(response.headers.get("Link", ""))
+                if not next_link:
+                    return records, None
+
+                next_url = next_link
+                next_params = None
+                pages_fetched += 1
+
+            if oldest is None:
+                return records, window
+            # Resume at the second of the oldest commit, minus what was read.
+            read_at_oldest = [
+                r["sha"] for r in records if r.get("commit_committer_date") == oldest
+            ]
+            if oldest == window["until"]:
+                read_at_oldest += list(skip)
+            return records, {**window, "until": oldest, "skip": read_at_oldest}
+
+        with ThreadPoolExecutor(max_workers=max(1, len(active))) as executor:
+            results = list(executor.map(read_window, active))
+
+        remaining = [window for _, window in results if window is not None] + pending
+        if remaining:
+            next_offset = {"backfill": {**backfill, "windows": remaining}}
+        else:
+            next_offset = {"cursor": backfill["until"]}
+        return chain.from_iterable(records for records, _ in results), next_offset
+
     def _read_assignees(
         self, start_offset: dict, table_options: dict[str, str]
     ) -> (Iterator[dict], dict):
@@ -1157,13 +1982,13 @@ class LakeflowConnect:
         next_params = params
 
         while next_url and pages_fetched < max_pages_per_batch:
-            response = self._session.get(next_url, params=next_params, timeout=30)
+            response = self._get(next_url, params=next_params)
             if response.status_code != 200:
                 raise RuntimeError(
                     f"GitHub API error for assignees: {response.status_code} {response.text}"
                 )
 
-            assignees = response.json() or []
+            assignees = response_json(response) or []
             if not isinstance(assignees, list):
                 raise ValueError(
                     f"Unexpected response format for assignees: {type(assignees).__name__}"
@@ -1226,13 +2051,13 @@ class LakeflowConnect:
         next_params = params
 
         while next_url and pages_fetched < max_pages_per_batch:
-            response = self._session.get(next_url, params=next_params, timeout=30)
+            response = self._get(next_url, params=next_params)
             if response.status_code != 200:
                 raise RuntimeError(
                     f"GitHub API error for branches: {response.status_code} {response.text}"
                 )
 
-            branches = response.json() or []
+            branches = response_json(response) or []
             if not isinstance(branches, list):
                 raise ValueError(
                     f"Unexpected response format for branches: {type(branches).__name__}"
@@ -1294,13 +2119,13 @@ class LakeflowConnect:
         next_params = params
 
         while next_url and pages_fetched < max_pages_per_batch:
-            response = self._session.get(next_url, params=next_params, timeout=30)
+            response = self._get(next_url, params=next_params)
             if response.status_code != 200:
                 raise RuntimeError(
                     f"GitHub API error for collaborators: {response.status_code} {response.text}"
                 )
 
-            collaborators = response.json() or []
+            collaborators = response_json(response) or []
             if not isinstance(collaborators, list):
                 raise ValueError(
                     f"Unexpected response format for collaborators: {type(collaborators).__name__}"
@@ -1367,13 +2192,13 @@ class LakeflowConnect:
         next_params = params
 
         while next_url and pages_fetched < max_pages_per_batch:
-            response = self._session.get(next_url, params=next_params, timeout=30)
+            response = self._get(next_url, params=next_params)
             if response.status_code != 200:
                 raise RuntimeError(
                     f"GitHub API error for organizations: {response.status_code} {response.text}"
                 )
 
-            orgs = response.json() or []
+            orgs = response_json(response) or []
             if not isinstance(orgs, list):
                 raise ValueError(
                     f"Unexpected response format for organizations list: {type(orgs).__name__}"
@@ -1451,13 +2276,13 @@ class LakeflowConnect:
         next_params = params
 
         while next_url and pages_fetched < max_pages_per_batch:
-            response = self._session.get(next_url, params=next_params, timeout=30)
+            response = self._get(next_url, params=next_params)
             if response.status_code != 200:
                 raise RuntimeError(
                     f"GitHub API error for teams: {response.status_code} {response.text}"
                 )
 
-            teams = response.json() or []
+            teams = response_json(response) or []
             if not isinstance(teams, list):
                 raise ValueError(
                     f"Unexpected response format for teams list: {type(teams).__name__}"
@@ -1473,7 +2298,7 @@ class LakeflowConnect:
                     continue
 
                 detail_url = f"{self.base_url}/orgs/{org_login}/teams/{team_slug}"
-                detail_resp = self._session.get(detail_url, timeout=30)
+                detail_resp = self._get(detail_url)
                 if detail_resp.status_code != 200:
                     raise RuntimeError(
                         "GitHub API error for team "
@@ -1481,7 +2306,7 @@ class LakeflowConnect:
                         f"{detail_resp.status_code} {detail_resp.text}"
                     )
 
-                team_obj = detail_resp.json() or {}
+                team_obj = response_json(detail_resp) or {}
                 if not isinstance(team_obj, dict):
                     raise ValueError(
                         "Unexpected response format for team detail: "
@@ -1516,13 +2341,13 @@ class LakeflowConnect:
         current authenticated user.
         """
         url = f"{self.base_url}/user"
-        response = self._session.get(url, timeout=30)
+        response = self._get(url)
         if response.status_code != 200:
             raise RuntimeError(
                 f"GitHub API error for users: {response.status_code} {response.text}"
             )
 
-        user_obj = response.json() or {}
+        user_obj = response_json(response) or {}
         if not isinstance(user_obj, dict):
             raise ValueError(
                 f"Unexpected response format for user: {type(user_obj).__name__}"
@@ -1583,7 +2408,7 @@ class LakeflowConnect:
             next_params = params
 
             while next_url and pages_fetched < max_pages_per_batch:
-                response = self._session.get(next_url, params=next_params, timeout=30)
+                response = self._get(next_url, params=next_params)
                 if response.status_code != 200:
                     raise RuntimeError(
                         "GitHub API error for reviews "
@@ -1591,7 +2416,7 @@ class LakeflowConnect:
                         f"{response.status_code} {response.text}"
                     )
 
-                reviews = response.json() or []
+                reviews = response_json(response) or []
                 if not isinstance(reviews, list):
                     raise ValueError(
                         "Unexpected response format for reviews: "
@@ -1644,14 +2469,14 @@ class LakeflowConnect:
         next_params = params
 
         while next_url and pages_fetched < max_pages_per_batch:
-            response = self._session.get(next_url, params=next_params, timeout=30)
+            response = self._get(next_url, params=next_params)
             if response.status_code != 200:
                 raise RuntimeError(
                     f"GitHub API error for pull_requests while discovering reviews: "
                     f"{response.status_code} {response.text}"
                 )
 
-            pull_requests = response.json() or []
+            pull_requests = response_json(response) or []
             if not isinstance(pull_requests, list):
                 raise ValueError(
                     "Unexpected response format for pull_requests when discovering "
@@ -1676,6 +2501,69 @@ class LakeflowConnect:
         # cursor for reviews, so the offset is always an empty dict.
         return iter(records), {}
 
+    def _drop_lookback_repeats(
+        self,
+        records: list[dict[str, Any]],
+        start_offset: dict,
+        cursor: str | None,
+        max_updated_at: str | None,
+        lookback_seconds: int,
+    ) -> (Iterator[dict], dict):
+        """
+        Build the next offset of a cdc table read with a lookback window.
+
+        The next cursor is moved back by `lookback_seconds` so late updates
+        are not missed, which makes the next batch read the records of that
+        window again. The offset therefore keeps `seen`, the `updated_at` of
+        every record in the window by `id`, and records whose `id` and
+        `updated_at` match an entry of the start offset's `seen` are dropped
+        instead of being emitted twice. `seen` only covers the lookback
+        window, so it stays small.
+        """
+        seen = {}
+        if start_offset and isinstance(start_offset, dict):
+            seen = start_offset.get("seen") or {}
+        new_records = [
+            record
+            for record in records
+            if seen.get(str(record.get("id"))) != record.get("updated_at")
+            or record.get("updated_at") is None
+        ]
+
+        # If no new records, return the same offset to indicate end of stream for this batch
+        if not new_records and start_offset:
+            return iter(new_records), start_offset
+
+        next_cursor = cursor
+        if max_updated_at:
+            next_cursor = self._apply_lookback(max_updated_at, lookback_seconds)
+        if not next_cursor:
+            return iter(new_records), {}
+
+        next_offset = {"cursor": next_cursor}
+        window = {
+            str(record["id"]): record["updated_at"]
+            for record in records
+            if record.get("id") is not None
+            and isinstance(record.get("updated_at"), str)
+            and record["updated_at"] >= next_cursor
+        }
+        if window:
+            next_offset["seen"] = window
+        return iter(new_records), next_offset
+
+    @staticmethod
+    def _apply_lookback(cursor: str, lookback_seconds: int) -> str:
+        """
+        Move an ISO 8601 cursor back by `lookback_seconds`.
+
+        If the cursor cannot be parsed it is returned unchanged.
+        """
+        epoch = iso8601_to_epoch(cursor)
+        if epoch is None:
+            return cursor
+        return epoch_to_iso8601(epoch - lookback_seconds)
+
     @staticmethod
     def _extract_next_link(link_header: str | None) -> str | None:
         """
@@ -0,0 +1,670 @@
+"""
+Offline tests for multi-repository reads and rate limit handling of the
+GitHub connector against the mock API server.
+"""
+
+import json
+import time
+
+import pytest
+
+from libs.utils import PUSHED_FILTERS_OPTION, epoch_to_iso8601, iso8601_to_epoch
+from tests.mock_api_fixtures import first_index_at, record_time
+from tests.mock_api_server import LinkHeaderPagination, MockAPIServer, MockResponse
+from sources.github.github import LakeflowConnect, _table_schemas
+
+REPOS = [f"service-{index}" for index in range(6)]
+ISSUES_PER_REPO = 120
+
+
+def install_org(server: MockAPIServer) -> None:
+    """Serve the `acme` organization's repositories and their issues."""
+    server.collection(
+        "/orgs/acme/repos",
+        [{"name": name, "owner": {"login": "acme"}} for name in REPOS],
+        LinkHeaderPagination(),
+    )
+    for repo_index, name in enumerate(REPOS):
+        issues = [
+            {
+                "id": repo_index * 100_000 + index + 1,
+                "number": index + 1,
+                "updated_at": epoch_to_iso8601(record_time(index)),
+            }
+            for index in range(ISSUES_PER_REPO)
+        ]
+        server.collection(
+            f"/repos/acme/{name}/issues",
+            issues,
+            LinkHeaderPagination(),
+            start=lambda request: first_index_at(
+                iso8601_to_epoch(request.query.get("since"))
+            ),
+        )
+
+
+def test_org_issues_are_read_concurrently_with_per_repo_cursors():
+    with MockAPIServer(latency=0.02) as server:
+        install_org(server)
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+        table_options = {"org": "acme", "max_workers": "3", "lookback_seconds": "0"}
+
+        records, offset = connector.read_table("issues", {}, table_options)
+        records = list(records)
+
+        assert len(records) == len(REPOS) * ISSUES_PER_REPO
+        assert {r["repository_name"] for r in records} == set(REPOS)
+        assert {r["repository_owner"] for r in records} == {"acme"}
+        assert 1 < server.max_in_flight <= 3
+        last_update = epoch_to_iso8601(record_time(ISSUES_PER_REPO - 1))
+        assert offset == {
+            "repos": {
+                f"acme/{name}": {
+                    "cursor": last_update,
+                    "seen": {str(repo_index * 100_000 + ISSUES_PER_REPO): last_update},
+                }
+                for repo_index, name in enumerate(REPOS)
+            }
+        }
+
+        # GitHub's `since` is inclusive, so each repository's last issue is
+        # read again, recognised as already emitted, and the offset no longer
+        # moves.
+        records, next_offset = connector.read_table("issues", offset, table_options)
+        assert list(records) == []
+        assert next_offset == offset
+
+
+def test_repos_option_reads_only_the_listed_repositories():
+    with MockAPIServer() as server:
+        install_org(server)
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+
+        records, offset = connector.read_table(
+            "issues", {}, {"owner": "acme", "repos": "service-1, acme/service-4"}
+        )
+
+        assert {r["repository_name"] for r in records} == {"service-1", "service-4"}
+        assert set(offset["repos"]) == {"acme/service-1", "acme/service-4"}
+        assert not any("/orgs/" in path for _, path in server.requests)
+
+
+def test_repos_option_requires_an_owner():
+    connector = LakeflowConnect({"token": "mock"})
+    with pytest.raises(ValueError, match="needs an owner"):
+        connector.read_table("issues", {}, {"repos": "service-1"})
+
+
+def test_multi_repo_commits_are_keyed_by_repository():
+    connector = LakeflowConnect({"token": "mock"})
+    assert connector.read_table_metadata("commits", {"owner": "a", "repo": "b"})[
+        "primary_keys"
+    ] == ["sha"]
+    assert connector.read_table_metadata("commits", {"org": "acme"})[
+        "primary_keys"
+    ] == ["repository_owner", "repository_name", "sha"]
+
+
+BRANCHES = [{"name": f"branch-{index}", "protected": False} for index in range(5)]
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record sleeps instead of sleeping, moving `time.time` forward by each one."""
+    recorded = []
+    now = [time.time()]
+
+    def sleep(seconds):
+        recorded.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(time, "sleep", sleep)
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return recorded
+
+
+def with_quota(records, remaining, reset_at, limit=5000):
+    """A handler serving `records` two per page with rate limit headers."""
+    pagination = LinkHeaderPagination(default_size=2)
+
+    def handler(request):
+        response = pagination(request, records, 0)
+        response.headers.update(
+            {
+                "X-RateLimit-Limit": str(limit),
+                "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": str(reset_at),
+                "X-RateLimit-Resource": "core",
+            }
+        )
+        return response
+
+    return handler
+
+
+def test_waits_for_the_primary_rate_limit_to_reset(sleeps):
+    reset_at = int(time.time()) + 30
+    calls = []
+
+    def handler(request):
+        calls.append(request.path)
+        if len(calls) == 1:
+            return MockResponse(
+                {"message": "API rate limit exceeded"},
+                status=403,
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset_at)},
+            )
+        return MockResponse(BRANCHES)
+
+    with MockAPIServer() as server:
+        server.route("/repos/acme/app/branches", handler)
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+
+        records, _ = connector.read_table("branches", {}, {"owner": "acme", "repo": "app"})
+
+        assert len(list(records)) == len(BRANCHES)
+    assert len(sleeps) == 1 and 25 <= sleeps[0] <= 32
+    assert connector.metrics.collect()["retries"] == 1
+
+
+def test_retries_secondary_rate_limits_after_retry_after(sleeps):
+
+    with MockAPIServer() as server:
+        server.route("/repos/acme/app/branches", BRANCHES)
+        server.throttle(2, retry_after=7)
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+
+        records, _ = connector.read_table("branches", {}, {"owner": "acme", "repo": "app"})
+
+        assert len(list(records)) == len(BRANCHES)
+    assert sleeps == [7.0, 7.0]
+
+
+def test_gives_up_after_max_retries(sleeps):
+
+    with MockAPIServer() as server:
+        server.route("/repos/acme/app/branches", BRANCHES)
+        server.throttle(3, retry_after=1)
+        connector = LakeflowConnect(
+            {"token": "mock", "base_url": server.base_url, "max_retries": "2"}
+        )
+
+        with pytest.raises(RuntimeError, match="429"):
+            connector.read_table("branches", {}, {"owner": "acme", "repo": "app"})
+
+
+def test_low_quota_holds_snapshots_and_paces_incremental_tables(sleeps):
+    reset_at = int(time.time()) + 600
+    issues = [
+        {"id": index, "updated_at": epoch_to_iso8601(record_time(index))}
+        for index in range(5)
+    ]
+
+    with MockAPIServer() as server:
+        server.route("/repos/acme/app/branches", with_quota(BRANCHES, 100, reset_at))
+        server.route("/repos/acme/app/issues", with_quota(issues, 100, reset_at))
+        options = {"owner": "acme", "repo": "app", "per_page": "2"}
+
+        # A CDC table keeps reading, spreading the last 100 requests over the
+        # 10 minutes left: the third page waits about 6 seconds.
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+        assert len(list(connector.read_table("issues", {}, options)[0])) == 5
+        assert len(sleeps) == 1 and 5 <= sleeps[0] <= 7
+
+        # 100 requests left is below the 500 reserved for incremental tables:
+        # after learning the quota, the snapshot waits for the reset.
+        sleeps.clear()
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+        assert len(list(connector.read_table("branches", {}, options)[0])) == 5
+        assert len(sleeps) == 1 and 590 <= sleeps[0] <= 602
+
+
+def quota_by_token(records, quotas, reset_at):
+    """A handler serving `records` with rate limit headers for each token."""
+    used = {token: 0 for token in quotas}
+
+    def handler(request):
+        token = request.headers["Authorization"].split()[-1]
+        used[token] += 1
+        if quotas[token] == 0:
+            return MockResponse(
+                {"message": "API rate limit exceeded"},
+                status=403,
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset_at)},
+            )
+        return MockResponse(
+            records,
+            headers={
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": str(quotas[token]),
+                "X-RateLimit-Reset": str(reset_at),
+            },
+        )
+
+    return handler, used
+
+
+def test_token_pool_prefers_the_token_with_most_quota(sleeps):
+    reset_at = int(time.time()) + 3600
+    handler, used = quota_by_token(BRANCHES, {"a": 4000, "b": 4900}, reset_at)
+
+    with MockAPIServer() as server:
+        server.route("/repos/acme/app/branches", handler)
+        connector = LakeflowConnect(
+            {"token": "a", "tokens": "b, a", "base_url": server.base_url}
+        )
+        for _ in range(10):
+            connector.read_table("branches", {}, {"owner": "acme", "repo": "app"})
+
+    # Each token is tried once to learn its quota, then "b" takes the rest.
+    assert used == {"a": 1, "b": 9}
+    assert sleeps == []
+
+
+def test_token_pool_moves_on_from_an_exhausted_token(sleeps):
+    reset_at = int(time.time()) + 3600
+    handler, used = quota_by_token(BRANCHES, {"a": 0, "b": 4900}, reset_at)
+
+    with MockAPIServer() as server:
+        server.route("/repos/acme/app/branches", handler)
+        connector = LakeflowConnect({"tokens": "a,b", "base_url": server.base_url})
+        for _ in range(3):
+            records, _ = connector.read_table(
+                "branches", {}, {"owner": "acme", "repo": "app"}
+            )
+            assert len(list(records)) == len(BRANCHES)
+
+    assert used == {"a": 1, "b": 3}
+    assert sleeps == []
+
+
+def test_token_pool_limits_requests_in_flight_per_token():
+    with MockAPIServer(latency=0.05) as server:
+        install_org(server)
+        connector = LakeflowConnect(
+            {
+                "tokens": "a,b",
+                "max_concurrent_requests_per_token": "1",
+                "base_url": server.base_url,
+            }
+        )
+
+        records, _ = connector.read_table(
+            "issues", {}, {"org": "acme", "max_workers": "6"}
+        )
+
+        assert len(list(records)) == len(REPOS) * ISSUES_PER_REPO
+        assert server.max_in_flight == 2
+
+
+def test_requires_a_token():
+    with pytest.raises(ValueError, match="'token' or 'tokens'"):
+        LakeflowConnect({"tokens": " , "})
+
+
+def install_commits(server: MockAPIServer, count: int, created_at: int) -> list:
+    """
+    Serve `count` commits, newest first, filtered by committer date like
+    GitHub (`since` and `until` are inclusive). Pairs of commits share a
+    second. Returns the shas.
+    """
+    commits = [
+        {
+            "sha": f"{index:040x}",
+            "commit": {
+                "message": f"commit {index}",
+                "author": {"date": epoch_to_iso8601(created_at + (index // 2) * 3600)},
+                "committer": {"date": epoch_to_iso8601(created_at + (index // 2) * 3600)},
+            },
+        }
+        for index in range(count)
+    ]
+    commits.reverse()
+    pagination = LinkHeaderPagination()
+
+    def handler(request):
+        since = iso8601_to_epoch(request.query.get("since")) or 0
+        until = iso8601_to_epoch(request.query.get("until")) or float("inf")
+        matching = [
+            commit
+            for commit in commits
+            if since
+            <= iso8601_to_epoch(commit["commit"]["committer"]["date"])
+            <= until
+        ]
+        return pagination(request, matching, 0)
+
+    server.route("/repos/acme/app/commits", handler)
+    server.route(
+        "/repos/acme/app", {"name": "app", "created_at": epoch_to_iso8601(created_at)}
+    )
+    return [commit["sha"] for commit in commits]
+
+
+def test_commits_backfill_reads_history_in_windows_then_tails():
+    created_at = int(time.time()) - 200 * 86400
+    with MockAPIServer(latency=0.01) as server:
+        shas = install_commits(server, 2000, created_at)
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+        table_options = {
+            "owner": "acme",
+            "repo": "app",
+            "backfill_window_days": "30",
+            "per_page": "25",
+            "max_pages_per_batch": "3",
+            "max_workers": "4",
+        }
+
+        seen = []
+        offset = {}
+        for _ in range(100):
+            records, offset = connector.read_table("commits", offset, table_options)
+            seen += [record["sha"] for record in records]
+            if "backfill" not in offset:
+                break
+            assert len(offset["backfill"]["windows"]) <= 7
+
+        assert sorted(seen) == sorted(shas)
+        assert set(offset) == {"cursor"}
+        assert server.max_in_flight > 1
+        windowed = [path for _, path in server.requests if "until=" in path]
+        assert windowed
+
+        # Once the backfill is done, reads continue from the planning time.
+        records, next_offset = connector.read_table("commits", offset, table_options)
+        assert list(records) == []
+        assert next_offset == offset
+
+
+def test_commits_backfill_plan_is_capped():
+    created_at = int(time.time()) - 200 * 86400
+    with MockAPIServer() as server:
+        install_commits(server, 10, created_at)
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+        table_options = {
+            "owner": "acme",
+            "repo": "app",
+            "backfill_window_days": "0.1",
+            "max_workers": "1",
+        }
+
+        _, offset = connector.read_table("commits", {}, table_options)
+
+        windows = offset["backfill"]["windows"]
+        assert len(windows) <= LakeflowConnect.MAX_BACKFILL_WINDOWS
+        for previous, window in zip(windows, windows[1:]):
+            assert (
+                iso8601_to_epoch(window["since"])
+                == iso8601_to_epoch(previous["until"]) + 1
+            )
+
+
+def test_commits_backfill_without_a_creation_date_asks_for_start_date():
+    with MockAPIServer() as server:
+        server.route("/repos/acme/app", {"name": "app"})
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+        table_options = {"owner": "acme", "repo": "app", "backfill_window_days": "30"}
+
+        with pytest.raises(ValueError, match="start_date"):
+            connector.read_table("commits", {}, table_options)
+
+
+def test_commits_tail_cursor_follows_the_committer_date():
+    cursor = int(time.time()) - 86400
+    # A rebased commit: committed after the cursor, authored long before it.
+    commits = [
+        {
+            "sha": "f" * 40,
+            "commit": {
+                "message": "rebased",
+                "author": {"date": epoch_to_iso8601(cursor - 30 * 86400)},
+                "committer": {"date": epoch_to_iso8601(cursor + 60)},
+            },
+        }
+    ]
+    with MockAPIServer() as server:
+        server.route(
+            "/repos/acme/app/commits",
+            lambda request: LinkHeaderPagination()(
+                request,
+                [
+                    commit
+                    for commit in commits
+                    if iso8601_to_epoch(commit["commit"]["committer"]["date"])
+                    >= iso8601_to_epoch(request.query["since"])
+                ],
+                0,
+            ),
+        )
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+        table_options = {"owner": "acme", "repo": "app"}
+
+        records, offset = connector.read_table(
+            "commits", {"cursor": epoch_to_iso8601(cursor)}, table_options
+        )
+        assert [record["sha"] for record in records] == ["f" * 40]
+        assert offset == {"cursor": epoch_to_iso8601(cursor + 60)}
+
+        # The cursor does not move back to the author date.
+        _, next_offset = connector.read_table("commits", offset, table_options)
+        assert next_offset == offset
+
+
+def install_issues(server: MockAPIServer, count: int, pull_every: int = 0) -> list:
+    """
+    Serve `count` issues of `acme/app`, filtered by `since`. With
+    `pull_every`, every `pull_every`-th one is a pull request, also served
+    by `/pulls/{number}`.
+    """
+    issues = [
+        {
+            "id": index + 1,
+            "number": index + 1,
+            "updated_at": epoch_to_iso8601(record_time(index)),
+            **(
+                {"pull_request": {"url": "..."}}
+                if pull_every and index % pull_every == 0
+                else {}
+            ),
+        }
+        for index in range(count)
+    ]
+    server.collection(
+        "/repos/acme/app/issues",
+        issues,
+        LinkHeaderPagination(),
+        start=lambda request: first_index_at(
+            iso8601_to_epoch(request.query.get("since"))
+        ),
+    )
+
+    def pull_request(request):
+        number = int(request.match.group(1))
+        return MockResponse(
+            {
+                "id": 10_000 + number,
+                "number": number,
+                "updated_at": issues[number - 1]["updated_at"],
+                "merged": False,
+            }
+        )
+
+    server.route(r"/repos/acme/app/pulls/(\d+)", pull_request)
+    return issues
+
+
+def test_lookback_window_does_not_emit_records_twice():
+    comments = [
+        {"id": index + 1, "updated_at": epoch_to_iso8601(record_time(index))}
+        for index in range(20)
+    ]
+    with MockAPIServer() as server:
+        server.collection(
+            "/repos/acme/app/issues/comments",
+            comments,
+            LinkHeaderPagination(),
+            start=lambda request: first_index_at(
+                iso8601_to_epoch(request.query.get("since"))
+            ),
+        )
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+        table_options = {"owner": "acme", "repo": "app", "lookback_seconds": "300"}
+
+        records, offset = connector.read_table("comments", {}, table_options)
+        assert len(list(records)) == 20
+        window = [c for c in comments if c["updated_at"] >= offset["cursor"]]
+        assert 1 < len(window) < 20
+        assert offset["seen"] == {str(c["id"]): c["updated_at"] for c in window}
+
+        # The lookback window is read again but nothing in it is re-emitted.
+        records, next_offset = connector.read_table("comments", offset, table_options)
+        assert list(records) == []
+        assert next_offset == offset
+
+        comments.append({"id": 21, "updated_at": epoch_to_iso8601(record_time(20))})
+        records, next_offset = connector.read_table("comments", offset, table_options)
+        assert [record["id"] for record in records] == [21]
+        assert next_offset["cursor"] > offset["cursor"]
+        assert "21" in next_offset["seen"]
+
+
+def test_co_read_splits_one_issues_sweep_into_both_tables():
+    with MockAPIServer() as server:
+        issues = install_issues(server, 90, pull_every=3)
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+        table_options = {"owner": "acme", "repo": "app", "lookback_seconds": "0"}
+
+        records, offset = connector.read_co_read(
+            ["issues", "pull_requests"], {}, table_options
+        )
+
+        rows = {"issues": [], "pull_requests": []}
+        for table_name, record in records:
+            rows[table_name].append(record)
+        assert len(rows["issues"]) == 90
+        pulls = rows["pull_requests"]
+        assert [pr["number"] for pr in pulls] == list(range(1, 91, 3))
+        assert {pr["merged"] for pr in pulls} == {False}
+        assert {pr["repository_name"] for pr in pulls} == {"app"}
+        assert offset["cursor"] == epoch_to_iso8601(record_time(89))
+        paths = [path for _, path in server.requests]
+        assert sum("/issues" in path for path in paths) == 1
+        assert len(paths) == 1 + len(pulls)
+
+        # Only the pull requests in the next sweep are fetched again.
+        server.requests.clear()
+        issues.append(
+            {
+                "id": 91,
+                "number": 91,
+                "updated_at": epoch_to_iso8601(record_time(90)),
+                "pull_request": {"url": "..."},
+            }
+        )
+        records, _ = connector.read_co_read(
+            ["issues", "pull_requests"], offset, table_options
+        )
+        assert [(name, record["number"]) for name, record in records] == [
+            ("issues", 91),
+            ("pull_requests", 91),
+        ]
+        assert len(server.requests) == 2
+
+
+def test_co_read_needs_issues_then_pull_requests_of_one_repository():
+    connector = LakeflowConnect({"token": "mock"})
+
+    with pytest.raises(ValueError, match="co-reads 'issues'"):
+        connector.read_co_read(["pull_requests", "issues"], {}, {})
+    with pytest.raises(ValueError, match="single 'owner' and 'repo'"):
+        connector.read_co_read(
+            ["issues", "pull_requests"], {}, {"repos": "acme/app,acme/web"}
+        )
+
+
+def test_schemas_are_built_once_and_shared():
+    first = LakeflowConnect({"token": "mock"})
+    second = LakeflowConnect({"token": "mock"})
+    for table in first.list_tables():
+        assert first.get_table_schema(table, {}) is second.get_table_schema(table, {})
+    with pytest.raises(ValueError, match="Unsupported table"):
+        first.get_table_schema("gists", {})
+    with pytest.raises(TypeError):
+        _table_schemas()["gists"] = first.get_table_schema("issues", {})
+
+
+def test_pushed_filters_become_since_and_state():
+    with MockAPIServer() as server:
+        install_issues(server, 30)
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+        table_options = {"owner": "acme", "repo": "app"}
+
+        assert connector.supported_filters("issues", table_options) == {
+            "updated_at": (">", ">="),
+            "state": ("=",),
+        }
+        assert connector.supported_filters("pull_requests", table_options) == {
+            "state": ("=",),
+        }
+        assert connector.supported_filters("issues", {"state": "open"}) == {
+            "updated_at": (">", ">=")
+        }
+
+        since = epoch_to_iso8601(record_time(20))
+        filters = [["updated_at", ">=", since], ["state", "=", "open"]]
+        records, _ = connector.read_table(
+            "issues",
+            {},
+            {**table_options, PUSHED_FILTERS_OPTION: json.dumps(filters)},
+        )
+
+        assert [record["number"] for record in records] == list(range(21, 31))
+        (path,) = [path for _, path in server.requests]
+        assert "state=open" in path
+        assert f"since={since}".replace(":", "%3A") in path
+
+
+def test_partitioned_stream_reads_each_repository_once_per_range():
+    with MockAPIServer() as server:
+        install_org(server)
+        connector = LakeflowConnect({"token": "mock", "base_url": server.base_url})
+        # End the first micro-batch between the 61st and 62nd issue.
+        lag = int(time.time()) - record_time(60) - 30
+        table_options = {"org": "acme", "lookback_seconds": str(lag)}
+
+        end = connector.latest_offset("issues", {}, table_options)
+        cursor = epoch_to_iso8601(record_time(60) + 30)
+        assert end == {
+            "repos": {f"acme/{name}": {"cursor": cursor} for name in REPOS}
+        }
+
+        partitions = connector.partition_offsets("issues", {}, end, table_options)
+        assert [start["repo"] for start, _ in partitions] == [
+            f"acme/{name}" for name in REPOS
+        ]
+        server.requests.clear()
+        first = {
+            start["repo"]: [
+                record["number"]
+                for record in connector.read_offset_range(
+                    "issues", start, stop, table_options
+                )
+            ]
+            for start, stop in partitions
+        }
+        assert first == {f"acme/{name}": list(range(1, 62)) for name in REPOS}
+        # Pages are sorted by `updated_at`, so each read stops on its first page.
+        assert len(server.requests) == len(REPOS)
+
+        table_options["lookback_seconds"] = "0"
+        next_end = connector.latest_offset("issues", end, table_options)
+        (start, stop), *_ = connector.partition_offsets(
+            "issues", end, next_end, table_options
+        )
+        assert start == {"repo": "acme/service-0", "cursor": cursor}
+        second = connector.read_offset_range("issues", start, stop, table_options)
+        assert [record["number"] for record in second] == list(range(62, 121))
+
+        assert connector.partition_offsets("issues", next_end, next_end, {}) == []
+        with pytest.raises(ValueError, match="partitioned streaming"):
+            connector.latest_offset("commits", {}, table_options)
@@ -1,20 +1,26 @@
 import requests
 import json
 from pyspark.sql.types import *
-from datetime import datetime
 import time
 import random
 from typing import Dict, List, Tuple, Iterator, Any
 
+from libs.metrics import ReadMetrics, attach_metrics
+from libs.utils import iso8601_to_epoch, projected_fields, response_json
+
 
 class LakeflowConnect:
     def __init__(self, options: dict) -> None:
         self.access_token = options["access_token"]
-        self.base_url = "https://api.hubapi.com"
+        self.base_url = options.get("base_url", "https://api.hubapi.com").rstrip("/")
         self.auth_header = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json",
         }
+        # Reuse connections across requests and count them per micro-batch
+        self._session = requests.Session()
+        self.metrics = ReadMetrics()
+        attach_metrics(self._session, self.metrics)
         # Cache for discovered schemas to avoid repeated API calls
         self._schema_cache = {}
         # Cache for table metadata
@@ -124,12 +130,12 @@ class LakeflowConnect:
         """
         try:
             url = f"{self.base_url}/crm/v3/schemas"
-            resp = requests.get(url, headers=self.auth_header)
+            resp = self._session.get(url, headers=self.auth_header)
 
             if resp.status_code != 200:
                 return []
 
-            data = resp.json()
+            data = response_json(resp)
             custom_objects = []
 
             # Extract custom object names
@@ -299,11 +305,11 @@ class LakeflowConnect:
         url = f"{self.base_url}/properties/v2/{object_type}/properties"
 
         try:
-            resp = requests.get(url, headers=self.auth_header)
+            resp = self._session.get(url, headers=self.auth_header)
             if resp.status_code != 200:
                 raise Exception("API error: {resp.status_code} {resp.text}")
 
-            return resp.json()
+            return response_json(resp)
         except Exception as e:
             return {"error": f"Failed to get object properties: {str(e)}"}
 
@@ -366,6 +372,14 @@ class LakeflowConnect:
         cursor_property_field = metadata.get("cursor_property_field")
         associations = metadata.get("associations", [])
 
+        # Request only the properties and associations a batch query selects
+        selected_properties = projected_fields(table_options, "properties")
+        if selected_properties is not None:
+            property_names = [p for p in property_names if p in selected_properties]
+        associations = [
+            a for a in associations if projected_fields(table_options, a) is None
+        ]
+
         all_records = []
         after = None
         latest_updated = start_offset.get("updatedAt") if start_offset else None
@@ -432,13 +446,13 @@ class LakeflowConnect:
         if associations:
             url += f"&associations={','.join(associations)}"
 
-        resp = requests.get(url, headers=self.auth_header)
+        resp = self._session.get(url, headers=self.auth_header)
         if resp.status_code != 200:
             raise Exception(
                 f"HubSpot API error for {table_name}: {resp.status_code} {resp.text}"
             )
 
-        data = resp.json()
+        data = response_json(resp)
         records = data.get("results", [])
         next_after = data.get("paging", {}).get("next", {}).get("after")
 
@@ -456,13 +470,8 @@ class LakeflowConnect:
         last_updated = start_offset.get("updatedAt", "1970-01-01T00:00:00.000Z")
 
         # Convert to milliseconds for HubSpot
-        try:
-            last_updated_ms = int(
-                datetime.fromisoformat(last_updated.replace("Z", "+00:00")).timestamp()
-                * 1000
-            )
-        except:
-            last_updated_ms = 0
+        last_updated_epoch = iso8601_to_epoch(last_updated)
+        last_updated_ms = int(last_updated_epoch * 1000) if last_updated_epoch else 0
 
         search_body = {
             "filterGroups": [
@@ -487,14 +496,14 @@ class LakeflowConnect:
             search_body["after"] = after
 
         url = f"{self.base_url}/crm/v3/objects/{table_name}/search"
-        resp = requests.post(url, headers=self.auth_header, json=search_body)
+        resp = self._session.post(url, headers=self.auth_header, json=search_body)
 
         if resp.status_code != 200:
             raise Exception(
                 f"HubSpot API error for {table_name}: {resp.status_code} {resp.text}"
             )
 
-        data = resp.json()
+        data = response_json(resp)
         records = data.get("results", [])
         next_after = data.get("paging", {}).get("next", {}).get("after")
 
@@ -554,7 +563,7 @@ class LakeflowConnect:
         """Test the connection to HubSpot API"""
         try:
             url = f"{self.base_url}/crm/v3/objects/contacts?limit=1"
-            resp = requests.get(url, headers=self.auth_header)
+            resp = self._session.get(url, headers=self.auth_header)
 
             if resp.status_code == 200:
                 return {"status": "success", "message": "Connection successful"}
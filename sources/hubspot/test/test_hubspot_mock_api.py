@@ -0,0 +1,65 @@
+"""
+Offline tests for column projection of the HubSpot connector against the
+mock API server.
+"""
+
+import json
+import time
+from urllib.parse import parse_qs, urlparse
+
+from libs.utils import PROJECTION_OPTION, parse_value, projection_paths, prune_schema
+from tests.mock_api_fixtures import FIXTURES
+from tests.mock_api_server import MockAPIServer
+from sources.hubspot.hubspot import LakeflowConnect
+
+FIXTURE = FIXTURES["hubspot.contacts"]
+
+
+def object_requests(server: MockAPIServer) -> list:
+    return [
+        parse_qs(urlparse(path).query)
+        for _, path in server.requests
+        if urlparse(path).path == "/crm/v3/objects/contacts"
+    ]
+
+
+def test_projection_requests_only_the_selected_properties(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    with MockAPIServer() as server:
+        FIXTURE.install(server, 250)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        full_schema = connector.get_table_schema("contacts", {})
+        schema = prune_schema(
+            full_schema, ["id", "updatedAt", "properties.string_property_0"]
+        )
+        projection = projection_paths(schema, full_schema)
+        assert projection == ["id", "updatedAt", "properties.string_property_0"]
+
+        records, offset = connector.read_table(
+            "contacts", {}, {PROJECTION_OPTION: json.dumps(projection)}
+        )
+        rows = [parse_value(record, schema) for record in records]
+
+        assert len(rows) == 250
+        assert rows[0].properties.string_property_0 == "value 0"
+        assert offset["updatedAt"] == rows[-1].updatedAt
+        pages = object_requests(server)
+        assert pages
+        for params in pages:
+            assert params["properties"] == ["string_property_0"]
+            assert "associations" not in params
+
+
+def test_without_projection_every_property_is_requested(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    with MockAPIServer() as server:
+        FIXTURE.install(server, 10)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+
+        records, _ = connector.read_table("contacts", {}, {})
+        list(records)
+
+        (params,) = object_requests(server)
+        properties = connector.get_table_schema("contacts", {})["properties"]
+        assert params["properties"][0].split(",") == properties.dataType.fieldNames()
+        assert params["associations"] == ["companies"]
@@ -81,3 +81,77 @@ class LakeflowConnect:
             records: An iterator of records in JSON format.
             offset: An offset in dict.
         """
+
+    # Optional. Implement this method only if some filters map to API parameters.
+    def supported_filters(
+        self, table_name: str, table_options: dict[str, str]
+    ) -> dict[str, tuple[str, ...]]:
+        """
+        Declare the filters of a batch query that can narrow the API requests of a table.
+        Args:
+            table_name: The name of the table being read.
+            table_options: The options of the table.
+        Returns:
+            A dictionary mapping column names (nested columns joined with dots, e.g. "properties.$city")
+            to the operators accepted for them: "=", ">", ">=", "<", "<=" and "in".
+            Matching filters are passed to `read_table` as `(column, op, value)` triples,
+            available through `libs.utils.pushed_filters(table_options)`.
+            `read_table` may return extra records (the rows that do not match are dropped after parsing),
+            but must not miss any record that matches.
+        """
+
+    # Optional. Implement the three methods below only if the offset range of a micro-batch
+    # can be split into partitions that are read independently (e.g. per repository or per time window).
+    # They are used instead of `read_table` when the `lakeflow.partitionedStream` option is "true".
+    def latest_offset(
+        self, table_name: str, start_offset: dict, table_options: dict[str, str]
+    ) -> dict:
+        """
+        Plan the end offset of the next micro-batch of a partitioned stream, without reading records.
+        Args:
+            table_name: The name of the table being read.
+            start_offset: The offset the micro-batch starts from ({} for the first one).
+            table_options: The options of the table.
+        Returns:
+            The end offset in dict. Return start_offset when there is nothing new to read.
+        """
+
+    def partition_offsets(
+        self,
+        table_name: str,
+        start_offset: dict,
+        end_offset: dict,
+        table_options: dict[str, str],
+    ) -> list[tuple[dict, dict]]:
+        """
+        Split the range between two offsets into partitions that can be read in parallel.
+        Args:
+            table_name: The name of the table being read.
+            start_offset: The start offset of the micro-batch.
+            end_offset: The end offset returned by `latest_offset`.
+            table_options: The options of the table.
+        Returns:
+            A list of (start, end) pairs of JSON-serializable dicts, one per partition.
+            Together, the partitions must cover every record between the two offsets, each exactly once.
+        """
+
+    def read_offset_range(
+        self,
+        table_name: str,
+        start_offset: dict,
+        end_offset: dict,
+        table_options: dict[str, str],
+    ) -> Iterator[dict]:
+        """
+        Read the records of one partition returned by `partition_offsets`.
+        Runs on an executor, so it must not rely on state set by the other methods.
+        Args:
+            table_name: The name of the table being read.
+            start_offset: The start of the partition.
+            end_offset: The end of the partition.
+            table_options: The options of the table.
+        Returns:
+            An iterator of records in JSON format.
+            For append tables, reading the same partition again must return the same records;
+            for cdc tables it is enough that no change is missed.
+        """
@@ -5,14 +5,37 @@
 # Do not edit manually. Make changes to the source files instead.
 # ==============================================================================
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Iterator
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlparse
+import cProfile
+import calendar
 import json
+import os
+import pstats
+import re
+import tempfile
+import threading
 import time
+import uuid
 
 from pyspark.sql import Row
-from pyspark.sql.datasource import DataSource, DataSourceReader, SimpleDataSourceStreamReader
+from pyspark.sql.datasource import (
+    DataSource,
+    DataSourceReader,
+    DataSourceStreamReader,
+    InputPartition,
+    SimpleDataSourceStreamReader,
+)
 from pyspark.sql.types import *
 import base64
 import requests
@@ -160,6 +183,746 @@ def register_lakeflow_source(spark):
             )
 
 
+    # Length of the fixed `YYYY-MM-DDTHH:MM:SSZ` layout used by most APIs for cursors.
+    _UTC_ISO8601_LENGTH = 20
+
+    # Parsed values of timestamps that do not use the fixed layout. Kept as a plain
+    # bounded dict (rather than functools.lru_cache) so it pickles with the
+    # generated source.
+    _ISO8601_CACHE: dict = {}
+    _ISO8601_CACHE_SIZE = 4096
+
+
+    def is_utc_iso8601(value: Any) -> bool:
+        """
+        Check whether a value uses the fixed `YYYY-MM-DDTHH:MM:SSZ` layout.
+
+        Timestamps in this layout sort lexicographically in time order, so they can
+        be compared as strings without parsing.
+        """
+        return (
+            isinstance(value, str)
+            and len(value) == _UTC_ISO8601_LENGTH
+            and value[4] == "-"
+            and value[7] == "-"
+            and value[10] == "T"
+            and value[13] == ":"
+            and value[16] == ":"
+            and value[19] == "Z"
+        )
+
+
+    def iso8601_to_epoch(value: Any) -> Optional[float]:
+        """
+        Convert an ISO 8601 timestamp string to seconds since the epoch.
+
+        The fixed `YYYY-MM-DDTHH:MM:SSZ` layout is converted by slicing; other
+        layouts (fractional seconds, offsets, space separator) go through
+        `datetime.fromisoformat` and are cached. Timestamps without an offset are
+        taken to be UTC. Returns None for values that cannot be parsed.
+        """
+        if is_utc_iso8601(value):
+            try:
+                fields = (
+                    int(value[0:4]),
+                    int(value[5:7]),
+                    int(value[8:10]),
+                    int(value[11:13]),
+                    int(value[14:16]),
+                    int(value[17:19]),
+                )
+            except ValueError:
+                return None
+            # calendar.timegm normalizes out-of-range fields instead of rejecting them.
+            if not (
+                1 <= fields[1] <= 12
+                and 1 <= fields[2]
+                and (
+                    fields[2] <= 28
+                    or fields[2] <= calendar.monthrange(fields[0], fields[1])[1]
+                )
+                and fields[3] < 24
+                and fields[4] < 60
+                and fields[5] < 60
+            ):
+                return None
+            return float(calendar.timegm(fields))
+
+        if not isinstance(value, str) or not value:
+            return None
+
+        cached = _ISO8601_CACHE.get(value)
+        if cached is not None:
+            return cached
+
+        text = value[:-1] + "+00:00" if value.endswith("Z") else value
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        epoch = parsed.timestamp()
+
+        if len(_ISO8601_CACHE) >= _ISO8601_CACHE_SIZE:
+            _ISO8601_CACHE.clear()
+        _ISO8601_CACHE[value] = epoch
+        return epoch
+
+
+    def epoch_to_iso8601(seconds: float) -> str:
+        """Format seconds since the epoch in the `YYYY-MM-DDTHH:MM:SSZ` layout."""
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
+
+
+    def latest_iso8601(current: Optional[str], candidate: Any) -> Optional[str]:
+        """
+        Return the later of two ISO 8601 timestamps, ignoring unparseable values.
+
+        Intended for tracking a cursor over many records: when both values use the
+        fixed UTC layout they are compared as strings, otherwise they are parsed.
+        """
+        if not isinstance(candidate, str) or not candidate:
+            return current
+        if current is None:
+            return candidate if iso8601_to_epoch(candidate) is not None else current
+        if is_utc_iso8601(current) and is_utc_iso8601(candidate):
+            return candidate if candidate > current else current
+        candidate_epoch = iso8601_to_epoch(candidate)
+        if candidate_epoch is None:
+            return current
+        current_epoch = iso8601_to_epoch(current)
+        if current_epoch is None or candidate_epoch > current_epoch:
+            return candidate
+        return current
+
+
+    # JSON backends in order of preference. Set the LAKEFLOW_JSON_BACKEND
+    # environment variable to one of these names to force a backend.
+    JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+
+    def select_json_backend(
+        preferred: Optional[str] = None,
+    ) -> Tuple[str, Callable[[Union[bytes, str]], Any]]:
+        """
+        Return the name and `loads` function of the fastest installed JSON decoder.
+
+        orjson and msgspec are used when importable; the standard library is the
+        fallback. All three accept `bytes` as well as `str`. `preferred` skips
+        the backends listed before it.
+        """
+        candidates = JSON_BACKENDS
+        if preferred:
+            if preferred not in JSON_BACKENDS:
+                raise ValueError(
+                    f"Unknown JSON backend '{preferred}', expected one of {JSON_BACKENDS}"
+                )
+            candidates = JSON_BACKENDS[JSON_BACKENDS.index(preferred):]
+        for name in candidates:
+            try:
+                if name == "orjson":
+                    import orjson
+
+                    return name, orjson.loads
+                if name == "msgspec":
+                    import msgspec
+
+                    return name, msgspec.json.decode
+            except ImportError:
+                continue
+        return "json", json.loads
+
+
+    JSON_BACKEND, _json_decode = select_json_backend(
+        os.environ.get("LAKEFLOW_JSON_BACKEND")
+    )
+
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document with the fastest available backend.
+
+        Documents the fast backends reject (such as `NaN` literals or malformed
+        input) are retried with the standard library, so the accepted input and
+        the `json.JSONDecodeError` raised match `json.loads`. Note that orjson
+        decodes integers wider than 64 bits as floats.
+        """
+        try:
+            return _json_decode(data)
+        except Exception:
+            if _json_decode is json.loads:
+                raise
+            return json.loads(data)
+
+
+    def response_json(response) -> Any:
+        """
+        Decode a `requests` response body straight from its bytes.
+
+        Replaces `response.json()`, which first decodes the body to `str` and
+        then parses it with the standard library.
+        """
+        return json_loads(response.content)
+
+
+    # Table option through which the batch reader hands the filters it pushed
+    # down to `read_table`, as a JSON list of `[column, op, value]` triples.
+    PUSHED_FILTERS_OPTION = "lakeflow.pushedFilters"
+
+    # Spark data source filter classes that can be pushed down, by class name.
+    _PUSHED_FILTER_OPS = {
+        "EqualTo": "=",
+        "GreaterThan": ">",
+        "GreaterThanOrEqual": ">=",
+        "LessThan": "<",
+        "LessThanOrEqual": "<=",
+        "In": "in",
+    }
+
+
+    def to_pushed_filter(spark_filter: Any) -> Optional[Tuple[str, str, Any]]:
+        """
+        Convert a `pyspark.sql.datasource.Filter` to a `(column, op, value)` triple.
+
+        Nested columns are joined with dots, e.g. `properties.$city`. Returns
+        None for filters that cannot be pushed down: other filter classes,
+        column names containing dots, and values that are not JSON scalars.
+        """
+        op = _PUSHED_FILTER_OPS.get(type(spark_filter).__name__)
+        if op is None:
+            return None
+        attribute = tuple(spark_filter.attribute)
+        if not attribute or any("." in name for name in attribute):
+            return None
+        values = spark_filter.value if op == "in" else (spark_filter.value,)
+        if not all(isinstance(value, (str, int, float, bool)) for value in values):
+            return None
+        value = list(values) if op == "in" else values[0]
+        return ".".join(attribute), op, value
+
+
+    def pushed_filters(table_options: Optional[dict]) -> list:
+        """
+        Return the `(column, op, value)` filters pushed down to a read.
+
+        Connectors use them to narrow their API requests. They do not have to
+        apply them exactly: the batch reader drops the rows that do not match.
+        """
+        value = (table_options or {}).get(PUSHED_FILTERS_OPTION)
+        if not value:
+            return []
+        return [tuple(pushed) for pushed in json.loads(value)]
+
+
+    def matches_filters(row: Any, filters: list) -> bool:
+        """Whether a parsed row satisfies every `(column, op, value)` filter."""
+        for column, op, value in filters:
+            field = row
+            for name in column.split("."):
+                field = None if field is None else field[name]
+            if field is None:
+                return False
+            if op == "=":
+                matched = field == value
+            elif op == ">":
+                matched = field > value
+            elif op == ">=":
+                matched = field >= value
+            elif op == "<":
+                matched = field < value
+            elif op == "<=":
+                matched = field <= value
+            elif op == "in":
+                matched = field in value
+            else:
+                raise ValueError(f"Unsupported filter operator {op!r}")
+            if not matched:
+                return False
+        return True
+
+
+    # Table option listing the columns a batch read returns, comma-separated;
+    # nested struct fields are written as `parent.field`.
+    COLUMNS_OPTION = "lakeflow.columns"
+    # Table option through which the batch reader hands the columns it needs to
+    # `read_table`, as a JSON list of column paths.
+    PROJECTION_OPTION = "lakeflow.projection"
+
+
+    def prune_schema(schema: StructType, columns: list) -> StructType:
+        """
+        Keep only `columns` of `schema`, in schema order.
+
+        A column is a top-level name or a `parent.field` path into a struct
+        column. Unknown columns raise a ValueError.
+        """
+        selected = {}
+        for column in columns:
+            name, _, sub = column.partition(".")
+            if name not in schema.fieldNames():
+                raise ValueError(f"Unknown column '{column}'")
+            if not sub:
+                selected[name] = None
+                continue
+            data_type = schema[name].dataType
+            if not isinstance(data_type, StructType) or sub not in data_type.fieldNames():
+                raise ValueError(f"Unknown column '{column}'")
+            if name not in selected or selected[name] is not None:
+                selected.setdefault(name, set()).add(sub)
+
+        fields = []
+        for field in schema.fields:
+            if field.name not in selected:
+                continue
+            subfields = selected[field.name]
+            if subfields is None:
+                fields.append(field)
+            else:
+                fields.append(
+                    StructField(
+                        field.name,
+                        StructType([f for f in field.dataType.fields if f.name in subfields]),
+                        field.nullable,
+                        field.metadata,
+                    )
+                )
+        return StructType(fields)
+
+
+    def projection_paths(schema: StructType, full_schema: StructType) -> Optional[list]:
+        """
+        Describe a pruned `schema` as column paths of `full_schema`.
+
+        Returns None when nothing was pruned. Struct columns whose fields were
+        pruned are listed field by field as `parent.field`.
+        """
+        if schema == full_schema:
+            return None
+        paths = []
+        for field in schema.fields:
+            full_type = (
+                full_schema[field.name].dataType
+                if field.name in full_schema.fieldNames()
+                else None
+            )
+            if (
+                isinstance(field.dataType, StructType)
+                and isinstance(full_type, StructType)
+                and field.dataType != full_type
+            ):
+                paths.extend(f"{field.name}.{sub}" for sub in field.dataType.fieldNames())
+            else:
+                paths.append(field.name)
+        return paths
+
+
+    def projected_fields(table_options: Optional[dict], column: str) -> Optional[set]:
+        """
+        Fields of `column` a read has to return.
+
+        None means the whole column (or no projection was pushed down); an
+        empty set means the column is not read at all. For a struct column, the
+        set holds the names of its selected fields.
+        """
+        value = (table_options or {}).get(PROJECTION_OPTION)
+        if not value:
+            return None
+        fields = set()
+        for path in json.loads(value):
+            name, _, sub = path.partition(".")
+            if name != column:
+                continue
+            if not sub:
+                return None
+            fields.add(sub)
+        return fields
+
+
+    ########################################################
+    # libs/metrics.py
+    ########################################################
+
+    METRICS_PATH_OPTION = "lakeflow.metrics.path"
+    DEFAULT_METRICS_PATH = os.path.join(tempfile.gettempdir(), "lakeflow_metrics")
+
+    # Upper bounds (in milliseconds) of the request latency histogram buckets; the
+    # last bucket counts everything slower than the largest bound.
+    LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    # Path segments that look like identifiers are collapsed so that per-endpoint
+    # statistics do not grow with the number of records (e.g. /tickets/{id}/comments).
+    _ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,}|[A-Za-z]+_[A-Za-z0-9]{8,})$")
+
+
+    def endpoint_name(url: str) -> str:
+        """Return the path of a request URL with identifier segments replaced by {id}."""
+        path = urlparse(url).path or "/"
+        return "/".join(
+            "{id}" if _ID_SEGMENT.match(segment) else segment
+            for segment in path.split("/")
+        )
+
+
+    class ReadMetrics:
+        """
+        Counters describing the work done by a connector for one read.
+
+        Connectors report HTTP traffic by registering `on_response` as a requests
+        response hook (see `attach_metrics`) and call `record_retry` whenever they
+        retry a request. The shared read path adds the records emitted and the time
+        spent reading from the connector versus converting records to rows, then
+        takes a snapshot per micro-batch with `collect`.
+
+        Counters may be updated from several threads at once.
+        """
+
+        def __init__(self) -> None:
+            self._lock = threading.Lock()
+            self._reset()
+
+        def __getstate__(self) -> dict:
+            # Locks cannot be pickled; each process gets its own.
+            state = self.__dict__.copy()
+            del state["_lock"]
+            return state
+
+        def __setstate__(self, state: dict) -> None:
+            self.__dict__.update(state)
+            self._lock = threading.Lock()
+
+        def _reset(self) -> None:
+            self.requests = 0
+            self.retries = 0
+            self.throttled = 0
+            self.errors = 0
+            self.bytes_downloaded = 0
+            self.fetch_seconds = 0.0
+            self.records = 0
+            self.read_seconds = 0.0
+            self.parse_seconds = 0.0
+            self.endpoints = {}
+
+        def on_response(self, response, *args, **kwargs):
+            """requests response hook recording one HTTP round trip."""
+            elapsed = response.elapsed.total_seconds()
+            content_length = response.headers.get("Content-Length")
+            try:
+                size = int(content_length)
+            except (TypeError, ValueError):
+                size = len(response.content or b"")
+            endpoint = endpoint_name(response.url)
+            elapsed_ms = elapsed * 1000
+
+            with self._lock:
+                self.requests += 1
+                self.bytes_downloaded += size
+                self.fetch_seconds += elapsed
+                if response.status_code == 429:
+                    self.throttled += 1
+                elif response.status_code >= 400:
+                    self.errors += 1
+
+                stats = self.endpoints.get(endpoint)
+                if stats is None:
+                    stats = {
+                        "requests": 0,
+                        "total_ms": 0.0,
+                        "max_ms": 0.0,
+                        "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                    }
+                    self.endpoints[endpoint] = stats
+                stats["requests"] += 1
+                stats["total_ms"] += elapsed_ms
+                stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+                bucket = len(LATENCY_BUCKETS_MS)
+                for index, bound in enumerate(LATENCY_BUCKETS_MS):
+                    if elapsed_ms <= bound:
+                        bucket = index
+                        break
+                stats["buckets"][bucket] += 1
+            return response
+
+        def record_retry(self) -> None:
+            """Count a request that is about to be retried."""
+            with self._lock:
+                self.retries += 1
+
+        def record_read(self, records: int, read_seconds: float, parse_seconds: float):
+            """Add the records emitted by a read and where its time went."""
+            with self._lock:
+                self.records += records
+                self.read_seconds += read_seconds
+                self.parse_seconds += parse_seconds
+
+        def collect(self) -> dict:
+            """Return the counters gathered so far and start counting from zero."""
+            with self._lock:
+                snapshot = {
+                    "requests": self.requests,
+                    "retries": self.retries,
+                    "throttled": self.throttled,
+                    "errors": self.errors,
+                    "bytes_downloaded": self.bytes_downloaded,
+                    "records": self.records,
+                    "read_seconds": round(self.read_seconds, 6),
+                    "fetch_seconds": round(self.fetch_seconds, 6),
+                    "parse_seconds": round(self.parse_seconds, 6),
+                    "endpoints": [
+                        {
+                            "endpoint": endpoint,
+                            "requests": stats["requests"],
+                            "total_ms": round(stats["total_ms"], 3),
+                            "max_ms": round(stats["max_ms"], 3),
+                            "buckets": list(stats["buckets"]),
+                        }
+                        for endpoint, stats in sorted(self.endpoints.items())
+                    ],
+                }
+                self._reset()
+            return snapshot
+
+
+    def attach_metrics(session, metrics: ReadMetrics) -> None:
+        """Report every response received through a requests session to `metrics`."""
+        session.hooks["response"].append(metrics.on_response)
+
+
+    def timed_rows(
+        records: Iterable[Any],
+        convert,
+        metrics: ReadMetrics,
+        read_seconds: float,
+        on_complete=None,
+    ) -> Iterator[Any]:
+        """
+        Convert records lazily while measuring conversion time.
+
+        `read_seconds` is the time already spent producing `records`; time spent
+        pulling further records out of a lazy iterator is added to it. Once the
+        records are exhausted the totals are added to `metrics` and
+        `on_complete` (if given) is called.
+        """
+        count = 0
+        parse_seconds = 0.0
+        iterator = iter(records)
+        perf_counter = time.perf_counter
+        while True:
+            started = perf_counter()
+            try:
+                record = next(iterator)
+            except StopIteration:
+                read_seconds += perf_counter() - started
+                break
+            converted = perf_counter()
+            row = convert(record)
+            parse_seconds += perf_counter() - converted
+            read_seconds += converted - started
+            count += 1
+            yield row
+        metrics.record_read(count, read_seconds, parse_seconds)
+        if on_complete is not None:
+            on_complete()
+
+
+    def _metrics_file(directory: str, table_name: str) -> str:
+        return os.path.join(directory, f"{table_name}.jsonl".replace(os.sep, "_"))
+
+
+    def append_metrics_line(directory: str, table_name: str, line: dict) -> None:
+        """
+        Append one metrics line to the log of `table_name` in `directory`.
+
+        The line is written with a single call so concurrent readers of the same
+        table do not interleave their lines. Failing to write is ignored: metrics
+        must never fail the read itself.
+        """
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(_metrics_file(directory, table_name), "a") as f:
+                f.write(json.dumps(line, default=str) + "\n")
+        except OSError:
+            pass
+
+
+    def read_metrics_lines(directory: str, table_name: str) -> list[dict]:
+        """Return the metrics lines logged for `table_name`, oldest first."""
+        try:
+            with open(_metrics_file(directory, table_name)) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # A line cut short by a read that died while writing it.
+                continue
+        return records
+
+
+    ########################################################
+    # libs/profiling.py
+    ########################################################
+
+    PROFILE_OPTION = "lakeflow.profile"
+    # Directory the profiles are written to; it must be writable by the executors.
+    PROFILE_PATH_OPTION = "lakeflow.profile.path"
+    DEFAULT_PROFILE_PATH = os.path.join(tempfile.gettempdir(), "lakeflow_profiles")
+
+    # Functions whose cumulative time makes up each category of the breakdown, as
+    # (file name suffix or None for any file, function name pattern). C functions
+    # have the file name "~". Whatever is not in a category is time spent in the
+    # connector's own code.
+    PROFILE_CATEGORIES = {
+        "fetch_seconds": [("requests/sessions.py", r"send")],
+        "json_decode_seconds": [
+            ("json/decoder.py", r"decode"),
+            ("~", r"<orjson\.loads>"),
+            ("~", r"<msgspec\..*decode>"),
+        ],
+        "parse_seconds": [(None, r"parse_value")],
+    }
+
+    # Number of functions listed in the JSON summary of a profile.
+    _TOP_FUNCTIONS = 30
+
+
+    def profile_breakdown(stats: pstats.Stats, total_seconds: float) -> dict:
+        """
+        Split the profiled time into fetching, JSON decoding, `parse_value`
+        conversion and the connector's own code (`connector_seconds`).
+        """
+        breakdown = {category: 0.0 for category in PROFILE_CATEGORIES}
+        for (filename, _, function), (_, _, _, cumulative, _) in stats.stats.items():
+            normalized = filename.replace(os.sep, "/")
+            for category, functions in PROFILE_CATEGORIES.items():
+                for suffix, name in functions:
+                    if re.fullmatch(name, function) and (
+                        suffix is None or normalized.endswith(suffix)
+                    ):
+                        breakdown[category] += cumulative
+        breakdown["connector_seconds"] = max(total_seconds - sum(breakdown.values()), 0.0)
+        breakdown["total_seconds"] = total_seconds
+        return {key: round(value, 6) for key, value in breakdown.items()}
+
+
+    class ReadProfiler:
+        """
+        Profiles one read with cProfile when `lakeflow.profile` is enabled.
+
+        Use the profiler as a context manager around the `read_table` call and
+        pass the rows returned to Spark through `rows`, which profiles pulling
+        (and converting) every record. Once the rows are exhausted the profile is
+        written to `lakeflow.profile.path` as `<name>.prof` (load it with
+        `pstats` or snakeviz) with a `<name>.json` summary holding the time
+        breakdown and the most expensive functions, and the summary is printed
+        as a JSON line with `"event": "lakeflow_connect_profile"`.
+
+        When profiling is disabled every method is a pass-through.
+        """
+
+        def __init__(self, options: dict, read_kind: str, **context) -> None:
+            self.enabled = str(options.get(PROFILE_OPTION, "false")).lower() == "true"
+            self.directory = options.get(PROFILE_PATH_OPTION) or DEFAULT_PROFILE_PATH
+            self.table_name = options.get("tableName")
+            self.read_kind = read_kind
+            self.context = context
+            self.seconds = 0.0
+            self._profile = cProfile.Profile() if self.enabled else None
+            self._started = None
+
+        def __enter__(self) -> "ReadProfiler":
+            if self.enabled:
+                self._started = time.perf_counter()
+                self._profile.enable()
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            if self.enabled:
+                self._profile.disable()
+                self.seconds += time.perf_counter() - self._started
+
+        def rows(self, rows: Iterable[Any]) -> Iterable[Any]:
+            """Profile iterating `rows`, then write the profile."""
+            if not self.enabled:
+                return rows
+            return self._profiled_rows(rows)
+
+        def _profiled_rows(self, rows: Iterable[Any]) -> Iterator[Any]:
+            iterator = iter(rows)
+            while True:
+                with self:
+                    try:
+                        row = next(iterator)
+                    except StopIteration:
+                        break
+                yield row
+            self.dump()
+
+        def _file_prefix(self) -> str:
+            parts = [self.table_name or "table", self.read_kind]
+            partition = _partition_id()
+            if partition is not None:
+                parts.append(f"p{partition}")
+            parts += [time.strftime("%Y%m%dT%H%M%S"), uuid.uuid4().hex[:8]]
+            name = "-".join(str(part) for part in parts)
+            return os.path.join(self.directory, name.replace(os.sep, "_"))
+
+        def dump(self) -> Optional[dict]:
+            """Write the profile and its summary; returns the summary."""
+            if not self.enabled:
+                return None
+            stats = pstats.Stats(self._profile)
+            summary = {
+                "event": "lakeflow_connect_profile",
+                "table": self.table_name,
+                "read": self.read_kind,
+                **self.context,
+                **profile_breakdown(stats, self.seconds),
+                "top_functions": [
+                    {
+                        "function": f"{filename}:{line}({function})",
+                        "calls": calls,
+                        "tottime": round(own, 6),
+                        "cumtime": round(cumulative, 6),
+                    }
+                    for (filename, line, function), (_, calls, own, cumulative, _) in sorted(
+                        stats.stats.items(), key=lambda item: item[1][3], reverse=True
+                    )[:_TOP_FUNCTIONS]
+                ],
+            }
+            prefix = self._file_prefix()
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                stats.dump_stats(f"{prefix}.prof")
+                with open(f"{prefix}.json", "w") as f:
+                    json.dump(summary, f, indent=2, default=str)
+                summary["path"] = f"{prefix}.prof"
+            except OSError as e:
+                # Profiling must never fail the read itself.
+                summary["error"] = f"Could not write profile to {self.directory}: {e}"
+            print(
+                json.dumps(
+                    {k: v for k, v in summary.items() if k != "top_functions"},
+                    default=str,
+                )
+            )
+            return summary
+
+
+    def _partition_id() -> Optional[int]:
+        """The Spark partition being read, when running inside a task."""
+        try:
+            from pyspark import TaskContext
+
+            context = TaskContext.get()
+        except Exception:
+            return None
+        return context.partitionId() if context is not None else None
+
+
     ########################################################
     # sources/mixpanel/mixpanel.py
     ########################################################
@@ -189,10 +952,14 @@ def register_lakeflow_source(spark):
                     "Authorization": "Basic " + base64.b64encode(auth_str.encode()).decode(),
                     "Content-Type": "application/json",
                 }
-                print(self.auth_header)
             else:
                 raise ValueError("Authentication credentials required: either (username, secret) or api_secret")
 
+            # Reuse connections across requests and count them per micro-batch
+            self._session = requests.Session()
+            self.metrics = ReadMetrics()
+            attach_metrics(self._session, self.metrics)
+
             # Configuration options
             self.region = options.get("region", "US")
             self.timezone = options.get("project_timezone", "US/Pacific")
@@ -207,6 +974,11 @@ def register_lakeflow_source(spark):
             else:
                 self.base_url = "https://data.mixpanel.com/api/2.0"
                 self.cohorts_base_url = "https://mixpanel.com/api"
+            # Explicit overrides, e.g. for a proxy or a local replay server
+            self.base_url = options.get("base_url", self.base_url).rstrip("/")
+            self.cohorts_base_url = options.get(
+                "cohorts_base_url", self.cohorts_base_url
+            ).rstrip("/")
 
             # Cache for schemas
             self._schema_cache = {}
@@ -216,6 +988,13 @@ def register_lakeflow_source(spark):
             Parse datetime string with multiple format support
             Supports: %Y-%m-%dT%H:%M:%S, %Y-%m-%d %H:%M:%S, %Y-%m-%dT%H:%M:%SZ
             """
+            # Fast path: the shared ISO 8601 parser, which reads timestamps without
+            # an offset as UTC. The result is a naive UTC datetime, like the
+            # strptime formats below.
+            epoch = iso8601_to_epoch(datetime_str)
+            if epoch is not None:
+                return datetime.fromtimestamp(epoch, timezone.utc).replace(tzinfo=None)
+
             # Support multiple datetime formats
             datetime_formats = [
                 "%Y-%m-%dT%H:%M:%S",
@@ -462,6 +1241,59 @@ def register_lakeflow_source(spark):
 
             return metadata[table_name]
 
+        def supported_filters(
+            self, table_name: str, table_options: dict[str, str]
+        ) -> dict[str, tuple[str, ...]]:
+            """
+            Filters of batch queries that map to export API parameters.
+
+            For `events`, `event` equalities become the `event` parameter, a lower
+            bound on `properties.time` moves `from_date` forward, and equalities on
+            the other standard string and integer properties become a `where`
+            expression.
+            """
+            if table_name != "events":
+                return {}
+            supported = {"event": ("=", "in"), "properties.time": (">", ">=")}
+            properties = self.get_table_schema("events", table_options)["properties"]
+            for field in properties.dataType.fields:
+                if field.name != "time" and isinstance(
+                    field.dataType, (StringType, LongType)
+                ):
+                    supported[f"properties.{field.name}"] = ("=",)
+            return supported
+
+        def _events_filter_params(self, table_options: dict[str, str]) -> tuple[dict, str]:
+            """
+            Turn pushed-down filters into export parameters.
+
+            Returns the `event`/`where` parameters and the earliest `from_date`
+            the filters allow (None without a time bound).
+            """
+            params = {}
+            events = None
+            conditions = []
+            from_date = None
+            for column, op, value in pushed_filters(table_options):
+                if column == "event":
+                    values = set(value) if op == "in" else {value}
+                    events = values if events is None else events & values
+                elif column == "properties.time":
+                    # Export dates are in the project's timezone; start a day
+                    # early so no timezone can push matching events before it.
+                    day = datetime.fromtimestamp(value - 86400, tz=timezone.utc).strftime(
+                        "%Y-%m-%d"
+                    )
+                    from_date = max(from_date or day, day)
+                elif column.startswith("properties.") and op == "=":
+                    name = column[len("properties."):]
+                    conditions.append(f"properties[{json.dumps(name)}] == {json.dumps(value)}")
+            if events is not None:
+                params["event"] = json.dumps(sorted(events))
+            if conditions:
+                params["where"] = " and ".join(conditions)
+            return params, from_date
+
         def read_table(
             self, table_name: str, start_offset: dict, table_options: dict[str, str]
         ) -> (Iterator[dict], dict):
@@ -479,26 +1311,32 @@ def register_lakeflow_source(spark):
                 start_offset = {}
 
             if table_name == "events":
-                return self._read_events_table(start_offset)
+                return self._read_events_table(start_offset, table_options)
             elif table_name == "cohorts":
                 return self._read_cohorts_table(start_offset)
             elif table_name == "cohort_members":
                 return self._read_cohort_members_table(start_offset)
             elif table_name == "engage":
-                return self._read_engage_table(start_offset)
+                return self._read_engage_table(start_offset, table_options)
             else:
                 raise ValueError(f"Unknown table: {table_name}")
 
-        def _read_events_table(self, start_offset: dict) -> (Iterator[dict], dict):
+        def _read_events_table(
+            self, start_offset: dict, table_options: dict[str, str] = None
+        ) -> (Iterator[dict], dict):
             """
             Read ALL events data from start_date to today using multiple 7-day API calls
             """
             # Extract offset information, handle None offset
             start_date = start_offset.get("start_date") if start_offset else None
+            filter_params, filter_from_date = self._events_filter_params(table_options)
 
             if not start_date:
                 # For initial snapshot, start from configured historical days ago
                 start_date = (datetime.now() - timedelta(days=self.historical_days)).strftime("%Y-%m-%d")
+                # A pushed-down time bound can skip the days before it
+                if filter_from_date and filter_from_date > start_date:
+                    start_date = filter_from_date
 
             # End date is today (inclusive)
             today = datetime.now().strftime("%Y-%m-%d")
@@ -524,6 +1362,7 @@ def register_lakeflow_source(spark):
                 params = {
                     "from_date": current_start,
                     "to_date": chunk_end,
+                    **filter_params,
                 }
 
                 # Only add project_id for service account authentication (username + secret)
@@ -537,12 +1376,13 @@ def register_lakeflow_source(spark):
                     if total_api_calls > 0:
                         time.sleep(0.34)  # Slightly more than 1/3 second to stay under 3 req/sec
 
-                    response = requests.get(url, params=params, headers=self.auth_header, timeout=120)
+                    response = self._session.get(url, params=params, headers=self.auth_header, timeout=120)
                     response.raise_for_status()
                     total_api_calls += 1
 
-                    # Mixpanel export returns JSONL format
-                    response_lines = response.text.strip().split('\n')
+                    # Mixpanel export returns JSONL format; decode each line from
+                    # the raw bytes rather than building a str of the whole body.
+                    response_lines = response.content.strip().split(b'\n')
                     total_lines = len(response_lines)
                     non_empty_lines = len([line for line in response_lines if line.strip()])
                     chunk_records = 0
@@ -553,7 +1393,7 @@ def register_lakeflow_source(spark):
                     for line_num, line in enumerate(response_lines):
                         if line.strip():
                             try:
-                                event = json.loads(line)
+                                event = json_loads(line)
 
                                 # Process event to separate standard and custom properties
                                 processed_event = self._process_event(event)
@@ -563,7 +1403,7 @@ def register_lakeflow_source(spark):
                             except json.JSONDecodeError as e:
                                 json_errors += 1
                                 print(f"JSON decode error on line {line_num + 1}: {e}")
-                                print(f"Problematic line (first 100 chars): {line[:100]}")
+                                print(f"Problematic line (first 100 chars): {line[:100].decode(errors='replace')}")
                                 continue
 
                     print(f"Fetched {chunk_records} events from {current_start} to {chunk_end} ({json_errors} JSON errors)")
@@ -593,6 +1433,19 @@ def register_lakeflow_source(spark):
 
             return record_iterator(), next_offset
 
+        def _engage_output_properties(self, table_options: dict[str, str]) -> list:
+            """
+            Profile properties a batch query selects, for `output_properties`.
+
+            Returns None (all properties) unless the query prunes `$properties`
+            to standard properties only; custom properties cannot be named in
+            advance. `$last_seen` is always requested for the incremental cursor.
+            """
+            selected = projected_fields(table_options, "$properties")
+            if selected is None or "custom_properties" in selected:
+                return None
+            return sorted(selected | {"$last_seen"})
+
         def _read_cohorts_table(self, start_offset: dict) -> (Iterator[dict], dict):
             """
             Read all cohorts data (full refresh/snapshot).
@@ -603,9 +1456,9 @@ def register_lakeflow_source(spark):
             records = []
 
             try:
-                response = requests.post(url, headers=self.auth_header, timeout=30)
+                response = self._session.post(url, headers=self.auth_header, timeout=30)
                 response.raise_for_status()
-                data = response.json()
+                data = response_json(response)
 
                 # Handle both response formats: list directly or dict with "cohorts" key
                 cohorts = data if isinstance(data, list) else data.get("cohorts", [])
@@ -636,9 +1489,9 @@ def register_lakeflow_source(spark):
 
             try:
                 # Fetch all cohorts
-                response = requests.post(url, headers=self.auth_header, timeout=30)
+                response = self._session.post(url, headers=self.auth_header, timeout=30)
                 response.raise_for_status()
-                cohorts_data = response.json()
+                cohorts_data = response_json(response)
 
                 # Handle both response formats: list directly or dict with "cohorts" key
                 cohorts = cohorts_data if isinstance(cohorts_data, list) else cohorts_data.get("cohorts", [])
@@ -659,14 +1512,14 @@ def register_lakeflow_source(spark):
                         params["project_id"] = self.project_id
 
                     try:
-                        members_response = requests.post(
+                        members_response = self._session.post(
                             members_url, 
                             params=params, 
                             headers=self.auth_header, 
                             timeout=60
                         )
                         members_response.raise_for_status()
-                        members_data = members_response.json()
+                        members_data = response_json(members_response)
 
                         # Extract distinct_id from each member
                         for member in members_data.get("results", []):
@@ -696,7 +1549,9 @@ def register_lakeflow_source(spark):
             # For snapshot tables, return the same offset (no incremental cursor)
             return iter(records), start_offset if start_offset else {}
 
-        def _read_engage_table(self, start_offset: dict) -> (Iterator[dict], dict):
+        def _read_engage_table(
+            self, start_offset: dict, table_options: dict[str, str] = None
+        ) -> (Iterator[dict], dict):
             """
             Read engage (people profiles) data with incremental loading and pagination
             """
@@ -728,12 +1583,15 @@ def register_lakeflow_source(spark):
             # Only add project_id for service account authentication (username + secret)
             if self.project_id and hasattr(self, 'username') and hasattr(self, 'secret'):
                 params["project_id"] = self.project_id
+            output_properties = self._engage_output_properties(table_options)
+            if output_properties is not None:
+                params["output_properties"] = json.dumps(output_properties)
 
             while True:
                 try:
-                    response = requests.post(url, params=params, headers=self.auth_header, timeout=30)
+                    response = self._session.post(url, params=params, headers=self.auth_header, timeout=30)
                     response.raise_for_status()
-                    data = response.json()
+                    data = response_json(response)
 
                     if not data.get("results"):
                         break
@@ -801,16 +1659,125 @@ def register_lakeflow_source(spark):
     ########################################################
 
     METADATA_TABLE = "_lakeflow_metadata"
+    METRICS_TABLE = "_lakeflow_metrics"
     TABLE_NAME = "tableName"
     TABLE_NAME_LIST = "tableNameList"
+    # Set to "false" to stop logging (and saving) a metrics line per micro-batch.
+    METRICS_LOG_OPTION = "lakeflow.metrics"
+    # Set to "true" to read micro-batches with LakeflowPartitionedStreamReader.
+    PARTITIONED_STREAM_OPTION = "lakeflow.partitionedStream"
+    # Connector methods a partitioned stream needs.
+    PARTITIONED_STREAM_METHODS = ("latest_offset", "partition_offsets", "read_offset_range")
+    # Pseudo-table that reads the tables in `tableNameList` from one sweep of the
+    # first one, through the connector's `read_co_read`.
+    CO_READ_TABLE = "_lakeflow_co_read"
+
+    METRICS_SCHEMA = StructType(
+        [
+            StructField("tableName", StringType(), False),
+            StructField("requests", LongType(), True),
+            StructField("retries", LongType(), True),
+            StructField("throttled", LongType(), True),
+            StructField("errors", LongType(), True),
+            StructField("bytes_downloaded", LongType(), True),
+            StructField("records", LongType(), True),
+            StructField("read_seconds", DoubleType(), True),
+            StructField("fetch_seconds", DoubleType(), True),
+            StructField("parse_seconds", DoubleType(), True),
+            StructField(
+                "endpoints",
+                ArrayType(
+                    StructType(
+                        [
+                            StructField("endpoint", StringType(), True),
+                            StructField("requests", LongType(), True),
+                            StructField("total_ms", DoubleType(), True),
+                            StructField("max_ms", DoubleType(), True),
+                            StructField("buckets", ArrayType(LongType()), True),
+                        ]
+                    )
+                ),
+                True,
+            ),
+            StructField("logged_at", TimestampType(), True),
+            StructField("start_offset", StringType(), True),
+            StructField("end_offset", StringType(), True),
+        ]
+    )
+
+
+    def _log_metrics(options: dict[str, str], metrics: dict, **context) -> None:
+        """
+        Print the metrics of one read as a single JSON line, and append it to the
+        table's metrics log for `_lakeflow_metrics`.
+        """
+        if options.get(METRICS_LOG_OPTION, "true").lower() == "false":
+            return
+        line = {
+            "event": "lakeflow_connect_metrics",
+            "table": options.get(TABLE_NAME),
+            "logged_at": datetime.now(timezone.utc).isoformat(),
+            **context,
+            **metrics,
+        }
+        append_metrics_line(
+            options.get(METRICS_PATH_OPTION) or DEFAULT_METRICS_PATH,
+            options.get(TABLE_NAME),
+            line,
+        )
+        print(json.dumps(line, default=str))
+
+
+    def co_read_schema(table_schemas: dict) -> StructType:
+        """
+        Schema of the co-read pseudo-table: the name of the table a row belongs
+        to, then one struct column per table holding its records.
+        """
+        return StructType(
+            [StructField(TABLE_NAME, StringType(), False)]
+            + [
+                StructField(table, schema, True)
+                for table, schema in table_schemas.items()
+            ]
+        )
+
+
+    class LakeflowCoRead:
+        """
+        Reads the co-read pseudo-table through a connector's `read_co_read`.
+
+        `read_co_read(table_names, start_offset, table_options)` returns
+        `(table_name, record)` pairs and one offset for the whole sweep. Each pair
+        becomes a row of `co_read_schema`, so the readers can treat the sweep as
+        a single table.
+        """
+
+        def __init__(self, lakeflow_connect: LakeflowConnect, table_names: list[str]):
+            if not hasattr(lakeflow_connect, "read_co_read"):
+                raise ValueError(
+                    f"{CO_READ_TABLE} needs a connector that implements read_co_read"
+                )
+            if not table_names:
+                raise ValueError(f"{CO_READ_TABLE} needs a {TABLE_NAME_LIST}")
+            self.lakeflow_connect = lakeflow_connect
+            self.table_names = table_names
+
+        def read_table(
+            self, table_name: str, start_offset: dict, table_options: dict[str, str]
+        ) -> (Iterator[dict], dict):
+            records, offset = self.lakeflow_connect.read_co_read(
+                self.table_names, start_offset, table_options
+            )
+            return ({TABLE_NAME: name, name: record} for name, record in records), offset
 
 
     class LakeflowStreamReader(SimpleDataSourceStreamReader):
         """
         Implements a data source stream reader for Lakeflow Connect.
-        Currently, only the simpleStreamReader is implemented, which uses a
-        more generic protocol suitable for most data sources that support
-        incremental loading.
+        This is the default simpleStreamReader, which uses a more generic
+        protocol suitable for most data sources that support incremental
+        loading. Every micro-batch is read by a single reader on the driver;
+        see LakeflowPartitionedStreamReader for connectors that can split one.
         """
 
         def __init__(
@@ -818,20 +1785,36 @@ def register_lakeflow_source(spark):
             options: dict[str, str],
             schema: StructType,
             lakeflow_connect: LakeflowConnect,
+            metrics: ReadMetrics,
         ):
             self.options = options
             self.lakeflow_connect = lakeflow_connect
             self.schema = schema
+            self.metrics = metrics
 
         def initialOffset(self):
             return {}
 
         def read(self, start: dict) -> (Iterator[tuple], dict):
-            records, offset = self.lakeflow_connect.read_table(
-                self.options["tableName"], start, self.options
+            profiler = ReadProfiler(self.options, "stream", start_offset=start)
+            started = time.perf_counter()
+            with profiler:
+                records, offset = self.lakeflow_connect.read_table(
+                    self.options["tableName"], start, self.options
+                )
+            rows = timed_rows(
+                records,
+                lambda x: parse_value(x, self.schema),
+                self.metrics,
+                time.perf_counter() - started,
+                on_complete=lambda: _log_metrics(
+                    self.options,
+                    self.metrics.collect(),
+                    start_offset=start,
+                    end_offset=offset,
+                ),
             )
-            rows = map(lambda x: parse_value(x, self.schema), records)
-            return rows, offset
+            return profiler.rows(rows), offset
 
         def readBetweenOffsets(self, start: dict, end: dict) -> Iterator[tuple]:
             # TODO: This does not ensure the records returned are identical across repeated calls.
@@ -842,33 +1825,208 @@ def register_lakeflow_source(spark):
             return self.read(start)[0]
 
 
+    class LakeflowPartitionedStreamReader(DataSourceStreamReader):
+        """
+        Stream reader that splits every micro-batch into partitions read by the
+        executors in parallel.
+
+        Used instead of LakeflowStreamReader when the `lakeflow.partitionedStream`
+        option is `true`. The driver only plans: the connector's `latest_offset`
+        picks the end offset of the next micro-batch without reading records, and
+        `partition_offsets` splits the range between two offsets into independent
+        `(start, end)` pairs (per repository, per time window, ...). Each
+        executor then reads one pair with `read_offset_range`.
+        """
+
+        def __init__(
+            self,
+            options: dict[str, str],
+            schema: StructType,
+            lakeflow_connect: LakeflowConnect,
+            metrics: ReadMetrics,
+        ):
+            self.options = options
+            self.schema = schema
+            self.lakeflow_connect = lakeflow_connect
+            self.metrics = metrics
+            self.table_name = options[TABLE_NAME]
+            # Last planned offset, the start of the next micro-batch on runtimes
+            # that call latestOffset() without one.
+            self.latest = None
+
+        def initialOffset(self):
+            return {}
+
+        def latestOffset(self, start: dict = None, limit=None) -> dict:
+            if start is None:
+                start = self.latest if self.latest is not None else self.initialOffset()
+            self.latest = self.lakeflow_connect.latest_offset(
+                self.table_name, start, self.options
+            )
+            return self.latest
+
+        def partitions(self, start: dict, end: dict):
+            return [
+                InputPartition({"start": part_start, "end": part_end})
+                for part_start, part_end in self.lakeflow_connect.partition_offsets(
+                    self.table_name, start, end, self.options
+                )
+            ]
+
+        def read(self, partition) -> Iterator[tuple]:
+            start, end = partition.value["start"], partition.value["end"]
+            profiler = ReadProfiler(self.options, "stream", start_offset=start)
+            started = time.perf_counter()
+            with profiler:
+                records = self.lakeflow_connect.read_offset_range(
+                    self.table_name, start, end, self.options
+                )
+            rows = timed_rows(
+                records,
+                lambda x: parse_value(x, self.schema),
+                self.metrics,
+                time.perf_counter() - started,
+                on_complete=lambda: _log_metrics(
+                    self.options,
+                    self.metrics.collect(),
+                    start_offset=start,
+                    end_offset=end,
+                ),
+            )
+            return profiler.rows(rows)
+
+        def commit(self, end: dict) -> None:
+            pass
+
+
     class LakeflowBatchReader(DataSourceReader):
         def __init__(
             self,
             options: dict[str, str],
             schema: StructType,
             lakeflow_connect: LakeflowConnect,
+            metrics: ReadMetrics,
         ):
             self.options = options
             self.schema = schema
             self.lakeflow_connect = lakeflow_connect
+            self.metrics = metrics
             self.table_name = options[TABLE_NAME]
+            # `(column, op, value)` filters accepted by `pushFilters`
+            self.pushed_filters = []
+            # Columns read when `lakeflow.columns` pruned `schema`, else None.
+            # Without the option the table's schema is not looked up again: for
+            # some connectors that costs API calls (e.g. HubSpot property
+            # discovery), and a schema given by the user is passed through as is.
+            self.projection = None
+            if self.table_name not in (
+                METADATA_TABLE,
+                METRICS_TABLE,
+                CO_READ_TABLE,
+            ) and options.get(COLUMNS_OPTION):
+                self.projection = projection_paths(
+                    schema, lakeflow_connect.get_table_schema(self.table_name, options)
+                )
+
+        def pushFilters(self, filters):
+            """
+            Push down the filters the connector can turn into API parameters.
+
+            Connectors opt in with `supported_filters(table_name, table_options)`,
+            which maps column names to the operators they accept. Accepted
+            filters are passed to `read_table` in the `lakeflow.pushedFilters`
+            option so the connector can narrow its requests, and rows that do
+            not match them are dropped after parsing. The other filters are
+            returned to Spark.
+            """
+            supported_filters = getattr(self.lakeflow_connect, "supported_filters", None)
+            if supported_filters is None or self.table_name in (
+                METADATA_TABLE,
+                METRICS_TABLE,
+            ):
+                return filters
+            supported = supported_filters(self.table_name, self.options) or {}
+            unhandled = []
+            for spark_filter in filters:
+                pushed = to_pushed_filter(spark_filter)
+                if pushed is not None and pushed[1] in supported.get(pushed[0], ()):
+                    self.pushed_filters.append(pushed)
+                else:
+                    unhandled.append(spark_filter)
+            return unhandled
+
+        def partitions(self):
+            # Metadata lookups can each cost API calls, so give every table its
+            # own partition; resolution then takes as long as the slowest table
+            # rather than the sum of all of them.
+            if self.table_name in (METADATA_TABLE, METRICS_TABLE):
+                table_names = self._metadata_table_names()
+                if table_names:
+                    return [InputPartition(table) for table in table_names]
+            return [InputPartition(None)]
 
         def read(self, partition):
             all_records = []
-            if self.table_name == METADATA_TABLE:
-                all_records = self._read_table_metadata()
-            else:
+            if self.table_name in (METADATA_TABLE, METRICS_TABLE):
+                table_names = self._metadata_table_names()
+                if partition is not None and partition.value is not None:
+                    table_names = [partition.value]
+                if self.table_name == METRICS_TABLE:
+                    all_records = self._read_table_metrics(table_names)
+                else:
+                    all_records = self._read_table_metadata(table_names)
+                return iter(map(lambda x: parse_value(x, self.schema), all_records))
+
+            options = dict(self.options)
+            if self.pushed_filters:
+                options[PUSHED_FILTERS_OPTION] = json.dumps(self.pushed_filters)
+            if self.projection is not None:
+                options[PROJECTION_OPTION] = json.dumps(self.projection)
+            profiler = ReadProfiler(self.options, "batch")
+            started = time.perf_counter()
+            with profiler:
                 all_records, _ = self.lakeflow_connect.read_table(
-                    self.table_name, None, self.options
+                    self.table_name, None, options
                 )
+            rows = timed_rows(
+                all_records,
+                lambda x: parse_value(x, self.schema),
+                self.metrics,
+                time.perf_counter() - started,
+                on_complete=lambda: _log_metrics(self.options, self.metrics.collect()),
+            )
+            if self.pushed_filters:
+                rows = (row for row in rows if matches_filters(row, self.pushed_filters))
+            return profiler.rows(rows)
 
-            rows = map(lambda x: parse_value(x, self.schema), all_records)
-            return iter(rows)
-
-        def _read_table_metadata(self):
+        def _metadata_table_names(self) -> list[str]:
             table_name_list = self.options.get(TABLE_NAME_LIST, "")
-            table_names = [o.strip() for o in table_name_list.split(",") if o.strip()]
+            return [o.strip() for o in table_name_list.split(",") if o.strip()]
+
+        def _read_table_metrics(self, table_names: list[str]):
+            """
+            Return the metrics logged by the reads of each table, one row per
+            micro-batch (or batch read), oldest first. Nothing is read from the
+            source; stream offsets are returned as JSON strings.
+            """
+            directory = self.options.get(METRICS_PATH_OPTION) or DEFAULT_METRICS_PATH
+            all_records = []
+            for table in table_names:
+                for line in read_metrics_lines(directory, table):
+                    all_records.append(
+                        {
+                            **line,
+                            "tableName": table,
+                            **{
+                                key: json.dumps(line[key])
+                                for key in ("start_offset", "end_offset")
+                                if key in line
+                            },
+                        }
+                    )
+            return all_records
+
+        def _read_table_metadata(self, table_names: list[str]):
             all_records = []
             for table in table_names:
                 metadata = self.lakeflow_connect.read_table_metadata(table, self.options)
@@ -880,6 +2038,11 @@ def register_lakeflow_source(spark):
         def __init__(self, options):
             self.options = options
             self.lakeflow_connect = LakeflowConnect(options)
+            # Connectors that instrument their HTTP calls expose a `metrics`
+            # attribute; the others still get record and timing counters.
+            self.metrics = getattr(self.lakeflow_connect, "metrics", None)
+            if not isinstance(self.metrics, ReadMetrics):
+                self.metrics = ReadMetrics()
 
         @classmethod
         def name(cls):
@@ -896,15 +2059,67 @@ def register_lakeflow_source(spark):
                         StructField("ingestion_type", StringType(), True),
                     ]
                 )
+            elif table == METRICS_TABLE:
+                return METRICS_SCHEMA
+            elif table == CO_READ_TABLE:
+                return co_read_schema(
+                    {
+                        name: self.lakeflow_connect.get_table_schema(name, self.options)
+                        for name in self._table_name_list()
+                    }
+                )
             else:
                 # Assuming the LakeflowConnect interface uses get_table_schema, not get_table_details
-                return self.lakeflow_connect.get_table_schema(table, self.options)
+                schema = self.lakeflow_connect.get_table_schema(table, self.options)
+                columns = self.options.get(COLUMNS_OPTION)
+                if columns:
+                    schema = prune_schema(
+                        schema, [c.strip() for c in columns.split(",") if c.strip()]
+                    )
+                return schema
 
         def reader(self, schema: StructType):
-            return LakeflowBatchReader(self.options, schema, self.lakeflow_connect)
+            return LakeflowBatchReader(
+                self.options, schema, self._table_reader(), self.metrics
+            )
+
+        def streamReader(self, schema: StructType):
+            # Without the option, the base class raises the not-implemented error
+            # that makes Spark fall back to simpleStreamReader.
+            if self.options.get(PARTITIONED_STREAM_OPTION, "false").lower() != "true":
+                return super().streamReader(schema)
+            if self.options[TABLE_NAME] == CO_READ_TABLE:
+                raise ValueError(
+                    f"{PARTITIONED_STREAM_OPTION} does not apply to {CO_READ_TABLE}"
+                )
+            missing = [
+                method
+                for method in PARTITIONED_STREAM_METHODS
+                if not hasattr(self.lakeflow_connect, method)
+            ]
+            if missing:
+                raise ValueError(
+                    f"{PARTITIONED_STREAM_OPTION} is set, but the connector does not "
+                    f"implement {', '.join(missing)}"
+                )
+            return LakeflowPartitionedStreamReader(
+                self.options, schema, self.lakeflow_connect, self.metrics
+            )
 
         def simpleStreamReader(self, schema: StructType):
-            return LakeflowStreamReader(self.options, schema, self.lakeflow_connect)
+            return LakeflowStreamReader(
+                self.options, schema, self._table_reader(), self.metrics
+            )
+
+        def _table_name_list(self) -> list[str]:
+            table_name_list = self.options.get(TABLE_NAME_LIST, "")
+            return [o.strip() for o in table_name_list.split(",") if o.strip()]
+
+        def _table_reader(self):
+            """The object whose `read_table` serves `tableName`."""
+            if self.options[TABLE_NAME] == CO_READ_TABLE:
+                return LakeflowCoRead(self.lakeflow_connect, self._table_name_list())
+            return self.lakeflow_connect
 
 
     spark.dataSource.register(LakeflowSource)
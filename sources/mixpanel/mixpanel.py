@@ -2,10 +2,19 @@ import requests
 import base64
 import json
 from pyspark.sql.types import *
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Iterator, Any
 import time
 
+from libs.metrics import ReadMetrics, attach_metrics
+from libs.utils import (
+    iso8601_to_epoch,
+    json_loads,
+    projected_fields,
+    pushed_filters,
+    response_json,
+)
+
 
 class LakeflowConnect:
     # Constants
@@ -32,10 +41,14 @@ class LakeflowConnect:
                 "Authorization": "Basic " + base64.b64encode(auth_str.encode()).decode(),
                 "Content-Type": "application/json",
             }
-            print(self.auth_header)
         else:
             raise ValueError("Authentication credentials required: either (username, secret) or api_secret")
         
+        # Reuse connections across requests and count them per micro-batch
+        self._session = requests.Session()
+        self.metrics = ReadMetrics()
+        attach_metrics(self._session, self.metrics)
+
         # Configuration options
         self.region = options.get("region", "US")
         self.timezone = options.get("project_timezone", "US/Pacific")
@@ -50,6 +63,11 @@ class LakeflowConnect:
         else:
             self.base_url = "https://data.mixpanel.com/api/2.0"
             self.cohorts_base_url = "https://mixpanel.com/api"
+        # Explicit overrides, e.g. for a proxy or a local replay server
+        self.base_url = options.get("base_url", self.base_url).rstrip("/")
+        self.cohorts_base_url = options.get(
+            "cohorts_base_url", self.cohorts_base_url
+        ).rstrip("/")
         
         # Cache for schemas
         self._schema_cache = {}
@@ -59,6 +77,13 @@ class LakeflowConnect:
         Parse datetime string with multiple format support
         Supports: %Y-%m-%dT%H:%M:%S, %Y-%m-%d %H:%M:%S, %Y-%m-%dT%H:%M:%SZ
         """
+        # Fast path: the shared ISO 8601 parser, which reads timestamps without
+        # an offset as UTC. The result is a naive UTC datetime, like the
+        # strptime formats below.
+        epoch = iso8601_to_epoch(datetime_str)
+        if epoch is not None:
+            return datetime.fromtimestamp(epoch, timezone.utc).replace(tzinfo=None)
+
         # Support multiple datetime formats
         datetime_formats = [
             "%Y-%m-%dT%H:%M:%S",
@@ -305,6 +330,59 @@ class LakeflowConnect:
         
         return metadata[table_name]
 
+    def supported_filters(
+        self, table_name: str, table_options: dict[str, str]
+    ) -> dict[str, tuple[str, ...]]:
+        """
+        Filters of batch queries that map to export API parameters.
+
+        For `events`, `event` equalities become the `event` parameter, a lower
+        bound on `properties.time` moves `from_date` forward, and equalities on
+        the other standard string and integer properties become a `where`
+        expression.
+        """
+        if table_name != "events":
+            return {}
+        supported = {"event": ("=", "in"), "properties.time": (">", ">=")}
+        properties = self.get_table_schema("events", table_options)["properties"]
+        for field in properties.dataType.fields:
+            if field.name != "time" and isinstance(
+                field.dataType, (StringType, LongType)
+            ):
+                supported[f"properties.{field.name}"] = ("=",)
+        return supported
+
+    def _events_filter_params(self, table_options: dict[str, str]) -> tuple[dict, str]:
+        """
+        Turn pushed-down filters into export parameters.
+
+        Returns the `event`/`where` parameters and the earliest `from_date`
+        the filters allow (None without a time bound).
+        """
+        params = {}
+        events = None
+        conditions = []
+        from_date = None
+        for column, op, value in pushed_filters(table_options):
+            if column == "event":
+                values = set(value) if op == "in" else {value}
+                events = values if events is None else events & values
+            elif column == "properties.time":
+                # Export dates are in the project's timezone; start a day
+                # early so no timezone can push matching events before it.
+                day = datetime.fromtimestamp(value - 86400, tz=timezone.utc).strftime(
+                    "%Y-%m-%d"
+                )
+                from_date = max(from_date or day, day)
+            elif column.startswith("properties.") and op == "=":
+                name = column[len("properties."):]
+                conditions.append(f"properties[{json.dumps(name)}] == {json.dumps(value)}")
+        if events is not None:
+            params["event"] = json.dumps(sorted(events))
+        if conditions:
+            params["where"] = " and ".join(conditions)
+        return params, from_date
+
     def read_table(
         self, table_name: str, start_offset: dict, table_options: dict[str, str]
     ) -> (Iterator[dict], dict):
@@ -322,26 +400,32 @@ class LakeflowConnect:
             start_offset = {}
             
         if table_name == "events":
-            return self._read_events_table(start_offset)
+            return self._read_events_table(start_offset, table_options)
         elif table_name == "cohorts":
             return self._read_cohorts_table(start_offset)
         elif table_name == "cohort_members":
             return self._read_cohort_members_table(start_offset)
         elif table_name == "engage":
-            return self._read_engage_table(start_offset)
+            return self._read_engage_table(start_offset, table_options)
         else:
             raise ValueError(f"Unknown table: {table_name}")
 
-    def _read_events_table(self, start_offset: dict) -> (Iterator[dict], dict):
+    def _read_events_table(
+        self, start_offset: dict, table_options: dict[str, str] = None
+    ) -> (Iterator[dict], dict):
         """
         Read ALL events data from start_date to today using multiple 7-day API calls
         """
         # Extract offset information, handle None offset
         start_date = start_offset.get("start_date") if start_offset else None
+        filter_params, filter_from_date = self._events_filter_params(table_options)
 
         if not start_date:
             # For initial snapshot, start from configured historical days ago
             start_date = (datetime.now() - timedelta(days=self.historical_days)).strftime("%Y-%m-%d")
+            # A pushed-down time bound can skip the days before it
+            if filter_from_date and filter_from_date > start_date:
+                start_date = filter_from_date
 
         # End date is today (inclusive)
         today = datetime.now().strftime("%Y-%m-%d")
@@ -367,6 +451,7 @@ class LakeflowConnect:
             params = {
                 "from_date": current_start,
                 "to_date": chunk_end,
+                **filter_params,
             }
 
             # Only add project_id for service account authentication (username + secret)
@@ -380,12 +465,13 @@ class LakeflowConnect:
                 if total_api_calls > 0:
                     time.sleep(0.34)  # Slightly more than 1/3 second to stay under 3 req/sec
 
-                response = requests.get(url, params=params, headers=self.auth_header, timeout=120)
+                response = self._session.get(url, params=params, headers=self.auth_header, timeout=120)
                 response.raise_for_status()
                 total_api_calls += 1
 
-                # Mixpanel export returns JSONL format
-                response_lines = response.text.strip().split('\n')
+                # Mixpanel export returns JSONL format; decode each line from
+                # the raw bytes rather than building a str of the whole body.
+                response_lines = response.content.strip().split(b'\n')
                 total_lines = len(response_lines)
                 non_empty_lines = len([line for line in response_lines if line.strip()])
                 chunk_records = 0
@@ -396,7 +482,7 @@ class LakeflowConnect:
                 for line_num, line in enumerate(response_lines):
                     if line.strip():
                         try:
-                            event = json.loads(line)
+                            event = json_loads(line)
 
                             # Process event to separate standard and custom properties
                             processed_event = self._process_event(event)
@@ -406,7 +492,7 @@ class LakeflowConnect:
                         except json.JSONDecodeError as e:
                             json_errors += 1
                             print(f"JSON decode error on line {line_num + 1}: {e}")
-                            print(f"Problematic line (first 100 chars): {line[:100]}")
+                            print(f"Problematic line (first 100 chars): {line[:100].decode(errors='replace')}")
                             continue
 
                 print(f"Fetched {chunk_records} events from {current_start} to {chunk_end} ({json_errors} JSON errors)")
@@ -436,6 +522,19 @@ class LakeflowConnect:
 
         return record_iterator(), next_offset
 
+    def _engage_output_properties(self, table_options: dict[str, str]) -> list:
+        """
+        Profile properties a batch query selects, for `output_properties`.
+
+        Returns None (all properties) unless the query prunes `$properties`
+        to standard properties only; custom properties cannot be named in
+        advance. `$last_seen` is always requested for the incremental cursor.
+        """
+        selected = projected_fields(table_options, "$properties")
+        if selected is None or "custom_properties" in selected:
+            return None
+        return sorted(selected | {"$last_seen"})
+
     def _read_cohorts_table(self, start_offset: dict) -> (Iterator[dict], dict):
         """
         Read all cohorts data (full refresh/snapshot).
@@ -446,9 +545,9 @@ class LakeflowConnect:
         records = []
 
         try:
-            response = requests.post(url, headers=self.auth_header, timeout=30)
+            response = self._session.post(url, headers=self.auth_header, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = response_json(response)
 
             # Handle both response formats: list directly or dict with "cohorts" key
             cohorts = data if isinstance(data, list) else data.get("cohorts", [])
@@ -479,9 +578,9 @@ class LakeflowConnect:
         
         try:
             # Fetch all cohorts
-            response = requests.post(url, headers=self.auth_header, timeout=30)
+            response = self._session.post(url, headers=self.auth_header, timeout=30)
             response.raise_for_status()
-            cohorts_data = response.json()
+            cohorts_data = response_json(response)
             
             # Handle both response formats: list directly or dict with "cohorts" key
             cohorts = cohorts_data if isinstance(cohorts_data, list) else cohorts_data.get("cohorts", [])
@@ -502,14 +601,14 @@ class LakeflowConnect:
                     params["project_id"] = self.project_id
                 
                 try:
-                    members_response = requests.post(
+                    members_response = self._session.post(
                         members_url, 
                         params=params, 
                         headers=self.auth_header, 
                         timeout=60
                     )
                     members_response.raise_for_status()
-                    members_data = members_response.json()
+                    members_data = response_json(members_response)
                     
                     # Extract distinct_id from each member
                     for member in members_data.get("results", []):
@@ -539,7 +638,9 @@ class LakeflowConnect:
         # For snapshot tables, return the same offset (no incremental cursor)
         return iter(records), start_offset if start_offset else {}
 
-    def _read_engage_table(self, start_offset: dict) -> (Iterator[dict], dict):
+    def _read_engage_table(
+        self, start_offset: dict, table_options: dict[str, str] = None
+    ) -> (Iterator[dict], dict):
         """
         Read engage (people profiles) data with incremental loading and pagination
         """
@@ -571,12 +672,15 @@ class LakeflowConnect:
         # Only add project_id for service account authentication (username + secret)
         if self.project_id and hasattr(self, 'username') and hasattr(self, 'secret'):
             params["project_id"] = self.project_id
+        output_properties = self._engage_output_properties(table_options)
+        if output_properties is not None:
+            params["output_properties"] = json.dumps(output_properties)
 
         while True:
             try:
-                response = requests.post(url, params=params, headers=self.auth_header, timeout=30)
+                response = self._session.post(url, params=params, headers=self.auth_header, timeout=30)
                 response.raise_for_status()
-                data = response.json()
+                data = response_json(response)
 
                 if not data.get("results"):
                     break
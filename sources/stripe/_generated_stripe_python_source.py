@@ -5,20 +5,41 @@
 # Do not edit manually. Make changes to the source files instead.
 # ==============================================================================
 
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
+    Mapping,
+    Optional,
     Tuple,
+    Union,
 )
+from urllib.parse import urlparse
+import cProfile
+import calendar
 import json
+import os
+import pstats
+import re
+import tempfile
+import threading
 import time
+import uuid
 
 from pyspark.sql import Row
-from pyspark.sql.datasource import DataSource, DataSourceReader, SimpleDataSourceStreamReader
+from pyspark.sql.datasource import (
+    DataSource,
+    DataSourceReader,
+    DataSourceStreamReader,
+    InputPartition,
+    SimpleDataSourceStreamReader,
+)
+from types import MappingProxyType
 from pyspark.sql.types import *
 import requests
 
@@ -165,852 +186,1624 @@ def register_lakeflow_source(spark):
             )
 
 
+    # Length of the fixed `YYYY-MM-DDTHH:MM:SSZ` layout used by most APIs for cursors.
+    _UTC_ISO8601_LENGTH = 20
+
+    # Parsed values of timestamps that do not use the fixed layout. Kept as a plain
+    # bounded dict (rather than functools.lru_cache) so it pickles with the
+    # generated source.
+    _ISO8601_CACHE: dict = {}
+    _ISO8601_CACHE_SIZE = 4096
+
+
+    def is_utc_iso8601(value: Any) -> bool:
+        """
+        Check whether a value uses the fixed `YYYY-MM-DDTHH:MM:SSZ` layout.
+
+        Timestamps in this layout sort lexicographically in time order, so they can
+        be compared as strings without parsing.
+        """
+        return (
+            isinstance(value, str)
+            and len(value) == _UTC_ISO8601_LENGTH
+            and value[4] == "-"
+            and value[7] == "-"
+            and value[10] == "T"
+            and value[13] == ":"
+            and value[16] == ":"
+            and value[19] == "Z"
+        )
+
+
+    def iso8601_to_epoch(value: Any) -> Optional[float]:
+        """
+        Convert an ISO 8601 timestamp string to seconds since the epoch.
+
+        The fixed `YYYY-MM-DDTHH:MM:SSZ` layout is converted by slicing; other
+        layouts (fractional seconds, offsets, space separator) go through
+        `datetime.fromisoformat` and are cached. Timestamps without an offset are
+        taken to be UTC. Returns None for values that cannot be parsed.
+        """
+        if is_utc_iso8601(value):
+            try:
+                fields = (
+                    int(value[0:4]),
+                    int(value[5:7]),
+                    int(value[8:10]),
+                    int(value[11:13]),
+                    int(value[14:16]),
+                    int(value[17:19]),
+                )
+            except ValueError:
+                return None
+            # calendar.timegm normalizes out-of-range fields instead of rejecting them.
+            if not (
+                1 <= fields[1] <= 12
+                and 1 <= fields[2]
+                and (
+                    fields[2] <= 28
+                    or fields[2] <= calendar.monthrange(fields[0], fields[1])[1]
+                )
+                and fields[3] < 24
+                and fields[4] < 60
+                and fields[5] < 60
+            ):
+                return None
+            return float(calendar.timegm(fields))
+
+        if not isinstance(value, str) or not value:
+            return None
+
+        cached = _ISO8601_CACHE.get(value)
+        if cached is not None:
+            return cached
+
+        text = value[:-1] + "+00:00" if value.endswith("Z") else value
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        epoch = parsed.timestamp()
+
+        if len(_ISO8601_CACHE) >= _ISO8601_CACHE_SIZE:
+            _ISO8601_CACHE.clear()
+        _ISO8601_CACHE[value] = epoch
+        return epoch
+
+
+    def epoch_to_iso8601(seconds: float) -> str:
+        """Format seconds since the epoch in the `YYYY-MM-DDTHH:MM:SSZ` layout."""
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
+
+
+    def latest_iso8601(current: Optional[str], candidate: Any) -> Optional[str]:
+        """
+        Return the later of two ISO 8601 timestamps, ignoring unparseable values.
+
+        Intended for tracking a cursor over many records: when both values use the
+        fixed UTC layout they are compared as strings, otherwise they are parsed.
+        """
+        if not isinstance(candidate, str) or not candidate:
+            return current
+        if current is None:
+            return candidate if iso8601_to_epoch(candidate) is not None else current
+        if is_utc_iso8601(current) and is_utc_iso8601(candidate):
+            return candidate if candidate > current else current
+        candidate_epoch = iso8601_to_epoch(candidate)
+        if candidate_epoch is None:
+            return current
+        current_epoch = iso8601_to_epoch(current)
+        if current_epoch is None or candidate_epoch > current_epoch:
+            return candidate
+        return current
+
+
+    # JSON backends in order of preference. Set the LAKEFLOW_JSON_BACKEND
+    # environment variable to one of these names to force a backend.
+    JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+
+    def select_json_backend(
+        preferred: Optional[str] = None,
+    ) -> Tuple[str, Callable[[Union[bytes, str]], Any]]:
+        """
+        Return the name and `loads` function of the fastest installed JSON decoder.
+
+        orjson and msgspec are used when importable; the standard library is the
+        fallback. All three accept `bytes` as well as `str`. `preferred` skips
+        the backends listed before it.
+        """
+        candidates = JSON_BACKENDS
+        if preferred:
+            if preferred not in JSON_BACKENDS:
+                raise ValueError(
+                    f"Unknown JSON backend '{preferred}', expected one of {JSON_BACKENDS}"
+                )
+            candidates = JSON_BACKENDS[JSON_BACKENDS.index(preferred):]
+        for name in candidates:
+            try:
+                if name == "orjson":
+                    import orjson
+
+                    return name, orjson.loads
+                if name == "msgspec":
+                    import msgspec
+
+                    return name, msgspec.json.decode
+            except ImportError:
+                continue
+        return "json", json.loads
+
+
+    JSON_BACKEND, _json_decode = select_json_backend(
+        os.environ.get("LAKEFLOW_JSON_BACKEND")
+    )
+
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document with the fastest available backend.
+
+        Documents the fast backends reject (such as `NaN` literals or malformed
+        input) are retried with the standard library, so the accepted input and
+        the `json.JSONDecodeError` raised match `json.loads`. Note that orjson
+        decodes integers wider than 64 bits as floats.
+        """
+        try:
+            return _json_decode(data)
+        except Exception:
+            if _json_decode is json.loads:
+                raise
+            return json.loads(data)
+
+
+    def response_json(response) -> Any:
+        """
+        Decode a `requests` response body straight from its bytes.
+
+        Replaces `response.json()`, which first decodes the body to `str` and
+        then parses it with the standard library.
+        """
+        return json_loads(response.content)
+
+
+    # Table option through which the batch reader hands the filters it pushed
+    # down to `read_table`, as a JSON list of `[column, op, value]` triples.
+    PUSHED_FILTERS_OPTION = "lakeflow.pushedFilters"
+
+    # Spark data source filter classes that can be pushed down, by class name.
+    _PUSHED_FILTER_OPS = {
+        "EqualTo": "=",
+        "GreaterThan": ">",
+        "GreaterThanOrEqual": ">=",
+        "LessThan": "<",
+        "LessThanOrEqual": "<=",
+        "In": "in",
+    }
+
+
+    def to_pushed_filter(spark_filter: Any) -> Optional[Tuple[str, str, Any]]:
+        """
+        Convert a `pyspark.sql.datasource.Filter` to a `(column, op, value)` triple.
+
+        Nested columns are joined with dots, e.g. `properties.$city`. Returns
+        None for filters that cannot be pushed down: other filter classes,
+        column names containing dots, and values that are not JSON scalars.
+        """
+        op = _PUSHED_FILTER_OPS.get(type(spark_filter).__name__)
+        if op is None:
+            return None
+        attribute = tuple(spark_filter.attribute)
+        if not attribute or any("." in name for name in attribute):
+            return None
+        values = spark_filter.value if op == "in" else (spark_filter.value,)
+        if not all(isinstance(value, (str, int, float, bool)) for value in values):
+            return None
+        value = list(values) if op == "in" else values[0]
+        return ".".join(attribute), op, value
+
+
+    def pushed_filters(table_options: Optional[dict]) -> list:
+        """
+        Return the `(column, op, value)` filters pushed down to a read.
+
+        Connectors use them to narrow their API requests. They do not have to
+        apply them exactly: the batch reader drops the rows that do not match.
+        """
+        value = (table_options or {}).get(PUSHED_FILTERS_OPTION)
+        if not value:
+            return []
+        return [tuple(pushed) for pushed in json.loads(value)]
+
+
+    def matches_filters(row: Any, filters: list) -> bool:
+        """Whether a parsed row satisfies every `(column, op, value)` filter."""
+        for column, op, value in filters:
+            field = row
+            for name in column.split("."):
+                field = None if field is None else field[name]
+            if field is None:
+                return False
+            if op == "=":
+                matched = field == value
+            elif op == ">":
+                matched = field > value
+            elif op == ">=":
+                matched = field >= value
+            elif op == "<":
+                matched = field < value
+            elif op == "<=":
+                matched = field <= value
+            elif op == "in":
+                matched = field in value
+            else:
+                raise ValueError(f"Unsupported filter operator {op!r}")
+            if not matched:
+                return False
+        return True
+
+
+    # Table option listing the columns a batch read returns, comma-separated;
+    # nested struct fields are written as `parent.field`.
+    COLUMNS_OPTION = "lakeflow.columns"
+    # Table option through which the batch reader hands the columns it needs to
+    # `read_table`, as a JSON list of column paths.
+    PROJECTION_OPTION = "lakeflow.projection"
+
+
+    def prune_schema(schema: StructType, columns: list) -> StructType:
+        """
+        Keep only `columns` of `schema`, in schema order.
+
+        A column is a top-level name or a `parent.field` path into a struct
+        column. Unknown columns raise a ValueError.
+        """
+        selected = {}
+        for column in columns:
+            name, _, sub = column.partition(".")
+            if name not in schema.fieldNames():
+                raise ValueError(f"Unknown column '{column}'")
+            if not sub:
+                selected[name] = None
+                continue
+            data_type = schema[name].dataType
+            if not isinstance(data_type, StructType) or sub not in data_type.fieldNames():
+                raise ValueError(f"Unknown column '{column}'")
+            if name not in selected or selected[name] is not None:
+                selected.setdefault(name, set()).add(sub)
+
+        fields = []
+        for field in schema.fields:
+            if field.name not in selected:
+                continue
+            subfields = selected[field.name]
+            if subfields is None:
+                fields.append(field)
+            else:
+                fields.append(
+                    StructField(
+                        field.name,
+                        StructType([f for f in field.dataType.fields if f.name in subfields]),
+                        field.nullable,
+                        field.metadata,
+                    )
+                )
+        return StructType(fields)
+
+
+    def projection_paths(schema: StructType, full_schema: StructType) -> Optional[list]:
+        """
+        Describe a pruned `schema` as column paths of `full_schema`.
+
+        Returns None when nothing was pruned. Struct columns whose fields were
+        pruned are listed field by field as `parent.field`.
+        """
+        if schema == full_schema:
+            return None
+        paths = []
+        for field in schema.fields:
+            full_type = (
+                full_schema[field.name].dataType
+                if field.name in full_schema.fieldNames()
+                else None
+            )
+            if (
+                isinstance(field.dataType, StructType)
+                and isinstance(full_type, StructType)
+                and field.dataType != full_type
+            ):
+                paths.extend(f"{field.name}.{sub}" for sub in field.dataType.fieldNames())
+            else:
+                paths.append(field.name)
+        return paths
+
+
+    def projected_fields(table_options: Optional[dict], column: str) -> Optional[set]:
+        """
+        Fields of `column` a read has to return.
+
+        None means the whole column (or no projection was pushed down); an
+        empty set means the column is not read at all. For a struct column, the
+        set holds the names of its selected fields.
+        """
+        value = (table_options or {}).get(PROJECTION_OPTION)
+        if not value:
+            return None
+        fields = set()
+        for path in json.loads(value):
+            name, _, sub = path.partition(".")
+            if name != column:
+                continue
+            if not sub:
+                return None
+            fields.add(sub)
+        return fields
+
+
     ########################################################
-    # sources/stripe/stripe.py
+    # libs/metrics.py
     ########################################################
 
-    class LakeflowConnect:
-        def __init__(self, options: dict) -> None:
-            """
-            Initialize the Stripe connector with API credentials.
+    METRICS_PATH_OPTION = "lakeflow.metrics.path"
+    DEFAULT_METRICS_PATH = os.path.join(tempfile.gettempdir(), "lakeflow_metrics")
 
-            Args:
-                options: Dictionary containing:
-                    - api_key: Stripe secret API key (sk_test_* or sk_live_*)
-            """
-            self.api_key = options["api_key"]
-            self.base_url = "https://api.stripe.com/v1"
-            self.auth = (self.api_key, "")  # API key as username, empty password
+    # Upper bounds (in milliseconds) of the request latency histogram buckets; the
+    # last bucket counts everything slower than the largest bound.
+    LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
 
-            # Cache for schemas to avoid repeated computation
-            self._schema_cache = {}
-
-            # Centralized object metadata configuration
-            self._object_config = {
-                "customers": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "customers",
-                    "supports_deleted": True,
-                },
-                "charges": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "charges",
-                    "supports_deleted": False,
-                },
-                "payment_intents": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "payment_intents",
-                    "supports_deleted": False,
-                },
-                "subscriptions": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "subscriptions",
-                    "supports_deleted": False,
-                },
-                "invoices": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "invoices",
-                    "supports_deleted": False,
-                },
-                "products": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "products",
-                    "supports_deleted": True,
-                },
-                "prices": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "prices",
-                    "supports_deleted": False,
-                },
-                "refunds": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "refunds",
-                    "supports_deleted": False,
-                },
-                "disputes": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "disputes",
-                    "supports_deleted": False,
-                },
-                "payment_methods": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "payment_methods",
-                    "supports_deleted": False,
-                },
-                "balance_transactions": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "balance_transactions",
-                    "supports_deleted": False,
-                },
-                "payouts": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "payouts",
-                    "supports_deleted": False,
-                },
-                "invoice_items": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "invoiceitems",
-                    "supports_deleted": False,
-                },
-                "plans": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "plans",
-                    "supports_deleted": True,
-                },
-                "events": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "events",
-                    "supports_deleted": False,
-                },
-                "coupons": {
-                    "primary_keys": ["id"],
-                    "cursor_field": "created",
-                    "ingestion_type": "cdc",
-                    "endpoint": "coupons",
-                    "supports_deleted": False,
-                },
-            }
+    # Path segments that look like identifiers are collapsed so that per-endpoint
+    # statistics do not grow with the number of records (e.g. /tickets/{id}/comments).
+    _ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,}|[A-Za-z]+_[A-Za-z0-9]{8,})$")
 
-            # Reusable nested schema for Stripe address objects
-            self._address_schema = StructType(
-                [
-                    StructField("line1", StringType(), True),
-                    StructField("line2", StringType(), True),
-                    StructField("city", StringType(), True),
-                    StructField("state", StringType(), True),
-                    StructField("postal_code", StringType(), True),
-                    StructField("country", StringType(), True),
-                ]
-            )
 
-            # Reusable nested schema for shipping (includes address + name/phone)
-            self._shipping_schema = StructType(
-                [
-                    StructField("name", StringType(), True),
-                    StructField("phone", StringType(), True),
-                    StructField("address", self._address_schema, True),
-                ]
+    def endpoint_name(url: str) -> str:
+        """Return the path of a request URL with identifier segments replaced by {id}."""
+        path = urlparse(url).path or "/"
+        return "/".join(
+            "{id}" if _ID_SEGMENT.match(segment) else segment
+            for segment in path.split("/")
+        )
+
+
+    class ReadMetrics:
+        """
+        Counters describing the work done by a connector for one read.
+
+        Connectors report HTTP traffic by registering `on_response` as a requests
+        response hook (see `attach_metrics`) and call `record_retry` whenever they
+        retry a request. The shared read path adds the records emitted and the time
+        spent reading from the connector versus converting records to rows, then
+        takes a snapshot per micro-batch with `collect`.
+
+        Counters may be updated from several threads at once.
+        """
+
+        def __init__(self) -> None:
+            self._lock = threading.Lock()
+            self._reset()
+
+        def __getstate__(self) -> dict:
+            # Locks cannot be pickled; each process gets its own.
+            state = self.__dict__.copy()
+            del state["_lock"]
+            return state
+
+        def __setstate__(self, state: dict) -> None:
+            self.__dict__.update(state)
+            self._lock = threading.Lock()
+
+        def _reset(self) -> None:
+            self.requests = 0
+            self.retries = 0
+            self.throttled = 0
+            self.errors = 0
+            self.bytes_downloaded = 0
+            self.fetch_seconds = 0.0
+            self.records = 0
+            self.read_seconds = 0.0
+            self.parse_seconds = 0.0
+            self.endpoints = {}
+
+        def on_response(self, response, *args, **kwargs):
+            """requests response hook recording one HTTP round trip."""
+            elapsed = response.elapsed.total_seconds()
+            content_length = response.headers.get("Content-Length")
+            try:
+                size = int(content_length)
+            except (TypeError, ValueError):
+                size = len(response.content or b"")
+            endpoint = endpoint_name(response.url)
+            elapsed_ms = elapsed * 1000
+
+            with self._lock:
+                self.requests += 1
+                self.bytes_downloaded += size
+                self.fetch_seconds += elapsed
+                if response.status_code == 429:
+                    self.throttled += 1
+                elif response.status_code >= 400:
+                    self.errors += 1
+
+                stats = self.endpoints.get(endpoint)
+                if stats is None:
+                    stats = {
+                        "requests": 0,
+                        "total_ms": 0.0,
+                        "max_ms": 0.0,
+                        "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                    }
+                    self.endpoints[endpoint] = stats
+                stats["requests"] += 1
+                stats["total_ms"] += elapsed_ms
+                stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+                bucket = len(LATENCY_BUCKETS_MS)
+                for index, bound in enumerate(LATENCY_BUCKETS_MS):
+                    if elapsed_ms <= bound:
+                        bucket = index
+                        break
+                stats["buckets"][bucket] += 1
+            return response
+
+        def record_retry(self) -> None:
+            """Count a request that is about to be retried."""
+            with self._lock:
+                self.retries += 1
+
+        def record_read(self, records: int, read_seconds: float, parse_seconds: float):
+            """Add the records emitted by a read and where its time went."""
+            with self._lock:
+                self.records += records
+                self.read_seconds += read_seconds
+                self.parse_seconds += parse_seconds
+
+        def collect(self) -> dict:
+            """Return the counters gathered so far and start counting from zero."""
+            with self._lock:
+                snapshot = {
+                    "requests": self.requests,
+                    "retries": self.retries,
+                    "throttled": self.throttled,
+                    "errors": self.errors,
+                    "bytes_downloaded": self.bytes_downloaded,
+                    "records": self.records,
+                    "read_seconds": round(self.read_seconds, 6),
+                    "fetch_seconds": round(self.fetch_seconds, 6),
+                    "parse_seconds": round(self.parse_seconds, 6),
+                    "endpoints": [
+                        {
+                            "endpoint": endpoint,
+                            "requests": stats["requests"],
+                            "total_ms": round(stats["total_ms"], 3),
+                            "max_ms": round(stats["max_ms"], 3),
+                            "buckets": list(stats["buckets"]),
+                        }
+                        for endpoint, stats in sorted(self.endpoints.items())
+                    ],
+                }
+                self._reset()
+            return snapshot
+
+
+    def attach_metrics(session, metrics: ReadMetrics) -> None:
+        """Report every response received through a requests session to `metrics`."""
+        session.hooks["response"].append(metrics.on_response)
+
+
+    def timed_rows(
+        records: Iterable[Any],
+        convert,
+        metrics: ReadMetrics,
+        read_seconds: float,
+        on_complete=None,
+    ) -> Iterator[Any]:
+        """
+        Convert records lazily while measuring conversion time.
+
+        `read_seconds` is the time already spent producing `records`; time spent
+        pulling further records out of a lazy iterator is added to it. Once the
+        records are exhausted the totals are added to `metrics` and
+        `on_complete` (if given) is called.
+        """
+        count = 0
+        parse_seconds = 0.0
+        iterator = iter(records)
+        perf_counter = time.perf_counter
+        while True:
+            started = perf_counter()
+            try:
+                record = next(iterator)
+            except StopIteration:
+                read_seconds += perf_counter() - started
+                break
+            converted = perf_counter()
+            row = convert(record)
+            parse_seconds += perf_counter() - converted
+            read_seconds += converted - started
+            count += 1
+            yield row
+        metrics.record_read(count, read_seconds, parse_seconds)
+        if on_complete is not None:
+            on_complete()
+
+
+    def _metrics_file(directory: str, table_name: str) -> str:
+        return os.path.join(directory, f"{table_name}.jsonl".replace(os.sep, "_"))
+
+
+    def append_metrics_line(directory: str, table_name: str, line: dict) -> None:
+        """
+        Append one metrics line to the log of `table_name` in `directory`.
+
+        The line is written with a single call so concurrent readers of the same
+        table do not interleave their lines. Failing to write is ignored: metrics
+        must never fail the read itself.
+        """
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(_metrics_file(directory, table_name), "a") as f:
+                f.write(json.dumps(line, default=str) + "\n")
+        except OSError:
+            pass
+
+
+    def read_metrics_lines(directory: str, table_name: str) -> list[dict]:
+        """Return the metrics lines logged for `table_name`, oldest first."""
+        try:
+            with open(_metrics_file(directory, table_name)) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # A line cut short by a read that died while writing it.
+                continue
+        return records
+
+
+    ########################################################
+    # libs/profiling.py
+    ########################################################
+
+    PROFILE_OPTION = "lakeflow.profile"
+    # Directory the profiles are written to; it must be writable by the executors.
+    PROFILE_PATH_OPTION = "lakeflow.profile.path"
+    DEFAULT_PROFILE_PATH = os.path.join(tempfile.gettempdir(), "lakeflow_profiles")
+
+    # Functions whose cumulative time makes up each category of the breakdown, as
+    # (file name suffix or None for any file, function name pattern). C functions
+    # have the file name "~". Whatever is not in a category is time spent in the
+    # connector's own code.
+    PROFILE_CATEGORIES = {
+        "fetch_seconds": [("requests/sessions.py", r"send")],
+        "json_decode_seconds": [
+            ("json/decoder.py", r"decode"),
+            ("~", r"<orjson\.loads>"),
+            ("~", r"<msgspec\..*decode>"),
+        ],
+        "parse_seconds": [(None, r"parse_value")],
+    }
+
+    # Number of functions listed in the JSON summary of a profile.
+    _TOP_FUNCTIONS = 30
+
+
+    def profile_breakdown(stats: pstats.Stats, total_seconds: float) -> dict:
+        """
+        Split the profiled time into fetching, JSON decoding, `parse_value`
+        conversion and the connector's own code (`connector_seconds`).
+        """
+        breakdown = {category: 0.0 for category in PROFILE_CATEGORIES}
+        for (filename, _, function), (_, _, _, cumulative, _) in stats.stats.items():
+            normalized = filename.replace(os.sep, "/")
+            for category, functions in PROFILE_CATEGORIES.items():
+                for suffix, name in functions:
+                    if re.fullmatch(name, function) and (
+                        suffix is None or normalized.endswith(suffix)
+                    ):
+                        breakdown[category] += cumulative
+        breakdown["connector_seconds"] = max(total_seconds - sum(breakdown.values()), 0.0)
+        breakdown["total_seconds"] = total_seconds
+        return {key: round(value, 6) for key, value in breakdown.items()}
+
+
+    class ReadProfiler:
+        """
+        Profiles one read with cProfile when `lakeflow.profile` is enabled.
+
+        Use the profiler as a context manager around the `read_table` call and
+        pass the rows returned to Spark through `rows`, which profiles pulling
+        (and converting) every record. Once the rows are exhausted the profile is
+        written to `lakeflow.profile.path` as `<name>.prof` (load it with
+        `pstats` or snakeviz) with a `<name>.json` summary holding the time
+        breakdown and the most expensive functions, and the summary is printed
+        as a JSON line with `"event": "lakeflow_connect_profile"`.
+
+        When profiling is disabled every method is a pass-through.
+        """
+
+        def __init__(self, options: dict, read_kind: str, **context) -> None:
+            self.enabled = str(options.get(PROFILE_OPTION, "false")).lower() == "true"
+            self.directory = options.get(PROFILE_PATH_OPTION) or DEFAULT_PROFILE_PATH
+            self.table_name = options.get("tableName")
+            self.read_kind = read_kind
+            self.context = context
+            self.seconds = 0.0
+            self._profile = cProfile.Profile() if self.enabled else None
+            self._started = None
+
+        def __enter__(self) -> "ReadProfiler":
+            if self.enabled:
+                self._started = time.perf_counter()
+                self._profile.enable()
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            if self.enabled:
+                self._profile.disable()
+                self.seconds += time.perf_counter() - self._started
+
+        def rows(self, rows: Iterable[Any]) -> Iterable[Any]:
+            """Profile iterating `rows`, then write the profile."""
+            if not self.enabled:
+                return rows
+            return self._profiled_rows(rows)
+
+        def _profiled_rows(self, rows: Iterable[Any]) -> Iterator[Any]:
+            iterator = iter(rows)
+            while True:
+                with self:
+                    try:
+                        row = next(iterator)
+                    except StopIteration:
+                        break
+                yield row
+            self.dump()
+
+        def _file_prefix(self) -> str:
+            parts = [self.table_name or "table", self.read_kind]
+            partition = _partition_id()
+            if partition is not None:
+                parts.append(f"p{partition}")
+            parts += [time.strftime("%Y%m%dT%H%M%S"), uuid.uuid4().hex[:8]]
+            name = "-".join(str(part) for part in parts)
+            return os.path.join(self.directory, name.replace(os.sep, "_"))
+
+        def dump(self) -> Optional[dict]:
+            """Write the profile and its summary; returns the summary."""
+            if not self.enabled:
+                return None
+            stats = pstats.Stats(self._profile)
+            summary = {
+                "event": "lakeflow_connect_profile",
+                "table": self.table_name,
+                "read": self.read_kind,
+                **self.context,
+                **profile_breakdown(stats, self.seconds),
+                "top_functions": [
+                    {
+                        "function": f"{filename}:{line}({function})",
+                        "calls": calls,
+                        "tottime": round(own, 6),
+                        "cumtime": round(cumulative, 6),
+                    }
+                    for (filename, line, function), (_, calls, own, cumulative, _) in sorted(
+                        stats.stats.items(), key=lambda item: item[1][3], reverse=True
+                    )[:_TOP_FUNCTIONS]
+                ],
+            }
+            prefix = self._file_prefix()
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                stats.dump_stats(f"{prefix}.prof")
+                with open(f"{prefix}.json", "w") as f:
+                    json.dump(summary, f, indent=2, default=str)
+                summary["path"] = f"{prefix}.prof"
+            except OSError as e:
+                # Profiling must never fail the read itself.
+                summary["error"] = f"Could not write profile to {self.directory}: {e}"
+            print(
+                json.dumps(
+                    {k: v for k, v in summary.items() if k != "top_functions"},
+                    default=str,
+                )
             )
+            return summary
+
+
+    def _partition_id() -> Optional[int]:
+        """The Spark partition being read, when running inside a task."""
+        try:
+            from pyspark import TaskContext
+
+            context = TaskContext.get()
+        except Exception:
+            return None
+        return context.partitionId() if context is not None else None
+
 
-            # Reusable nested schema for billing details
-            self._billing_details_schema = StructType(
+    ########################################################
+    # sources/stripe/stripe.py
+    ########################################################
+
+    def _build_schema_config() -> Dict[str, StructType]:
+        """Build the Spark schema of every Stripe table."""
+        # Reusable nested schema for Stripe address objects
+        address_schema = StructType(
+            [
+                StructField("line1", StringType(), True),
+                StructField("line2", StringType(), True),
+                StructField("city", StringType(), True),
+                StructField("state", StringType(), True),
+                StructField("postal_code", StringType(), True),
+                StructField("country", StringType(), True),
+            ]
+        )
+
+        # Reusable nested schema for shipping (includes address + name/phone)
+        shipping_schema = StructType(
+            [
+                StructField("name", StringType(), True),
+                StructField("phone", StringType(), True),
+                StructField("address", address_schema, True),
+            ]
+        )
+
+        # Reusable nested schema for billing details
+        billing_details_schema = StructType(
+            [
+                StructField("address", address_schema, True),
+                StructField("email", StringType(), True),
+                StructField("name", StringType(), True),
+                StructField("phone", StringType(), True),
+                StructField("tax_id", StringType(), True),
+            ]
+        )
+
+        # Nested schema for card checks
+        card_checks_schema = StructType(
+            [
+                StructField("address_line1_check", StringType(), True),
+                StructField("address_postal_code_check", StringType(), True),
+                StructField("cvc_check", StringType(), True),
+            ]
+        )
+
+        # Nested schema for card details in payment_method_details
+        card_details_schema = StructType(
+            [
+                StructField("amount_authorized", LongType(), True),
+                StructField("authorization_code", StringType(), True),
+                StructField("brand", StringType(), True),
+                StructField("checks", card_checks_schema, True),
+                StructField("country", StringType(), True),
+                StructField("exp_month", LongType(), True),
+                StructField("exp_year", LongType(), True),
+                StructField("fingerprint", StringType(), True),
+                StructField("funding", StringType(), True),
+                StructField("last4", StringType(), True),
+                StructField("network", StringType(), True),
+                StructField("network_transaction_id", StringType(), True),
+                StructField("regulated_status", StringType(), True),
+                StructField("installments", StringType(), True),
+                StructField("mandate", StringType(), True),
+                StructField("three_d_secure", StringType(), True),
+                StructField("wallet", StringType(), True),
+                StructField("extended_authorization", StringType(), True),
+                StructField("incremental_authorization", StringType(), True),
+                StructField("multicapture", StringType(), True),
+                StructField("network_token", StringType(), True),
+                StructField("overcapture", StringType(), True),
+            ]
+        )
+
+        # Nested schema for payment_method_details (polymorphic - card is most common)
+        payment_method_details_schema = StructType(
+            [
+                StructField("type", StringType(), True),
+                StructField("card", card_details_schema, True),
+                # Other payment types stored as JSON strings for flexibility
+                StructField("ach_credit_transfer", StringType(), True),
+                StructField("ach_debit", StringType(), True),
+                StructField("acss_debit", StringType(), True),
+                StructField("affirm", StringType(), True),
+                StructField("afterpay_clearpay", StringType(), True),
+                StructField("alipay", StringType(), True),
+                StructField("amazon_pay", StringType(), True),
+                StructField("au_becs_debit", StringType(), True),
+                StructField("bacs_debit", StringType(), True),
+                StructField("bancontact", StringType(), True),
+                StructField("blik", StringType(), True),
+                StructField("boleto", StringType(), True),
+                StructField("card_present", StringType(), True),
+                StructField("cashapp", StringType(), True),
+                StructField("customer_balance", StringType(), True),
+                StructField("eps", StringType(), True),
+                StructField("fpx", StringType(), True),
+                StructField("giropay", StringType(), True),
+                StructField("grabpay", StringType(), True),
+                StructField("ideal", StringType(), True),
+                StructField("interac_present", StringType(), True),
+                StructField("klarna", StringType(), True),
+                StructField("konbini", StringType(), True),
+                StructField("link", StringType(), True),
+                StructField("multibanco", StringType(), True),
+                StructField("oxxo", StringType(), True),
+                StructField("p24", StringType(), True),
+                StructField("paynow", StringType(), True),
+                StructField("paypal", StringType(), True),
+                StructField("pix", StringType(), True),
+                StructField("promptpay", StringType(), True),
+                StructField("revolut_pay", StringType(), True),
+                StructField("sepa_debit", StringType(), True),
+                StructField("sofort", StringType(), True),
+                StructField("stripe_account", StringType(), True),
+                StructField("swish", StringType(), True),
+                StructField("us_bank_account", StringType(), True),
+                StructField("wechat", StringType(), True),
+                StructField("wechat_pay", StringType(), True),
+                StructField("zip", StringType(), True),
+            ]
+        )
+
+        # Nested schema for charge outcome
+        outcome_schema = StructType(
+            [
+                StructField("type", StringType(), True),
+                StructField("network_status", StringType(), True),
+                StructField("reason", StringType(), True),
+                StructField("risk_level", StringType(), True),
+                StructField("risk_score", LongType(), True),
+                StructField("seller_message", StringType(), True),
+                StructField("advice_code", StringType(), True),
+                StructField("network_advice_code", StringType(), True),
+                StructField("network_decline_code", StringType(), True),
+            ]
+        )
+
+        # Nested schema for price recurring
+        recurring_schema = StructType(
+            [
+                StructField("interval", StringType(), True),
+                StructField("interval_count", LongType(), True),
+                StructField("meter", StringType(), True),
+                StructField("trial_period_days", LongType(), True),
+                StructField("usage_type", StringType(), True),
+                StructField("aggregate_usage", StringType(), True),
+            ]
+        )
+
+        # Nested schema for fee detail (used in balance_transactions.fee_details array)
+        fee_detail_schema = StructType(
+            [
+                StructField("amount", LongType(), True),
+                StructField("application", StringType(), True),
+                StructField("currency", StringType(), True),
+                StructField("description", StringType(), True),
+                StructField("type", StringType(), True),
+            ]
+        )
+
+        # Nested schema for period (used in invoice line items, subscriptions, etc.)
+        period_schema = StructType(
+            [
+                StructField("start", LongType(), True),
+                StructField("end", LongType(), True),
+            ]
+        )
+
+        # Nested schema for invoice line item
+        invoice_line_item_schema = StructType(
+            [
+                StructField("id", StringType(), True),
+                StructField("object", StringType(), True),
+                StructField("amount", LongType(), True),
+                StructField("amount_excluding_tax", LongType(), True),
+                StructField("currency", StringType(), True),
+                StructField("description", StringType(), True),
+                StructField("discountable", BooleanType(), True),
+                StructField("discounts", StringType(), True),
+                StructField("discount_amounts", StringType(), True),
+                StructField("invoice", StringType(), True),
+                StructField("invoice_item", StringType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("metadata", StringType(), True),
+                StructField("period", period_schema, True),
+                StructField("plan", StringType(), True),
+                StructField("price", StringType(), True),
+                StructField("proration", BooleanType(), True),
+                StructField("proration_details", StringType(), True),
+                StructField("quantity", LongType(), True),
+                StructField("subscription", StringType(), True),
+                StructField("subscription_item", StringType(), True),
+                StructField("tax_amounts", StringType(), True),
+                StructField("tax_rates", StringType(), True),
+                StructField("type", StringType(), True),
+                StructField("unit_amount_excluding_tax", StringType(), True),
+            ]
+        )
+
+        # Nested schema for invoice lines (paginated list wrapper)
+        invoice_lines_schema = StructType(
+            [
+                StructField("object", StringType(), True),
+                StructField("data", ArrayType(invoice_line_item_schema), True),
+                StructField("has_more", BooleanType(), True),
+                StructField("total_count", LongType(), True),
+                StructField("url", StringType(), True),
+            ]
+        )
+
+        # Nested schema for invoice payment settings
+        invoice_payment_settings_schema = StructType(
+            [
+                StructField("default_mandate", StringType(), True),
+                StructField("payment_method_options", StringType(), True),
+                StructField("payment_method_types", StringType(), True),
+            ]
+        )
+
+        # Nested schema for invoice status transitions
+        status_transitions_schema = StructType(
+            [
+                StructField("finalized_at", LongType(), True),
+                StructField("marked_uncollectible_at", LongType(), True),
+                StructField("paid_at", LongType(), True),
+                StructField("voided_at", LongType(), True),
+            ]
+        )
+
+        # Nested schema for card payment method options
+        card_payment_method_options_schema = StructType(
+            [
+                StructField("installments", StringType(), True),
+                StructField("mandate_options", StringType(), True),
+                StructField("network", StringType(), True),
+                StructField("request_three_d_secure", StringType(), True),
+                StructField("setup_future_usage", StringType(), True),
+                StructField("capture_method", StringType(), True),
+            ]
+        )
+
+        # Nested schema for payment_method_options (polymorphic)
+        payment_method_options_schema = StructType(
+            [
+                StructField("card", card_payment_method_options_schema, True),
+                StructField("acss_debit", StringType(), True),
+                StructField("affirm", StringType(), True),
+                StructField("afterpay_clearpay", StringType(), True),
+                StructField("alipay", StringType(), True),
+                StructField("amazon_pay", StringType(), True),
+                StructField("au_becs_debit", StringType(), True),
+                StructField("bacs_debit", StringType(), True),
+                StructField("bancontact", StringType(), True),
+                StructField("blik", StringType(), True),
+                StructField("boleto", StringType(), True),
+                StructField("cashapp", StringType(), True),
+                StructField("customer_balance", StringType(), True),
+                StructField("eps", StringType(), True),
+                StructField("fpx", StringType(), True),
+                StructField("giropay", StringType(), True),
+                StructField("grabpay", StringType(), True),
+                StructField("ideal", StringType(), True),
+                StructField("interac_present", StringType(), True),
+                StructField("klarna", StringType(), True),
+                StructField("konbini", StringType(), True),
+                StructField("link", StringType(), True),
+                StructField("mobilepay", StringType(), True),
+                StructField("multibanco", StringType(), True),
+                StructField("oxxo", StringType(), True),
+                StructField("p24", StringType(), True),
+                StructField("paynow", StringType(), True),
+                StructField("paypal", StringType(), True),
+                StructField("pix", StringType(), True),
+                StructField("promptpay", StringType(), True),
+                StructField("revolut_pay", StringType(), True),
+                StructField("sepa_debit", StringType(), True),
+                StructField("sofort", StringType(), True),
+                StructField("swish", StringType(), True),
+                StructField("us_bank_account", StringType(), True),
+                StructField("wechat_pay", StringType(), True),
+                StructField("zip", StringType(), True),
+            ]
+        )
+
+        # Centralized schema configuration
+        return {
+            "customers": StructType(
                 [
-                    StructField("address", self._address_schema, True),
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
                     StructField("email", StringType(), True),
                     StructField("name", StringType(), True),
                     StructField("phone", StringType(), True),
-                    StructField("tax_id", StringType(), True),
+                    StructField("description", StringType(), True),
+                    StructField("address", address_schema, True),
+                    StructField("shipping", shipping_schema, True),
+                    StructField("balance", LongType(), True),
+                    StructField("currency", StringType(), True),
+                    StructField("delinquent", BooleanType(), True),
+                    StructField("preferred_locales", ArrayType(StringType()), True),
+                    StructField("invoice_settings", StringType(), True),
+                    StructField("tax_exempt", StringType(), True),
+                    StructField("default_source", StringType(), True),
+                    StructField("invoice_prefix", StringType(), True),
+                    StructField("metadata", StringType(), True),
+                    StructField("discount", StringType(), True),
+                    StructField("deleted", BooleanType(), True),
+                    StructField("test_clock", StringType(), True),
+                    StructField("tax", StringType(), True),
+                    StructField("sources", StringType(), True),
+                    StructField("subscriptions", StringType(), True),
+                    StructField("next_invoice_sequence", LongType(), True),
                 ]
-            )
-
-            # Nested schema for card checks
-            self._card_checks_schema = StructType(
+            ),
+            "charges": StructType(
                 [
-                    StructField("address_line1_check", StringType(), True),
-                    StructField("address_postal_code_check", StringType(), True),
-                    StructField("cvc_check", StringType(), True),
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    StructField("amount", LongType(), True),
+                    StructField("amount_captured", LongType(), True),
+                    StructField("amount_refunded", LongType(), True),
+                    StructField("currency", StringType(), True),
+                    StructField("status", StringType(), True),
+                    StructField("paid", BooleanType(), True),
+                    StructField("refunded", BooleanType(), True),
+                    StructField("captured", BooleanType(), True),
+                    StructField("disputed", BooleanType(), True),
+                    StructField("customer", StringType(), True),
+                    StructField("invoice", StringType(), True),
+                    StructField("payment_intent", StringType(), True),
+                    StructField("payment_method", StringType(), True),
+                    StructField("description", StringType(), True),
+                    StructField("receipt_email", StringType(), True),
+                    StructField("receipt_url", StringType(), True),
+                    StructField("statement_descriptor", StringType(), True),
+                    StructField("billing_details", billing_details_schema, True),
+                    StructField("payment_method_details", payment_method_details_schema, True),
+                    StructField("outcome", outcome_schema, True),
+                    StructField("metadata", StringType(), True),
+                    StructField("failure_code", StringType(), True),
+                    StructField("failure_message", StringType(), True),
                 ]
-            )
-
-            # Nested schema for card details in payment_method_details
-            self._card_details_schema = StructType(
+            ),
+            "payment_intents": StructType(
                 [
-                    StructField("amount_authorized", LongType(), True),
-                    StructField("authorization_code", StringType(), True),
-                    StructField("brand", StringType(), True),
-                    StructField("checks", self._card_checks_schema, True),
-                    StructField("country", StringType(), True),
-                    StructField("exp_month", LongType(), True),
-                    StructField("exp_year", LongType(), True),
-                    StructField("fingerprint", StringType(), True),
-                    StructField("funding", StringType(), True),
-                    StructField("last4", StringType(), True),
-                    StructField("network", StringType(), True),
-                    StructField("network_transaction_id", StringType(), True),
-                    StructField("regulated_status", StringType(), True),
-                    StructField("installments", StringType(), True),
-                    StructField("mandate", StringType(), True),
-                    StructField("three_d_secure", StringType(), True),
-                    StructField("wallet", StringType(), True),
-                    StructField("extended_authorization", StringType(), True),
-                    StructField("incremental_authorization", StringType(), True),
-                    StructField("multicapture", StringType(), True),
-                    StructField("network_token", StringType(), True),
-                    StructField("overcapture", StringType(), True),
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    StructField("amount", LongType(), True),
+                    StructField("amount_capturable", LongType(), True),
+                    StructField("amount_received", LongType(), True),
+                    StructField("currency", StringType(), True),
+                    StructField("status", StringType(), True),
+                    StructField("canceled_at", LongType(), True),
+                    StructField("cancellation_reason", StringType(), True),
+                    StructField("customer", StringType(), True),
+                    StructField("invoice", StringType(), True),
+                    StructField("payment_method", StringType(), True),
+                    StructField("description", StringType(), True),
+                    StructField("receipt_email", StringType(), True),
+                    StructField("statement_descriptor", StringType(), True),
+                    StructField("capture_method", StringType(), True),
+                    StructField("confirmation_method", StringType(), True),
+                    StructField("charges", StringType(), True),
+                    StructField("payment_method_options", payment_method_options_schema, True),
+                    StructField("shipping", StringType(), True),
+                    StructField("metadata", StringType(), True),
+                    StructField("latest_charge", StringType(), True),
                 ]
-            )
-
-            # Nested schema for payment_method_details (polymorphic - card is most common)
-            self._payment_method_details_schema = StructType(
+            ),
+            "subscriptions": StructType(
+                [
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    StructField("status", StringType(), True),
+                    StructField("current_period_start", LongType(), True),
+                    StructField("current_period_end", LongType(), True),
+                    StructField("cancel_at", LongType(), True),
+                    StructField("canceled_at", LongType(), True),
+                    StructField("ended_at", LongType(), True),
+                    StructField("trial_start", LongType(), True),
+                    StructField("trial_end", LongType(), True),
+                    StructField("customer", StringType(), True),
+                    StructField("default_payment_method", StringType(), True),
+                    StructField("latest_invoice", StringType(), True),
+                    StructField("billing_cycle_anchor", LongType(), True),
+                    StructField("collection_method", StringType(), True),
+                    StructField("days_until_due", LongType(), True),
+                    StructField("items", StringType(), True),
+                    StructField("metadata", StringType(), True),
+                    StructField("discount", StringType(), True),
+                    StructField("cancel_at_period_end", BooleanType(), True),
+                ]
+            ),
+            "invoices": StructType(
+                [
+                    # Core identifiers
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    # Status and payment info
+                    StructField("status", StringType(), True),
+                    StructField("paid", BooleanType(), True),
+                    StructField("paid_out_of_band", BooleanType(), True),
+                    StructField("attempted", BooleanType(), True),
+                    StructField("attempt_count", LongType(), True),
+                    StructField("auto_advance", BooleanType(), True),
+                    # Amounts
+                    StructField("amount_due", LongType(), True),
+                    StructField("amount_paid", LongType(), True),
+                    StructField("amount_remaining", LongType(), True),
+                    StructField("amount_shipping", LongType(), True),
+                    StructField("total", LongType(), True),
+                    StructField("subtotal", LongType(), True),
+                    StructField("subtotal_excluding_tax", LongType(), True),
+                    StructField("total_excluding_tax", LongType(), True),
+                    StructField("tax", LongType(), True),
+                    StructField("starting_balance", LongType(), True),
+                    StructField("ending_balance", LongType(), True),
+                    StructField("pre_payment_credit_notes_amount", LongType(), True),
+                    StructField("post_payment_credit_notes_amount", LongType(), True),
+                    StructField("currency", StringType(), True),
+                    # Customer info
+                    StructField("customer", StringType(), True),
+                    StructField("customer_email", StringType(), True),
+                    StructField("customer_name", StringType(), True),
+                    StructField("customer_phone", StringType(), True),
+                    StructField("customer_address", address_schema, True),
+                    StructField("customer_shipping", shipping_schema, True),
+                    StructField("customer_tax_exempt", StringType(), True),
+                    StructField("customer_tax_ids", StringType(), True),
+                    # References
+                    StructField("subscription", StringType(), True),
+                    StructField("charge", StringType(), True),
+                    StructField("payment_intent", StringType(), True),
+                    StructField("default_payment_method", StringType(), True),
+                    StructField("default_source", StringType(), True),
+                    StructField("quote", StringType(), True),
+                    StructField("latest_revision", StringType(), True),
+                    StructField("from_invoice", StringType(), True),
+                    # Billing details
+                    StructField("billing_reason", StringType(), True),
+                    StructField("collection_method", StringType(), True),
+                    StructField("description", StringType(), True),
+                    StructField("footer", StringType(), True),
+                    StructField("statement_descriptor", StringType(), True),
+                    StructField("receipt_number", StringType(), True),
+                    # Dates
+                    StructField("due_date", LongType(), True),
+                    StructField("period_start", LongType(), True),
+                    StructField("period_end", LongType(), True),
+                    StructField("next_payment_attempt", LongType(), True),
+                    StructField("webhooks_delivered_at", LongType(), True),
+                    StructField("effective_at", LongType(), True),
+                    # URLs
+                    StructField("number", StringType(), True),
+                    StructField("hosted_invoice_url", StringType(), True),
+                    StructField("invoice_pdf", StringType(), True),
+                    # Account info
+                    StructField("account_country", StringType(), True),
+                    StructField("account_name", StringType(), True),
+                    StructField("account_tax_ids", StringType(), True),
+                    # Connect
+                    StructField("application", StringType(), True),
+                    StructField("application_fee_amount", LongType(), True),
+                    StructField("on_behalf_of", StringType(), True),
+                    StructField("transfer_data", StringType(), True),
+                    # Complex nested objects
+                    StructField("automatic_tax", StringType(), True),
+                    StructField("custom_fields", StringType(), True),
+                    StructField("default_tax_rates", StringType(), True),
+                    StructField("discount", StringType(), True),
+                    StructField("discounts", StringType(), True),
+                    StructField("issuer", StringType(), True),
+                    StructField("last_finalization_error", StringType(), True),
+                    StructField("lines", invoice_lines_schema, True),
+                    StructField("payment_settings", invoice_payment_settings_schema, True),
+                    StructField("rendering", StringType(), True),
+                    StructField("shipping_cost", StringType(), True),
+                    StructField("shipping_details", StringType(), True),
+                    StructField("status_transitions", status_transitions_schema, True),
+                    StructField("subscription_details", StringType(), True),
+                    StructField("threshold_reason", StringType(), True),
+                    StructField("total_discount_amounts", StringType(), True),
+                    StructField("total_tax_amounts", StringType(), True),
+                    StructField("metadata", StringType(), True),
+                    StructField("test_clock", StringType(), True),
+                ]
+            ),
+            "products": StructType(
                 [
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("updated", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    StructField("name", StringType(), True),
+                    StructField("description", StringType(), True),
+                    StructField("active", BooleanType(), True),
                     StructField("type", StringType(), True),
-                    StructField("card", self._card_details_schema, True),
-                    # Other payment types stored as JSON strings for flexibility
-                    StructField("ach_credit_transfer", StringType(), True),
-                    StructField("ach_debit", StringType(), True),
-                    StructField("acss_debit", StringType(), True),
-                    StructField("affirm", StringType(), True),
-                    StructField("afterpay_clearpay", StringType(), True),
-                    StructField("alipay", StringType(), True),
-                    StructField("amazon_pay", StringType(), True),
-                    StructField("au_becs_debit", StringType(), True),
-                    StructField("bacs_debit", StringType(), True),
-                    StructField("bancontact", StringType(), True),
-                    StructField("blik", StringType(), True),
-                    StructField("boleto", StringType(), True),
-                    StructField("card_present", StringType(), True),
-                    StructField("cashapp", StringType(), True),
-                    StructField("customer_balance", StringType(), True),
-                    StructField("eps", StringType(), True),
-                    StructField("fpx", StringType(), True),
-                    StructField("giropay", StringType(), True),
-                    StructField("grabpay", StringType(), True),
-                    StructField("ideal", StringType(), True),
-                    StructField("interac_present", StringType(), True),
-                    StructField("klarna", StringType(), True),
-                    StructField("konbini", StringType(), True),
-                    StructField("link", StringType(), True),
-                    StructField("multibanco", StringType(), True),
-                    StructField("oxxo", StringType(), True),
-                    StructField("p24", StringType(), True),
-                    StructField("paynow", StringType(), True),
-                    StructField("paypal", StringType(), True),
-                    StructField("pix", StringType(), True),
-                    StructField("promptpay", StringType(), True),
-                    StructField("revolut_pay", StringType(), True),
-                    StructField("sepa_debit", StringType(), True),
-                    StructField("sofort", StringType(), True),
-                    StructField("stripe_account", StringType(), True),
-                    StructField("swish", StringType(), True),
-                    StructField("us_bank_account", StringType(), True),
-                    StructField("wechat", StringType(), True),
-                    StructField("wechat_pay", StringType(), True),
-                    StructField("zip", StringType(), True),
+                    StructField("unit_label", StringType(), True),
+                    StructField("url", StringType(), True),
+                    StructField("images", ArrayType(StringType()), True),
+                    StructField("metadata", StringType(), True),
+                    StructField("statement_descriptor", StringType(), True),
+                    StructField("tax_code", StringType(), True),
+                    StructField("shippable", BooleanType(), True),
+                    StructField("deleted", BooleanType(), True),
+                    StructField("default_price", StringType(), True),
+                    StructField("features", StringType(), True),
+                    StructField("package_dimensions", StringType(), True),
                 ]
-            )
-
-            # Nested schema for charge outcome
-            self._outcome_schema = StructType(
+            ),
+            "prices": StructType(
                 [
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    StructField("active", BooleanType(), True),
+                    StructField("currency", StringType(), True),
+                    StructField("unit_amount", LongType(), True),
+                    StructField("unit_amount_decimal", StringType(), True),
+                    StructField("product", StringType(), True),
+                    StructField("billing_scheme", StringType(), True),
                     StructField("type", StringType(), True),
-                    StructField("network_status", StringType(), True),
+                    StructField("recurring", recurring_schema, True),
+                    StructField("lookup_key", StringType(), True),
+                    StructField("nickname", StringType(), True),
+                    StructField("tax_behavior", StringType(), True),
+                    StructField("tiers", StringType(), True),
+                    StructField("tiers_mode", StringType(), True),
+                    StructField("metadata", StringType(), True),
+                ]
+            ),
+            "refunds": StructType(
+                [
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    StructField("amount", LongType(), True),
+                    StructField("currency", StringType(), True),
+                    StructField("charge", StringType(), True),
+                    StructField("payment_intent", StringType(), True),
+                    StructField("status", StringType(), True),
                     StructField("reason", StringType(), True),
-                    StructField("risk_level", StringType(), True),
-                    StructField("risk_score", LongType(), True),
-                    StructField("seller_message", StringType(), True),
-                    StructField("advice_code", StringType(), True),
-                    StructField("network_advice_code", StringType(), True),
-                    StructField("network_decline_code", StringType(), True),
+                    StructField("receipt_number", StringType(), True),
+                    StructField("metadata", StringType(), True),
+                    StructField("failure_reason", StringType(), True),
                 ]
-            )
-
-            # Nested schema for price recurring
-            self._recurring_schema = StructType(
+            ),
+            "disputes": StructType(
                 [
-                    StructField("interval", StringType(), True),
-                    StructField("interval_count", LongType(), True),
-                    StructField("meter", StringType(), True),
-                    StructField("trial_period_days", LongType(), True),
-                    StructField("usage_type", StringType(), True),
-                    StructField("aggregate_usage", StringType(), True),
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    StructField("amount", LongType(), True),
+                    StructField("currency", StringType(), True),
+                    StructField("charge", StringType(), True),
+                    StructField("payment_intent", StringType(), True),
+                    StructField("status", StringType(), True),
+                    StructField("reason", StringType(), True),
+                    StructField("evidence", StringType(), True),
+                    StructField("evidence_details", StringType(), True),
+                    StructField("is_charge_refundable", BooleanType(), True),
+                    StructField("metadata", StringType(), True),
                 ]
-            )
-
-            # Nested schema for fee detail (used in balance_transactions.fee_details array)
-            self._fee_detail_schema = StructType(
+            ),
+            "payment_methods": StructType(
+                [
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    StructField("type", StringType(), True),
+                    StructField("customer", StringType(), True),
+                    StructField("billing_details", billing_details_schema, True),
+                    StructField("card", StringType(), True),
+                    StructField("us_bank_account", StringType(), True),
+                    StructField("metadata", StringType(), True),
+                ]
+            ),
+            "balance_transactions": StructType(
                 [
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
                     StructField("amount", LongType(), True),
-                    StructField("application", StringType(), True),
                     StructField("currency", StringType(), True),
-                    StructField("description", StringType(), True),
+                    StructField("net", LongType(), True),
+                    StructField("fee", LongType(), True),
+                    StructField("fee_details", ArrayType(fee_detail_schema), True),
                     StructField("type", StringType(), True),
+                    StructField("source", StringType(), True),
+                    StructField("status", StringType(), True),
+                    StructField("description", StringType(), True),
+                    StructField("available_on", LongType(), True),
+                    StructField("exchange_rate", DoubleType(), True),
+                    StructField("reporting_category", StringType(), True),
                 ]
-            )
-
-            # Nested schema for period (used in invoice line items, subscriptions, etc.)
-            self._period_schema = StructType(
+            ),
+            "payouts": StructType(
                 [
-                    StructField("start", LongType(), True),
-                    StructField("end", LongType(), True),
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    StructField("amount", LongType(), True),
+                    StructField("currency", StringType(), True),
+                    StructField("arrival_date", LongType(), True),
+                    StructField("status", StringType(), True),
+                    StructField("type", StringType(), True),
+                    StructField("method", StringType(), True),
+                    StructField("destination", StringType(), True),
+                    StructField("description", StringType(), True),
+                    StructField("balance_transaction", StringType(), True),
+                    StructField("failure_code", StringType(), True),
+                    StructField("failure_message", StringType(), True),
+                    StructField("metadata", StringType(), True),
                 ]
-            )
-
-            # Nested schema for invoice line item
-            self._invoice_line_item_schema = StructType(
+            ),
+            "invoice_items": StructType(
                 [
-                    StructField("id", StringType(), True),
+                    StructField("id", StringType(), False),
                     StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
                     StructField("amount", LongType(), True),
-                    StructField("amount_excluding_tax", LongType(), True),
                     StructField("currency", StringType(), True),
+                    StructField("customer", StringType(), True),
+                    StructField("invoice", StringType(), True),
+                    StructField("subscription", StringType(), True),
+                    StructField("price", StringType(), True),
                     StructField("description", StringType(), True),
-                    StructField("discountable", BooleanType(), True),
+                    StructField("quantity", LongType(), True),
+                    StructField("unit_amount", LongType(), True),
+                    StructField("unit_amount_decimal", StringType(), True),
+                    StructField("period", StringType(), True),
                     StructField("discounts", StringType(), True),
-                    StructField("discount_amounts", StringType(), True),
-                    StructField("invoice", StringType(), True),
-                    StructField("invoice_item", StringType(), True),
-                    StructField("livemode", BooleanType(), True),
                     StructField("metadata", StringType(), True),
-                    StructField("period", self._period_schema, True),
-                    StructField("plan", StringType(), True),
-                    StructField("price", StringType(), True),
                     StructField("proration", BooleanType(), True),
-                    StructField("proration_details", StringType(), True),
-                    StructField("quantity", LongType(), True),
-                    StructField("subscription", StringType(), True),
-                    StructField("subscription_item", StringType(), True),
-                    StructField("tax_amounts", StringType(), True),
+                    StructField("date", LongType(), True),
+                    StructField("discountable", BooleanType(), True),
                     StructField("tax_rates", StringType(), True),
-                    StructField("type", StringType(), True),
-                    StructField("unit_amount_excluding_tax", StringType(), True),
                 ]
-            )
-
-            # Nested schema for invoice lines (paginated list wrapper)
-            self._invoice_lines_schema = StructType(
+            ),
+            "plans": StructType(
                 [
+                    StructField("id", StringType(), False),
                     StructField("object", StringType(), True),
-                    StructField("data", ArrayType(self._invoice_line_item_schema), True),
-                    StructField("has_more", BooleanType(), True),
-                    StructField("total_count", LongType(), True),
-                    StructField("url", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    StructField("active", BooleanType(), True),
+                    StructField("amount", LongType(), True),
+                    StructField("currency", StringType(), True),
+                    StructField("interval", StringType(), True),
+                    StructField("interval_count", LongType(), True),
+                    StructField("product", StringType(), True),
+                    StructField("nickname", StringType(), True),
+                    StructField("usage_type", StringType(), True),
+                    StructField("aggregate_usage", StringType(), True),
+                    StructField("trial_period_days", LongType(), True),
+                    StructField("tiers", StringType(), True),
+                    StructField("tiers_mode", StringType(), True),
+                    StructField("metadata", StringType(), True),
+                    StructField("deleted", BooleanType(), True),
                 ]
-            )
-
-            # Nested schema for invoice payment settings
-            self._invoice_payment_settings_schema = StructType(
+            ),
+            "events": StructType(
                 [
-                    StructField("default_mandate", StringType(), True),
-                    StructField("payment_method_options", StringType(), True),
-                    StructField("payment_method_types", StringType(), True),
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    StructField("type", StringType(), True),
+                    StructField("data", StringType(), True),
+                    StructField("api_version", StringType(), True),
+                    StructField("request", StringType(), True),
+                    StructField("pending_webhooks", LongType(), True),
                 ]
-            )
+            ),
+            "coupons": StructType(
+                [
+                    StructField("id", StringType(), False),
+                    StructField("object", StringType(), True),
+                    StructField("created", LongType(), True),
+                    StructField("livemode", BooleanType(), True),
+                    StructField("name", StringType(), True),
+                    StructField("amount_off", LongType(), True),
+                    StructField("percent_off", DoubleType(), True),
+                    StructField("currency", StringType(), True),
+                    StructField("duration", StringType(), True),
+                    StructField("duration_in_months", LongType(), True),
+                    StructField("max_redemptions", LongType(), True),
+                    StructField("times_redeemed", LongType(), True),
+                    StructField("redeem_by", LongType(), True),
+                    StructField("valid", BooleanType(), True),
+                    StructField("applies_to", StringType(), True),
+                    StructField("metadata", StringType(), True),
+                    StructField("currency_options", StringType(), True),
+                ]
+            ),
+        }
+
+
+    # Read-only table schemas, built on first use and then reused by every
+    # connector in the process (the schemas are static). Each process that reads
+    # builds its own copy. Use `_schema_registry()` rather than this directly.
+    _SCHEMA_REGISTRY: Optional[Mapping[str, StructType]] = None
+
+
+    def _schema_registry() -> Mapping[str, StructType]:
+        """Return the schema of every Stripe table, building them on first use."""
+        global _SCHEMA_REGISTRY
+        if _SCHEMA_REGISTRY is None:
+            _SCHEMA_REGISTRY = MappingProxyType(_build_schema_config())
+        return _SCHEMA_REGISTRY
+
 
-            # Nested schema for invoice status transitions
-            self._status_transitions_schema = StructType(
-                [
-                    StructField("finalized_at", LongType(), True),
-                    StructField("marked_uncollectible_at", LongType(), True),
-                    StructField("paid_at", LongType(), True),
-                    StructField("voided_at", LongType(), True),
-                ]
-            )
+    class LakeflowConnect:
+        # Stripe list parameters for range filters on the cursor field
+        RANGE_PARAMS = {">": "gt", ">=": "gte", "<": "lt", "<=": "lte"}
+        # Tables whose list endpoint does not filter on `created`
+        UNFILTERED_TABLES = ("payment_methods",)
+        # Lower bound of the first partitioned stream micro-batch (2011-01-01,
+        # before any Stripe object was created)
+        STREAM_START = 1293840000
+
+        # Object metadata of every table (static, shared by every instance)
+        _object_config = {
+            "customers": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "customers",
+                "supports_deleted": True,
+            },
+            "charges": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "charges",
+                "supports_deleted": False,
+            },
+            "payment_intents": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "payment_intents",
+                "supports_deleted": False,
+            },
+            "subscriptions": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "subscriptions",
+                "supports_deleted": False,
+            },
+            "invoices": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "invoices",
+                "supports_deleted": False,
+            },
+            "products": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "products",
+                "supports_deleted": True,
+            },
+            "prices": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "prices",
+                "supports_deleted": False,
+            },
+            "refunds": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "refunds",
+                "supports_deleted": False,
+            },
+            "disputes": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "disputes",
+                "supports_deleted": False,
+            },
+            "payment_methods": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "payment_methods",
+                "supports_deleted": False,
+            },
+            "balance_transactions": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "balance_transactions",
+                "supports_deleted": False,
+            },
+            "payouts": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "payouts",
+                "supports_deleted": False,
+            },
+            "invoice_items": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "invoiceitems",
+                "supports_deleted": False,
+            },
+            "plans": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "plans",
+                "supports_deleted": True,
+            },
+            "events": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "events",
+                "supports_deleted": False,
+            },
+            "coupons": {
+                "primary_keys": ["id"],
+                "cursor_field": "created",
+                "ingestion_type": "cdc",
+                "endpoint": "coupons",
+                "supports_deleted": False,
+            },
+        }
 
-            # Nested schema for card payment method options
-            self._card_payment_method_options_schema = StructType(
-                [
-                    StructField("installments", StringType(), True),
-                    StructField("mandate_options", StringType(), True),
-                    StructField("network", StringType(), True),
-                    StructField("request_three_d_secure", StringType(), True),
-                    StructField("setup_future_usage", StringType(), True),
-                    StructField("capture_method", StringType(), True),
-                ]
-            )
+        def __init__(self, options: dict) -> None:
+            """
+            Initialize the Stripe connector with API credentials.
 
-            # Nested schema for payment_method_options (polymorphic)
-            self._payment_method_options_schema = StructType(
-                [
-                    StructField("card", self._card_payment_method_options_schema, True),
-                    StructField("acss_debit", StringType(), True),
-                    StructField("affirm", StringType(), True),
-                    StructField("afterpay_clearpay", StringType(), True),
-                    StructField("alipay", StringType(), True),
-                    StructField("amazon_pay", StringType(), True),
-                    StructField("au_becs_debit", StringType(), True),
-                    StructField("bacs_debit", StringType(), True),
-                    StructField("bancontact", StringType(), True),
-                    StructField("blik", StringType(), True),
-                    StructField("boleto", StringType(), True),
-                    StructField("cashapp", StringType(), True),
-                    StructField("customer_balance", StringType(), True),
-                    StructField("eps", StringType(), True),
-                    StructField("fpx", StringType(), True),
-                    StructField("giropay", StringType(), True),
-                    StructField("grabpay", StringType(), True),
-                    StructField("ideal", StringType(), True),
-                    StructField("interac_present", StringType(), True),
-                    StructField("klarna", StringType(), True),
-                    StructField("konbini", StringType(), True),
-                    StructField("link", StringType(), True),
-                    StructField("mobilepay", StringType(), True),
-                    StructField("multibanco", StringType(), True),
-                    StructField("oxxo", StringType(), True),
-                    StructField("p24", StringType(), True),
-                    StructField("paynow", StringType(), True),
-                    StructField("paypal", StringType(), True),
-                    StructField("pix", StringType(), True),
-                    StructField("promptpay", StringType(), True),
-                    StructField("revolut_pay", StringType(), True),
-                    StructField("sepa_debit", StringType(), True),
-                    StructField("sofort", StringType(), True),
-                    StructField("swish", StringType(), True),
-                    StructField("us_bank_account", StringType(), True),
-                    StructField("wechat_pay", StringType(), True),
-                    StructField("zip", StringType(), True),
-                ]
-            )
+            Args:
+                options: Dictionary containing:
+                    - api_key: Stripe secret API key (sk_test_* or sk_live_*)
+                    - base_url (optional): Override for the Stripe API base URL. Defaults to https://api.stripe.com/v1.
+            """
+            self.api_key = options["api_key"]
+            self.base_url = options.get("base_url", "https://api.stripe.com/v1").rstrip("/")
+            self.auth = (self.api_key, "")  # API key as username, empty password
+            # Reuse connections across requests and count them per micro-batch
+            self._session = requests.Session()
+            self.metrics = ReadMetrics()
+            attach_metrics(self._session, self.metrics)
 
-            # Centralized schema configuration
-            self._schema_config = {
-                "customers": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("email", StringType(), True),
-                        StructField("name", StringType(), True),
-                        StructField("phone", StringType(), True),
-                        StructField("description", StringType(), True),
-                        StructField("address", self._address_schema, True),
-                        StructField("shipping", self._shipping_schema, True),
-                        StructField("balance", LongType(), True),
-                        StructField("currency", StringType(), True),
-                        StructField("delinquent", BooleanType(), True),
-                        StructField("preferred_locales", ArrayType(StringType()), True),
-                        StructField("invoice_settings", StringType(), True),
-                        StructField("tax_exempt", StringType(), True),
-                        StructField("default_source", StringType(), True),
-                        StructField("invoice_prefix", StringType(), True),
-                        StructField("metadata", StringType(), True),
-                        StructField("discount", StringType(), True),
-                        StructField("deleted", BooleanType(), True),
-                        StructField("test_clock", StringType(), True),
-                        StructField("tax", StringType(), True),
-                        StructField("sources", StringType(), True),
-                        StructField("subscriptions", StringType(), True),
-                        StructField("next_invoice_sequence", LongType(), True),
-                    ]
-                ),
-                "charges": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("amount", LongType(), True),
-                        StructField("amount_captured", LongType(), True),
-                        StructField("amount_refunded", LongType(), True),
-                        StructField("currency", StringType(), True),
-                        StructField("status", StringType(), True),
-                        StructField("paid", BooleanType(), True),
-                        StructField("refunded", BooleanType(), True),
-                        StructField("captured", BooleanType(), True),
-                        StructField("disputed", BooleanType(), True),
-                        StructField("customer", StringType(), True),
-                        StructField("invoice", StringType(), True),
-                        StructField("payment_intent", StringType(), True),
-                        StructField("payment_method", StringType(), True),
-                        StructField("description", StringType(), True),
-                        StructField("receipt_email", StringType(), True),
-                        StructField("receipt_url", StringType(), True),
-                        StructField("statement_descriptor", StringType(), True),
-                        StructField("billing_details", self._billing_details_schema, True),
-                        StructField("payment_method_details", self._payment_method_details_schema, True),
-                        StructField("outcome", self._outcome_schema, True),
-                        StructField("metadata", StringType(), True),
-                        StructField("failure_code", StringType(), True),
-                        StructField("failure_message", StringType(), True),
-                    ]
-                ),
-                "payment_intents": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("amount", LongType(), True),
-                        StructField("amount_capturable", LongType(), True),
-                        StructField("amount_received", LongType(), True),
-                        StructField("currency", StringType(), True),
-                        StructField("status", StringType(), True),
-                        StructField("canceled_at", LongType(), True),
-                        StructField("cancellation_reason", StringType(), True),
-                        StructField("customer", StringType(), True),
-                        StructField("invoice", StringType(), True),
-                        StructField("payment_method", StringType(), True),
-                        StructField("description", StringType(), True),
-                        StructField("receipt_email", StringType(), True),
-                        StructField("statement_descriptor", StringType(), True),
-                        StructField("capture_method", StringType(), True),
-                        StructField("confirmation_method", StringType(), True),
-                        StructField("charges", StringType(), True),
-                        StructField("payment_method_options", self._payment_method_options_schema, True),
-                        StructField("shipping", StringType(), True),
-                        StructField("metadata", StringType(), True),
-                        StructField("latest_charge", StringType(), True),
-                    ]
-                ),
-                "subscriptions": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("status", StringType(), True),
-                        StructField("current_period_start", LongType(), True),
-                        StructField("current_period_end", LongType(), True),
-                        StructField("cancel_at", LongType(), True),
-                        StructField("canceled_at", LongType(), True),
-                        StructField("ended_at", LongType(), True),
-                        StructField("trial_start", LongType(), True),
-                        StructField("trial_end", LongType(), True),
-                        StructField("customer", StringType(), True),
-                        StructField("default_payment_method", StringType(), True),
-                        StructField("latest_invoice", StringType(), True),
-                        StructField("billing_cycle_anchor", LongType(), True),
-                        StructField("collection_method", StringType(), True),
-                        StructField("days_until_due", LongType(), True),
-                        StructField("items", StringType(), True),
-                        StructField("metadata", StringType(), True),
-                        StructField("discount", StringType(), True),
-                        StructField("cancel_at_period_end", BooleanType(), True),
-                    ]
-                ),
-                "invoices": StructType(
-                    [
-                        # Core identifiers
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        # Status and payment info
-                        StructField("status", StringType(), True),
-                        StructField("paid", BooleanType(), True),
-                        StructField("paid_out_of_band", BooleanType(), True),
-                        StructField("attempted", BooleanType(), True),
-                        StructField("attempt_count", LongType(), True),
-                        StructField("auto_advance", BooleanType(), True),
-                        # Amounts
-                        StructField("amount_due", LongType(), True),
-                        StructField("amount_paid", LongType(), True),
-                        StructField("amount_remaining", LongType(), True),
-                        StructField("amount_shipping", LongType(), True),
-                        StructField("total", LongType(), True),
-                        StructField("subtotal", LongType(), True),
-                        StructField("subtotal_excluding_tax", LongType(), True),
-                        StructField("total_excluding_tax", LongType(), True),
-                        StructField("tax", LongType(), True),
-                        StructField("starting_balance", LongType(), True),
-                        StructField("ending_balance", LongType(), True),
-                        StructField("pre_payment_credit_notes_amount", LongType(), True),
-                        StructField("post_payment_credit_notes_amount", LongType(), True),
-                        StructField("currency", StringType(), True),
-                        # Customer info
-                        StructField("customer", StringType(), True),
-                        StructField("customer_email", StringType(), True),
-                        StructField("customer_name", StringType(), True),
-                        StructField("customer_phone", StringType(), True),
-                        StructField("customer_address", self._address_schema, True),
-                        StructField("customer_shipping", self._shipping_schema, True),
-                        StructField("customer_tax_exempt", StringType(), True),
-                        StructField("customer_tax_ids", StringType(), True),
-                        # References
-                        StructField("subscription", StringType(), True),
-                        StructField("charge", StringType(), True),
-                        StructField("payment_intent", StringType(), True),
-                        StructField("default_payment_method", StringType(), True),
-                        StructField("default_source", StringType(), True),
-                        StructField("quote", StringType(), True),
-                        StructField("latest_revision", StringType(), True),
-                        StructField("from_invoice", StringType(), True),
-                        # Billing details
-                        StructField("billing_reason", StringType(), True),
-                        StructField("collection_method", StringType(), True),
-                        StructField("description", StringType(), True),
-                        StructField("footer", StringType(), True),
-                        StructField("statement_descriptor", StringType(), True),
-                        StructField("receipt_number", StringType(), True),
-                        # Dates
-                        StructField("due_date", LongType(), True),
-                        StructField("period_start", LongType(), True),
-                        StructField("period_end", LongType(), True),
-                        StructField("next_payment_attempt", LongType(), True),
-                        StructField("webhooks_delivered_at", LongType(), True),
-                        StructField("effective_at", LongType(), True),
-                        # URLs
-                        StructField("number", StringType(), True),
-                        StructField("hosted_invoice_url", StringType(), True),
-                        StructField("invoice_pdf", StringType(), True),
-                        # Account info
-                        StructField("account_country", StringType(), True),
-                        StructField("account_name", StringType(), True),
-                        StructField("account_tax_ids", StringType(), True),
-                        # Connect
-                        StructField("application", StringType(), True),
-                        StructField("application_fee_amount", LongType(), True),
-                        StructField("on_behalf_of", StringType(), True),
-                        StructField("transfer_data", StringType(), True),
-                        # Complex nested objects
-                        StructField("automatic_tax", StringType(), True),
-                        StructField("custom_fields", StringType(), True),
-                        StructField("default_tax_rates", StringType(), True),
-                        StructField("discount", StringType(), True),
-                        StructField("discounts", StringType(), True),
-                        StructField("issuer", StringType(), True),
-                        StructField("last_finalization_error", StringType(), True),
-                        StructField("lines", self._invoice_lines_schema, True),
-                        StructField("payment_settings", self._invoice_payment_settings_schema, True),
-                        StructField("rendering", StringType(), True),
-                        StructField("shipping_cost", StringType(), True),
-                        StructField("shipping_details", StringType(), True),
-                        StructField("status_transitions", self._status_transitions_schema, True),
-                        StructField("subscription_details", StringType(), True),
-                        StructField("threshold_reason", StringType(), True),
-                        StructField("total_discount_amounts", StringType(), True),
-                        StructField("total_tax_amounts", StringType(), True),
-                        StructField("metadata", StringType(), True),
-                        StructField("test_clock", StringType(), True),
-                    ]
-                ),
-                "products": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("updated", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("name", StringType(), True),
-                        StructField("description", StringType(), True),
-                        StructField("active", BooleanType(), True),
-                        StructField("type", StringType(), True),
-                        StructField("unit_label", StringType(), True),
-                        StructField("url", StringType(), True),
-                        StructField("images", ArrayType(StringType()), True),
-                        StructField("metadata", StringType(), True),
-                        StructField("statement_descriptor", StringType(), True),
-                        StructField("tax_code", StringType(), True),
-                        StructField("shippable", BooleanType(), True),
-                        StructField("deleted", BooleanType(), True),
-                        StructField("default_price", StringType(), True),
-                        StructField("features", StringType(), True),
-                        StructField("package_dimensions", StringType(), True),
-                    ]
-                ),
-                "prices": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("active", BooleanType(), True),
-                        StructField("currency", StringType(), True),
-                        StructField("unit_amount", LongType(), True),
-                        StructField("unit_amount_decimal", StringType(), True),
-                        StructField("product", StringType(), True),
-                        StructField("billing_scheme", StringType(), True),
-                        StructField("type", StringType(), True),
-                        StructField("recurring", self._recurring_schema, True),
-                        StructField("lookup_key", StringType(), True),
-                        StructField("nickname", StringType(), True),
-                        StructField("tax_behavior", StringType(), True),
-                        StructField("tiers", StringType(), True),
-                        StructField("tiers_mode", StringType(), True),
-                        StructField("metadata", StringType(), True),
-                    ]
-                ),
-                "refunds": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("amount", LongType(), True),
-                        StructField("currency", StringType(), True),
-                        StructField("charge", StringType(), True),
-                        StructField("payment_intent", StringType(), True),
-                        StructField("status", StringType(), True),
-                        StructField("reason", StringType(), True),
-                        StructField("receipt_number", StringType(), True),
-                        StructField("metadata", StringType(), True),
-                        StructField("failure_reason", StringType(), True),
-                    ]
-                ),
-                "disputes": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("amount", LongType(), True),
-                        StructField("currency", StringType(), True),
-                        StructField("charge", StringType(), True),
-                        StructField("payment_intent", StringType(), True),
-                        StructField("status", StringType(), True),
-                        StructField("reason", StringType(), True),
-                        StructField("evidence", StringType(), True),
-                        StructField("evidence_details", StringType(), True),
-                        StructField("is_charge_refundable", BooleanType(), True),
-                        StructField("metadata", StringType(), True),
-                    ]
-                ),
-                "payment_methods": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("type", StringType(), True),
-                        StructField("customer", StringType(), True),
-                        StructField("billing_details", self._billing_details_schema, True),
-                        StructField("card", StringType(), True),
-                        StructField("us_bank_account", StringType(), True),
-                        StructField("metadata", StringType(), True),
-                    ]
-                ),
-                "balance_transactions": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("amount", LongType(), True),
-                        StructField("currency", StringType(), True),
-                        StructField("net", LongType(), True),
-                        StructField("fee", LongType(), True),
-                        StructField("fee_details", ArrayType(self._fee_detail_schema), True),
-                        StructField("type", StringType(), True),
-                        StructField("source", StringType(), True),
-                        StructField("status", StringType(), True),
-                        StructField("description", StringType(), True),
-                        StructField("available_on", LongType(), True),
-                        StructField("exchange_rate", DoubleType(), True),
-                        StructField("reporting_category", StringType(), True),
-                    ]
-                ),
-                "payouts": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("amount", LongType(), True),
-                        StructField("currency", StringType(), True),
-                        StructField("arrival_date", LongType(), True),
-                        StructField("status", StringType(), True),
-                        StructField("type", StringType(), True),
-                        StructField("method", StringType(), True),
-                        StructField("destination", StringType(), True),
-                        StructField("description", StringType(), True),
-                        StructField("balance_transaction", StringType(), True),
-                        StructField("failure_code", StringType(), True),
-                        StructField("failure_message", StringType(), True),
-                        StructField("metadata", StringType(), True),
-                    ]
-                ),
-                "invoice_items": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("amount", LongType(), True),
-                        StructField("currency", StringType(), True),
-                        StructField("customer", StringType(), True),
-                        StructField("invoice", StringType(), True),
-                        StructField("subscription", StringType(), True),
-                        StructField("price", StringType(), True),
-                        StructField("description", StringType(), True),
-                        StructField("quantity", LongType(), True),
-                        StructField("unit_amount", LongType(), True),
-                        StructField("unit_amount_decimal", StringType(), True),
-                        StructField("period", StringType(), True),
-                        StructField("discounts", StringType(), True),
-                        StructField("metadata", StringType(), True),
-                        StructField("proration", BooleanType(), True),
-                        StructField("date", LongType(), True),
-                        StructField("discountable", BooleanType(), True),
-                        StructField("tax_rates", StringType(), True),
-                    ]
-                ),
-                "plans": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("active", BooleanType(), True),
-                        StructField("amount", LongType(), True),
-                        StructField("currency", StringType(), True),
-                        StructField("interval", StringType(), True),
-                        StructField("interval_count", LongType(), True),
-                        StructField("product", StringType(), True),
-                        StructField("nickname", StringType(), True),
-                        StructField("usage_type", StringType(), True),
-                        StructField("aggregate_usage", StringType(), True),
-                        StructField("trial_period_days", LongType(), True),
-                        StructField("tiers", StringType(), True),
-                        StructField("tiers_mode", StringType(), True),
-                        StructField("metadata", StringType(), True),
-                        StructField("deleted", BooleanType(), True),
-                    ]
-                ),
-                "events": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("type", StringType(), True),
-                        StructField("data", StringType(), True),
-                        StructField("api_version", StringType(), True),
-                        StructField("request", StringType(), True),
-                        StructField("pending_webhooks", LongType(), True),
-                    ]
-                ),
-                "coupons": StructType(
-                    [
-                        StructField("id", StringType(), False),
-                        StructField("object", StringType(), True),
-                        StructField("created", LongType(), True),
-                        StructField("livemode", BooleanType(), True),
-                        StructField("name", StringType(), True),
-                        StructField("amount_off", LongType(), True),
-                        StructField("percent_off", DoubleType(), True),
-                        StructField("currency", StringType(), True),
-                        StructField("duration", StringType(), True),
-                        StructField("duration_in_months", LongType(), True),
-                        StructField("max_redemptions", LongType(), True),
-                        StructField("times_redeemed", LongType(), True),
-                        StructField("redeem_by", LongType(), True),
-                        StructField("valid", BooleanType(), True),
-                        StructField("applies_to", StringType(), True),
-                        StructField("metadata", StringType(), True),
-                        StructField("currency_options", StringType(), True),
-                    ]
-                ),
-            }
+        @property
+        def _schema_config(self) -> Mapping[str, StructType]:
+            """The read-only schema registry, built on first access."""
+            return _schema_registry()
 
         def list_tables(self) -> list[str]:
             """
@@ -1080,6 +1873,27 @@ def register_lakeflow_source(spark):
                 "ingestion_type": config["ingestion_type"],
             }
 
+        def supported_filters(
+            self, table_name: str, table_options: Dict[str, str]
+        ) -> Dict[str, Tuple[str, ...]]:
+            """
+            Get the filters of batch queries that map to Stripe list parameters.
+
+            Range filters on `created` become `created[gt]`, `created[gte]`,
+            `created[lt]` and `created[lte]`. The payment methods list does not
+            accept them.
+
+            Args:
+                table_name: Name of the table
+
+            Returns:
+                Dictionary mapping column names to the supported operators
+            """
+            if table_name not in self._object_config or table_name in self.UNFILTERED_TABLES:
+                return {}
+            cursor_field = self._object_config[table_name]["cursor_field"]
+            return {cursor_field: tuple(self.RANGE_PARAMS)}
+
         def read_table(
             self, table_name: str, start_offset: dict, table_options: Dict[str, str]
         ) -> Tuple[List[Dict], Dict]:
@@ -1109,69 +1923,186 @@ def register_lakeflow_source(spark):
             if is_incremental:
                 return self._read_data_incremental(table_name, start_offset)
             else:
-                return self._read_data_full(table_name)
+                return self._read_data_full(table_name, table_options)
 
-        def _read_data_full(self, table_name: str) -> Tuple[List[Dict], Dict]:
+        def latest_offset(
+            self, table_name: str, start_offset: dict, table_options: Dict[str, str]
+        ) -> Dict:
             """
-            Read all data from a Stripe table (full refresh).
+            Plan the end offset of a partitioned stream micro-batch.
+
+            The cursor moves to the current time minus `lookback_seconds`
+            (default 60), so objects whose creation may not be listed yet are
+            left to a later micro-batch.
 
             Args:
                 table_name: Name of the table
+                start_offset: Offset the micro-batch starts from
+                table_options: Table options
 
             Returns:
-                Tuple of (all_records, offset)
+                {cursor_field: <unix_timestamp>}, or the start offset if the
+                cursor does not move
             """
-            config = self._object_config[table_name]
-            endpoint = config["endpoint"]
-            cursor_field = config["cursor_field"]
+            cursor_field = self._check_partitioned_stream_table(table_name)
+            lookback_seconds = int(table_options.get("lookback_seconds", 60))
+            end = int(time.time()) - lookback_seconds
+            start = (start_offset or {}).get(cursor_field)
+            if start is not None and start >= end:
+                return start_offset
+            return {cursor_field: end}
+
+        def partition_offsets(
+            self,
+            table_name: str,
+            start_offset: dict,
+            end_offset: dict,
+            table_options: Dict[str, str],
+        ) -> List[Tuple[Dict, Dict]]:
+            """
+            Split a partitioned stream micro-batch into `created` windows.
 
-            all_records = []
-            starting_after = None
-            latest_cursor_value = 0
+            The range from the start cursor (or 2011-01-01 on the first
+            micro-batch) to the end cursor is cut into `stream_partitions`
+            (default 8) windows of equal length, of at least one second each.
 
-            while True:
-                # Build request parameters
-                params = {
-                    "limit": 100  # Max allowed by Stripe
-                }
+            Args:
+                table_name: Name of the table
+                start_offset: Offset the micro-batch starts from
+                end_offset: Offset planned by `latest_offset`
+                table_options: Table options
+
+            Returns:
+                List of (window start, window end) offsets
+            """
+            cursor_field = self._check_partitioned_stream_table(table_name)
+            start = (start_offset or {}).get(cursor_field, self.STREAM_START)
+            end = (end_offset or {}).get(cursor_field, start)
+            if end <= start:
+                return []
+            count = max(1, min(int(table_options.get("stream_partitions", 8)), end - start))
+            bounds = [start + (end - start) * i // count for i in range(count)] + [end]
+            return [
+                ({cursor_field: low}, {cursor_field: high})
+                for low, high in zip(bounds, bounds[1:])
+            ]
+
+        def read_offset_range(
+            self,
+            table_name: str,
+            start_offset: dict,
+            end_offset: dict,
+            table_options: Dict[str, str],
+        ) -> Iterator[Dict]:
+            """
+            Read the objects created in one window of a partitioned stream.
+
+            Objects created at or after the window start and before its end are
+            requested with `created[gte]` and `created[lt]` and yielded page by
+            page. Adjacent windows share a bound, so every object is read once.
+
+            Args:
+                table_name: Name of the table
+                start_offset: Window start
+                end_offset: Window end
+                table_options: Table options
+
+            Returns:
+                Iterator of records
+            """
+            cursor_field = self._check_partitioned_stream_table(table_name)
+            params = {
+                f"{cursor_field}[gte]": start_offset[cursor_field],
+                f"{cursor_field}[lt]": end_offset[cursor_field],
+            }
+            for records in self._iter_pages(table_name, params):
+                yield from records
+
+        def _check_partitioned_stream_table(self, table_name: str) -> str:
+            """Return the cursor field of a table that can be read in windows."""
+            if table_name not in self._object_config or table_name in self.UNFILTERED_TABLES:
+                raise ValueError(
+                    f"Table {table_name!r} does not support partitioned streaming"
+                )
+            return self._object_config[table_name]["cursor_field"]
 
-                if starting_after:
-                    params["starting_after"] = starting_after
+        def _iter_pages(self, table_name: str, params: Dict) -> Iterator[List[Dict]]:
+            """
+            Page through the list endpoint of a Stripe table.
+
+            Pages of up to 100 objects are followed with `starting_after` until
+            Stripe reports no more.
+
+            Args:
+                table_name: Name of the table
+                params: List parameters other than `limit` and `starting_after`
+
+            Returns:
+                Iterator of the non-empty pages' records
+            """
+            url = f"{self.base_url}/{self._object_config[table_name]['endpoint']}"
+            params = {"limit": 100, **params}  # Max allowed by Stripe
 
-                # Make API request
-                url = f"{self.base_url}/{endpoint}"
-                response = requests.get(url, auth=self.auth, params=params)
+            while True:
+                response = self._session.get(url, auth=self.auth, params=params)
 
                 if response.status_code != 200:
                     raise Exception(
                         f"Stripe API error for {table_name}: {response.status_code} {response.text}"
                     )
 
-                data = response.json()
+                data = response_json(response)
                 records = data.get("data", [])
 
                 if not records:
-                    break
-
-                all_records.extend(records)
+                    return
 
-                # Track the latest cursor value for checkpointing
-                for record in records:
-                    cursor_value = record.get(cursor_field, 0)
-                    if cursor_value > latest_cursor_value:
-                        latest_cursor_value = cursor_value
+                yield records
 
                 # Check if there are more pages
-                has_more = data.get("has_more", False)
-                if not has_more:
-                    break
+                if not data.get("has_more", False):
+                    return
 
                 # Get the last object ID for pagination
-                starting_after = records[-1]["id"]
+                params["starting_after"] = records[-1]["id"]
 
                 # Rate limiting - be nice to the API
                 time.sleep(0.1)
 
+        def _read_data_full(
+            self, table_name: str, table_options: Dict[str, str] = None
+        ) -> Tuple[List[Dict], Dict]:
+            """
+            Read all data from a Stripe table (full refresh).
+
+            Args:
+                table_name: Name of the table
+                table_options: Table options; filters pushed down on the cursor
+                    field restrict the `created` range requested.
+
+            Returns:
+                Tuple of (all_records, offset)
+            """
+            cursor_field = self._object_config[table_name]["cursor_field"]
+
+            # Range filters pushed down on the cursor field
+            range_params = {}
+            for column, op, value in pushed_filters(table_options):
+                if column == cursor_field and op in self.RANGE_PARAMS:
+                    range_params[f"{cursor_field}[{self.RANGE_PARAMS[op]}]"] = value
+
+            all_records = []
+            latest_cursor_value = 0
+
+            for records in self._iter_pages(table_name, range_params):
+                all_records.extend(records)
+
+                # Track the latest cursor value for checkpointing
+                for record in records:
+                    cursor_value = record.get(cursor_field, 0)
+                    if cursor_value > latest_cursor_value:
+                        latest_cursor_value = cursor_value
+
             # Return records and offset for next incremental sync
             offset = {cursor_field: latest_cursor_value} if latest_cursor_value > 0 else {}
             return all_records, offset
@@ -1189,42 +2120,17 @@ def register_lakeflow_source(spark):
             Returns:
                 Tuple of (new_records, new_offset)
             """
-            config = self._object_config[table_name]
-            endpoint = config["endpoint"]
-            cursor_field = config["cursor_field"]
+            cursor_field = self._object_config[table_name]["cursor_field"]
 
             # Get the starting point from offset
             cursor_start = start_offset.get(cursor_field, 0)
 
             all_records = []
-            starting_after = None
             latest_cursor_value = cursor_start
 
-            while True:
-                # Build request parameters for incremental fetch
-                params = {
-                    "limit": 100,
-                    f"{cursor_field}[gte]": cursor_start,  # Greater than or equal to last cursor
-                }
-
-                if starting_after:
-                    params["starting_after"] = starting_after
-
-                # Make API request
-                url = f"{self.base_url}/{endpoint}"
-                response = requests.get(url, auth=self.auth, params=params)
-
-                if response.status_code != 200:
-                    raise Exception(
-                        f"Stripe API error for {table_name}: {response.status_code} {response.text}"
-                    )
-
-                data = response.json()
-                records = data.get("data", [])
-
-                if not records:
-                    break
-
+            # Greater than or equal to last cursor
+            params = {f"{cursor_field}[gte]": cursor_start}
+            for records in self._iter_pages(table_name, params):
                 all_records.extend(records)
 
                 # Track the latest cursor value
@@ -1233,17 +2139,6 @@ def register_lakeflow_source(spark):
                     if cursor_value > latest_cursor_value:
                         latest_cursor_value = cursor_value
 
-                # Check if there are more pages
-                has_more = data.get("has_more", False)
-                if not has_more:
-                    break
-
-                # Get the last object ID for pagination
-                starting_after = records[-1]["id"]
-
-                # Rate limiting
-                time.sleep(0.1)
-
             # Return new offset for next sync
             offset = {cursor_field: latest_cursor_value}
             return all_records, offset
@@ -1257,7 +2152,7 @@ def register_lakeflow_source(spark):
             """
             try:
                 url = f"{self.base_url}/customers?limit=1"
-                response = requests.get(url, auth=self.auth)
+                response = self._session.get(url, auth=self.auth)
 
                 if response.status_code == 200:
                     return {"status": "success", "message": "Connection successful"}
@@ -1275,16 +2170,125 @@ def register_lakeflow_source(spark):
     ########################################################
 
     METADATA_TABLE = "_lakeflow_metadata"
+    METRICS_TABLE = "_lakeflow_metrics"
     TABLE_NAME = "tableName"
     TABLE_NAME_LIST = "tableNameList"
+    # Set to "false" to stop logging (and saving) a metrics line per micro-batch.
+    METRICS_LOG_OPTION = "lakeflow.metrics"
+    # Set to "true" to read micro-batches with LakeflowPartitionedStreamReader.
+    PARTITIONED_STREAM_OPTION = "lakeflow.partitionedStream"
+    # Connector methods a partitioned stream needs.
+    PARTITIONED_STREAM_METHODS = ("latest_offset", "partition_offsets", "read_offset_range")
+    # Pseudo-table that reads the tables in `tableNameList` from one sweep of the
+    # first one, through the connector's `read_co_read`.
+    CO_READ_TABLE = "_lakeflow_co_read"
+
+    METRICS_SCHEMA = StructType(
+        [
+            StructField("tableName", StringType(), False),
+            StructField("requests", LongType(), True),
+            StructField("retries", LongType(), True),
+            StructField("throttled", LongType(), True),
+            StructField("errors", LongType(), True),
+            StructField("bytes_downloaded", LongType(), True),
+            StructField("records", LongType(), True),
+            StructField("read_seconds", DoubleType(), True),
+            StructField("fetch_seconds", DoubleType(), True),
+            StructField("parse_seconds", DoubleType(), True),
+            StructField(
+                "endpoints",
+                ArrayType(
+                    StructType(
+                        [
+                            StructField("endpoint", StringType(), True),
+                            StructField("requests", LongType(), True),
+                            StructField("total_ms", DoubleType(), True),
+                            StructField("max_ms", DoubleType(), True),
+                            StructField("buckets", ArrayType(LongType()), True),
+                        ]
+                    )
+                ),
+                True,
+            ),
+            StructField("logged_at", TimestampType(), True),
+            StructField("start_offset", StringType(), True),
+            StructField("end_offset", StringType(), True),
+        ]
+    )
+
+
+    def _log_metrics(options: dict[str, str], metrics: dict, **context) -> None:
+        """
+        Print the metrics of one read as a single JSON line, and append it to the
+        table's metrics log for `_lakeflow_metrics`.
+        """
+        if options.get(METRICS_LOG_OPTION, "true").lower() == "false":
+            return
+        line = {
+            "event": "lakeflow_connect_metrics",
+            "table": options.get(TABLE_NAME),
+            "logged_at": datetime.now(timezone.utc).isoformat(),
+            **context,
+            **metrics,
+        }
+        append_metrics_line(
+            options.get(METRICS_PATH_OPTION) or DEFAULT_METRICS_PATH,
+            options.get(TABLE_NAME),
+            line,
+        )
+        print(json.dumps(line, default=str))
+
+
+    def co_read_schema(table_schemas: dict) -> StructType:
+        """
+        Schema of the co-read pseudo-table: the name of the table a row belongs
+        to, then one struct column per table holding its records.
+        """
+        return StructType(
+            [StructField(TABLE_NAME, StringType(), False)]
+            + [
+                StructField(table, schema, True)
+                for table, schema in table_schemas.items()
+            ]
+        )
+
+
+    class LakeflowCoRead:
+        """
+        Reads the co-read pseudo-table through a connector's `read_co_read`.
+
+        `read_co_read(table_names, start_offset, table_options)` returns
+        `(table_name, record)` pairs and one offset for the whole sweep. Each pair
+        becomes a row of `co_read_schema`, so the readers can treat the sweep as
+        a single table.
+        """
+
+        def __init__(self, lakeflow_connect: LakeflowConnect, table_names: list[str]):
+            if not hasattr(lakeflow_connect, "read_co_read"):
+                raise ValueError(
+                    f"{CO_READ_TABLE} needs a connector that implements read_co_read"
+                )
+            if not table_names:
+                raise ValueError(f"{CO_READ_TABLE} needs a {TABLE_NAME_LIST}")
+            self.lakeflow_connect = lakeflow_connect
+            self.table_names = table_names
+
+        def read_table(
+            self, table_name: str, start_offset: dict, table_options: dict[str, str]
+        ) -> (Iterator[dict], dict):
+            records, offset = self.lakeflow_connect.read_co_read(
+                self.table_names, start_offset, table_options
+            )
+            return ({TABLE_NAME: name, name: record} for name, record in records), offset
 
 
     class LakeflowStreamReader(SimpleDataSourceStreamReader):
         """
         Implements a data source stream reader for Lakeflow Connect.
-        Currently, only the simpleStreamReader is implemented, which uses a
-        more generic protocol suitable for most data sources that support
-        incremental loading.
+        This is the default simpleStreamReader, which uses a more generic
+        protocol suitable for most data sources that support incremental
+        loading. Every micro-batch is read by a single reader on the driver;
+        see LakeflowPartitionedStreamReader for connectors that can split one.
         """
 
         def __init__(
@@ -1292,20 +2296,36 @@ def register_lakeflow_source(spark):
             options: dict[str, str],
             schema: StructType,
             lakeflow_connect: LakeflowConnect,
+            metrics: ReadMetrics,
         ):
             self.options = options
             self.lakeflow_connect = lakeflow_connect
             self.schema = schema
+            self.metrics = metrics
 
         def initialOffset(self):
             return {}
 
         def read(self, start: dict) -> (Iterator[tuple], dict):
-            records, offset = self.lakeflow_connect.read_table(
-                self.options["tableName"], start, self.options
+            profiler = ReadProfiler(self.options, "stream", start_offset=start)
+            started = time.perf_counter()
+            with profiler:
+                records, offset = self.lakeflow_connect.read_table(
+                    self.options["tableName"], start, self.options
+                )
+            rows = timed_rows(
+                records,
+                lambda x: parse_value(x, self.schema),
+                self.metrics,
+                time.perf_counter() - started,
+                on_complete=lambda: _log_metrics(
+                    self.options,
+                    self.metrics.collect(),
+                    start_offset=start,
+                    end_offset=offset,
+                ),
             )
-            rows = map(lambda x: parse_value(x, self.schema), records)
-            return rows, offset
+            return profiler.rows(rows), offset
 
         def readBetweenOffsets(self, start: dict, end: dict) -> Iterator[tuple]:
             # TODO: This does not ensure the records returned are identical across repeated calls.
@@ -1316,33 +2336,208 @@ def register_lakeflow_source(spark):
             return self.read(start)[0]
 
 
+    class LakeflowPartitionedStreamReader(DataSourceStreamReader):
+        """
+        Stream reader that splits every micro-batch into partitions read by the
+        executors in parallel.
+
+        Used instead of LakeflowStreamReader when the `lakeflow.partitionedStream`
+        option is `true`. The driver only plans: the connector's `latest_offset`
+        picks the end offset of the next micro-batch without reading records, and
+        `partition_offsets` splits the range between two offsets into independent
+        `(start, end)` pairs (per repository, per time window, ...). Each
+        executor then reads one pair with `read_offset_range`.
+        """
+
+        def __init__(
+            self,
+            options: dict[str, str],
+            schema: StructType,
+            lakeflow_connect: LakeflowConnect,
+            metrics: ReadMetrics,
+        ):
+            self.options = options
+            self.schema = schema
+            self.lakeflow_connect = lakeflow_connect
+            self.metrics = metrics
+            self.table_name = options[TABLE_NAME]
+            # Last planned offset, the start of the next micro-batch on runtimes
+            # that call latestOffset() without one.
+            self.latest = None
+
+        def initialOffset(self):
+            return {}
+
+        def latestOffset(self, start: dict = None, limit=None) -> dict:
+            if start is None:
+                start = self.latest if self.latest is not None else self.initialOffset()
+            self.latest = self.lakeflow_connect.latest_offset(
+                self.table_name, start, self.options
+            )
+            return self.latest
+
+        def partitions(self, start: dict, end: dict):
+            return [
+                InputPartition({"start": part_start, "end": part_end})
+                for part_start, part_end in self.lakeflow_connect.partition_offsets(
+                    self.table_name, start, end, self.options
+                )
+            ]
+
+        def read(self, partition) -> Iterator[tuple]:
+            start, end = partition.value["start"], partition.value["end"]
+            profiler = ReadProfiler(self.options, "stream", start_offset=start)
+            started = time.perf_counter()
+            with profiler:
+                records = self.lakeflow_connect.read_offset_range(
+                    self.table_name, start, end, self.options
+                )
+            rows = timed_rows(
+                records,
+                lambda x: parse_value(x, self.schema),
+                self.metrics,
+                time.perf_counter() - started,
+                on_complete=lambda: _log_metrics(
+                    self.options,
+                    self.metrics.collect(),
+                    start_offset=start,
+                    end_offset=end,
+                ),
+            )
+            return profiler.rows(rows)
+
+        def commit(self, end: dict) -> None:
+            pass
+
+
     class LakeflowBatchReader(DataSourceReader):
         def __init__(
             self,
             options: dict[str, str],
             schema: StructType,
             lakeflow_connect: LakeflowConnect,
+            metrics: ReadMetrics,
         ):
             self.options = options
             self.schema = schema
             self.lakeflow_connect = lakeflow_connect
+            self.metrics = metrics
             self.table_name = options[TABLE_NAME]
+            # `(column, op, value)` filters accepted by `pushFilters`
+            self.pushed_filters = []
+            # Columns read when `lakeflow.columns` pruned `schema`, else None.
+            # Without the option the table's schema is not looked up again: for
+            # some connectors that costs API calls (e.g. HubSpot property
+            # discovery), and a schema given by the user is passed through as is.
+            self.projection = None
+            if self.table_name not in (
+                METADATA_TABLE,
+                METRICS_TABLE,
+                CO_READ_TABLE,
+            ) and options.get(COLUMNS_OPTION):
+                self.projection = projection_paths(
+                    schema, lakeflow_connect.get_table_schema(self.table_name, options)
+                )
+
+        def pushFilters(self, filters):
+            """
+            Push down the filters the connector can turn into API parameters.
+
+            Connectors opt in with `supported_filters(table_name, table_options)`,
+            which maps column names to the operators they accept. Accepted
+            filters are passed to `read_table` in the `lakeflow.pushedFilters`
+            option so the connector can narrow its requests, and rows that do
+            not match them are dropped after parsing. The other filters are
+            returned to Spark.
+            """
+            supported_filters = getattr(self.lakeflow_connect, "supported_filters", None)
+            if supported_filters is None or self.table_name in (
+                METADATA_TABLE,
+                METRICS_TABLE,
+            ):
+                return filters
+            supported = supported_filters(self.table_name, self.options) or {}
+            unhandled = []
+            for spark_filter in filters:
+                pushed = to_pushed_filter(spark_filter)
+                if pushed is not None and pushed[1] in supported.get(pushed[0], ()):
+                    self.pushed_filters.append(pushed)
+                else:
+                    unhandled.append(spark_filter)
+            return unhandled
+
+        def partitions(self):
+            # Metadata lookups can each cost API calls, so give every table its
+            # own partition; resolution then takes as long as the slowest table
+            # rather than the sum of all of them.
+            if self.table_name in (METADATA_TABLE, METRICS_TABLE):
+                table_names = self._metadata_table_names()
+                if table_names:
+                    return [InputPartition(table) for table in table_names]
+            return [InputPartition(None)]
 
         def read(self, partition):
             all_records = []
-            if self.table_name == METADATA_TABLE:
-                all_records = self._read_table_metadata()
-            else:
+            if self.table_name in (METADATA_TABLE, METRICS_TABLE):
+                table_names = self._metadata_table_names()
+                if partition is not None and partition.value is not None:
+                    table_names = [partition.value]
+                if self.table_name == METRICS_TABLE:
+                    all_records = self._read_table_metrics(table_names)
+                else:
+                    all_records = self._read_table_metadata(table_names)
+                return iter(map(lambda x: parse_value(x, self.schema), all_records))
+
+            options = dict(self.options)
+            if self.pushed_filters:
+                options[PUSHED_FILTERS_OPTION] = json.dumps(self.pushed_filters)
+            if self.projection is not None:
+                options[PROJECTION_OPTION] = json.dumps(self.projection)
+            profiler = ReadProfiler(self.options, "batch")
+            started = time.perf_counter()
+            with profiler:
                 all_records, _ = self.lakeflow_connect.read_table(
-                    self.table_name, None, self.options
+                    self.table_name, None, options
                 )
+            rows = timed_rows(
+                all_records,
+                lambda x: parse_value(x, self.schema),
+                self.metrics,
+                time.perf_counter() - started,
+                on_complete=lambda: _log_metrics(self.options, self.metrics.collect()),
+            )
+            if self.pushed_filters:
+                rows = (row for row in rows if matches_filters(row, self.pushed_filters))
+            return profiler.rows(rows)
 
-            rows = map(lambda x: parse_value(x, self.schema), all_records)
-            return iter(rows)
-
-        def _read_table_metadata(self):
+        def _metadata_table_names(self) -> list[str]:
             table_name_list = self.options.get(TABLE_NAME_LIST, "")
-            table_names = [o.strip() for o in table_name_list.split(",") if o.strip()]
+            return [o.strip() for o in table_name_list.split(",") if o.strip()]
+
+        def _read_table_metrics(self, table_names: list[str]):
+            """
+            Return the metrics logged by the reads of each table, one row per
+            micro-batch (or batch read), oldest first. Nothing is read from the
+            source; stream offsets are returned as JSON strings.
+            """
+            directory = self.options.get(METRICS_PATH_OPTION) or DEFAULT_METRICS_PATH
+            all_records = []
+            for table in table_names:
+                for line in read_metrics_lines(directory, table):
+                    all_records.append(
+                        {
+                            **line,
+                            "tableName": table,
+                            **{
+                                key: json.dumps(line[key])
+                                for key in ("start_offset", "end_offset")
+                                if key in line
+                            },
+                        }
+                    )
+            return all_records
+
+        def _read_table_metadata(self, table_names: list[str]):
             all_records = []
             for table in table_names:
                 metadata = self.lakeflow_connect.read_table_metadata(table, self.options)
@@ -1354,6 +2549,11 @@ def register_lakeflow_source(spark):
         def __init__(self, options):
             self.options = options
             self.lakeflow_connect = LakeflowConnect(options)
+            # Connectors that instrument their HTTP calls expose a `metrics`
+            # attribute; the others still get record and timing counters.
+            self.metrics = getattr(self.lakeflow_connect, "metrics", None)
+            if not isinstance(self.metrics, ReadMetrics):
+                self.metrics = ReadMetrics()
 
         @classmethod
         def name(cls):
@@ -1370,15 +2570,67 @@ def register_lakeflow_source(spark):
                         StructField("ingestion_type", StringType(), True),
                     ]
                 )
+            elif table == METRICS_TABLE:
+                return METRICS_SCHEMA
+            elif table == CO_READ_TABLE:
+                return co_read_schema(
+                    {
+                        name: self.lakeflow_connect.get_table_schema(name, self.options)
+                        for name in self._table_name_list()
+                    }
+                )
             else:
                 # Assuming the LakeflowConnect interface uses get_table_schema, not get_table_details
-                return self.lakeflow_connect.get_table_schema(table, self.options)
+                schema = self.lakeflow_connect.get_table_schema(table, self.options)
+                columns = self.options.get(COLUMNS_OPTION)
+                if columns:
+                    schema = prune_schema(
+                        schema, [c.strip() for c in columns.split(",") if c.strip()]
+                    )
+                return schema
 
         def reader(self, schema: StructType):
-            return LakeflowBatchReader(self.options, schema, self.lakeflow_connect)
+            return LakeflowBatchReader(
+                self.options, schema, self._table_reader(), self.metrics
+            )
+
+        def streamReader(self, schema: StructType):
+            # Without the option, the base class raises the not-implemented error
+            # that makes Spark fall back to simpleStreamReader.
+            if self.options.get(PARTITIONED_STREAM_OPTION, "false").lower() != "true":
+                return super().streamReader(schema)
+            if self.options[TABLE_NAME] == CO_READ_TABLE:
+                raise ValueError(
+                    f"{PARTITIONED_STREAM_OPTION} does not apply to {CO_READ_TABLE}"
+                )
+            missing = [
+                method
+                for method in PARTITIONED_STREAM_METHODS
+                if not hasattr(self.lakeflow_connect, method)
+            ]
+            if missing:
+                raise ValueError(
+                    f"{PARTITIONED_STREAM_OPTION} is set, but the connector does not "
+                    f"implement {', '.join(missing)}"
+                )
+            return LakeflowPartitionedStreamReader(
+                self.options, schema, self.lakeflow_connect, self.metrics
+            )
 
         def simpleStreamReader(self, schema: StructType):
-            return LakeflowStreamReader(self.options, schema, self.lakeflow_connect)
+            return LakeflowStreamReader(
+                self.options, schema, self._table_reader(), self.metrics
+            )
+
+        def _table_name_list(self) -> list[str]:
+            table_name_list = self.options.get(TABLE_NAME_LIST, "")
+            return [o.strip() for o in table_name_list.split(",") if o.strip()]
+
+        def _table_reader(self):
+            """The object whose `read_table` serves `tableName`."""
+            if self.options[TABLE_NAME] == CO_READ_TABLE:
+                return LakeflowCoRead(self.lakeflow_connect, self._table_name_list())
+            return self.lakeflow_connect
 
 
     spark.dataSource.register(LakeflowSource)
@@ -11,851 +11,887 @@ from pyspark.sql.types import (
 )
 from datetime import datetime
 import time
-from typing import Dict, List, Tuple, Iterator, Any
-
-
-class LakeflowConnect:
-    def __init__(self, options: dict) -> None:
-        """
-        Initialize the Stripe connector with API credentials.
-
-        Args:
-            options: Dictionary containing:
-                - api_key: Stripe secret API key (sk_test_* or sk_live_*)
-        """
-        self.api_key = options["api_key"]
-        self.base_url = "https://api.stripe.com/v1"
-        self.auth = (self.api_key, "")  # API key as username, empty password
-
-        # Cache for schemas to avoid repeated computation
-        self._schema_cache = {}
-
-        # Centralized object metadata configuration
-        self._object_config = {
-            "customers": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "customers",
-                "supports_deleted": True,
-            },
-            "charges": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "charges",
-                "supports_deleted": False,
-            },
-            "payment_intents": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "payment_intents",
-                "supports_deleted": False,
-            },
-            "subscriptions": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "subscriptions",
-                "supports_deleted": False,
-            },
-            "invoices": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "invoices",
-                "supports_deleted": False,
-            },
-            "products": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "products",
-                "supports_deleted": True,
-            },
-            "prices": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "prices",
-                "supports_deleted": False,
-            },
-            "refunds": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "refunds",
-                "supports_deleted": False,
-            },
-            "disputes": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "disputes",
-                "supports_deleted": False,
-            },
-            "payment_methods": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "payment_methods",
-                "supports_deleted": False,
-            },
-            "balance_transactions": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "balance_transactions",
-                "supports_deleted": False,
-            },
-            "payouts": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "payouts",
-                "supports_deleted": False,
-            },
-            "invoice_items": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "invoiceitems",
-                "supports_deleted": False,
-            },
-            "plans": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "plans",
-                "supports_deleted": True,
-            },
-            "events": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "events",
-                "supports_deleted": False,
-            },
-            "coupons": {
-                "primary_keys": ["id"],
-                "cursor_field": "created",
-                "ingestion_type": "cdc",
-                "endpoint": "coupons",
-                "supports_deleted": False,
-            },
-        }
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Iterator, Any, Mapping, Optional
+
+from libs.metrics import ReadMetrics, attach_metrics
+from libs.utils import pushed_filters, response_json
+
+
+def _build_schema_config() -> Dict[str, StructType]:
+    """Build the Spark schema of every Stripe table."""
+    # Reusable nested schema for Stripe address objects
+    address_schema = StructType(
+        [
+            StructField("line1", StringType(), True),
+            StructField("line2", StringType(), True),
+            StructField("city", StringType(), True),
+            StructField("state", StringType(), True),
+            StructField("postal_code", StringType(), True),
+            StructField("country", StringType(), True),
+        ]
+    )
+
+    # Reusable nested schema for shipping (includes address + name/phone)
+    shipping_schema = StructType(
+        [
+            StructField("name", StringType(), True),
+            StructField("phone", StringType(), True),
+            StructField("address", address_schema, True),
+        ]
+    )
+
+    # Reusable nested schema for billing details
+    billing_details_schema = StructType(
+        [
+            StructField("address", address_schema, True),
+            StructField("email", StringType(), True),
+            StructField("name", StringType(), True),
+            StructField("phone", StringType(), True),
+            StructField("tax_id", StringType(), True),
+        ]
+    )
+
+    # Nested schema for card checks
+    card_checks_schema = StructType(
+        [
+            StructField("address_line1_check", StringType(), True),
+            StructField("address_postal_code_check", StringType(), True),
+            StructField("cvc_check", StringType(), True),
+        ]
+    )
+
+    # Nested schema for card details in payment_method_details
+    card_details_schema = StructType(
+        [
+            StructField("amount_authorized", LongType(), True),
+            StructField("authorization_code", StringType(), True),
+            StructField("brand", StringType(), True),
+            StructField("checks", card_checks_schema, True),
+            StructField("country", StringType(), True),
+            StructField("exp_month", LongType(), True),
+            StructField("exp_year", LongType(), True),
+            StructField("fingerprint", StringType(), True),
+            StructField("funding", StringType(), True),
+            StructField("last4", StringType(), True),
+            StructField("network", StringType(), True),
+            StructField("network_transaction_id", StringType(), True),
+            StructField("regulated_status", StringType(), True),
+            StructField("installments", StringType(), True),
+            StructField("mandate", StringType(), True),
+            StructField("three_d_secure", StringType(), True),
+            StructField("wallet", StringType(), True),
+            StructField("extended_authorization", StringType(), True),
+            StructField("incremental_authorization", StringType(), True),
+            StructField("multicapture", StringType(), True),
+            StructField("network_token", StringType(), True),
+            StructField("overcapture", StringType(), True),
+        ]
+    )
+
+    # Nested schema for payment_method_details (polymorphic - card is most common)
+    payment_method_details_schema = StructType(
+        [
+            StructField("type", StringType(), True),
+            StructField("card", card_details_schema, True),
+            # Other payment types stored as JSON strings for flexibility
+            StructField("ach_credit_transfer", StringType(), True),
+            StructField("ach_debit", StringType(), True),
+            StructField("acss_debit", StringType(), True),
+            StructField("affirm", StringType(), True),
+            StructField("afterpay_clearpay", StringType(), True),
+            StructField("alipay", StringType(), True),
+            StructField("amazon_pay", StringType(), True),
+            StructField("au_becs_debit", StringType(), True),
+            StructField("bacs_debit", StringType(), True),
+            StructField("bancontact", StringType(), True),
+            StructField("blik", StringType(), True),
+            StructField("boleto", StringType(), True),
+            StructField("card_present", StringType(), True),
+            StructField("cashapp", StringType(), True),
+            StructField("customer_balance", StringType(), True),
+            StructField("eps", StringType(), True),
+            StructField("fpx", StringType(), True),
+            StructField("giropay", StringType(), True),
+            StructField("grabpay", StringType(), True),
+            StructField("ideal", StringType(), True),
+            StructField("interac_present", StringType(), True),
+            StructField("klarna", StringType(), True),
+            StructField("konbini", StringType(), True),
+            StructField("link", StringType(), True),
+            StructField("multibanco", StringType(), True),
+            StructField("oxxo", StringType(), True),
+            StructField("p24", StringType(), True),
+            StructField("paynow", StringType(), True),
+            StructField("paypal", StringType(), True),
+            StructField("pix", StringType(), True),
+            StructField("promptpay", StringType(), True),
+            StructField("revolut_pay", StringType(), True),
+            StructField("sepa_debit", StringType(), True),
+            StructField("sofort", StringType(), True),
+            StructField("stripe_account", StringType(), True),
+            StructField("swish", StringType(), True),
+            StructField("us_bank_account", StringType(), True),
+            StructField("wechat", StringType(), True),
+            StructField("wechat_pay", StringType(), True),
+            StructField("zip", StringType(), True),
+        ]
+    )
+
+    # Nested schema for charge outcome
+    outcome_schema = StructType(
+        [
+            StructField("type", StringType(), True),
+            StructField("network_status", StringType(), True),
+            StructField("reason", StringType(), True),
+            StructField("risk_level", StringType(), True),
+            StructField("risk_score", LongType(), True),
+            StructField("seller_message", StringType(), True),
+            StructField("advice_code", StringType(), True),
+            StructField("network_advice_code", StringType(), True),
+            StructField("network_decline_code", StringType(), True),
+        ]
+    )
+
+    # Nested schema for price recurring
+    recurring_schema = StructType(
+        [
+            StructField("interval", StringType(), True),
+            StructField("interval_count", LongType(), True),
+            StructField("meter", StringType(), True),
+            StructField("trial_period_days", LongType(), True),
+            StructField("usage_type", StringType(), True),
+            StructField("aggregate_usage", StringType(), True),
+        ]
+    )
+
+    # Nested schema for fee detail (used in balance_transactions.fee_details array)
+    fee_detail_schema = StructType(
+        [
+            StructField("amount", LongType(), True),
+            StructField("application", StringType(), True),
+            StructField("currency", StringType(), True),
+            StructField("description", StringType(), True),
+            StructField("type", StringType(), True),
+        ]
+    )
 
-        # Reusable nested schema for Stripe address objects
-        self._address_schema = StructType(
-            [
-                StructField("line1", StringType(), True),
-                StructField("line2", StringType(), True),
-                StructField("city", StringType(), True),
-                StructField("state", StringType(), True),
-                StructField("postal_code", StringType(), True),
-                StructField("country", StringType(), True),
-            ]
-        )
+    # Nested schema for period (used in invoice line items, subscriptions, etc.)
+    period_schema = StructType(
+        [
+            StructField("start", LongType(), True),
+            StructField("end", LongType(), True),
+        ]
+    )
+
+    # Nested schema for invoice line item
+    invoice_line_item_schema = StructType(
+        [
+            StructField("id", StringType(), True),
+            StructField("object", StringType(), True),
+            StructField("amount", LongType(), True),
+            StructField("amount_excluding_tax", LongType(), True),
+            StructField("currency", StringType(), True),
+            StructField("description", StringType(), True),
+            StructField("discountable", BooleanType(), True),
+            StructField("discounts", StringType(), True),
+            StructField("discount_amounts", StringType(), True),
+            StructField("invoice", StringType(), True),
+            StructField("invoice_item", StringType(), True),
+            StructField("livemode", BooleanType(), True),
+            StructField("metadata", StringType(), True),
+            StructField("period", period_schema, True),
+            StructField("plan", StringType(), True),
+            StructField("price", StringType(), True),
+            StructField("proration", BooleanType(), True),
+            StructField("proration_details", StringType(), True),
+            StructField("quantity", LongType(), True),
+            StructField("subscription", StringType(), True),
+            StructField("subscription_item", StringType(), True),
+            StructField("tax_amounts", StringType(), True),
+            StructField("tax_rates", StringType(), True),
+            StructField("type", StringType(), True),
+            StructField("unit_amount_excluding_tax", StringType(), True),
+        ]
+    )
+
+    # Nested schema for invoice lines (paginated list wrapper)
+    invoice_lines_schema = StructType(
+        [
+            StructField("object", StringType(), True),
+            StructField("data", ArrayType(invoice_line_item_schema), True),
+            StructField("has_more", BooleanType(), True),
+            StructField("total_count", LongType(), True),
+            StructField("url", StringType(), True),
+        ]
+    )
+
+    # Nested schema for invoice payment settings
+    invoice_payment_settings_schema = StructType(
+        [
+            StructField("default_mandate", StringType(), True),
+            StructField("payment_method_options", StringType(), True),
+            StructField("payment_method_types", StringType(), True),
+        ]
+    )
+
+    # Nested schema for invoice status transitions
+    status_transitions_schema = StructType(
+        [
+            StructField("finalized_at", LongType(), True),
+            StructField("marked_uncollectible_at", LongType(), True),
+            StructField("paid_at", LongType(), True),
+            StructField("voided_at", LongType(), True),
+        ]
+    )
+
+    # Nested schema for card payment method options
+    card_payment_method_options_schema = StructType(
+        [
+            StructField("installments", StringType(), True),
+            StructField("mandate_options", StringType(), True),
+            StructField("network", StringType(), True),
+            StructField("request_three_d_secure", StringType(), True),
+            StructField("setup_future_usage", StringType(), True),
+            StructField("capture_method", StringType(), True),
+        ]
+    )
+
+    # Nested schema for payment_method_options (polymorphic)
+    payment_method_options_schema = StructType(
+        [
+            StructField("card", card_payment_method_options_schema, True),
+            StructField("acss_debit", StringType(), True),
+            StructField("affirm", StringType(), True),
+            StructField("afterpay_clearpay", StringType(), True),
+            StructField("alipay", StringType(), True),
+            StructField("amazon_pay", StringType(), True),
+            StructField("au_becs_debit", StringType(), True),
+            StructField("bacs_debit", StringType(), True),
+            StructField("bancontact", StringType(), True),
+            StructField("blik", StringType(), True),
+            StructField("boleto", StringType(), True),
+            StructField("cashapp", StringType(), True),
+            StructField("customer_balance", StringType(), True),
+            StructField("eps", StringType(), True),
+            StructField("fpx", StringType(), True),
+            StructField("giropay", StringType(), True),
+            StructField("grabpay", StringType(), True),
+            StructField("ideal", StringType(), True),
+            StructField("interac_present", StringType(), True),
+            StructField("klarna", StringType(), True),
+            StructField("konbini", StringType(), True),
+            StructField("link", StringType(), True),
+            StructField("mobilepay", StringType(), True),
+            StructField("multibanco", StringType(), True),
+            StructField("oxxo", StringType(), True),
+            StructField("p24", StringType(), True),
+            StructField("paynow", StringType(), True),
+            StructField("paypal", StringType(), True),
+            StructField("pix", StringType(), True),
+            StructField("promptpay", StringType(), True),
+            StructField("revolut_pay", StringType(), True),
+            StructField("sepa_debit", StringType(), True),
+            StructField("sofort", StringType(), True),
+            StructField("swish", StringType(), True),
+            StructField("us_bank_account", StringType(), True),
+            StructField("wechat_pay", StringType(), True),
+            StructField("zip", StringType(), True),
+        ]
+    )
 
-        # Reusable nested schema for shipping (includes address + name/phone)
-        self._shipping_schema = StructType(
+    # Centralized schema configuration
+    return {
+        "customers": StructType(
             [
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("email", StringType(), True),
                 StructField("name", StringType(), True),
                 StructField("phone", StringType(), True),
-                StructField("address", self._address_schema, True),
+                StructField("description", StringType(), True),
+                StructField("address", address_schema, True),
+                StructField("shipping", shipping_schema, True),
+                StructField("balance", LongType(), True),
+                StructField("currency", StringType(), True),
+                StructField("delinquent", BooleanType(), True),
+                StructField("preferred_locales", ArrayType(StringType()), True),
+                StructField("invoice_settings", StringType(), True),
+                StructField("tax_exempt", StringType(), True),
+                StructField("default_source", StringType(), True),
+                StructField("invoice_prefix", StringType(), True),
+                StructField("metadata", StringType(), True),
+                StructField("discount", StringType(), True),
+                StructField("deleted", BooleanType(), True),
+                StructField("test_clock", StringType(), True),
+                StructField("tax", StringType(), True),
+                StructField("sources", StringType(), True),
+                StructField("subscriptions", StringType(), True),
+                StructField("next_invoice_sequence", LongType(), True),
             ]
-        )
-
-        # Reusable nested schema for billing details
-        self._billing_details_schema = StructType(
+        ),
+        "charges": StructType(
             [
-                StructField("address", self._address_schema, True),
-                StructField("email", StringType(), True),
-                StructField("name", StringType(), True),
-                StructField("phone", StringType(), True),
-                StructField("tax_id", StringType(), True),
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("amount", LongType(), True),
+                StructField("amount_captured", LongType(), True),
+                StructField("amount_refunded", LongType(), True),
+                StructField("currency", StringType(), True),
+                StructField("status", StringType(), True),
+                StructField("paid", BooleanType(), True),
+                StructField("refunded", BooleanType(), True),
+                StructField("captured", BooleanType(), True),
+                StructField("disputed", BooleanType(), True),
+                StructField("customer", StringType(), True),
+                StructField("invoice", StringType(), True),
+                StructField("payment_intent", StringType(), True),
+                StructField("payment_method", StringType(), True),
+                StructField("description", StringType(), True),
+                StructField("receipt_email", StringType(), True),
+                StructField("receipt_url", StringType(), True),
+                StructField("statement_descriptor", StringType(), True),
+                StructField("billing_details", billing_details_schema, True),
+                StructField("payment_method_details", payment_method_details_schema, True),
+                StructField("outcome", outcome_schema, True),
+                StructField("metadata", StringType(), True),
+                StructField("failure_code", StringType(), True),
+                StructField("failure_message", StringType(), True),
             ]
-        )
-
-        # Nested schema for card checks
-        self._card_checks_schema = StructType(
+        ),
+        "payment_intents": StructType(
             [
-                StructField("address_line1_check", StringType(), True),
-                StructField("address_postal_code_check", StringType(), True),
-                StructField("cvc_check", StringType(), True),
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("amount", LongType(), True),
+                StructField("amount_capturable", LongType(), True),
+                StructField("amount_received", LongType(), True),
+                StructField("currency", StringType(), True),
+                StructField("status", StringType(), True),
+                StructField("canceled_at", LongType(), True),
+                StructField("cancellation_reason", StringType(), True),
+                StructField("customer", StringType(), True),
+                StructField("invoice", StringType(), True),
+                StructField("payment_method", StringType(), True),
+                StructField("description", StringType(), True),
+                StructField("receipt_email", StringType(), True),
+                StructField("statement_descriptor", StringType(), True),
+                StructField("capture_method", StringType(), True),
+                StructField("confirmation_method", StringType(), True),
+                StructField("charges", StringType(), True),
+                StructField("payment_method_options", payment_method_options_schema, True),
+                StructField("shipping", StringType(), True),
+                StructField("metadata", StringType(), True),
+                StructField("latest_charge", StringType(), True),
             ]
-        )
-
-        # Nested schema for card details in payment_method_details
-        self._card_details_schema = StructType(
+        ),
+        "subscriptions": StructType(
             [
-                StructField("amount_authorized", LongType(), True),
-                StructField("authorization_code", StringType(), True),
-                StructField("brand", StringType(), True),
-                StructField("checks", self._card_checks_schema, True),
-                StructField("country", StringType(), True),
-                StructField("exp_month", LongType(), True),
-                StructField("exp_year", LongType(), True),
-                StructField("fingerprint", StringType(), True),
-                StructField("funding", StringType(), True),
-                StructField("last4", StringType(), True),
-                StructField("network", StringType(), True),
-                StructField("network_transaction_id", StringType(), True),
-                StructField("regulated_status", StringType(), True),
-                StructField("installments", StringType(), True),
-                StructField("mandate", StringType(), True),
-                StructField("three_d_secure", StringType(), True),
-                StructField("wallet", StringType(), True),
-                StructField("extended_authorization", StringType(), True),
-                StructField("incremental_authorization", StringType(), True),
-                StructField("multicapture", StringType(), True),
-                StructField("network_token", StringType(), True),
-                StructField("overcapture", StringType(), True),
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("status", StringType(), True),
+                StructField("current_period_start", LongType(), True),
+                StructField("current_period_end", LongType(), True),
+                StructField("cancel_at", LongType(), True),
+                StructField("canceled_at", LongType(), True),
+                StructField("ended_at", LongType(), True),
+                StructField("trial_start", LongType(), True),
+                StructField("trial_end", LongType(), True),
+                StructField("customer", StringType(), True),
+                StructField("default_payment_method", StringType(), True),
+                StructField("latest_invoice", StringType(), True),
+                StructField("billing_cycle_anchor", LongType(), True),
+                StructField("collection_method", StringType(), True),
+                StructField("days_until_due", LongType(), True),
+                StructField("items", StringType(), True),
+                StructField("metadata", StringType(), True),
+                StructField("discount", StringType(), True),
+                StructField("cancel_at_period_end", BooleanType(), True),
             ]
-        )
-
-        # Nested schema for payment_method_details (polymorphic - card is most common)
-        self._payment_method_details_schema = StructType(
+        ),
+        "invoices": StructType(
             [
+                # Core identifiers
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                # Status and payment info
+                StructField("status", StringType(), True),
+                StructField("paid", BooleanType(), True),
+                StructField("paid_out_of_band", BooleanType(), True),
+                StructField("attempted", BooleanType(), True),
+                StructField("attempt_count", LongType(), True),
+                StructField("auto_advance", BooleanType(), True),
+                # Amounts
+                StructField("amount_due", LongType(), True),
+                StructField("amount_paid", LongType(), True),
+                StructField("amount_remaining", LongType(), True),
+                StructField("amount_shipping", LongType(), True),
+                StructField("total", LongType(), True),
+                StructField("subtotal", LongType(), True),
+                StructField("subtotal_excluding_tax", LongType(), True),
+                StructField("total_excluding_tax", LongType(), True),
+                StructField("tax", LongType(), True),
+                StructField("starting_balance", LongType(), True),
+                StructField("ending_balance", LongType(), True),
+                StructField("pre_payment_credit_notes_amount", LongType(), True),
+                StructField("post_payment_credit_notes_amount", LongType(), True),
+                StructField("currency", StringType(), True),
+                # Customer info
+                StructField("customer", StringType(), True),
+                StructField("customer_email", StringType(), True),
+                StructField("customer_name", StringType(), True),
+                StructField("customer_phone", StringType(), True),
+                StructField("customer_address", address_schema, True),
+                StructField("customer_shipping", shipping_schema, True),
+                StructField("customer_tax_exempt", StringType(), True),
+                StructField("customer_tax_ids", StringType(), True),
+                # References
+                StructField("subscription", StringType(), True),
+                StructField("charge", StringType(), True),
+                StructField("payment_intent", StringType(), True),
+                StructField("default_payment_method", StringType(), True),
+                StructField("default_source", StringType(), True),
+                StructField("quote", StringType(), True),
+                StructField("latest_revision", StringType(), True),
+                StructField("from_invoice", StringType(), True),
+                # Billing details
+                StructField("billing_reason", StringType(), True),
+                StructField("collection_method", StringType(), True),
+                StructField("description", StringType(), True),
+                StructField("footer", StringType(), True),
+                StructField("statement_descriptor", StringType(), True),
+                StructField("receipt_number", StringType(), True),
+                # Dates
+                StructField("due_date", LongType(), True),
+                StructField("period_start", LongType(), True),
+                StructField("period_end", LongType(), True),
+                StructField("next_payment_attempt", LongType(), True),
+                StructField("webhooks_delivered_at", LongType(), True),
+                StructField("effective_at", LongType(), True),
+                # URLs
+                StructField("number", StringType(), True),
+                StructField("hosted_invoice_url", StringType(), True),
+                StructField("invoice_pdf", StringType(), True),
+                # Account info
+                StructField("account_country", StringType(), True),
+                StructField("account_name", StringType(), True),
+                StructField("account_tax_ids", StringType(), True),
+                # Connect
+                StructField("application", StringType(), True),
+                StructField("application_fee_amount", LongType(), True),
+                StructField("on_behalf_of", StringType(), True),
+                StructField("transfer_data", StringType(), True),
+                # Complex nested objects
+                StructField("automatic_tax", StringType(), True),
+                StructField("custom_fields", StringType(), True),
+                StructField("default_tax_rates", StringType(), True),
+                StructField("discount", StringType(), True),
+                StructField("discounts", StringType(), True),
+                StructField("issuer", StringType(), True),
+                StructField("last_finalization_error", StringType(), True),
+                StructField("lines", invoice_lines_schema, True),
+                StructField("payment_settings", invoice_payment_settings_schema, True),
+                StructField("rendering", StringType(), True),
+                StructField("shipping_cost", StringType(), True),
+                StructField("shipping_details", StringType(), True),
+                StructField("status_transitions", status_transitions_schema, True),
+                StructField("subscription_details", StringType(), True),
+                StructField("threshold_reason", StringType(), True),
+                StructField("total_discount_amounts", StringType(), True),
+                StructField("total_tax_amounts", StringType(), True),
+                StructField("metadata", StringType(), True),
+                StructField("test_clock", StringType(), True),
+            ]
+        ),
+        "products": StructType(
+            [
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("updated", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("name", StringType(), True),
+                StructField("description", StringType(), True),
+                StructField("active", BooleanType(), True),
                 StructField("type", StringType(), True),
-                StructField("card", self._card_details_schema, True),
-                # Other payment types stored as JSON strings for flexibility
-                StructField("ach_credit_transfer", StringType(), True),
-                StructField("ach_debit", StringType(), True),
-                StructField("acss_debit", StringType(), True),
-                StructField("affirm", StringType(), True),
-                StructField("afterpay_clearpay", StringType(), True),
-                StructField("alipay", StringType(), True),
-                StructField("amazon_pay", StringType(), True),
-                StructField("au_becs_debit", StringType(), True),
-                StructField("bacs_debit", StringType(), True),
-                StructField("bancontact", StringType(), True),
-                StructField("blik", StringType(), True),
-                StructField("boleto", StringType(), True),
-                StructField("card_present", StringType(), True),
-                StructField("cashapp", StringType(), True),
-                StructField("customer_balance", StringType(), True),
-                StructField("eps", StringType(), True),
-                StructField("fpx", StringType(), True),
-                StructField("giropay", StringType(), True),
-                StructField("grabpay", StringType(), True),
-                StructField("ideal", StringType(), True),
-                StructField("interac_present", StringType(), True),
-                StructField("klarna", StringType(), True),
-                StructField("konbini", StringType(), True),
-                StructField("link", StringType(), True),
-                StructField("multibanco", StringType(), True),
-                StructField("oxxo", StringType(), True),
-                StructField("p24", StringType(), True),
-                StructField("paynow", StringType(), True),
-                StructField("paypal", StringType(), True),
-                StructField("pix", StringType(), True),
-                StructField("promptpay", StringType(), True),
-                StructField("revolut_pay", StringType(), True),
-                StructField("sepa_debit", StringType(), True),
-                StructField("sofort", StringType(), True),
-                StructField("stripe_account", StringType(), True),
-                StructField("swish", StringType(), True),
-                StructField("us_bank_account", StringType(), True),
-                StructField("wechat", StringType(), True),
-                StructField("wechat_pay", StringType(), True),
-                StructField("zip", StringType(), True),
+                StructField("unit_label", StringType(), True),
+                StructField("url", StringType(), True),
+                StructField("images", ArrayType(StringType()), True),
+                StructField("metadata", StringType(), True),
+                StructField("statement_descriptor", StringType(), True),
+                StructField("tax_code", StringType(), True),
+                StructField("shippable", BooleanType(), True),
+                StructField("deleted", BooleanType(), True),
+                StructField("default_price", StringType(), True),
+                StructField("features", StringType(), True),
+                StructField("package_dimensions", StringType(), True),
             ]
-        )
-
-        # Nested schema for charge outcome
-        self._outcome_schema = StructType(
+        ),
+        "prices": StructType(
             [
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("active", BooleanType(), True),
+                StructField("currency", StringType(), True),
+                StructField("unit_amount", LongType(), True),
+                StructField("unit_amount_decimal", StringType(), True),
+                StructField("product", StringType(), True),
+                StructField("billing_scheme", StringType(), True),
                 StructField("type", StringType(), True),
-                StructField("network_status", StringType(), True),
+                StructField("recurring", recurring_schema, True),
+                StructField("lookup_key", StringType(), True),
+                StructField("nickname", StringType(), True),
+                StructField("tax_behavior", StringType(), True),
+                StructField("tiers", StringType(), True),
+                StructField("tiers_mode", StringType(), True),
+                StructField("metadata", StringType(), True),
+            ]
+        ),
+        "refunds": StructType(
+            [
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("amount", LongType(), True),
+                StructField("currency", StringType(), True),
+                StructField("charge", StringType(), True),
+                StructField("payment_intent", StringType(), True),
+                StructField("status", StringType(), True),
                 StructField("reason", StringType(), True),
-                StructField("risk_level", StringType(), True),
-                StructField("risk_score", LongType(), True),
-                StructField("seller_message", StringType(), True),
-                StructField("advice_code", StringType(), True),
-                StructField("network_advice_code", StringType(), True),
-                StructField("network_decline_code", StringType(), True),
+                StructField("receipt_number", StringType(), True),
+                StructField("metadata", StringType(), True),
+                StructField("failure_reason", StringType(), True),
             ]
-        )
-
-        # Nested schema for price recurring
-        self._recurring_schema = StructType(
+        ),
+        "disputes": StructType(
             [
-                StructField("interval", StringType(), True),
-                StructField("interval_count", LongType(), True),
-                StructField("meter", StringType(), True),
-                StructField("trial_period_days", LongType(), True),
-                StructField("usage_type", StringType(), True),
-                StructField("aggregate_usage", StringType(), True),
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("amount", LongType(), True),
+                StructField("currency", StringType(), True),
+                StructField("charge", StringType(), True),
+                StructField("payment_intent", StringType(), True),
+                StructField("status", StringType(), True),
+                StructField("reason", StringType(), True),
+                StructField("evidence", StringType(), True),
+                StructField("evidence_details", StringType(), True),
+                StructField("is_charge_refundable", BooleanType(), True),
+                StructField("metadata", StringType(), True),
             ]
-        )
-
-        # Nested schema for fee detail (used in balance_transactions.fee_details array)
-        self._fee_detail_schema = StructType(
+        ),
+        "payment_methods": StructType(
+            [
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("type", StringType(), True),
+                StructField("customer", StringType(), True),
+                StructField("billing_details", billing_details_schema, True),
+                StructField("card", StringType(), True),
+                StructField("us_bank_account", StringType(), True),
+                StructField("metadata", StringType(), True),
+            ]
+        ),
+        "balance_transactions": StructType(
             [
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
                 StructField("amount", LongType(), True),
-                StructField("application", StringType(), True),
                 StructField("currency", StringType(), True),
-                StructField("description", StringType(), True),
+                StructField("net", LongType(), True),
+                StructField("fee", LongType(), True),
+                StructField("fee_details", ArrayType(fee_detail_schema), True),
                 StructField("type", StringType(), True),
+                StructField("source", StringType(), True),
+                StructField("status", StringType(), True),
+                StructField("description", StringType(), True),
+                StructField("available_on", LongType(), True),
+                StructField("exchange_rate", DoubleType(), True),
+                StructField("reporting_category", StringType(), True),
             ]
-        )
-
-        # Nested schema for period (used in invoice line items, subscriptions, etc.)
-        self._period_schema = StructType(
+        ),
+        "payouts": StructType(
             [
-                StructField("start", LongType(), True),
-                StructField("end", LongType(), True),
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("amount", LongType(), True),
+                StructField("currency", StringType(), True),
+                StructField("arrival_date", LongType(), True),
+                StructField("status", StringType(), True),
+                StructField("type", StringType(), True),
+                StructField("method", StringType(), True),
+                StructField("destination", StringType(), True),
+                StructField("description", StringType(), True),
+                StructField("balance_transaction", StringType(), True),
+                StructField("failure_code", StringType(), True),
+                StructField("failure_message", StringType(), True),
+                StructField("metadata", StringType(), True),
             ]
-        )
-
-        # Nested schema for invoice line item
-        self._invoice_line_item_schema = StructType(
+        ),
+        "invoice_items": StructType(
             [
-                StructField("id", StringType(), True),
+                StructField("id", StringType(), False),
                 StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
                 StructField("amount", LongType(), True),
-                StructField("amount_excluding_tax", LongType(), True),
                 StructField("currency", StringType(), True),
+                StructField("customer", StringType(), True),
+                StructField("invoice", StringType(), True),
+                StructField("subscription", StringType(), True),
+                StructField("price", StringType(), True),
                 StructField("description", StringType(), True),
-                StructField("discountable", BooleanType(), True),
+                StructField("quantity", LongType(), True),
+                StructField("unit_amount", LongType(), True),
+                StructField("unit_amount_decimal", StringType(), True),
+                StructField("period", StringType(), True),
                 StructField("discounts", StringType(), True),
-                StructField("discount_amounts", StringType(), True),
-                StructField("invoice", StringType(), True),
-                StructField("invoice_item", StringType(), True),
-                StructField("livemode", BooleanType(), True),
                 StructField("metadata", StringType(), True),
-                StructField("period", self._period_schema, True),
-                StructField("plan", StringType(), True),
-                StructField("price", StringType(), True),
                 StructField("proration", BooleanType(), True),
-                StructField("proration_details", StringType(), True),
-                StructField("quantity", LongType(), True),
-                StructField("subscription", StringType(), True),
-                StructField("subscription_item", StringType(), True),
-                StructField("tax_amounts", StringType(), True),
+                StructField("date", LongType(), True),
+                StructField("discountable", BooleanType(), True),
                 StructField("tax_rates", StringType(), True),
-                StructField("type", StringType(), True),
-                StructField("unit_amount_excluding_tax", StringType(), True),
             ]
-        )
-
-        # Nested schema for invoice lines (paginated list wrapper)
-        self._invoice_lines_schema = StructType(
+        ),
+        "plans": StructType(
             [
+                StructField("id", StringType(), False),
                 StructField("object", StringType(), True),
-                StructField("data", ArrayType(self._invoice_line_item_schema), True),
-                StructField("has_more", BooleanType(), True),
-                StructField("total_count", LongType(), True),
-                StructField("url", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("active", BooleanType(), True),
+                StructField("amount", LongType(), True),
+                StructField("currency", StringType(), True),
+                StructField("interval", StringType(), True),
+                StructField("interval_count", LongType(), True),
+                StructField("product", StringType(), True),
+                StructField("nickname", StringType(), True),
+                StructField("usage_type", StringType(), True),
+                StructField("aggregate_usage", StringType(), True),
+                StructField("trial_period_days", LongType(), True),
+                StructField("tiers", StringType(), True),
+                StructField("tiers_mode", StringType(), True),
+                StructField("metadata", StringType(), True),
+                StructField("deleted", BooleanType(), True),
             ]
-        )
-
-        # Nested schema for invoice payment settings
-        self._invoice_payment_settings_schema = StructType(
+        ),
+        "events": StructType(
             [
-                StructField("default_mandate", StringType(), True),
-                StructField("payment_method_options", StringType(), True),
-                StructField("payment_method_types", StringType(), True),
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("type", StringType(), True),
+                StructField("data", StringType(), True),
+                StructField("api_version", StringType(), True),
+                StructField("request", StringType(), True),
+                StructField("pending_webhooks", LongType(), True),
             ]
-        )
-
-        # Nested schema for invoice status transitions
-        self._status_transitions_schema = StructType(
+        ),
+        "coupons": StructType(
             [
-                StructField("finalized_at", LongType(), True),
-                StructField("marked_uncollectible_at", LongType(), True),
-                StructField("paid_at", LongType(), True),
-                StructField("voided_at", LongType(), True),
+                StructField("id", StringType(), False),
+                StructField("object", StringType(), True),
+                StructField("created", LongType(), True),
+                StructField("livemode", BooleanType(), True),
+                StructField("name", StringType(), True),
+                StructField("amount_off", LongType(), True),
+                StructField("percent_off", DoubleType(), True),
+                StructField("currency", StringType(), True),
+                StructField("duration", StringType(), True),
+                StructField("duration_in_months", LongType(), True),
+                StructField("max_redemptions", LongType(), True),
+                StructField("times_redeemed", LongType(), True),
+                StructField("redeem_by", LongType(), True),
+                StructField("valid", BooleanType(), True),
+                StructField("applies_to", StringType(), True),
+                StructField("metadata", StringType(), True),
+                StructField("currency_options", StringType(), True),
             ]
-        )
+        ),
+    }
 
-        # Nested schema for card payment method options
-        self._card_payment_method_options_schema = StructType(
-            [
-                StructField("installments", StringType(), True),
-                StructField("mandate_options", StringType(), True),
-                StructField("network", StringType(), True),
-                StructField("request_three_d_secure", StringType(), True),
-                StructField("setup_future_usage", StringType(), True),
-                StructField("capture_method", StringType(), True),
-            ]
-        )
 
-        # Nested schema for payment_method_options (polymorphic)
-        self._payment_method_options_schema = StructType(
-            [
-                StructField("card", self._card_payment_method_options_schema, True),
-                StructField("acss_debit", StringType(), True),
-                StructField("affirm", StringType(), True),
-                StructField("afterpay_clearpay", StringType(), True),
-                StructField("alipay", StringType(), True),
-                StructField("amazon_pay", StringType(), True),
-                StructField("au_becs_debit", StringType(), True),
-                StructField("bacs_debit", StringType(), True),
-                StructField("bancontact", StringType(), True),
-                StructField("blik", StringType(), True),
-                StructField("boleto", StringType(), True),
-                StructField("cashapp", StringType(), True),
-                StructField("customer_balance", StringType(), True),
-                StructField("eps", StringType(), True),
-                StructField("fpx", StringType(), True),
-                StructField("giropay", StringType(), True),
-                StructField("grabpay", StringType(), True),
-                StructField("ideal", StringType(), True),
-                StructField("interac_present", StringType(), True),
-                StructField("klarna", StringType(), True),
-                StructField("konbini", StringType(), True),
-                StructField("link", StringType(), True),
-                StructField("mobilepay", StringType(), True),
-                StructField("multibanco", StringType(), True),
-                StructField("oxxo", StringType(), True),
-                StructField("p24", StringType(), True),
-                StructField("paynow", StringType(), True),
-                StructField("paypal", StringType(), True),
-                StructField("pix", StringType(), True),
-                StructField("promptpay", StringType(), True),
-                StructField("revolut_pay", StringType(), True),
-                StructField("sepa_debit", StringType(), True),
-                StructField("sofort", StringType(), True),
-                StructField("swish", StringType(), True),
-                StructField("us_bank_account", StringType(), True),
-                StructField("wechat_pay", StringType(), True),
-                StructField("zip", StringType(), True),
-            ]
-        )
+# Read-only table schemas, built on first use and then reused by every
+# connector in the process (the schemas are static). Each process that reads
+# builds its own copy. Use `_schema_registry()` rather than this directly.
+_SCHEMA_REGISTRY: Optional[Mapping[str, StructType]] = None
 
-        # Centralized schema configuration
-        self._schema_config = {
-            "customers": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("email", StringType(), True),
-                    StructField("name", StringType(), True),
-                    StructField("phone", StringType(), True),
-                    StructField("description", StringType(), True),
-                    StructField("address", self._address_schema, True),
-                    StructField("shipping", self._shipping_schema, True),
-                    StructField("balance", LongType(), True),
-                    StructField("currency", StringType(), True),
-                    StructField("delinquent", BooleanType(), True),
-                    StructField("preferred_locales", ArrayType(StringType()), True),
-                    StructField("invoice_settings", StringType(), True),
-                    StructField("tax_exempt", StringType(), True),
-                    StructField("default_source", StringType(), True),
-                    StructField("invoice_prefix", StringType(), True),
-                    StructField("metadata", StringType(), True),
-                    StructField("discount", StringType(), True),
-                    StructField("deleted", BooleanType(), True),
-                    StructField("test_clock", StringType(), True),
-                    StructField("tax", StringType(), True),
-                    StructField("sources", StringType(), True),
-                    StructField("subscriptions", StringType(), True),
-                    StructField("next_invoice_sequence", LongType(), True),
-                ]
-            ),
-            "charges": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("amount", LongType(), True),
-                    StructField("amount_captured", LongType(), True),
-                    StructField("amount_refunded", LongType(), True),
-                    StructField("currency", StringType(), True),
-                    StructField("status", StringType(), True),
-                    StructField("paid", BooleanType(), True),
-                    StructField("refunded", BooleanType(), True),
-                    StructField("captured", BooleanType(), True),
-                    StructField("disputed", BooleanType(), True),
-                    StructField("customer", StringType(), True),
-                    StructField("invoice", StringType(), True),
-                    StructField("payment_intent", StringType(), True),
-                    StructField("payment_method", StringType(), True),
-                    StructField("description", StringType(), True),
-                    StructField("receipt_email", StringType(), True),
-                    StructField("receipt_url", StringType(), True),
-                    StructField("statement_descriptor", StringType(), True),
-                    StructField("billing_details", self._billing_details_schema, True),
-                    StructField("payment_method_details", self._payment_method_details_schema, True),
-                    StructField("outcome", self._outcome_schema, True),
-                    StructField("metadata", StringType(), True),
-                    StructField("failure_code", StringType(), True),
-                    StructField("failure_message", StringType(), True),
-                ]
-            ),
-            "payment_intents": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("amount", LongType(), True),
-                    StructField("amount_capturable", LongType(), True),
-                    StructField("amount_received", LongType(), True),
-                    StructField("currency", StringType(), True),
-                    StructField("status", StringType(), True),
-                    StructField("canceled_at", LongType(), True),
-                    StructField("cancellation_reason", StringType(), True),
-                    StructField("customer", StringType(), True),
-                    StructField("invoice", StringType(), True),
-                    StructField("payment_method", StringType(), True),
-                    StructField("description", StringType(), True),
-                    StructField("receipt_email", StringType(), True),
-                    StructField("statement_descriptor", StringType(), True),
-                    StructField("capture_method", StringType(), True),
-                    StructField("confirmation_method", StringType(), True),
-                    StructField("charges", StringType(), True),
-                    StructField("payment_method_options", self._payment_method_options_schema, True),
-                    StructField("shipping", StringType(), True),
-                    StructField("metadata", StringType(), True),
-                    StructField("latest_charge", StringType(), True),
-                ]
-            ),
-            "subscriptions": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("status", StringType(), True),
-                    StructField("current_period_start", LongType(), True),
-                    StructField("current_period_end", LongType(), True),
-                    StructField("cancel_at", LongType(), True),
-                    StructField("canceled_at", LongType(), True),
-                    StructField("ended_at", LongType(), True),
-                    StructField("trial_start", LongType(), True),
-                    StructField("trial_end", LongType(), True),
-                    StructField("customer", StringType(), True),
-                    StructField("default_payment_method", StringType(), True),
-                    StructField("latest_invoice", StringType(), True),
-                    StructField("billing_cycle_anchor", LongType(), True),
-                    StructField("collection_method", StringType(), True),
-                    StructField("days_until_due", LongType(), True),
-                    StructField("items", StringType(), True),
-                    StructField("metadata", StringType(), True),
-                    StructField("discount", StringType(), True),
-                    StructField("cancel_at_period_end", BooleanType(), True),
-                ]
-            ),
-            "invoices": StructType(
-                [
-                    # Core identifiers
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    # Status and payment info
-                    StructField("status", StringType(), True),
-                    StructField("paid", BooleanType(), True),
-                    StructField("paid_out_of_band", BooleanType(), True),
-                    StructField("attempted", BooleanType(), True),
-                    StructField("attempt_count", LongType(), True),
-                    StructField("auto_advance", BooleanType(), True),
-                    # Amounts
-                    StructField("amount_due", LongType(), True),
-                    StructField("amount_paid", LongType(), True),
-                    StructField("amount_remaining", LongType(), True),
-                    StructField("amount_shipping", LongType(), True),
-                    StructField("total", LongType(), True),
-                    StructField("subtotal", LongType(), True),
-                    StructField("subtotal_excluding_tax", LongType(), True),
-                    StructField("total_excluding_tax", LongType(), True),
-                    StructField("tax", LongType(), True),
-                    StructField("starting_balance", LongType(), True),
-                    StructField("ending_balance", LongType(), True),
-                    StructField("pre_payment_credit_notes_amount", LongType(), True),
-                    StructField("post_payment_credit_notes_amount", LongType(), True),
-                    StructField("currency", StringType(), True),
-                    # Customer info
-                    StructField("customer", StringType(), True),
-                    StructField("customer_email", StringType(), True),
-                    StructField("customer_name", StringType(), True),
-                    StructField("customer_phone", StringType(), True),
-                    StructField("customer_address", self._address_schema, True),
-                    StructField("customer_shipping", self._shipping_schema, True),
-                    StructField("customer_tax_exempt", StringType(), True),
-                    StructField("customer_tax_ids", StringType(), True),
-                    # References
-                    StructField("subscription", StringType(), True),
-                    StructField("charge", StringType(), True),
-                    StructField("payment_intent", StringType(), True),
-                    StructField("default_payment_method", StringType(), True),
-                    StructField("default_source", StringType(), True),
-                    StructField("quote", StringType(), True),
-                    StructField("latest_revision", StringType(), True),
-                    StructField("from_invoice", StringType(), True),
-                    # Billing details
-                    StructField("billing_reason", StringType(), True),
-                    StructField("collection_method", StringType(), True),
-                    StructField("description", StringType(), True),
-                    StructField("footer", StringType(), True),
-                    StructField("statement_descriptor", StringType(), True),
-                    StructField("receipt_number", StringType(), True),
-                    # Dates
-                    StructField("due_date", LongType(), True),
-                    StructField("period_start", LongType(), True),
-                    StructField("period_end", LongType(), True),
-                    StructField("next_payment_attempt", LongType(), True),
-                    StructField("webhooks_delivered_at", LongType(), True),
-                    StructField("effective_at", LongType(), True),
-                    # URLs
-                    StructField("number", StringType(), True),
-                    StructField("hosted_invoice_url", StringType(), True),
-                    StructField("invoice_pdf", StringType(), True),
-                    # Account info
-                    StructField("account_country", StringType(), True),
-                    StructField("account_name", StringType(), True),
-                    StructField("account_tax_ids", StringType(), True),
-                    # Connect
-                    StructField("application", StringType(), True),
-                    StructField("application_fee_amount", LongType(), True),
-                    StructField("on_behalf_of", StringType(), True),
-                    StructField("transfer_data", StringType(), True),
-                    # Complex nested objects
-                    StructField("automatic_tax", StringType(), True),
-                    StructField("custom_fields", StringType(), True),
-                    StructField("default_tax_rates", StringType(), True),
-                    StructField("discount", StringType(), True),
-                    StructField("discounts", StringType(), True),
-                    StructField("issuer", StringType(), True),
-                    StructField("last_finalization_error", StringType(), True),
-                    StructField("lines", self._invoice_lines_schema, True),
-                    StructField("payment_settings", self._invoice_payment_settings_schema, True),
-                    StructField("rendering", StringType(), True),
-                    StructField("shipping_cost", StringType(), True),
-                    StructField("shipping_details", StringType(), True),
-                    StructField("status_transitions", self._status_transitions_schema, True),
-                    StructField("subscription_details", StringType(), True),
-                    StructField("threshold_reason", StringType(), True),
-                    StructField("total_discount_amounts", StringType(), True),
-                    StructField("total_tax_amounts", StringType(), True),
-                    StructField("metadata", StringType(), True),
-                    StructField("test_clock", StringType(), True),
-                ]
-            ),
-            "products": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("updated", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("name", StringType(), True),
-                    StructField("description", StringType(), True),
-                    StructField("active", BooleanType(), True),
-                    StructField("type", StringType(), True),
-                    StructField("unit_label", StringType(), True),
-                    StructField("url", StringType(), True),
-                    StructField("images", ArrayType(StringType()), True),
-                    StructField("metadata", StringType(), True),
-                    StructField("statement_descriptor", StringType(), True),
-                    StructField("tax_code", StringType(), True),
-                    StructField("shippable", BooleanType(), True),
-                    StructField("deleted", BooleanType(), True),
-                    StructField("default_price", StringType(), True),
-                    StructField("features", StringType(), True),
-                    StructField("package_dimensions", StringType(), True),
-                ]
-            ),
-            "prices": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("active", BooleanType(), True),
-                    StructField("currency", StringType(), True),
-                    StructField("unit_amount", LongType(), True),
-                    StructField("unit_amount_decimal", StringType(), True),
-                    StructField("product", StringType(), True),
-                    StructField("billing_scheme", StringType(), True),
-                    StructField("type", StringType(), True),
-                    StructField("recurring", self._recurring_schema, True),
-                    StructField("lookup_key", StringType(), True),
-                    StructField("nickname", StringType(), True),
-                    StructField("tax_behavior", StringType(), True),
-                    StructField("tiers", StringType(), True),
-                    StructField("tiers_mode", StringType(), True),
-                    StructField("metadata", StringType(), True),
-                ]
-            ),
-            "refunds": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("amount", LongType(), True),
-                    StructField("currency", StringType(), True),
-                    StructField("charge", StringType(), True),
-                    StructField("payment_intent", StringType(), True),
-                    StructField("status", StringType(), True),
-                    StructField("reason", StringType(), True),
-                    StructField("receipt_number", StringType(), True),
-                    StructField("metadata", StringType(), True),
-                    StructField("failure_reason", StringType(), True),
-                ]
-            ),
-            "disputes": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("amount", LongType(), True),
-                    StructField("currency", StringType(), True),
-                    StructField("charge", StringType(), True),
-                    StructField("payment_intent", StringType(), True),
-                    StructField("status", StringType(), True),
-                    StructField("reason", StringType(), True),
-                    StructField("evidence", StringType(), True),
-                    StructField("evidence_details", StringType(), True),
-                    StructField("is_charge_refundable", BooleanType(), True),
-                    StructField("metadata", StringType(), True),
-                ]
-            ),
-            "payment_methods": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("type", StringType(), True),
-                    StructField("customer", StringType(), True),
-                    StructField("billing_details", self._billing_details_schema, True),
-                    StructField("card", StringType(), True),
-                    StructField("us_bank_account", StringType(), True),
-                    StructField("metadata", StringType(), True),
-                ]
-            ),
-            "balance_transactions": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("amount", LongType(), True),
-                    StructField("currency", StringType(), True),
-                    StructField("net", LongType(), True),
-                    StructField("fee", LongType(), True),
-                    StructField("fee_details", ArrayType(self._fee_detail_schema), True),
-                    StructField("type", StringType(), True),
-                    StructField("source", StringType(), True),
-                    StructField("status", StringType(), True),
-                    StructField("description", StringType(), True),
-                    StructField("available_on", LongType(), True),
-                    StructField("exchange_rate", DoubleType(), True),
-                    StructField("reporting_category", StringType(), True),
-                ]
-            ),
-            "payouts": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("amount", LongType(), True),
-                    StructField("currency", StringType(), True),
-                    StructField("arrival_date", LongType(), True),
-                    StructField("status", StringType(), True),
-                    StructField("type", StringType(), True),
-                    StructField("method", StringType(), True),
-                    StructField("destination", StringType(), True),
-                    StructField("description", StringType(), True),
-                    StructField("balance_transaction", StringType(), True),
-                    StructField("failure_code", StringType(), True),
-                    StructField("failure_message", StringType(), True),
-                    StructField("metadata", StringType(), True),
-                ]
-            ),
-            "invoice_items": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("amount", LongType(), True),
-                    StructField("currency", StringType(), True),
-                    StructField("customer", StringType(), True),
-                    StructField("invoice", StringType(), True),
-                    StructField("subscription", StringType(), True),
-                    StructField("price", StringType(), True),
-                    StructField("description", StringType(), True),
-                    StructField("quantity", LongType(), True),
-                    StructField("unit_amount", LongType(), True),
-                    StructField("unit_amount_decimal", StringType(), True),
-                    StructField("period", StringType(), True),
-                    StructField("discounts", StringType(), True),
-                    StructField("metadata", StringType(), True),
-                    StructField("proration", BooleanType(), True),
-                    StructField("date", LongType(), True),
-                    StructField("discountable", BooleanType(), True),
-                    StructField("tax_rates", StringType(), True),
-                ]
-            ),
-            "plans": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("active", BooleanType(), True),
-                    StructField("amount", LongType(), True),
-                    StructField("currency", StringType(), True),
-                    StructField("interval", StringType(), True),
-                    StructField("interval_count", LongType(), True),
-                    StructField("product", StringType(), True),
-                    StructField("nickname", StringType(), True),
-                    StructField("usage_type", StringType(), True),
-                    StructField("aggregate_usage", StringType(), True),
-                    StructField("trial_period_days", LongType(), True),
-                    StructField("tiers", StringType(), True),
-                    StructField("tiers_mode", StringType(), True),
-                    StructField("metadata", StringType(), True),
-                    StructField("deleted", BooleanType(), True),
-                ]
-            ),
-            "events": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("type", StringType(), True),
-                    StructField("data", StringType(), True),
-                    StructField("api_version", StringType(), True),
-                    StructField("request", StringType(), True),
-                    StructField("pending_webhooks", LongType(), True),
-                ]
-            ),
-            "coupons": StructType(
-                [
-                    StructField("id", StringType(), False),
-                    StructField("object", StringType(), True),
-                    StructField("created", LongType(), True),
-                    StructField("livemode", BooleanType(), True),
-                    StructField("name", StringType(), True),
-                    StructField("amount_off", LongType(), True),
-                    StructField("percent_off", DoubleType(), True),
-                    StructField("currency", StringType(), True),
-                    StructField("duration", StringType(), True),
-                    StructField("duration_in_months", LongType(), True),
-                    StructField("max_redemptions", LongType(), True),
-                    StructField("times_redeemed", LongType(), True),
-                    StructField("redeem_by", LongType(), True),
-                    StructField("valid", BooleanType(), True),
-                    StructField("applies_to", StringType(), True),
-                    StructField("metadata", StringType(), True),
-                    StructField("currency_options", StringType(), True),
-                ]
-            ),
-        }
+
+def _schema_registry() -> Mapping[str, StructType]:
+    """Return the schema of every Stripe table, building them on first use."""
+    global _SCHEMA_REGISTRY
+    if _SCHEMA_REGISTRY is None:
+        _SCHEMA_REGISTRY = MappingProxyType(_build_schema_config())
+    return _SCHEMA_REGISTRY
+
+
+class LakeflowConnect:
+    # Stripe list parameters for range filters on the cursor field
+    RANGE_PARAMS = {">": "gt", ">=": "gte", "<": "lt", "<=": "lte"}
+    # Tables whose list endpoint does not filter on `created`
+    UNFILTERED_TABLES = ("payment_methods",)
+    # Lower bound of the first partitioned stream micro-batch (2011-01-01,
+    # before any Stripe object was created)
+    STREAM_START = 1293840000
+
+    # Object metadata of every table (static, shared by every instance)
+    _object_config = {
+        "customers": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "customers",
+            "supports_deleted": True,
+        },
+        "charges": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "charges",
+            "supports_deleted": False,
+        },
+        "payment_intents": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "payment_intents",
+            "supports_deleted": False,
+        },
+        "subscriptions": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "subscriptions",
+            "supports_deleted": False,
+        },
+        "invoices": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "invoices",
+            "supports_deleted": False,
+        },
+        "products": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "products",
+            "supports_deleted": True,
+        },
+        "prices": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "prices",
+            "supports_deleted": False,
+        },
+        "refunds": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "refunds",
+            "supports_deleted": False,
+        },
+        "disputes": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "disputes",
+            "supports_deleted": False,
+        },
+        "payment_methods": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "payment_methods",
+            "supports_deleted": False,
+        },
+        "balance_transactions": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "balance_transactions",
+            "supports_deleted": False,
+        },
+        "payouts": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "payouts",
+            "supports_deleted": False,
+        },
+        "invoice_items": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "invoiceitems",
+            "supports_deleted": False,
+        },
+        "plans": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "plans",
+            "supports_deleted": True,
+        },
+        "events": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "events",
+            "supports_deleted": False,
+        },
+        "coupons": {
+            "primary_keys": ["id"],
+            "cursor_field": "created",
+            "ingestion_type": "cdc",
+            "endpoint": "coupons",
+            "supports_deleted": False,
+        },
+    }
+
+    def __init__(self, options: dict) -> None:
+        """
+        Initialize the Stripe connector with API credentials.
+
+        Args:
+            options: Dictionary containing:
+                - api_key: Stripe secret API key (sk_test_* or sk_live_*)
+                - base_url (optional): Override for the Stripe API base URL. Defaults to https://api.stripe.com/v1.
+        """
+        self.api_key = options["api_key"]
+        self.base_url = options.get("base_url", "https://api.stripe.com/v1").rstrip("/")
+        self.auth = (self.api_key, "")  # API key as username, empty password
+        # Reuse connections across requests and count them per micro-batch
+        self._session = requests.Session()
+        self.metrics = ReadMetrics()
+        attach_metrics(self._session, self.metrics)
+
+    @property
+    def _schema_config(self) -> Mapping[str, StructType]:
+        """The read-only schema registry, built on first access."""
+        return _schema_registry()
 
     def list_tables(self) -> list[str]:
         """
@@ -925,6 +961,27 @@ class LakeflowConnect:
             "ingestion_type": config["ingestion_type"],
         }
 
+    def supported_filters(
+        self, table_name: str, table_options: Dict[str, str]
+    ) -> Dict[str, Tuple[str, ...]]:
+        """
+        Get the filters of batch queries that map to Stripe list parameters.
+
+        Range filters on `created` become `created[gt]`, `created[gte]`,
+        `created[lt]` and `created[lte]`. The payment methods list does not
+        accept them.
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            Dictionary mapping column names to the supported operators
+        """
+        if table_name not in self._object_config or table_name in self.UNFILTERED_TABLES:
+            return {}
+        cursor_field = self._object_config[table_name]["cursor_field"]
+        return {cursor_field: tuple(self.RANGE_PARAMS)}
+
     def read_table(
         self, table_name: str, start_offset: dict, table_options: Dict[str, str]
     ) -> Tuple[List[Dict], Dict]:
@@ -954,69 +1011,186 @@ class LakeflowConnect:
         if is_incremental:
             return self._read_data_incremental(table_name, start_offset)
         else:
-            return self._read_data_full(table_name)
+            return self._read_data_full(table_name, table_options)
 
-    def _read_data_full(self, table_name: str) -> Tuple[List[Dict], Dict]:
+    def latest_offset(
+        self, table_name: str, start_offset: dict, table_options: Dict[str, str]
+    ) -> Dict:
         """
-        Read all data from a Stripe table (full refresh).
+        Plan the end offset of a partitioned stream micro-batch.
+
+        The cursor moves to the current time minus `lookback_seconds`
+        (default 60), so objects whose creation may not be listed yet are
+        left to a later micro-batch.
 
         Args:
             table_name: Name of the table
+            start_offset: Offset the micro-batch starts from
+            table_options: Table options
 
         Returns:
-            Tuple of (all_records, offset)
+            {cursor_field: <unix_timestamp>}, or the start offset if the
+            cursor does not move
         """
-        config = self._object_config[table_name]
-        endpoint = config["endpoint"]
-        cursor_field = config["cursor_field"]
+        cursor_field = self._check_partitioned_stream_table(table_name)
+        lookback_seconds = int(table_options.get("lookback_seconds", 60))
+        end = int(time.time()) - lookback_seconds
+        start = (start_offset or {}).get(cursor_field)
+        if start is not None and start >= end:
+            return start_offset
+        return {cursor_field: end}
+
+    def partition_offsets(
+        self,
+        table_name: str,
+        start_offset: dict,
+        end_offset: dict,
+        table_options: Dict[str, str],
+    ) -> List[Tuple[Dict, Dict]]:
+        """
+        Split a partitioned stream micro-batch into `created` windows.
 
-        all_records = []
-        starting_after = None
-        latest_cursor_value = 0
+        The range from the start cursor (or 2011-01-01 on the first
+        micro-batch) to the end cursor is cut into `stream_partitions`
+        (default 8) windows of equal length, of at least one second each.
 
-        while True:
-            # Build request parameters
-            params = {
-                "limit": 100  # Max allowed by Stripe
-            }
+        Args:
+            table_name: Name of the table
+            start_offset: Offset the micro-batch starts from
+            end_offset: Offset planned by `latest_offset`
+            table_options: Table options
 
-            if starting_after:
-                params["starting_after"] = starting_after
+        Returns:
+            List of (window start, window end) offsets
+        """
+        cursor_field = self._check_partitioned_stream_table(table_name)
+        start = (start_offset or {}).get(cursor_field, self.STREAM_START)
+        end = (end_offset or {}).get(cursor_field, start)
+        if end <= start:
+            return []
+        count = max(1, min(int(table_options.get("stream_partitions", 8)), end - start))
+        bounds = [start + (end - start) * i // count for i in range(count)] + [end]
+        return [
+            ({cursor_field: low}, {cursor_field: high})
+            for low, high in zip(bounds, bounds[1:])
+        ]
+
+    def read_offset_range(
+        self,
+        table_name: str,
+        start_offset: dict,
+        end_offset: dict,
+        table_options: Dict[str, str],
+    ) -> Iterator[Dict]:
+        """
+        Read the objects created in one window of a partitioned stream.
+
+        Objects created at or after the window start and before its end are
+        requested with `created[gte]` and `created[lt]` and yielded page by
+        page. Adjacent windows share a bound, so every object is read once.
+
+        Args:
+            table_name: Name of the table
+            start_offset: Window start
+            end_offset: Window end
+            table_options: Table options
 
-            # Make API request
-            url = f"{self.base_url}/{endpoint}"
-            response = requests.get(url, auth=self.auth, params=params)
+        Returns:
+            Iterator of records
+        """
+        cursor_field = self._check_partitioned_stream_table(table_name)
+        params = {
+            f"{cursor_field}[gte]": start_offset[cursor_field],
+            f"{cursor_field}[lt]": end_offset[cursor_field],
+        }
+        for records in self._iter_pages(table_name, params):
+            yield from records
+
+    def _check_partitioned_stream_table(self, table_name: str) -> str:
+        """Return the cursor field of a table that can be read in windows."""
+        if table_name not in self._object_config or table_name in self.UNFILTERED_TABLES:
+            raise ValueError(
+                f"Table {table_name!r} does not support partitioned streaming"
+            )
+        return self._object_config[table_name]["cursor_field"]
+
+    def _iter_pages(self, table_name: str, params: Dict) -> Iterator[List[Dict]]:
+        """
+        Page through the list endpoint of a Stripe table.
+
+        Pages of up to 100 objects are followed with `starting_after` until
+        Stripe reports no more.
+
+        Args:
+            table_name: Name of the table
+            params: List parameters other than `limit` and `starting_after`
+
+        Returns:
+            Iterator of the non-empty pages' records
+        """
+        url = f"{self.base_url}/{self._object_config[table_name]['endpoint']}"
+        params = {"limit": 100, **params}  # Max allowed by Stripe
+
+        while True:
+            response = self._session.get(url, auth=self.auth, params=params)
 
             if response.status_code != 200:
                 raise Exception(
                     f"Stripe API error for {table_name}: {response.status_code} {response.text}"
                 )
 
-            data = response.json()
+            data = response_json(response)
             records = data.get("data", [])
 
             if not records:
-                break
+                return
 
-            all_records.extend(records)
-
-            # Track the latest cursor value for checkpointing
-            for record in records:
-                cursor_value = record.get(cursor_field, 0)
-                if cursor_value > latest_cursor_value:
-                    latest_cursor_value = cursor_value
+            yield records
 
             # Check if there are more pages
-            has_more = data.get("has_more", False)
-            if not has_more:
-                break
+            if not data.get("has_more", False):
+                return
 
             # Get the last object ID for pagination
-            starting_after = records[-1]["id"]
+            params["starting_after"] = records[-1]["id"]
 
             # Rate limiting - be nice to the API
             time.sleep(0.1)
 
+    def _read_data_full(
+        self, table_name: str, table_options: Dict[str, str] = None
+    ) -> Tuple[List[Dict], Dict]:
+        """
+        Read all data from a Stripe table (full refresh).
+
+        Args:
+            table_name: Name of the table
+            table_options: Table options; filters pushed down on the cursor
+                field restrict the `created` range requested.
+
+        Returns:
+            Tuple of (all_records, offset)
+        """
+        cursor_field = self._object_config[table_name]["cursor_field"]
+
+        # Range filters pushed down on the cursor field
+        range_params = {}
+        for column, op, value in pushed_filters(table_options):
+            if column == cursor_field and op in self.RANGE_PARAMS:
+                range_params[f"{cursor_field}[{self.RANGE_PARAMS[op]}]"] = value
+
+        all_records = []
+        latest_cursor_value = 0
+
+        for records in self._iter_pages(table_name, range_params):
+            all_records.extend(records)
+
+            # Track the latest cursor value for checkpointing
+            for record in records:
+                cursor_value = record.get(cursor_field, 0)
+                if cursor_value > latest_cursor_value:
+                    latest_cursor_value = cursor_value
+
         # Return records and offset for next incremental sync
         offset = {cursor_field: latest_cursor_value} if latest_cursor_value > 0 else {}
         return all_records, offset
@@ -1034,42 +1208,17 @@ class LakeflowConnect:
         Returns:
             Tuple of (new_records, new_offset)
         """
-        config = self._object_config[table_name]
-        endpoint = config["endpoint"]
-        cursor_field = config["cursor_field"]
+        cursor_field = self._object_config[table_name]["cursor_field"]
 
         # Get the starting point from offset
         cursor_start = start_offset.get(cursor_field, 0)
 
         all_records = []
-        starting_after = None
         latest_cursor_value = cursor_start
 
-        while True:
-            # Build request parameters for incremental fetch
-            params = {
-                "limit": 100,
-                f"{cursor_field}[gte]": cursor_start,  # Greater than or equal to last cursor
-            }
-
-            if starting_after:
-                params["starting_after"] = starting_after
-
-            # Make API request
-            url = f"{self.base_url}/{endpoint}"
-            response = requests.get(url, auth=self.auth, params=params)
-
-            if response.status_code != 200:
-                raise Exception(
-                    f"Stripe API error for {table_name}: {response.status_code} {response.text}"
-                )
-
-            data = response.json()
-            records = data.get("data", [])
-
-            if not records:
-                break
-
+        # Greater than or equal to last cursor
+        params = {f"{cursor_field}[gte]": cursor_start}
+        for records in self._iter_pages(table_name, params):
             all_records.extend(records)
 
             # Track the latest cursor value
@@ -1078,17 +1227,6 @@ class LakeflowConnect:
                 if cursor_value > latest_cursor_value:
                     latest_cursor_value = cursor_value
 
-            # Check if there are more pages
-            has_more = data.get("has_more", False)
-            if not has_more:
-                break
-
-            # Get the last object ID for pagination
-            starting_after = records[-1]["id"]
-
-            # Rate limiting
-            time.sleep(0.1)
-
         # Return new offset for next sync
         offset = {cursor_field: latest_cursor_value}
         return all_records, offset
@@ -1102,7 +1240,7 @@ class LakeflowConnect:
         """
         try:
             url = f"{self.base_url}/customers?limit=1"
-            response = requests.get(url, auth=self.auth)
+            response = self._session.get(url, auth=self.auth)
 
             if response.status_code == 200:
                 return {"status": "success", "message": "Connection successful"}
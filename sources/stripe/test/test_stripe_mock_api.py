@@ -0,0 +1,132 @@
+"""
+Offline tests for the Stripe connector against the mock API server.
+"""
+
+import time
+
+import pytest
+
+from tests.mock_api_fixtures import FIXTURES, record_time
+from tests.mock_api_server import HasMorePagination, MockAPIServer
+from sources.stripe.stripe import LakeflowConnect, _schema_registry
+
+FIXTURE = FIXTURES["stripe.customers"]
+
+
+def install_customers(server: MockAPIServer, count: int) -> None:
+    """Serve `count` customers, filtered by `created[gte]` and `created[lt]`."""
+    customers = [
+        {"id": f"cus_{index:014d}", "object": "customer", "created": record_time(index)}
+        for index in range(count)
+    ]
+
+    def handler(request):
+        low = int(request.query.get("created[gte]", 0))
+        high = int(request.query.get("created[lt]", 2**31))
+        matching = [c for c in customers if low <= c["created"] < high]
+        positions = {c["id"]: i for i, c in enumerate(matching)}
+        return HasMorePagination(id_to_index=positions.__getitem__)(
+            request, matching, 0
+        )
+
+    server.route("/v1/customers", handler)
+
+
+def test_full_and_incremental_reads_page_through_customers():
+    with MockAPIServer() as server:
+        FIXTURE.install(server, 250)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+
+        records, offset = connector.read_table("customers", {}, {})
+
+        assert len({record["id"] for record in records}) == 250
+        assert offset == {"created": record_time(249)}
+        assert len(server.requests) == 3
+
+        server.requests.clear()
+        records, next_offset = connector.read_table("customers", offset, {})
+        assert [record["id"] for record in records] == [f"cus_{249:014d}"]
+        assert next_offset == offset
+        (path,) = [path for _, path in server.requests]
+        assert f"created%5Bgte%5D={record_time(249)}" in path
+
+
+def test_partition_offsets_split_the_range_into_contiguous_windows():
+    connector = LakeflowConnect({"api_key": "sk_test_mock"})
+    start = LakeflowConnect.STREAM_START
+    end = {"created": start + 100}
+
+    windows = connector.partition_offsets(
+        "customers", {}, end, {"stream_partitions": "4"}
+    )
+
+    assert windows == [
+        ({"created": start}, {"created": start + 25}),
+        ({"created": start + 25}, {"created": start + 50}),
+        ({"created": start + 50}, {"created": start + 75}),
+        ({"created": start + 75}, {"created": start + 100}),
+    ]
+    # Windows last at least a second, and an empty range has none.
+    short = connector.partition_offsets(
+        "customers", {"created": 10}, {"created": 13}, {}
+    )
+    assert len(short) == 3
+    assert connector.partition_offsets("customers", end, end, {}) == []
+
+
+def test_latest_offset_keeps_the_start_until_the_cursor_moves():
+    connector = LakeflowConnect({"api_key": "sk_test_mock"})
+
+    before = int(time.time())
+    end = connector.latest_offset("customers", {}, {"lookback_seconds": "60"})
+    assert before - 60 <= end["created"] <= int(time.time()) - 60
+
+    ahead = {"created": int(time.time()) + 3600}
+    assert connector.latest_offset("customers", ahead, {}) is ahead
+
+
+def test_windows_read_every_customer_once():
+    with MockAPIServer() as server:
+        install_customers(server, 300)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        start, end = {"created": record_time(0)}, {"created": record_time(300)}
+
+        ids = []
+        for window_start, window_end in connector.partition_offsets(
+            "customers", start, end, {"stream_partitions": "2"}
+        ):
+            ids += [
+                record["id"]
+                for record in connector.read_offset_range(
+                    "customers", window_start, window_end, {}
+                )
+            ]
+
+        assert sorted(ids) == [f"cus_{index:014d}" for index in range(300)]
+        paths = [path for _, path in server.requests]
+        # Two windows of 150 customers, two pages of up to 100 each.
+        assert len(paths) == 4
+        assert sum("starting_after=" in path for path in paths) == 2
+        assert all("created%5Blt%5D" in path for path in paths)
+
+
+def test_schemas_are_built_once_and_shared():
+    first = LakeflowConnect({"api_key": "sk_test_mock"})
+    second = LakeflowConnect({"api_key": "sk_test_mock"})
+    for table in first.list_tables():
+        assert first.get_table_schema(table, {}) is second.get_table_schema(table, {})
+    with pytest.raises(TypeError):
+        _schema_registry()["customers"] = None
+
+
+def test_payment_methods_cannot_be_read_in_windows():
+    connector = LakeflowConnect({"api_key": "sk_test_mock"})
+
+    with pytest.raises(ValueError, match="payment_methods"):
+        connector.latest_offset("payment_methods", {}, {})
+    with pytest.raises(ValueError, match="payment_methods"):
+        list(
+            connector.read_offset_range(
+                "payment_methods", {"created": 0}, {"created": 1}, {}
+            )
+        )
@@ -5,17 +5,40 @@
 # Do not edit manually. Make changes to the source files instead.
 # ==============================================================================
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
+    Optional,
+    Tuple,
+    Union,
 )
+from urllib.parse import urlparse
+import cProfile
+import calendar
+import json
+import os
+import pstats
+import re
+import tempfile
+import threading
+import time
+import uuid
 
 from pyspark.sql import Row
-from pyspark.sql.datasource import DataSource, DataSourceReader, SimpleDataSourceStreamReader
+from pyspark.sql.datasource import (
+    DataSource,
+    DataSourceReader,
+    DataSourceStreamReader,
+    InputPartition,
+    SimpleDataSourceStreamReader,
+)
 from pyspark.sql.types import *
 import base64
 import requests
@@ -163,16 +186,818 @@ def register_lakeflow_source(spark):
             )
 
 
+    # Length of the fixed `YYYY-MM-DDTHH:MM:SSZ` layout used by most APIs for cursors.
+    _UTC_ISO8601_LENGTH = 20
+
+    # Parsed values of timestamps that do not use the fixed layout. Kept as a plain
+    # bounded dict (rather than functools.lru_cache) so it pickles with the
+    # generated source.
+    _ISO8601_CACHE: dict = {}
+    _ISO8601_CACHE_SIZE = 4096
+
+
+    def is_utc_iso8601(value: Any) -> bool:
+        """
+        Check whether a value uses the fixed `YYYY-MM-DDTHH:MM:SSZ` layout.
+
+        Timestamps in this layout sort lexicographically in time order, so they can
+        be compared as strings without parsing.
+        """
+        return (
+            isinstance(value, str)
+            and len(value) == _UTC_ISO8601_LENGTH
+            and value[4] == "-"
+            and value[7] == "-"
+            and value[10] == "T"
+            and value[13] == ":"
+            and value[16] == ":"
+            and value[19] == "Z"
+        )
+
+
+    def iso8601_to_epoch(value: Any) -> Optional[float]:
+        """
+        Convert an ISO 8601 timestamp string to seconds since the epoch.
+
+        The fixed `YYYY-MM-DDTHH:MM:SSZ` layout is converted by slicing; other
+        layouts (fractional seconds, offsets, space separator) go through
+        `datetime.fromisoformat` and are cached. Timestamps without an offset are
+        taken to be UTC. Returns None for values that cannot be parsed.
+        """
+        if is_utc_iso8601(value):
+            try:
+                fields = (
+                    int(value[0:4]),
+                    int(value[5:7]),
+                    int(value[8:10]),
+                    int(value[11:13]),
+                    int(value[14:16]),
+                    int(value[17:19]),
+                )
+            except ValueError:
+                return None
+            # calendar.timegm normalizes out-of-range fields instead of rejecting them.
+            if not (
+                1 <= fields[1] <= 12
+                and 1 <= fields[2]
+                and (
+                    fields[2] <= 28
+                    or fields[2] <= calendar.monthrange(fields[0], fields[1])[1]
+                )
+                and fields[3] < 24
+                and fields[4] < 60
+                and fields[5] < 60
+            ):
+                return None
+            return float(calendar.timegm(fields))
+
+        if not isinstance(value, str) or not value:
+            return None
+
+        cached = _ISO8601_CACHE.get(value)
+        if cached is not None:
+            return cached
+
+        text = value[:-1] + "+00:00" if value.endswith("Z") else value
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        epoch = parsed.timestamp()
+
+        if len(_ISO8601_CACHE) >= _ISO8601_CACHE_SIZE:
+            _ISO8601_CACHE.clear()
+        _ISO8601_CACHE[value] = epoch
+        return epoch
+
+
+    def epoch_to_iso8601(seconds: float) -> str:
+        """Format seconds since the epoch in the `YYYY-MM-DDTHH:MM:SSZ` layout."""
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
+
+
+    def latest_iso8601(current: Optional[str], candidate: Any) -> Optional[str]:
+        """
+        Return the later of two ISO 8601 timestamps, ignoring unparseable values.
+
+        Intended for tracking a cursor over many records: when both values use the
+        fixed UTC layout they are compared as strings, otherwise they are parsed.
+        """
+        if not isinstance(candidate, str) or not candidate:
+            return current
+        if current is None:
+            return candidate if iso8601_to_epoch(candidate) is not None else current
+        if is_utc_iso8601(current) and is_utc_iso8601(candidate):
+            return candidate if candidate > current else current
+        candidate_epoch = iso8601_to_epoch(candidate)
+        if candidate_epoch is None:
+            return current
+        current_epoch = iso8601_to_epoch(current)
+        if current_epoch is None or candidate_epoch > current_epoch:
+            return candidate
+        return current
+
+
+    # JSON backends in order of preference. Set the LAKEFLOW_JSON_BACKEND
+    # environment variable to one of these names to force a backend.
+    JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+
+    def select_json_backend(
+        preferred: Optional[str] = None,
+    ) -> Tuple[str, Callable[[Union[bytes, str]], Any]]:
+        """
+        Return the name and `loads` function of the fastest installed JSON decoder.
+
+        orjson and msgspec are used when importable; the standard library is the
+        fallback. All three accept `bytes` as well as `str`. `preferred` skips
+        the backends listed before it.
+        """
+        candidates = JSON_BACKENDS
+        if preferred:
+            if preferred not in JSON_BACKENDS:
+                raise ValueError(
+                    f"Unknown JSON backend '{preferred}', expected one of {JSON_BACKENDS}"
+                )
+            candidates = JSON_BACKENDS[JSON_BACKENDS.index(preferred):]
+        for name in candidates:
+            try:
+                if name == "orjson":
+                    import orjson
+
+                    return name, orjson.loads
+                if name == "msgspec":
+                    import msgspec
+
+                    return name, msgspec.json.decode
+            except ImportError:
+                continue
+        return "json", json.loads
+
+
+    JSON_BACKEND, _json_decode = select_json_backend(
+        os.environ.get("LAKEFLOW_JSON_BACKEND")
+    )
+
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document with the fastest available backend.
+
+        Documents the fast backends reject (such as `NaN` literals or malformed
+        input) are retried with the standard library, so the accepted input and
+        the `json.JSONDecodeError` raised match `json.loads`. Note that orjson
+        decodes integers wider than 64 bits as floats.
+        """
+        try:
+            return _json_decode(data)
+        except Exception:
+            if _json_decode is json.loads:
+                raise
+            return json.loads(data)
+
+
+    def response_json(response) -> Any:
+        """
+        Decode a `requests` response body straight from its bytes.
+
+        Replaces `response.json()`, which first decodes the body to `str` and
+        then parses it with the standard library.
+        """
+        return json_loads(response.content)
+
+
+    # Table option through which the batch reader hands the filters it pushed
+    # down to `read_table`, as a JSON list of `[column, op, value]` triples.
+    PUSHED_FILTERS_OPTION = "lakeflow.pushedFilters"
+
+    # Spark data source filter classes that can be pushed down, by class name.
+    _PUSHED_FILTER_OPS = {
+        "EqualTo": "=",
+        "GreaterThan": ">",
+        "GreaterThanOrEqual": ">=",
+        "LessThan": "<",
+        "LessThanOrEqual": "<=",
+        "In": "in",
+    }
+
+
+    def to_pushed_filter(spark_filter: Any) -> Optional[Tuple[str, str, Any]]:
+        """
+        Convert a `pyspark.sql.datasource.Filter` to a `(column, op, value)` triple.
+
+        Nested columns are joined with dots, e.g. `properties.$city`. Returns
+        None for filters that cannot be pushed down: other filter classes,
+        column names containing dots, and values that are not JSON scalars.
+        """
+        op = _PUSHED_FILTER_OPS.get(type(spark_filter).__name__)
+        if op is None:
+            return None
+        attribute = tuple(spark_filter.attribute)
+        if not attribute or any("." in name for name in attribute):
+            return None
+        values = spark_filter.value if op == "in" else (spark_filter.value,)
+        if not all(isinstance(value, (str, int, float, bool)) for value in values):
+            return None
+        value = list(values) if op == "in" else values[0]
+        return ".".join(attribute), op, value
+
+
+    def pushed_filters(table_options: Optional[dict]) -> list:
+        """
+        Return the `(column, op, value)` filters pushed down to a read.
+
+        Connectors use them to narrow their API requests. They do not have to
+        apply them exactly: the batch reader drops the rows that do not match.
+        """
+        value = (table_options or {}).get(PUSHED_FILTERS_OPTION)
+        if not value:
+            return []
+        return [tuple(pushed) for pushed in json.loads(value)]
+
+
+    def matches_filters(row: Any, filters: list) -> bool:
+        """Whether a parsed row satisfies every `(column, op, value)` filter."""
+        for column, op, value in filters:
+            field = row
+            for name in column.split("."):
+                field = None if field is None else field[name]
+            if field is None:
+                return False
+            if op == "=":
+                matched = field == value
+            elif op == ">":
+                matched = field > value
+            elif op == ">=":
+                matched = field >= value
+            elif op == "<":
+                matched = field < value
+            elif op == "<=":
+                matched = field <= value
+            elif op == "in":
+                matched = field in value
+            else:
+                raise ValueError(f"Unsupported filter operator {op!r}")
+            if not matched:
+                return False
+        return True
+
+
+    # Table option listing the columns a batch read returns, comma-separated;
+    # nested struct fields are written as `parent.field`.
+    COLUMNS_OPTION = "lakeflow.columns"
+    # Table option through which the batch reader hands the columns it needs to
+    # `read_table`, as a JSON list of column paths.
+    PROJECTION_OPTION = "lakeflow.projection"
+
+
+    def prune_schema(schema: StructType, columns: list) -> StructType:
+        """
+        Keep only `columns` of `schema`, in schema order.
+
+        A column is a top-level name or a `parent.field` path into a struct
+        column. Unknown columns raise a ValueError.
+        """
+        selected = {}
+        for column in columns:
+            name, _, sub = column.partition(".")
+            if name not in schema.fieldNames():
+                raise ValueError(f"Unknown column '{column}'")
+            if not sub:
+                selected[name] = None
+                continue
+            data_type = schema[name].dataType
+            if not isinstance(data_type, StructType) or sub not in data_type.fieldNames():
+                raise ValueError(f"Unknown column '{column}'")
+            if name not in selected or selected[name] is not None:
+                selected.setdefault(name, set()).add(sub)
+
+        fields = []
+        for field in schema.fields:
+            if field.name not in selected:
+                continue
+            subfields = selected[field.name]
+            if subfields is None:
+                fields.append(field)
+            else:
+                fields.append(
+                    StructField(
+                        field.name,
+                        StructType([f for f in field.dataType.fields if f.name in subfields]),
+                        field.nullable,
+                        field.metadata,
+                    )
+                )
+        return StructType(fields)
+
+
+    def projection_paths(schema: StructType, full_schema: StructType) -> Optional[list]:
+        """
+        Describe a pruned `schema` as column paths of `full_schema`.
+
+        Returns None when nothing was pruned. Struct columns whose fields were
+        pruned are listed field by field as `parent.field`.
+        """
+        if schema == full_schema:
+            return None
+        paths = []
+        for field in schema.fields:
+            full_type = (
+                full_schema[field.name].dataType
+                if field.name in full_schema.fieldNames()
+                else None
+            )
+            if (
+                isinstance(field.dataType, StructType)
+                and isinstance(full_type, StructType)
+                and field.dataType != full_type
+            ):
+                paths.extend(f"{field.name}.{sub}" for sub in field.dataType.fieldNames())
+            else:
+                paths.append(field.name)
+        return paths
+
+
+    def projected_fields(table_options: Optional[dict], column: str) -> Optional[set]:
+        """
+        Fields of `column` a read has to return.
+
+        None means the whole column (or no projection was pushed down); an
+        empty set means the column is not read at all. For a struct column, the
+        set holds the names of its selected fields.
+        """
+        value = (table_options or {}).get(PROJECTION_OPTION)
+        if not value:
+            return None
+        fields = set()
+        for path in json.loads(value):
+            name, _, sub = path.partition(".")
+            if name != column:
+                continue
+            if not sub:
+                return None
+            fields.add(sub)
+        return fields
+
+
+    ########################################################
+    # libs/metrics.py
+    ########################################################
+
+    METRICS_PATH_OPTION = "lakeflow.metrics.path"
+    DEFAULT_METRICS_PATH = os.path.join(tempfile.gettempdir(), "lakeflow_metrics")
+
+    # Upper bounds (in milliseconds) of the request latency histogram buckets; the
+    # last bucket counts everything slower than the largest bound.
+    LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    # Path segments that look like identifiers are collapsed so that per-endpoint
+    # statistics do not grow with the number of records (e.g. /tickets/{id}/comments).
+    _ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,}|[A-Za-z]+_[A-Za-z0-9]{8,})$")
+
+
+    def endpoint_name(url: str) -> str:
+        """Return the path of a request URL with identifier segments replaced by {id}."""
+        path = urlparse(url).path or "/"
+        return "/".join(
+            "{id}" if _ID_SEGMENT.match(segment) else segment
+            for segment in path.split("/")
+        )
+
+
+    class ReadMetrics:
+        """
+        Counters describing the work done by a connector for one read.
+
+        Connectors report HTTP traffic by registering `on_response` as a requests
+        response hook (see `attach_metrics`) and call `record_retry` whenever they
+        retry a request. The shared read path adds the records emitted and the time
+        spent reading from the connector versus converting records to rows, then
+        takes a snapshot per micro-batch with `collect`.
+
+        Counters may be updated from several threads at once.
+        """
+
+        def __init__(self) -> None:
+            self._lock = threading.Lock()
+            self._reset()
+
+        def __getstate__(self) -> dict:
+            # Locks cannot be pickled; each process gets its own.
+            state = self.__dict__.copy()
+            del state["_lock"]
+            return state
+
+        def __setstate__(self, state: dict) -> None:
+            self.__dict__.update(state)
+            self._lock = threading.Lock()
+
+        def _reset(self) -> None:
+            self.requests = 0
+            self.retries = 0
+            self.throttled = 0
+            self.errors = 0
+            self.bytes_downloaded = 0
+            self.fetch_seconds = 0.0
+            self.records = 0
+            self.read_seconds = 0.0
+            self.parse_seconds = 0.0
+            self.endpoints = {}
+
+        def on_response(self, response, *args, **kwargs):
+            """requests response hook recording one HTTP round trip."""
+            elapsed = response.elapsed.total_seconds()
+            content_length = response.headers.get("Content-Length")
+            try:
+                size = int(content_length)
+            except (TypeError, ValueError):
+                size = len(response.content or b"")
+            endpoint = endpoint_name(response.url)
+            elapsed_ms = elapsed * 1000
+
+            with self._lock:
+                self.requests += 1
+                self.bytes_downloaded += size
+                self.fetch_seconds += elapsed
+                if response.status_code == 429:
+                    self.throttled += 1
+                elif response.status_code >= 400:
+                    self.errors += 1
+
+                stats = self.endpoints.get(endpoint)
+                if stats is None:
+                    stats = {
+                        "requests": 0,
+                        "total_ms": 0.0,
+                        "max_ms": 0.0,
+                        "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                    }
+                    self.endpoints[endpoint] = stats
+                stats["requests"] += 1
+                stats["total_ms"] += elapsed_ms
+                stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+                bucket = len(LATENCY_BUCKETS_MS)
+                for index, bound in enumerate(LATENCY_BUCKETS_MS):
+                    if elapsed_ms <= bound:
+                        bucket = index
+                        break
+                stats["buckets"][bucket] += 1
+            return response
+
+        def record_retry(self) -> None:
+            """Count a request that is about to be retried."""
+            with self._lock:
+                self.retries += 1
+
+        def record_read(self, records: int, read_seconds: float, parse_seconds: float):
+            """Add the records emitted by a read and where its time went."""
+            with self._lock:
+                self.records += records
+                self.read_seconds += read_seconds
+                self.parse_seconds += parse_seconds
+
+        def collect(self) -> dict:
+            """Return the counters gathered so far and start counting from zero."""
+            with self._lock:
+                snapshot = {
+                    "requests": self.requests,
+                    "retries": self.retries,
+                    "throttled": self.throttled,
+                    "errors": self.errors,
+                    "bytes_downloaded": self.bytes_downloaded,
+                    "records": self.records,
+                    "read_seconds": round(self.read_seconds, 6),
+                    "fetch_seconds": round(self.fetch_seconds, 6),
+                    "parse_seconds": round(self.parse_seconds, 6),
+                    "endpoints": [
+                        {
+                            "endpoint": endpoint,
+                            "requests": stats["requests"],
+                            "total_ms": round(stats["total_ms"], 3),
+                            "max_ms": round(stats["max_ms"], 3),
+                            "buckets": list(stats["buckets"]),
+                        }
+                        for endpoint, stats in sorted(self.endpoints.items())
+                    ],
+                }
+                self._reset()
+            return snapshot
+
+
+    def attach_metrics(session, metrics: ReadMetrics) -> None:
+        """Report every response received through a requests session to `metrics`."""
+        session.hooks["response"].append(metrics.on_response)
+
+
+    def timed_rows(
+        records: Iterable[Any],
+        convert,
+        metrics: ReadMetrics,
+        read_seconds: float,
+        on_complete=None,
+    ) -> Iterator[Any]:
+        """
+        Convert records lazily while measuring conversion time.
+
+        `read_seconds` is the time already spent producing `records`; time spent
+        pulling further records out of a lazy iterator is added to it. Once the
+        records are exhausted the totals are added to `metrics` and
+        `on_complete` (if given) is called.
+        """
+        count = 0
+        parse_seconds = 0.0
+        iterator = iter(records)
+        perf_counter = time.perf_counter
+        while True:
+            started = perf_counter()
+            try:
+                record = next(iterator)
+            except StopIteration:
+                read_seconds += perf_counter() - started
+                break
+            converted = perf_counter()
+            row = convert(record)
+            parse_seconds += perf_counter() - converted
+            read_seconds += converted - started
+            count += 1
+            yield row
+        metrics.record_read(count, read_seconds, parse_seconds)
+        if on_complete is not None:
+            on_complete()
+
+
+    def _metrics_file(directory: str, table_name: str) -> str:
+        return os.path.join(directory, f"{table_name}.jsonl".replace(os.sep, "_"))
+
+
+    def append_metrics_line(directory: str, table_name: str, line: dict) -> None:
+        """
+        Append one metrics line to the log of `table_name` in `directory`.
+
+        The line is written with a single call so concurrent readers of the same
+        table do not interleave their lines. Failing to write is ignored: metrics
+        must never fail the read itself.
+        """
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(_metrics_file(directory, table_name), "a") as f:
+                f.write(json.dumps(line, default=str) + "\n")
+        except OSError:
+            pass
+
+
+    def read_metrics_lines(directory: str, table_name: str) -> list[dict]:
+        """Return the metrics lines logged for `table_name`, oldest first."""
+        try:
+            with open(_metrics_file(directory, table_name)) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # A line cut short by a read that died while writing it.
+                continue
+        return records
+
+
+    ########################################################
+    # libs/profiling.py
+    ########################################################
+
+    PROFILE_OPTION = "lakeflow.profile"
+    # Directory the profiles are written to; it must be writable by the executors.
+    PROFILE_PATH_OPTION = "lakeflow.profile.path"
+    DEFAULT_PROFILE_PATH = os.path.join(tempfile.gettempdir(), "lakeflow_profiles")
+
+    # Functions whose cumulative time makes up each category of the breakdown, as
+    # (file name suffix or None for any file, function name pattern). C functions
+    # have the file name "~". Whatever is not in a category is time spent in the
+    # connector's own code.
+    PROFILE_CATEGORIES = {
+        "fetch_seconds": [("requests/sessions.py", r"send")],
+        "json_decode_seconds": [
+            ("json/decoder.py", r"decode"),
+            ("~", r"<orjson\.loads>"),
+            ("~", r"<msgspec\..*decode>"),
+        ],
+        "parse_seconds": [(None, r"parse_value")],
+    }
+
+    # Number of functions listed in the JSON summary of a profile.
+    _TOP_FUNCTIONS = 30
+
+
+    def profile_breakdown(stats: pstats.Stats, total_seconds: float) -> dict:
+        """
+        Split the profiled time into fetching, JSON decoding, `parse_value`
+        conversion and the connector's own code (`connector_seconds`).
+        """
+        breakdown = {category: 0.0 for category in PROFILE_CATEGORIES}
+        for (filename, _, function), (_, _, _, cumulative, _) in stats.stats.items():
+            normalized = filename.replace(os.sep, "/")
+            for category, functions in PROFILE_CATEGORIES.items():
+                for suffix, name in functions:
+                    if re.fullmatch(name, function) and (
+                        suffix is None or normalized.endswith(suffix)
+                    ):
+                        breakdown[category] += cumulative
+        breakdown["connector_seconds"] = max(total_seconds - sum(breakdown.values()), 0.0)
+        breakdown["total_seconds"] = total_seconds
+        return {key: round(value, 6) for key, value in breakdown.items()}
+
+
+    class ReadProfiler:
+        """
+        Profiles one read with cProfile when `lakeflow.profile` is enabled.
+
+        Use the profiler as a context manager around the `read_table` call and
+        pass the rows returned to Spark through `rows`, which profiles pulling
+        (and converting) every record. Once the rows are exhausted the profile is
+        written to `lakeflow.profile.path` as `<name>.prof` (load it with
+        `pstats` or snakeviz) with a `<name>.json` summary holding the time
+        breakdown and the most expensive functions, and the summary is printed
+        as a JSON line with `"event": "lakeflow_connect_profile"`.
+
+        When profiling is disabled every method is a pass-through.
+        """
+
+        def __init__(self, options: dict, read_kind: str, **context) -> None:
+            self.enabled = str(options.get(PROFILE_OPTION, "false")).lower() == "true"
+            self.directory = options.get(PROFILE_PATH_OPTION) or DEFAULT_PROFILE_PATH
+            self.table_name = options.get("tableName")
+            self.read_kind = read_kind
+            self.context = context
+            self.seconds = 0.0
+            self._profile = cProfile.Profile() if self.enabled else None
+            self._started = None
+
+        def __enter__(self) -> "ReadProfiler":
+            if self.enabled:
+                self._started = time.perf_counter()
+                self._profile.enable()
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            if self.enabled:
+                self._profile.disable()
+                self.seconds += time.perf_counter() - self._started
+
+        def rows(self, rows: Iterable[Any]) -> Iterable[Any]:
+            """Profile iterating `rows`, then write the profile."""
+            if not self.enabled:
+                return rows
+            return self._profiled_rows(rows)
+
+        def _profiled_rows(self, rows: Iterable[Any]) -> Iterator[Any]:
+            iterator = iter(rows)
+            while True:
+                with self:
+                    try:
+                        row = next(iterator)
+                    except StopIteration:
+                        break
+                yield row
+            self.dump()
+
+        def _file_prefix(self) -> str:
+            parts = [self.table_name or "table", self.read_kind]
+            partition = _partition_id()
+            if partition is not None:
+                parts.append(f"p{partition}")
+            parts += [time.strftime("%Y%m%dT%H%M%S"), uuid.uuid4().hex[:8]]
+            name = "-".join(str(part) for part in parts)
+            return os.path.join(self.directory, name.replace(os.sep, "_"))
+
+        def dump(self) -> Optional[dict]:
+            """Write the profile and its summary; returns the summary."""
+            if not self.enabled:
+                return None
+            stats = pstats.Stats(self._profile)
+            summary = {
+                "event": "lakeflow_connect_profile",
+                "table": self.table_name,
+                "read": self.read_kind,
+                **self.context,
+                **profile_breakdown(stats, self.seconds),
+                "top_functions": [
+                    {
+                        "function": f"{filename}:{line}({function})",
+                        "calls": calls,
+                        "tottime": round(own, 6),
+                        "cumtime": round(cumulative, 6),
+                    }
+                    for (filename, line, function), (_, calls, own, cumulative, _) in sorted(
+                        stats.stats.items(), key=lambda item: item[1][3], reverse=True
+                    )[:_TOP_FUNCTIONS]
+                ],
+            }
+            prefix = self._file_prefix()
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                stats.dump_stats(f"{prefix}.prof")
+                with open(f"{prefix}.json", "w") as f:
+                    json.dump(summary, f, indent=2, default=str)
+                summary["path"] = f"{prefix}.prof"
+            except OSError as e:
+                # Profiling must never fail the read itself.
+                summary["error"] = f"Could not write profile to {self.directory}: {e}"
+            print(
+                json.dumps(
+                    {k: v for k, v in summary.items() if k != "top_functions"},
+                    default=str,
+                )
+            )
+            return summary
+
+
+    def _partition_id() -> Optional[int]:
+        """The Spark partition being read, when running inside a task."""
+        try:
+            from pyspark import TaskContext
+
+            context = TaskContext.get()
+        except Exception:
+            return None
+        return context.partitionId() if context is not None else None
+
+
     ########################################################
     # sources/zendesk/zendesk.py
     ########################################################
 
     class LakeflowConnect:
+        # Incremental exports whose `start_time` can come from an `updated_at` filter.
+        FILTERED_EXPORTS = ("tickets", "users", "organizations")
+        # Tables the incremental tickets export can sideload (`include=`).
+        SIDELOAD_TABLES = ("users", "organizations", "groups")
+
+        # API endpoints and response keys of every table.
+        API_CONFIG = {
+            "tickets": {
+                "endpoint": "incremental/tickets.json",
+                "cursor_endpoint": "incremental/tickets/cursor.json",
+                "response_key": "tickets",
+                "supports_incremental": True,
+            },
+            "organizations": {
+                "endpoint": "incremental/organizations.json",
+                "response_key": "organizations",
+                "supports_incremental": True,
+            },
+            "articles": {
+                "endpoint": "help_center/articles.json",
+                "response_key": "articles",
+                "supports_incremental": False,
+                "supports_pagination": True,
+                "pagination": "cursor",
+            },
+            "brands": {
+                "endpoint": "brands.json",
+                "response_key": "brands",
+                "supports_incremental": False,
+                "supports_pagination": True,
+                "pagination": "offset",
+            },
+            "groups": {
+                "endpoint": "groups.json",
+                "response_key": "groups",
+                "supports_incremental": False,
+                "supports_pagination": True,
+                "pagination": "cursor",
+            },
+            "ticket_comments": {
+                "endpoint": "incremental/ticket_events.json",
+                "response_key": "ticket_events",
+                "supports_incremental": True,
+                "include": "comment_events",
+            },
+            "topics": {
+                "endpoint": "community/topics.json",
+                "response_key": "topics",
+                "supports_incremental": False,
+                "supports_pagination": True,
+                "pagination": "cursor",
+            },
+            "users": {
+                "endpoint": "incremental/users.json",
+                "cursor_endpoint": "incremental/users/cursor.json",
+                "response_key": "users",
+                "supports_incremental": True,
+            },
+        }
+
         def __init__(self, options: dict) -> None:
             self.subdomain = options["subdomain"]
             self.email = options["email"]
             self.api_token = options["api_token"]
-            self.base_url = f"https://{self.subdomain}.zendesk.com/api/v2"
+            self.base_url = options.get(
+                "base_url", f"https://{self.subdomain}.zendesk.com/api/v2"
+            ).rstrip("/")
             user = f"{self.email}/token"
             token = self.api_token
             auth_str = f"{user}:{token}"
@@ -180,6 +1005,14 @@ def register_lakeflow_source(spark):
                 "Authorization": "Basic " + base64.b64encode(auth_str.encode()).decode(),
                 "Content-Type": "application/json",
             }
+            # Reuse connections across the many pages of an export
+            self._session = requests.Session()
+            self._session.headers.update(self.auth_header)
+            # Request, byte and latency counters reported per micro-batch
+            self.metrics = ReadMetrics()
+            attach_metrics(self._session, self.metrics)
+            # Number of times a rate-limited (429) request is retried
+            self.max_retries = int(options.get("max_retries", 3))
 
         def list_tables(self) -> List[str]:
             return [
@@ -446,73 +1279,314 @@ def register_lakeflow_source(spark):
 
             return metadata[table_name]
 
+        def supported_filters(
+            self, table_name: str, table_options: Dict[str, str]
+        ) -> Dict[str, tuple]:
+            """
+            Filters of batch queries that narrow the incremental exports.
+
+            A lower bound on `updated_at` becomes the `start_time` of the
+            tickets, users and organizations exports.
+            """
+            if table_name in self.FILTERED_EXPORTS:
+                return {"updated_at": (">", ">=")}
+            return {}
+
         def read_table(
             self, table_name: str, start_offset: dict, table_options: Dict[str, str]
         ) -> (Iterator[dict], dict):
-            # Map table names to their API endpoints and response keys
-            api_config = {
-                "tickets": {
-                    "endpoint": "incremental/tickets.json",
-                    "response_key": "tickets",
-                    "supports_incremental": True,
-                },
-                "organizations": {
-                    "endpoint": "incremental/organizations.json",
-                    "response_key": "organizations",
-                    "supports_incremental": True,
-                },
-                "articles": {
-                    "endpoint": "help_center/articles.json",
-                    "response_key": "articles",
-                    "supports_incremental": False,
-                    "supports_pagination": True,
-                },
-                "brands": {
-                    "endpoint": "brands.json",
-                    "response_key": "brands",
-                    "supports_incremental": False,
-                    "supports_pagination": True,
-                },
-                "groups": {
-                    "endpoint": "groups.json",
-                    "response_key": "groups",
-                    "supports_incremental": False,
-                    "supports_pagination": True,
-                },
-                "ticket_comments": {
-                    "endpoint": "incremental/ticket_events.json",
-                    "response_key": "ticket_events",
-                    "supports_incremental": True,
-                    "include": "comment_events",
-                },
-                "topics": {
-                    "endpoint": "community/topics.json",
-                    "response_key": "topics",
-                    "supports_incremental": False,
-                    "supports_pagination": True,
-                },
-                "users": {
-                    "endpoint": "incremental/users.json",
-                    "response_key": "users",
-                    "supports_incremental": True,
-                },
-            }
-
-            if table_name not in api_config:
+            if table_name not in self.API_CONFIG:
                 raise ValueError(f"Table '{table_name}' is not supported.")
 
-            config = api_config[table_name]
+            config = self.API_CONFIG[table_name]
+            table_options = table_options or {}
+
+            # A pushed-down `updated_at` bound starts a fresh export at that time.
+            if not start_offset and self.supported_filters(table_name, table_options):
+                start_time = 0
+                for column, op, value in pushed_filters(table_options):
+                    if column == "updated_at" and op in (">", ">="):
+                        start_time = max(start_time, self._parse_time(value) or 0)
+                if start_time:
+                    start_offset = {"start_time": start_time}
+
+            if table_name == "ticket_comments":
+                comments_strategy = table_options.get("comments_strategy", "ticket_events")
+                if comments_strategy == "per_ticket":
+                    return self._read_comments_per_ticket(
+                        self.API_CONFIG["tickets"], start_offset, table_options
+                    )
+                if comments_strategy != "ticket_events":
+                    raise ValueError(
+                        f"Invalid comments_strategy {comments_strategy!r}; "
+                        "expected 'ticket_events' or 'per_ticket'."
+                    )
 
             if config.get("supports_incremental", False):
-                return self._read_incremental(table_name, config, start_offset)
+                return self._read_incremental_table(
+                    table_name, config, start_offset, table_options
+                )
             else:
-                return self._read_paginated(table_name, config, start_offset)
+                return self._read_paginated(
+                    table_name, config, start_offset, table_options
+                )
+
+        def read_co_read(
+            self, table_names: List[str], start_offset: dict, table_options: Dict[str, str]
+        ) -> (Iterator[tuple], dict):
+            """
+            Read `tickets` together with the tables sideloaded onto its export.
+
+            `table_names` is `tickets` followed by any of `users`,
+            `organizations` and `groups`. One sweep of the incremental tickets
+            export with `include=<those tables>` returns the changed tickets plus
+            the users, organizations and groups they reference. Records are
+            returned as `(table_name, record)` pairs; each sideloaded record
+            appears once, in its most recently updated copy. The offset is the
+            tickets export offset.
+            """
+            sideloads = list(dict.fromkeys(table_names[1:]))
+            if (
+                not table_names
+                or table_names[0] != "tickets"
+                or not set(sideloads) <= set(self.SIDELOAD_TABLES)
+            ):
+                raise ValueError(
+                    "Zendesk co-reads 'tickets' followed by any of "
+                    f"{list(self.SIDELOAD_TABLES)}, got {table_names}"
+                )
+
+            config = dict(self.API_CONFIG["tickets"])
+            sideload_buffers = {}
+            if sideloads:
+                config["include"] = ",".join(sideloads)
+                sideload_buffers = {name: [] for name in sideloads}
+            tickets, offset = self._read_incremental_table(
+                "tickets", config, start_offset, table_options or {}, sideload_buffers
+            )
+
+            records = [("tickets", ticket) for ticket in tickets]
+            for name, buffer in sideload_buffers.items():
+                records.extend((name, record) for record in self._latest_by_id(buffer))
+            return records, offset
+
+        @staticmethod
+        def _latest_by_id(records: List[dict]) -> List[dict]:
+            """
+            Collapse sideloaded records to one per id.
+
+            The same user or organization is sideloaded on every page that
+            references it; keep the most recently updated copy.
+            """
+            latest = {}
+            for record in records:
+                record_id = record.get("id")
+                current = latest.get(record_id)
+                if current is None or (record.get("updated_at") or "") >= (
+                    current.get("updated_at") or ""
+                ):
+                    latest[record_id] = record
+            return list(latest.values())
+
+        def _read_incremental_table(
+            self,
+            table_name: str,
+            config: dict,
+            start_offset: dict,
+            table_options: Dict[str, str],
+            sideload_buffers: Dict[str, list] = None,
+            max_records: int = None,
+        ):
+            """
+            Dispatch an incremental read to the time- or cursor-based export.
+
+            With `max_records`, either export stops after the page that reaches
+            that many records and the next batch continues from its offset.
+            """
+            incremental_mode = table_options.get("incremental_mode", "time")
+            if incremental_mode == "cursor":
+                if "cursor_endpoint" not in config:
+                    raise ValueError(
+                        f"Table '{table_name}' does not support cursor-based incremental "
+                        "exports; use incremental_mode 'time'."
+                    )
+                return self._read_incremental_cursor(
+                    table_name,
+                    config,
+                    start_offset,
+                    table_options,
+                    sideload_buffers,
+                    max_records,
+                )
+            if incremental_mode != "time":
+                raise ValueError(
+                    f"Invalid incremental_mode {incremental_mode!r}; expected 'time' or 'cursor'."
+                )
+            return self._read_incremental(
+                table_name, config, start_offset, sideload_buffers, max_records
+            )
 
-        def _read_incremental(self, table_name: str, config: dict, start_offset: dict):
-            """Read data from incremental API endpoints"""
+        def _read_comments_per_ticket(
+            self,
+            tickets_config: dict,
+            start_offset: dict,
+            table_options: Dict[str, str],
+        ):
+            """
+            Read ticket_comments through the per-ticket comments endpoint.
+
+            The incremental tickets export tells us which tickets changed since
+            `start_offset` (a new comment always updates its ticket); the comments
+            of those tickets are then fetched from `/tickets/{id}/comments.json`
+            with a bounded pool of workers, paced to `max_requests_per_minute`.
+            Unlike the ticket events export, no non-comment events are downloaded.
+            The checkpoint is the tickets export offset; a micro-batch stops
+            reading the export after the page that reaches `max_tickets_per_batch`
+            tickets, so it never fetches the comments of the whole account at once.
+            """
+            try:
+                max_workers = max(1, int(table_options.get("max_workers", 4)))
+            except (TypeError, ValueError):
+                max_workers = 4
+            try:
+                requests_per_minute = float(
+                    table_options.get("max_requests_per_minute", 200)
+                )
+            except (TypeError, ValueError):
+                requests_per_minute = 200.0
+            try:
+                max_tickets = max(1, int(table_options.get("max_tickets_per_batch", 1000)))
+            except (TypeError, ValueError):
+                max_tickets = 1000
+
+            tickets, offset = self._read_incremental_table(
+                "tickets",
+                tickets_config,
+                start_offset,
+                table_options,
+                max_records=max_tickets,
+            )
+            ticket_ids = []
+            for ticket in tickets:
+                # Comments of deleted tickets are no longer served by the API.
+                ticket_id = ticket.get("id")
+                if ticket_id is not None and ticket.get("status") != "deleted":
+                    ticket_ids.append(ticket_id)
+            ticket_ids = list(dict.fromkeys(ticket_ids))
+            if not ticket_ids:
+                return [], offset
+
+            wait_for_slot = self._rate_limiter(requests_per_minute)
+
+            def fetch_comments(ticket_id):
+                return self._read_ticket_comments(ticket_id, wait_for_slot)
+
+            all_records = []
+            max_workers = min(max_workers, len(ticket_ids))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for comments in executor.map(fetch_comments, ticket_ids):
+                    all_records.extend(comments)
+            return all_records, offset
+
+        def _read_ticket_comments(self, ticket_id, wait_for_slot) -> List[dict]:
+            """Read every comment of one ticket, following cursor pagination."""
+            url = f"{self.base_url}/tickets/{ticket_id}/comments.json"
+            params = {"page[size]": 100}
+            records = []
+            while True:
+                wait_for_slot()
+                resp = self._get(url, params=params)
+                if resp.status_code == 404:
+                    # The ticket was deleted after the tickets export saw it.
+                    return records
+                if resp.status_code != 200:
+                    raise Exception(
+                        f"Zendesk API error for ticket_comments: {resp.status_code} {resp.text}"
+                    )
+
+                data = response_json(resp)
+                for comment in data.get("comments", []):
+                    records.append(
+                        {
+                            **comment,
+                            "ticket_id": ticket_id,
+                            "updated_at": comment.get("created_at"),
+                            "event_type": "Comment",
+                        }
+                    )
+
+                meta = data.get("meta") or {}
+                after_cursor = meta.get("after_cursor")
+                if not meta.get("has_more") or not after_cursor:
+                    return records
+                params = {"page[size]": 100, "page[after]": after_cursor}
+
+        @staticmethod
+        def _rate_limiter(requests_per_minute: float):
+            """
+            Return a callable that blocks until the next request may be sent.
+
+            Requests are spaced evenly at `requests_per_minute` across all the
+            threads that share the callable. A non-positive rate disables pacing.
+            """
+            if requests_per_minute <= 0:
+                return lambda: None
+
+            interval = 60.0 / requests_per_minute
+            lock = threading.Lock()
+            next_slot = [time.monotonic()]
+
+            def wait_for_slot():
+                with lock:
+                    now = time.monotonic()
+                    slot = max(now, next_slot[0])
+                    next_slot[0] = slot + interval
+                if slot > now:
+                    time.sleep(slot - now)
+
+            return wait_for_slot
+
+        def _get(self, url: str, params: dict = None) -> requests.Response:
+            """
+            Issue a GET request, waiting out 429 responses.
+
+            Incremental exports are limited to 10 requests per minute, so a 429 is
+            expected during large syncs. Zendesk tells us how long to wait via the
+            Retry-After header; we honour it up to `max_retries` times before
+            handing the response back to the caller.
+            """
+            for attempt in range(self.max_retries + 1):
+                resp = self._session.get(url, params=params, timeout=60)
+                if resp.status_code != 429 or attempt == self.max_retries:
+                    return resp
+                try:
+                    retry_after = int(resp.headers.get("Retry-After", 60))
+                except (TypeError, ValueError):
+                    retry_after = 60
+                self.metrics.record_retry()
+                time.sleep(max(1, retry_after))
+            return resp
+
+        def _read_incremental(
+            self,
+            table_name: str,
+            config: dict,
+            start_offset: dict,
+            sideload_buffers: Dict[str, list] = None,
+            max_records: int = None,
+        ):
+            """
+            Read data from incremental API endpoints.
+
+            The export is ordered by update time, so stopping after the page that
+            reaches `max_records` leaves only records updated at or after the
+            latest second read; the next batch restarts at that second and skips
+            the ids already emitted there (`boundary_ids`).
+            """
             start_time = 0
             if start_offset and "start_time" in start_offset:
                 start_time = start_offset["start_time"]
+            boundary_ids = set((start_offset or {}).get("boundary_ids", []))
 
             endpoint = config["endpoint"]
             response_key = config["response_key"]
@@ -525,15 +1599,16 @@ def register_lakeflow_source(spark):
             all_records = []
             next_page = url
             last_time = start_time
+            latest_seen = None
 
             while next_page:
-                resp = requests.get(next_page, headers=self.auth_header)
+                resp = self._get(next_page)
                 if resp.status_code != 200:
                     raise Exception(
                         f"Zendesk API error for {table_name}: {resp.status_code} {resp.text}"
                     )
 
-                data = resp.json()
+                data = response_json(resp)
 
                 # Handle ticket_comments specially
                 if table_name == "ticket_comments":
@@ -552,89 +1627,363 @@ def register_lakeflow_source(spark):
                                         **child,
                                     }
                                     all_records.append(comment_record)
-                        # Update last_time
-                        try:
-                            event_time = int(
-                                datetime.strptime(
-                                    event.get("created_at", ""), "%Y-%m-%dT%H:%M:%SZ"
-                                ).timestamp()
-                            )
-                            if event_time > last_time:
-                                last_time = event_time
-                        except Exception:
-                            pass
+                        latest_seen = latest_iso8601(latest_seen, event.get("created_at"))
                 else:
                     records = data.get(response_key, [])
                     all_records.extend(records)
+                    self._collect_sideloads(data, sideload_buffers)
 
-                    # Update last_time based on updated_at field
                     for record in records:
-                        try:
-                            record_time = int(
-                                datetime.strptime(
-                                    record.get("updated_at", ""), "%Y-%m-%dT%H:%M:%SZ"
-                                ).timestamp()
-                            )
-                            if record_time > last_time:
-                                last_time = record_time
-                        except Exception:
-                            pass
+                        latest_seen = latest_iso8601(latest_seen, record.get("updated_at"))
 
                 next_page = data.get("next_page")
                 end_of_stream = data.get("end_of_stream", True)
 
                 if end_of_stream or not next_page:
                     break
+                # Only count records the previous batch did not emit, so a page
+                # full of boundary-second repeats cannot stall the stream.
+                if max_records and (
+                    len(self._dedupe_boundary(all_records, start_time, boundary_ids))
+                    >= max_records
+                ):
+                    break
 
-            return all_records, {"start_time": last_time}
+            # Cursor timestamps are compared as strings while paging and only the
+            # latest one is converted to epoch seconds.
+            last_time = max(last_time, self._parse_time(latest_seen) or 0)
 
-        def _read_paginated(self, table_name: str, config: dict, start_offset: dict):
-            """Read data from paginated API endpoints"""
-            endpoint = config["endpoint"]
-            response_key = config["response_key"]
+            if table_name == "ticket_comments":
+                return all_records, {"start_time": last_time}
 
-            # For paginated endpoints, use page number from offset
-            page = 1
-            if start_offset and "page" in start_offset:
-                page = start_offset["page"]
+            # The next batch restarts at `last_time` (inclusive), so drop whatever
+            # the previous batch already emitted at its boundary second.
+            all_records = self._dedupe_boundary(all_records, start_time, boundary_ids)
+            if not all_records and start_offset:
+                return all_records, start_offset
+            return all_records, self._incremental_offset(
+                all_records, last_time, start_time, boundary_ids
+            )
 
-            url = f"{self.base_url}/{endpoint}?page={page}&per_page=100"
+        def _read_incremental_cursor(
+            self,
+            table_name: str,
+            config: dict,
+            start_offset: dict,
+            table_options: Dict[str, str],
+            sideload_buffers: Dict[str, list] = None,
+            max_records: int = None,
+        ):
+            """
+            Read data from cursor-based incremental export endpoints.
+
+            The first request starts from `start_time`; every following request
+            passes the `after_cursor` of the previous page. That cursor is stored
+            in the offset after each batch, so the next batch resumes right after
+            the last page read rather than replaying everything from a timestamp.
+            Reads stop after `max_pages_per_batch` pages, leaving the remainder of
+            the stream for the next batch.
+            """
+            start_offset = start_offset or {}
+            cursor = start_offset.get("cursor")
+            start_time = start_offset.get("start_time", 0)
+            boundary_ids = set(start_offset.get("boundary_ids", []))
+
+            try:
+                per_page = int(table_options.get("per_page", 1000))
+            except (TypeError, ValueError):
+                per_page = 1000
+            per_page = max(1, min(per_page, 1000))
+
+            try:
+                max_pages_per_batch = int(table_options.get("max_pages_per_batch", 50))
+            except (TypeError, ValueError):
+                max_pages_per_batch = 50
+            max_pages_per_batch = max(1, max_pages_per_batch)
+
+            url = f"{self.base_url}/{config['cursor_endpoint']}"
+            response_key = config["response_key"]
 
             all_records = []
-            current_page = page
+            last_time = start_time
+            latest_seen = None
+            pages_fetched = 0
 
-            while True:
-                current_url = f"{self.base_url}/{endpoint}?page={current_page}&per_page=100"
-                resp = requests.get(current_url, headers=self.auth_header)
+            while pages_fetched < max_pages_per_batch:
+                params = {"per_page": per_page}
+                if cursor:
+                    params["cursor"] = cursor
+                else:
+                    params["start_time"] = start_time
+                if "include" in config:
+                    params["include"] = config["include"]
 
+                resp = self._get(url, params=params)
                 if resp.status_code != 200:
-                    # Some endpoints might return 404 when no more pages
-                    if resp.status_code == 404:
-                        break
                     raise Exception(
                         f"Zendesk API error for {table_name}: {resp.status_code} {resp.text}"
                     )
 
-                data = resp.json()
+                data = response_json(resp)
                 records = data.get(response_key, [])
+                all_records.extend(records)
+                self._collect_sideloads(data, sideload_buffers)
+                pages_fetched += 1
 
-                if not records:
+                for record in records:
+                    latest_seen = latest_iso8601(latest_seen, record.get("updated_at"))
+
+                after_cursor = data.get("after_cursor")
+                if after_cursor:
+                    cursor = after_cursor
+                if data.get("end_of_stream", True) or not after_cursor:
+                    break
+                if max_records and len(all_records) >= max_records:
                     break
 
-                all_records.extend(records)
+            last_time = max(last_time, self._parse_time(latest_seen) or 0)
 
-                # Check if there's a next page
-                next_page = data.get("next_page")
-                if not next_page:
+            # A record updated while the export is being paged can show up again
+            # on a later page, and the boundary second of the previous batch can
+            # be re-delivered after a restart from `start_time`.
+            all_records = self._dedupe_boundary(all_records, start_time, boundary_ids)
+            if not all_records and start_offset:
+                return all_records, start_offset
+
+            next_offset = self._incremental_offset(
+                all_records, last_time, start_time, boundary_ids
+            )
+            if cursor:
+                next_offset["cursor"] = cursor
+            return all_records, next_offset
+
+        @staticmethod
+        def _collect_sideloads(data: dict, sideload_buffers: Dict[str, list]) -> None:
+            """Append the sideloaded arrays of an export page to their buffers."""
+            if not sideload_buffers:
+                return
+            for name, buffer in sideload_buffers.items():
+                buffer.extend(data.get(name) or [])
+
+        @staticmethod
+        def _parse_time(value) -> int:
+            """Convert a Zendesk `YYYY-MM-DDTHH:MM:SSZ` UTC timestamp to epoch seconds."""
+            epoch = iso8601_to_epoch(value)
+            return int(epoch) if epoch is not None else None
+
+        def _dedupe_boundary(
+            self, records: List[dict], start_time: int, boundary_ids: set
+        ) -> List[dict]:
+            """
+            Drop duplicate deliveries from an incremental export batch.
+
+            A record is skipped when the same (id, updated_at) pair was already
+            seen earlier in the batch, or when it was updated exactly at
+            `start_time` and its id was emitted by the previous batch
+            (`boundary_ids`).
+            """
+            seen = set()
+            deduped = []
+            for record in records:
+                key = (record.get("id"), record.get("updated_at"))
+                if key in seen:
+                    continue
+                if (
+                    boundary_ids
+                    and key[0] in boundary_ids
+                    and self._parse_time(key[1]) == start_time
+                ):
+                    continue
+                seen.add(key)
+                deduped.append(record)
+            return deduped
+
+        def _incremental_offset(
+            self,
+            records: List[dict],
+            last_time: int,
+            start_time: int,
+            previous_boundary_ids: set,
+        ) -> dict:
+            """
+            Build the offset for the next incremental batch.
+
+            Besides `start_time`, the ids updated exactly at `last_time` are kept
+            so the next batch can skip them when it re-reads that second. If the
+            batch did not move past the previous boundary second, the ids carried
+            over from the previous offset are kept as well.
+            """
+            offset = {"start_time": last_time}
+            boundary_ids = {
+                record.get("id")
+                for record in records
+                if record.get("id") is not None
+                and self._parse_time(record.get("updated_at")) == last_time
+            }
+            if last_time == start_time:
+                boundary_ids |= previous_boundary_ids
+            boundary_ids = sorted(boundary_ids)
+            if boundary_ids:
+                offset["boundary_ids"] = boundary_ids
+            return offset
+
+        def _read_paginated(
+            self,
+            table_name: str,
+            config: dict,
+            start_offset: dict,
+            table_options: Dict[str, str],
+        ):
+            """
+            Read data from paginated API endpoints.
+
+            Endpoints that support cursor pagination are read with `page[size]` /
+            `page[after]`. The rest use offset pagination, where the total `count`
+            from the first page tells us which pages exist so the remaining ones
+            can be fetched concurrently.
+
+            At most `max_pages_per_batch` pages are read per call. When the limit
+            cuts a read short the offset points at the first unread page;
+            otherwise it points at the last page so the next batch re-reads it and
+            picks up anything appended since.
+            """
+            try:
+                max_pages_per_batch = int(table_options.get("max_pages_per_batch", 1000))
+            except (TypeError, ValueError):
+                max_pages_per_batch = 1000
+            max_pages_per_batch = max(1, max_pages_per_batch)
+
+            pagination = table_options.get("pagination", config["pagination"])
+            if pagination == "cursor":
+                return self._read_cursor_paginated(
+                    table_name, config, start_offset, max_pages_per_batch
+                )
+            if pagination != "offset":
+                raise ValueError(
+                    f"Invalid pagination {pagination!r}; expected 'cursor' or 'offset'."
+                )
+
+            try:
+                max_workers = int(table_options.get("max_workers", 4))
+            except (TypeError, ValueError):
+                max_workers = 4
+            return self._read_offset_paginated(
+                table_name, config, start_offset, max_pages_per_batch, max(1, max_workers)
+            )
+
+        def _read_cursor_paginated(
+            self,
+            table_name: str,
+            config: dict,
+            start_offset: dict,
+            max_pages_per_batch: int,
+        ):
+            """Read a paginated endpoint using cursor pagination."""
+            url = f"{self.base_url}/{config['endpoint']}"
+            response_key = config["response_key"]
+
+            cursor = (start_offset or {}).get("cursor")
+            all_records = []
+            pages_fetched = 0
+
+            while True:
+                params = {"page[size]": 100}
+                if cursor:
+                    params["page[after]"] = cursor
+
+                resp = self._get(url, params=params)
+                if resp.status_code != 200:
+                    raise Exception(
+                        f"Zendesk API error for {table_name}: {resp.status_code} {resp.text}"
+                    )
+
+                data = response_json(resp)
+                all_records.extend(data.get(response_key, []))
+                pages_fetched += 1
+
+                meta = data.get("meta") or {}
+                after_cursor = meta.get("after_cursor")
+                if not meta.get("has_more") or not after_cursor:
+                    break
+                if pages_fetched >= max_pages_per_batch:
+                    # Resume right after the last page read
+                    cursor = after_cursor
                     break
+                cursor = after_cursor
 
-                current_page += 1
+            return all_records, {"cursor": cursor} if cursor else {}
+
+        def _read_offset_paginated(
+            self,
+            table_name: str,
+            config: dict,
+            start_offset: dict,
+            max_pages_per_batch: int,
+            max_workers: int,
+        ):
+            """Read a paginated endpoint using offset pagination."""
+            endpoint = config["endpoint"]
+            response_key = config["response_key"]
+            per_page = 100
+
+            # For paginated endpoints, use page number from offset
+            page = 1
+            if start_offset and "page" in start_offset:
+                page = start_offset["page"]
 
-                # Optional: Add a reasonable limit to prevent infinite loops
-                if current_page > 1000:  # Adjust as needed
+            def fetch_page(page_number: int):
+                resp = self._get(
+                    f"{self.base_url}/{endpoint}",
+                    params={"page": page_number, "per_page": per_page},
+                )
+                if resp.status_code == 404:
+                    # Some endpoints return 404 when no more pages
+                    return None
+                if resp.status_code != 200:
+                    raise Exception(
+                        f"Zendesk API error for {table_name}: {resp.status_code} {resp.text}"
+                    )
+                return response_json(resp)
+
+            first = fetch_page(page)
+            if first is None or not first.get(response_key):
+                return [], {"page": page}
+
+            all_records = list(first[response_key])
+            last_page = page
+
+            count = first.get("count")
+            if isinstance(count, int) and first.get("next_page"):
+                # The total count tells us exactly which pages remain; fetch them
+                # concurrently. executor.map yields results in page order, so the
+                # records are reassembled in the order the API serves them.
+                final_page = -(-count // per_page)
+                budget_end = page + max_pages_per_batch - 1
+                remaining = list(range(page + 1, min(final_page, budget_end) + 1))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for page_number, data in zip(remaining, executor.map(fetch_page, remaining)):
+                        records = (data or {}).get(response_key) or []
+                        if not records:
+                            break
+                        all_records.extend(records)
+                        last_page = page_number
+                if last_page >= budget_end and last_page < final_page:
+                    return all_records, {"page": last_page + 1}
+                return all_records, {"page": last_page}
+
+            # Without a count, fall back to following next_page serially.
+            data = first
+            while data.get("next_page"):
+                if last_page - page + 1 >= max_pages_per_batch:
+                    return all_records, {"page": last_page + 1}
+                data = fetch_page(last_page + 1)
+                records = (data or {}).get(response_key) or []
+                if not records:
                     break
+                all_records.extend(records)
+                last_page += 1
 
-            return all_records, {"page": current_page}
+            return all_records, {"page": last_page}
 
 
     ########################################################
@@ -642,16 +1991,125 @@ def register_lakeflow_source(spark):
     ########################################################
 
     METADATA_TABLE = "_lakeflow_metadata"
+    METRICS_TABLE = "_lakeflow_metrics"
     TABLE_NAME = "tableName"
     TABLE_NAME_LIST = "tableNameList"
+    # Set to "false" to stop logging (and saving) a metrics line per micro-batch.
+    METRICS_LOG_OPTION = "lakeflow.metrics"
+    # Set to "true" to read micro-batches with LakeflowPartitionedStreamReader.
+    PARTITIONED_STREAM_OPTION = "lakeflow.partitionedStream"
+    # Connector methods a partitioned stream needs.
+    PARTITIONED_STREAM_METHODS = ("latest_offset", "partition_offsets", "read_offset_range")
+    # Pseudo-table that reads the tables in `tableNameList` from one sweep of the
+    # first one, through the connector's `read_co_read`.
+    CO_READ_TABLE = "_lakeflow_co_read"
+
+    METRICS_SCHEMA = StructType(
+        [
+            StructField("tableName", StringType(), False),
+            StructField("requests", LongType(), True),
+            StructField("retries", LongType(), True),
+            StructField("throttled", LongType(), True),
+            StructField("errors", LongType(), True),
+            StructField("bytes_downloaded", LongType(), True),
+            StructField("records", LongType(), True),
+            StructField("read_seconds", DoubleType(), True),
+            StructField("fetch_seconds", DoubleType(), True),
+            StructField("parse_seconds", DoubleType(), True),
+            StructField(
+                "endpoints",
+                ArrayType(
+                    StructType(
+                        [
+                            StructField("endpoint", StringType(), True),
+                            StructField("requests", LongType(), True),
+                            StructField("total_ms", DoubleType(), True),
+                            StructField("max_ms", DoubleType(), True),
+                            StructField("buckets", ArrayType(LongType()), True),
+                        ]
+                    )
+                ),
+                True,
+            ),
+            StructField("logged_at", TimestampType(), True),
+            StructField("start_offset", StringType(), True),
+            StructField("end_offset", StringType(), True),
+        ]
+    )
+
+
+    def _log_metrics(options: dict[str, str], metrics: dict, **context) -> None:
+        """
+        Print the metrics of one read as a single JSON line, and append it to the
+        table's metrics log for `_lakeflow_metrics`.
+        """
+        if options.get(METRICS_LOG_OPTION, "true").lower() == "false":
+            return
+        line = {
+            "event": "lakeflow_connect_metrics",
+            "table": options.get(TABLE_NAME),
+            "logged_at": datetime.now(timezone.utc).isoformat(),
+            **context,
+            **metrics,
+        }
+        append_metrics_line(
+            options.get(METRICS_PATH_OPTION) or DEFAULT_METRICS_PATH,
+            options.get(TABLE_NAME),
+            line,
+        )
+        print(json.dumps(line, default=str))
+
+
+    def co_read_schema(table_schemas: dict) -> StructType:
+        """
+        Schema of the co-read pseudo-table: the name of the table a row belongs
+        to, then one struct column per table holding its records.
+        """
+        return StructType(
+            [StructField(TABLE_NAME, StringType(), False)]
+            + [
+                StructField(table, schema, True)
+                for table, schema in table_schemas.items()
+            ]
+        )
+
+
+    class LakeflowCoRead:
+        """
+        Reads the co-read pseudo-table through a connector's `read_co_read`.
+
+        `read_co_read(table_names, start_offset, table_options)` returns
+        `(table_name, record)` pairs and one offset for the whole sweep. Each pair
+        becomes a row of `co_read_schema`, so the readers can treat the sweep as
+        a single table.
+        """
+
+        def __init__(self, lakeflow_connect: LakeflowConnect, table_names: list[str]):
+            if not hasattr(lakeflow_connect, "read_co_read"):
+                raise ValueError(
+                    f"{CO_READ_TABLE} needs a connector that implements read_co_read"
+                )
+            if not table_names:
+                raise ValueError(f"{CO_READ_TABLE} needs a {TABLE_NAME_LIST}")
+            self.lakeflow_connect = lakeflow_connect
+            self.table_names = table_names
+
+        def read_table(
+            self, table_name: str, start_offset: dict, table_options: dict[str, str]
+        ) -> (Iterator[dict], dict):
+            records, offset = self.lakeflow_connect.read_co_read(
+                self.table_names, start_offset, table_options
+            )
+            return ({TABLE_NAME: name, name: record} for name, record in records), offset
 
 
     class LakeflowStreamReader(SimpleDataSourceStreamReader):
         """
         Implements a data source stream reader for Lakeflow Connect.
-        Currently, only the simpleStreamReader is implemented, which uses a
-        more generic protocol suitable for most data sources that support
-        incremental loading.
+        This is the default simpleStreamReader, which uses a more generic
+        protocol suitable for most data sources that support incremental
+        loading. Every micro-batch is read by a single reader on the driver;
+        see LakeflowPartitionedStreamReader for connectors that can split one.
         """
 
         def __init__(
@@ -659,20 +2117,36 @@ def register_lakeflow_source(spark):
             options: dict[str, str],
             schema: StructType,
             lakeflow_connect: LakeflowConnect,
+            metrics: ReadMetrics,
         ):
             self.options = options
             self.lakeflow_connect = lakeflow_connect
             self.schema = schema
+            self.metrics = metrics
 
         def initialOffset(self):
             return {}
 
         def read(self, start: dict) -> (Iterator[tuple], dict):
-            records, offset = self.lakeflow_connect.read_table(
-                self.options["tableName"], start, self.options
+            profiler = ReadProfiler(self.options, "stream", start_offset=start)
+            started = time.perf_counter()
+            with profiler:
+                records, offset = self.lakeflow_connect.read_table(
+                    self.options["tableName"], start, self.options
+                )
+            rows = timed_rows(
+                records,
+                lambda x: parse_value(x, self.schema),
+                self.metrics,
+                time.perf_counter() - started,
+                on_complete=lambda: _log_metrics(
+                    self.options,
+                    self.metrics.collect(),
+                    start_offset=start,
+                    end_offset=offset,
+                ),
             )
-            rows = map(lambda x: parse_value(x, self.schema), records)
-            return rows, offset
+            return profiler.rows(rows), offset
 
         def readBetweenOffsets(self, start: dict, end: dict) -> Iterator[tuple]:
             # TODO: This does not ensure the records returned are identical across repeated calls.
@@ -683,33 +2157,208 @@ def register_lakeflow_source(spark):
             return self.read(start)[0]
 
 
+    class LakeflowPartitionedStreamReader(DataSourceStreamReader):
+        """
+        Stream reader that splits every micro-batch into partitions read by the
+        executors in parallel.
+
+        Used instead of LakeflowStreamReader when the `lakeflow.partitionedStream`
+        option is `true`. The driver only plans: the connector's `latest_offset`
+        picks the end offset of the next micro-batch without reading records, and
+        `partition_offsets` splits the range between two offsets into independent
+        `(start, end)` pairs (per repository, per time window, ...). Each
+        executor then reads one pair with `read_offset_range`.
+        """
+
+        def __init__(
+            self,
+            options: dict[str, str],
+            schema: StructType,
+            lakeflow_connect: LakeflowConnect,
+            metrics: ReadMetrics,
+        ):
+            self.options = options
+            self.schema = schema
+            self.lakeflow_connect = lakeflow_connect
+            self.metrics = metrics
+            self.table_name = options[TABLE_NAME]
+            # Last planned offset, the start of the next micro-batch on runtimes
+            # that call latestOffset() without one.
+            self.latest = None
+
+        def initialOffset(self):
+            return {}
+
+        def latestOffset(self, start: dict = None, limit=None) -> dict:
+            if start is None:
+                start = self.latest if self.latest is not None else self.initialOffset()
+            self.latest = self.lakeflow_connect.latest_offset(
+                self.table_name, start, self.options
+            )
+            return self.latest
+
+        def partitions(self, start: dict, end: dict):
+            return [
+                InputPartition({"start": part_start, "end": part_end})
+                for part_start, part_end in self.lakeflow_connect.partition_offsets(
+                    self.table_name, start, end, self.options
+                )
+            ]
+
+        def read(self, partition) -> Iterator[tuple]:
+            start, end = partition.value["start"], partition.value["end"]
+            profiler = ReadProfiler(self.options, "stream", start_offset=start)
+            started = time.perf_counter()
+            with profiler:
+                records = self.lakeflow_connect.read_offset_range(
+                    self.table_name, start, end, self.options
+                )
+            rows = timed_rows(
+                records,
+                lambda x: parse_value(x, self.schema),
+                self.metrics,
+                time.perf_counter() - started,
+                on_complete=lambda: _log_metrics(
+                    self.options,
+                    self.metrics.collect(),
+                    start_offset=start,
+                    end_offset=end,
+                ),
+            )
+            return profiler.rows(rows)
+
+        def commit(self, end: dict) -> None:
+            pass
+
+
     class LakeflowBatchReader(DataSourceReader):
         def __init__(
             self,
             options: dict[str, str],
             schema: StructType,
             lakeflow_connect: LakeflowConnect,
+            metrics: ReadMetrics,
         ):
             self.options = options
             self.schema = schema
             self.lakeflow_connect = lakeflow_connect
+            self.metrics = metrics
             self.table_name = options[TABLE_NAME]
+            # `(column, op, value)` filters accepted by `pushFilters`
+            self.pushed_filters = []
+            # Columns read when `lakeflow.columns` pruned `schema`, else None.
+            # Without the option the table's schema is not looked up again: for
+            # some connectors that costs API calls (e.g. HubSpot property
+            # discovery), and a schema given by the user is passed through as is.
+            self.projection = None
+            if self.table_name not in (
+                METADATA_TABLE,
+                METRICS_TABLE,
+                CO_READ_TABLE,
+            ) and options.get(COLUMNS_OPTION):
+                self.projection = projection_paths(
+                    schema, lakeflow_connect.get_table_schema(self.table_name, options)
+                )
+
+        def pushFilters(self, filters):
+            """
+            Push down the filters the connector can turn into API parameters.
+
+            Connectors opt in with `supported_filters(table_name, table_options)`,
+            which maps column names to the operators they accept. Accepted
+            filters are passed to `read_table` in the `lakeflow.pushedFilters`
+            option so the connector can narrow its requests, and rows that do
+            not match them are dropped after parsing. The other filters are
+            returned to Spark.
+            """
+            supported_filters = getattr(self.lakeflow_connect, "supported_filters", None)
+            if supported_filters is None or self.table_name in (
+                METADATA_TABLE,
+                METRICS_TABLE,
+            ):
+                return filters
+            supported = supported_filters(self.table_name, self.options) or {}
+            unhandled = []
+            for spark_filter in filters:
+                pushed = to_pushed_filter(spark_filter)
+                if pushed is not None and pushed[1] in supported.get(pushed[0], ()):
+                    self.pushed_filters.append(pushed)
+                else:
+                    unhandled.append(spark_filter)
+            return unhandled
+
+        def partitions(self):
+            # Metadata lookups can each cost API calls, so give every table its
+            # own partition; resolution then takes as long as the slowest table
+            # rather than the sum of all of them.
+            if self.table_name in (METADATA_TABLE, METRICS_TABLE):
+                table_names = self._metadata_table_names()
+                if table_names:
+                    return [InputPartition(table) for table in table_names]
+            return [InputPartition(None)]
 
         def read(self, partition):
             all_records = []
-            if self.table_name == METADATA_TABLE:
-                all_records = self._read_table_metadata()
-            else:
+            if self.table_name in (METADATA_TABLE, METRICS_TABLE):
+                table_names = self._metadata_table_names()
+                if partition is not None and partition.value is not None:
+                    table_names = [partition.value]
+                if self.table_name == METRICS_TABLE:
+                    all_records = self._read_table_metrics(table_names)
+                else:
+                    all_records = self._read_table_metadata(table_names)
+                return iter(map(lambda x: parse_value(x, self.schema), all_records))
+
+            options = dict(self.options)
+            if self.pushed_filters:
+                options[PUSHED_FILTERS_OPTION] = json.dumps(self.pushed_filters)
+            if self.projection is not None:
+                options[PROJECTION_OPTION] = json.dumps(self.projection)
+            profiler = ReadProfiler(self.options, "batch")
+            started = time.perf_counter()
+            with profiler:
                 all_records, _ = self.lakeflow_connect.read_table(
-                    self.table_name, None, self.options
+                    self.table_name, None, options
                 )
+            rows = timed_rows(
+                all_records,
+                lambda x: parse_value(x, self.schema),
+                self.metrics,
+                time.perf_counter() - started,
+                on_complete=lambda: _log_metrics(self.options, self.metrics.collect()),
+            )
+            if self.pushed_filters:
+                rows = (row for row in rows if matches_filters(row, self.pushed_filters))
+            return profiler.rows(rows)
 
-            rows = map(lambda x: parse_value(x, self.schema), all_records)
-            return iter(rows)
-
-        def _read_table_metadata(self):
+        def _metadata_table_names(self) -> list[str]:
             table_name_list = self.options.get(TABLE_NAME_LIST, "")
-            table_names = [o.strip() for o in table_name_list.split(",") if o.strip()]
+            return [o.strip() for o in table_name_list.split(",") if o.strip()]
+
+        def _read_table_metrics(self, table_names: list[str]):
+            """
+            Return the metrics logged by the reads of each table, one row per
+            micro-batch (or batch read), oldest first. Nothing is read from the
+            source; stream offsets are returned as JSON strings.
+            """
+            directory = self.options.get(METRICS_PATH_OPTION) or DEFAULT_METRICS_PATH
+            all_records = []
+            for table in table_names:
+                for line in read_metrics_lines(directory, table):
+                    all_records.append(
+                        {
+                            **line,
+                            "tableName": table,
+                            **{
+                                key: json.dumps(line[key])
+                                for key in ("start_offset", "end_offset")
+                                if key in line
+                            },
+                        }
+                    )
+            return all_records
+
+        def _read_table_metadata(self, table_names: list[str]):
             all_records = []
             for table in table_names:
                 metadata = self.lakeflow_connect.read_table_metadata(table, self.options)
@@ -721,6 +2370,11 @@ def register_lakeflow_source(spark):
         def __init__(self, options):
             self.options = options
             self.lakeflow_connect = LakeflowConnect(options)
+            # Connectors that instrument their HTTP calls expose a `metrics`
+            # attribute; the others still get record and timing counters.
+            self.metrics = getattr(self.lakeflow_connect, "metrics", None)
+            if not isinstance(self.metrics, ReadMetrics):
+                self.metrics = ReadMetrics()
 
         @classmethod
         def name(cls):
@@ -737,15 +2391,67 @@ def register_lakeflow_source(spark):
                         StructField("ingestion_type", StringType(), True),
                     ]
                 )
+            elif table == METRICS_TABLE:
+                return METRICS_SCHEMA
+            elif table == CO_READ_TABLE:
+                return co_read_schema(
+                    {
+                        name: self.lakeflow_connect.get_table_schema(name, self.options)
+                        for name in self._table_name_list()
+                    }
+                )
             else:
                 # Assuming the LakeflowConnect interface uses get_table_schema, not get_table_details
-                return self.lakeflow_connect.get_table_schema(table, self.options)
+                schema = self.lakeflow_connect.get_table_schema(table, self.options)
+                columns = self.options.get(COLUMNS_OPTION)
+                if columns:
+                    schema = prune_schema(
+                        schema, [c.strip() for c in columns.split(",") if c.strip()]
+                    )
+                return schema
 
         def reader(self, schema: StructType):
-            return LakeflowBatchReader(self.options, schema, self.lakeflow_connect)
+            return LakeflowBatchReader(
+                self.options, schema, self._table_reader(), self.metrics
+            )
+
+        def streamReader(self, schema: StructType):
+            # Without the option, the base class raises the not-implemented error
+            # that makes Spark fall back to simpleStreamReader.
+            if self.options.get(PARTITIONED_STREAM_OPTION, "false").lower() != "true":
+                return super().streamReader(schema)
+            if self.options[TABLE_NAME] == CO_READ_TABLE:
+                raise ValueError(
+                    f"{PARTITIONED_STREAM_OPTION} does not apply to {CO_READ_TABLE}"
+                )
+            missing = [
+                method
+                for method in PARTITIONED_STREAM_METHODS
+                if not hasattr(self.lakeflow_connect, method)
+            ]
+            if missing:
+                raise ValueError(
+                    f"{PARTITIONED_STREAM_OPTION} is set, but the connector does not "
+                    f"implement {', '.join(missing)}"
+                )
+            return LakeflowPartitionedStreamReader(
+                self.options, schema, self.lakeflow_connect, self.metrics
+            )
 
         def simpleStreamReader(self, schema: StructType):
-            return LakeflowStreamReader(self.options, schema, self.lakeflow_connect)
+            return LakeflowStreamReader(
+                self.options, schema, self._table_reader(), self.metrics
+            )
+
+        def _table_name_list(self) -> list[str]:
+            table_name_list = self.options.get(TABLE_NAME_LIST, "")
+            return [o.strip() for o in table_name_list.split(",") if o.strip()]
+
+        def _table_reader(self):
+            """The object whose `read_table` serves `tableName`."""
+            if self.options[TABLE_NAME] == CO_READ_TABLE:
+                return LakeflowCoRead(self.lakeflow_connect, self._table_name_list())
+            return self.lakeflow_connect
 
 
     spark.dataSource.register(LakeflowSource)
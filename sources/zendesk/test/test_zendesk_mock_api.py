@@ -0,0 +1,400 @@
+"""
+Offline load tests for the Zendesk connector against the mock API server.
+"""
+
+import json
+import time
+from urllib.parse import unquote
+
+import pytest
+
+from libs.utils import PUSHED_FILTERS_OPTION, epoch_to_iso8601, iso8601_to_epoch
+from tests.mock_api_fixtures import FIXTURES, ZENDESK_COMMENTS_PER_TICKET, record_time
+from tests.mock_api_server import (
+    MetaCursorPagination,
+    MockAPIServer,
+    MockResponse,
+    NextPagePagination,
+)
+from sources.zendesk.zendesk import LakeflowConnect
+
+FIXTURE = FIXTURES["zendesk.tickets"]
+
+
+def test_incremental_export_waits_out_rate_limits(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    with MockAPIServer() as server:
+        FIXTURE.install(server, 2500)
+        server.throttle(2, retry_after=5, path=r"/api/v2/incremental/tickets\.json")
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+
+        records, offset = connector.read_table("tickets", {}, {})
+
+        assert len(records) == 2500
+        assert server.throttled_count == 2
+    assert sleeps == [5, 5]
+    metrics = connector.metrics.collect()
+    assert metrics["retries"] == 2
+    assert metrics["throttled"] == 2
+
+
+def test_per_ticket_comments_are_fetched_concurrently():
+    tickets = 40
+    with MockAPIServer(latency=0.05) as server:
+        FIXTURE.install(server, tickets)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+
+        records, _ = connector.read_table(
+            "ticket_comments",
+            {},
+            {
+                "comments_strategy": "per_ticket",
+                "max_workers": "4",
+                "max_requests_per_minute": "0",
+            },
+        )
+
+        assert len(records) == tickets * ZENDESK_COMMENTS_PER_TICKET
+        assert {r["ticket_id"] for r in records} == set(range(1, tickets + 1))
+        assert 1 < server.max_in_flight <= 4
+
+
+def test_pushed_updated_at_filter_sets_the_export_start_time():
+    with MockAPIServer() as server:
+        FIXTURE.install(server, 100)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        assert connector.supported_filters("tickets", {}) == {"updated_at": (">", ">=")}
+        assert connector.supported_filters("groups", {}) == {}
+
+        filters = [["updated_at", ">=", epoch_to_iso8601(record_time(60))]]
+        records, offset = connector.read_table(
+            "tickets", {}, {PUSHED_FILTERS_OPTION: json.dumps(filters)}
+        )
+
+        assert [record["id"] for record in records] == list(range(61, 101))
+        assert f"start_time={record_time(60)}" in server.requests[0][1]
+
+
+def ticket(ticket_id, updated_at):
+    return {"id": ticket_id, "status": "open", "updated_at": epoch_to_iso8601(updated_at)}
+
+
+def first_updated_at(tickets, start_time):
+    """Index of the first ticket updated at or after `start_time`."""
+    for index, record in enumerate(tickets):
+        if iso8601_to_epoch(record["updated_at"]) >= start_time:
+            return index
+    return len(tickets)
+
+
+def install_cursor_export(server, tickets):
+    """Serve `tickets` from the cursor-based export; cursors are list indexes."""
+
+    def export(request):
+        if "cursor" in request.query:
+            low = int(request.query["cursor"])
+        else:
+            low = first_updated_at(tickets, int(request.query.get("start_time", 0)))
+        high = min(low + int(request.query.get("per_page", 1000)), len(tickets))
+        return MockResponse(
+            {
+                "tickets": tickets[low:high],
+                "after_cursor": str(high),
+                "end_of_stream": high >= len(tickets),
+            }
+        )
+
+    server.route(r"/api/v2/incremental/tickets/cursor\.json", export)
+
+
+def test_cursor_export_resumes_from_the_after_cursor():
+    tickets = [ticket(index + 1, record_time(index)) for index in range(50)]
+    with MockAPIServer() as server:
+        install_cursor_export(server, tickets)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        options = {"incremental_mode": "cursor", "per_page": "10", "max_pages_per_batch": "2"}
+
+        records, offset = connector.read_table("tickets", {}, options)
+        assert [record["id"] for record in records] == list(range(1, 21))
+        assert offset == {
+            "start_time": record_time(19),
+            "boundary_ids": [20],
+            "cursor": "20",
+        }
+
+        server.requests.clear()
+        records, offset = connector.read_table("tickets", offset, options)
+        assert [record["id"] for record in records] == list(range(21, 41))
+        first_request = server.requests[0][1]
+        assert "cursor=20" in first_request and "start_time" not in first_request
+        assert offset["cursor"] == "40"
+
+
+def test_cursor_export_end_of_stream_offset():
+    tickets = [ticket(index + 1, record_time(index)) for index in range(50)]
+    with MockAPIServer() as server:
+        install_cursor_export(server, tickets)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        options = {"incremental_mode": "cursor", "per_page": "10"}
+
+        records, offset = connector.read_table("tickets", {}, options)
+        assert len(records) == 50
+        assert offset == {
+            "start_time": record_time(49),
+            "boundary_ids": [50],
+            "cursor": "50",
+        }
+
+        # At the end of the stream the offset stays put until a ticket changes.
+        records, next_offset = connector.read_table("tickets", offset, options)
+        assert records == [] and next_offset == offset
+
+        tickets.append(ticket(51, record_time(60)))
+        records, next_offset = connector.read_table("tickets", offset, options)
+        assert [record["id"] for record in records] == [51]
+        assert next_offset["cursor"] == "51"
+
+
+def test_cursor_export_reads_at_least_one_page_per_batch():
+    tickets = [ticket(index + 1, record_time(index)) for index in range(30)]
+    with MockAPIServer() as server:
+        install_cursor_export(server, tickets)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+
+        for max_pages in ("0", "-3"):
+            options = {
+                "incremental_mode": "cursor",
+                "per_page": "10",
+                "max_pages_per_batch": max_pages,
+            }
+            records, offset = connector.read_table("tickets", {}, options)
+            assert [record["id"] for record in records] == list(range(1, 11))
+            assert offset["cursor"] == "10"
+
+
+def test_time_export_drops_boundary_ids_at_equal_timestamps():
+    boundary = record_time(7)
+    tickets = [ticket(index + 1, record_time(min(index, 7))) for index in range(10)]
+    with MockAPIServer() as server:
+        server.collection(
+            r"/api/v2/incremental/tickets\.json",
+            tickets,
+            NextPagePagination("tickets"),
+            start=lambda request: first_updated_at(
+                tickets, int(request.query.get("start_time", 0))
+            ),
+        )
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+
+        records, offset = connector.read_table("tickets", {}, {})
+        assert len(records) == 10
+        assert offset == {"start_time": boundary, "boundary_ids": [8, 9, 10]}
+
+        # The export restarts at the boundary second (inclusive): tickets 8-10
+        # come back and are dropped, ticket 11 shares the second but is new.
+        tickets.append(ticket(11, boundary))
+        tickets.append(ticket(12, record_time(8)))
+        records, offset = connector.read_table("tickets", offset, {})
+        assert [record["id"] for record in records] == [11, 12]
+        assert offset == {"start_time": record_time(8), "boundary_ids": [12]}
+
+
+def test_co_read_sideloads_related_tables_onto_one_tickets_sweep():
+    pages = [
+        {
+            "tickets": [ticket(1, record_time(0)), ticket(2, record_time(1))],
+            "users": [{"id": 100, "updated_at": epoch_to_iso8601(record_time(0))}],
+            "organizations": [{"id": 7, "updated_at": epoch_to_iso8601(record_time(0))}],
+        },
+        {
+            "tickets": [ticket(3, record_time(2))],
+            "users": [{"id": 100, "updated_at": epoch_to_iso8601(record_time(2))}],
+            "organizations": [],
+        },
+    ]
+
+    def export(request):
+        page = int(request.query.get("page", 0))
+        last = page == len(pages) - 1
+        return MockResponse(
+            {
+                **pages[page],
+                "next_page": None if last else request.url_with(page=page + 1),
+                "end_of_stream": last,
+            }
+        )
+
+    with MockAPIServer() as server:
+        server.route(r"/api/v2/incremental/tickets\.json", export)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+
+        records, offset = connector.read_co_read(
+            ["tickets", "users", "organizations"], {}, {}
+        )
+
+        assert [(name, record["id"]) for name, record in records] == [
+            ("tickets", 1),
+            ("tickets", 2),
+            ("tickets", 3),
+            ("users", 100),
+            ("organizations", 7),
+        ]
+        # The latest copy of a user sideloaded on several pages is kept.
+        assert records[3][1]["updated_at"] == epoch_to_iso8601(record_time(2))
+        assert offset == {"start_time": record_time(2), "boundary_ids": [3]}
+        assert len(server.requests) == 2
+        assert "include=users,organizations" in unquote(server.requests[0][1])
+
+        with pytest.raises(ValueError, match="co-reads 'tickets'"):
+            connector.read_co_read(["users", "tickets"], {}, {})
+
+
+def read_batches(connector, table_name, table_options, count):
+    """Read `count` consecutive batches, returning their records and offsets."""
+    batches, offset = [], {}
+    for _ in range(count):
+        records, offset = connector.read_table(table_name, offset, table_options)
+        batches.append(([record["id"] for record in records], offset))
+    return batches
+
+
+def test_capped_cursor_pagination_resumes_after_the_last_page():
+    groups = [{"id": index + 1, "name": f"Group {index + 1}"} for index in range(250)]
+    with MockAPIServer() as server:
+        server.collection(r"/api/v2/groups\.json", groups, MetaCursorPagination("groups"))
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+
+        batches = read_batches(connector, "groups", {"max_pages_per_batch": "1"}, 3)
+
+        assert [offset for _, offset in batches] == [
+            {"cursor": "100"},
+            {"cursor": "200"},
+            {"cursor": "200"},
+        ]
+        ids = [record_id for batch, _ in batches for record_id in batch]
+        assert ids == list(range(1, 251))
+
+
+def test_capped_offset_pagination_resumes_at_the_first_unread_page():
+    brands = [{"id": index + 1, "name": f"Brand {index + 1}"} for index in range(250)]
+
+    def list_brands(request):
+        page = int(request.query.get("page", 1))
+        per_page = int(request.query.get("per_page", 100))
+        low = (page - 1) * per_page
+        has_more = low + per_page < len(brands)
+        return MockResponse(
+            {
+                "brands": brands[low : low + per_page],
+                "count": len(brands),
+                "next_page": request.url_with(page=page + 1) if has_more else None,
+            }
+        )
+
+    with MockAPIServer() as server:
+        server.route(r"/api/v2/brands\.json", list_brands)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+
+        batches = read_batches(connector, "brands", {"max_pages_per_batch": "2"}, 2)
+
+        assert [offset for _, offset in batches] == [{"page": 3}, {"page": 3}]
+        ids = [record_id for batch, _ in batches for record_id in batch]
+        assert ids == list(range(1, 251))
+
+
+def test_per_ticket_comments_follow_pages_and_the_tickets_offset():
+    comments_per_ticket = 250
+    tickets = [ticket(index + 1, record_time(index)) for index in range(3)]
+    comments = MetaCursorPagination("comments")
+
+    def ticket_comments(request):
+        ticket_id = int(request.match.group(1))
+        records = [
+            {"id": ticket_id * 1000 + index, "created_at": tickets[0]["updated_at"]}
+            for index in range(comments_per_ticket)
+        ]
+        return comments(request, records, 0)
+
+    with MockAPIServer() as server:
+        server.collection(
+            r"/api/v2/incremental/tickets\.json",
+            tickets,
+            NextPagePagination("tickets"),
+            start=lambda request: first_updated_at(
+                tickets, int(request.query.get("start_time", 0))
+            ),
+        )
+        server.route(r"/api/v2/tickets/(\d+)/comments\.json", ticket_comments)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        options = {"comments_strategy": "per_ticket", "max_requests_per_minute": "0"}
+
+        records, offset = connector.read_table("ticket_comments", {}, options)
+        assert len(records) == 3 * comments_per_ticket
+        assert len({record["id"] for record in records}) == len(records)
+        comment_requests = [path for _, path in server.requests if "/comments" in path]
+        assert len(comment_requests) == 3 * 3
+        assert offset == {"start_time": record_time(2), "boundary_ids": [3]}
+
+        # No ticket changed: no comment requests and the offset stays put.
+        server.requests.clear()
+        records, next_offset = connector.read_table("ticket_comments", offset, options)
+        assert records == [] and next_offset == offset
+        assert all("/comments" not in path for _, path in server.requests)
+
+        tickets.append(ticket(2, record_time(5)))
+        records, next_offset = connector.read_table("ticket_comments", offset, options)
+        assert {record["ticket_id"] for record in records} == {2}
+        assert len(records) == comments_per_ticket
+        assert next_offset == {"start_time": record_time(5), "boundary_ids": [2]}
+
+
+def test_per_ticket_comments_cap_the_tickets_read_per_batch():
+    # Two tickets per second, so pages and the cap split seconds in two.
+    tickets = [ticket(index + 1, record_time(index // 2)) for index in range(25)]
+
+    def ticket_comments(request):
+        ticket_id = int(request.match.group(1))
+        return MockResponse(
+            {
+                "comments": [{"id": ticket_id * 1000, "created_at": "2024-01-01"}],
+                "meta": {"has_more": False},
+            }
+        )
+
+    with MockAPIServer() as server:
+        server.collection(
+            r"/api/v2/incremental/tickets\.json",
+            tickets,
+            NextPagePagination("tickets", page_size=3),
+            start=lambda request: first_updated_at(
+                tickets, int(request.query.get("start_time", 0))
+            ),
+        )
+        server.route(r"/api/v2/tickets/(\d+)/comments\.json", ticket_comments)
+        connector = LakeflowConnect(FIXTURE.options(server.base_url))
+        options = {
+            "comments_strategy": "per_ticket",
+            "max_requests_per_minute": "0",
+            "max_tickets_per_batch": "5",
+        }
+
+        records, offset = connector.read_table("ticket_comments", {}, options)
+        # Two pages reach the cap; the next batch restarts at the last
+        # second read and skips tickets 5 and 6, already emitted there.
+        assert sorted(record["ticket_id"] for record in records) == [1, 2, 3, 4, 5, 6]
+        assert offset == {"start_time": record_time(2), "boundary_ids": [5, 6]}
+
+        ticket_ids = [record["ticket_id"] for record in records]
+        for _ in range(10):
+            server.requests.clear()
+            records, offset = connector.read_table("ticket_comments", offset, options)
+            comment_requests = [p for _, p in server.requests if "/comments" in p]
+            assert len(comment_requests) == len(records) <= 5 + 3
+            if not records:
+                break
+            ticket_ids += [record["ticket_id"] for record in records]
+
+        assert sorted(ticket_ids) == list(range(1, 26))
+        assert offset == {"start_time": record_time(12), "boundary_ids": [25]}
@@ -1,16 +1,88 @@
 import requests
 import base64
+import threading
+import time
 from pyspark.sql.types import *
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Iterator
 
+from libs.metrics import ReadMetrics, attach_metrics
+from libs.utils import (
+    iso8601_to_epoch,
+    latest_iso8601,
+    pushed_filters,
+    response_json,
+)
+
 
 class LakeflowConnect:
+    # Incremental exports whose `start_time` can come from an `updated_at` filter.
+    FILTERED_EXPORTS = ("tickets", "users", "organizations")
+    # Tables the incremental tickets export can sideload (`include=`).
+    SIDELOAD_TABLES = ("users", "organizations", "groups")
+
+    # API endpoints and response keys of every table.
+    API_CONFIG = {
+        "tickets": {
+            "endpoint": "incremental/tickets.json",
+            "cursor_endpoint": "incremental/tickets/cursor.json",
+            "response_key": "tickets",
+            "supports_incremental": True,
+        },
+        "organizations": {
+            "endpoint": "incremental/organizations.json",
+            "response_key": "organizations",
+            "supports_incremental": True,
+        },
+        "articles": {
+            "endpoint": "help_center/articles.json",
+            "response_key": "articles",
+            "supports_incremental": False,
+            "supports_pagination": True,
+            "pagination": "cursor",
+        },
+        "brands": {
+            "endpoint": "brands.json",
+            "response_key": "brands",
+            "supports_incremental": False,
+            "supports_pagination": True,
+            "pagination": "offset",
+        },
+        "groups": {
+            "endpoint": "groups.json",
+            "response_key": "groups",
+            "supports_incremental": False,
+            "supports_pagination": True,
+            "pagination": "cursor",
+        },
+        "ticket_comments": {
+            "endpoint": "incremental/ticket_events.json",
+            "response_key": "ticket_events",
+            "supports_incremental": True,
+            "include": "comment_events",
+        },
+        "topics": {
+            "endpoint": "community/topics.json",
+            "response_key": "topics",
+            "supports_incremental": False,
+            "supports_pagination": True,
+            "pagination": "cursor",
+        },
+        "users": {
+            "endpoint": "incremental/users.json",
+            "cursor_endpoint": "incremental/users/cursor.json",
+            "response_key": "users",
+            "supports_incremental": True,
+        },
+    }
+
     def __init__(self, options: dict) -> None:
         self.subdomain = options["subdomain"]
         self.email = options["email"]
         self.api_token = options["api_token"]
-        self.base_url = f"https://{self.subdomain}.zendesk.com/api/v2"
+        self.base_url = options.get(
+            "base_url", f"https://{self.subdomain}.zendesk.com/api/v2"
+        ).rstrip("/")
         user = f"{self.email}/token"
         token = self.api_token
         auth_str = f"{user}:{token}"
@@ -18,6 +90,14 @@ class LakeflowConnect:
             "Authorization": "Basic " + base64.b64encode(auth_str.encode()).decode(),
             "Content-Type": "application/json",
         }
+        # Reuse connections across the many pages of an export
+        self._session = requests.Session()
+        self._session.headers.update(self.auth_header)
+        # Request, byte and latency counters reported per micro-batch
+        self.metrics = ReadMetrics()
+        attach_metrics(self._session, self.metrics)
+        # Number of times a rate-limited (429) request is retried
+        self.max_retries = int(options.get("max_retries", 3))
 
     def list_tables(self) -> List[str]:
         return [
@@ -284,73 +364,314 @@ class LakeflowConnect:
 
         return metadata[table_name]
 
+    def supported_filters(
+        self, table_name: str, table_options: Dict[str, str]
+    ) -> Dict[str, tuple]:
+        """
+        Filters of batch queries that narrow the incremental exports.
+
+        A lower bound on `updated_at` becomes the `start_time` of the
+        tickets, users and organizations exports.
+        """
+        if table_name in self.FILTERED_EXPORTS:
+            return {"updated_at": (">", ">=")}
+        return {}
+
     def read_table(
         self, table_name: str, start_offset: dict, table_options: Dict[str, str]
     ) -> (Iterator[dict], dict):
-        # Map table names to their API endpoints and response keys
-        api_config = {
-            "tickets": {
-                "endpoint": "incremental/tickets.json",
-                "response_key": "tickets",
-                "supports_incremental": True,
-            },
-            "organizations": {
-                "endpoint": "incremental/organizations.json",
-                "response_key": "organizations",
-                "supports_incremental": True,
-            },
-            "articles": {
-                "endpoint": "help_center/articles.json",
-                "response_key": "articles",
-                "supports_incremental": False,
-                "supports_pagination": True,
-            },
-            "brands": {
-                "endpoint": "brands.json",
-                "response_key": "brands",
-                "supports_incremental": False,
-                "supports_pagination": True,
-            },
-            "groups": {
-                "endpoint": "groups.json",
-                "response_key": "groups",
-                "supports_incremental": False,
-                "supports_pagination": True,
-            },
-            "ticket_comments": {
-                "endpoint": "incremental/ticket_events.json",
-                "response_key": "ticket_events",
-                "supports_incremental": True,
-                "include": "comment_events",
-            },
-            "topics": {
-                "endpoint": "community/topics.json",
-                "response_key": "topics",
-                "supports_incremental": False,
-                "supports_pagination": True,
-            },
-            "users": {
-                "endpoint": "incremental/users.json",
-                "response_key": "users",
-                "supports_incremental": True,
-            },
-        }
-
-        if table_name not in api_config:
+        if table_name not in self.API_CONFIG:
             raise ValueError(f"Table '{table_name}' is not supported.")
 
-        config = api_config[table_name]
+        config = self.API_CONFIG[table_name]
+        table_options = table_options or {}
+
+        # A pushed-down `updated_at` bound starts a fresh export at that time.
+        if not start_offset and self.supported_filters(table_name, table_options):
+            start_time = 0
+            for column, op, value in pushed_filters(table_options):
+                if column == "updated_at" and op in (">", ">="):
+                    start_time = max(start_time, self._parse_time(value) or 0)
+            if start_time:
+                start_offset = {"start_time": start_time}
+
+        if table_name == "ticket_comments":
+            comments_strategy = table_options.get("comments_strategy", "ticket_events")
+            if comments_strategy == "per_ticket":
+                return self._read_comments_per_ticket(
+                    self.API_CONFIG["tickets"], start_offset, table_options
+                )
+            if comments_strategy != "ticket_events":
+                raise ValueError(
+                    f"Invalid comments_strategy {comments_strategy!r}; "
+                    "expected 'ticket_events' or 'per_ticket'."
+                )
 
         if config.get("supports_incremental", False):
-            return self._read_incremental(table_name, config, start_offset)
+            return self._read_incremental_table(
+                table_name, config, start_offset, table_options
+            )
         else:
-            return self._read_paginated(table_name, config, start_offset)
+            return self._read_paginated(
+                table_name, config, start_offset, table_options
+            )
+
+    def read_co_read(
+        self, table_names: List[str], start_offset: dict, table_options: Dict[str, str]
+    ) -> (Iterator[tuple], dict):
+        """
+        Read `tickets` together with the tables sideloaded onto its export.
+
+        `table_names` is `tickets` followed by any of `users`,
+        `organizations` and `groups`. One sweep of the incremental tickets
+        export with `include=<those tables>` returns the changed tickets plus
+        the users, organizations and groups they reference. Records are
+        returned as `(table_name, record)` pairs; each sideloaded record
+        appears once, in its most recently updated copy. The offset is the
+        tickets export offset.
+        """
+        sideloads = list(dict.fromkeys(table_names[1:]))
+        if (
+            not table_names
+            or table_names[0] != "tickets"
+            or not set(sideloads) <= set(self.SIDELOAD_TABLES)
+        ):
+            raise ValueError(
+                "Zendesk co-reads 'tickets' followed by any of "
+                f"{list(self.SIDELOAD_TABLES)}, got {table_names}"
+            )
+
+        config = dict(self.API_CONFIG["tickets"])
+        sideload_buffers = {}
+        if sideloads:
+            config["include"] = ",".join(sideloads)
+            sideload_buffers = {name: [] for name in sideloads}
+        tickets, offset = self._read_incremental_table(
+            "tickets", config, start_offset, table_options or {}, sideload_buffers
+        )
+
+        records = [("tickets", ticket) for ticket in tickets]
+        for name, buffer in sideload_buffers.items():
+            records.extend((name, record) for record in self._latest_by_id(buffer))
+        return records, offset
+
+    @staticmethod
+    def _latest_by_id(records: List[dict]) -> List[dict]:
+        """
+        Collapse sideloaded records to one per id.
+
+        The same user or organization is sideloaded on every page that
+        references it; keep the most recently updated copy.
+        """
+        latest = {}
+        for record in records:
+            record_id = record.get("id")
+            current = latest.get(record_id)
+            if current is None or (record.get("updated_at") or "") >= (
+                current.get("updated_at") or ""
+            ):
+                latest[record_id] = record
+        return list(latest.values())
+
+    def _read_incremental_table(
+        self,
+        table_name: str,
+        config: dict,
+        start_offset: dict,
+        table_options: Dict[str, str],
+        sideload_buffers: Dict[str, list] = None,
+        max_records: int = None,
+    ):
+        """
+        Dispatch an incremental read to the time- or cursor-based export.
+
+        With `max_records`, either export stops after the page that reaches
+        that many records and the next batch continues from its offset.
+        """
+        incremental_mode = table_options.get("incremental_mode", "time")
+        if incremental_mode == "cursor":
+            if "cursor_endpoint" not in config:
+                raise ValueError(
+                    f"Table '{table_name}' does not support cursor-based incremental "
+                    "exports; use incremental_mode 'time'."
+                )
+            return self._read_incremental_cursor(
+                table_name,
+                config,
+                start_offset,
+                table_options,
+                sideload_buffers,
+                max_records,
+            )
+        if incremental_mode != "time":
+            raise ValueError(
+                f"Invalid incremental_mode {incremental_mode!r}; expected 'time' or 'cursor'."
+            )
+        return self._read_incremental(
+            table_name, config, start_offset, sideload_buffers, max_records
+        )
+
+    def _read_comments_per_ticket(
+        self,
+        tickets_config: dict,
+        start_offset: dict,
+        table_options: Dict[str, str],
+    ):
+        """
+        Read ticket_comments through the per-ticket comments endpoint.
+
+        The incremental tickets export tells us which tickets changed since
+        `start_offset` (a new comment always updates its ticket); the comments
+        of those tickets are then fetched from `/tickets/{id}/comments.json`
+        with a bounded pool of workers, paced to `max_requests_per_minute`.
+        Unlike the ticket events export, no non-comment events are downloaded.
+        The checkpoint is the tickets export offset; a micro-batch stops
+        reading the export after the page that reaches `max_tickets_per_batch`
+        tickets, so it never fetches the comments of the whole account at once.
+        """
+        try:
+            max_workers = max(1, int(table_options.get("max_workers", 4)))
+        except (TypeError, ValueError):
+            max_workers = 4
+        try:
+            requests_per_minute = float(
+                table_options.get("max_requests_per_minute", 200)
+            )
+        except (TypeError, ValueError):
+            requests_per_minute = 200.0
+        try:
+            max_tickets = max(1, int(table_options.get("max_tickets_per_batch", 1000)))
+        except (TypeError, ValueError):
+            max_tickets = 1000
+
+        tickets, offset = self._read_incremental_table(
+            "tickets",
+            tickets_config,
+            start_offset,
+            table_options,
+            max_records=max_tickets,
+        )
+        ticket_ids = []
+        for ticket in tickets:
+            # Comments of deleted tickets are no longer served by the API.
+            ticket_id = ticket.get("id")
+            if ticket_id is not None and ticket.get("status") != "deleted":
+                ticket_ids.append(ticket_id)
+        ticket_ids = list(dict.fromkeys(ticket_ids))
+        if not ticket_ids:
+            return [], offset
+
+        wait_for_slot = self._rate_limiter(requests_per_minute)
+
+        def fetch_comments(ticket_id):
+            return self._read_ticket_comments(ticket_id, wait_for_slot)
+
+        all_records = []
+        max_workers = min(max_workers, len(ticket_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for comments in executor.map(fetch_comments, ticket_ids):
+                all_records.extend(comments)
+        return all_records, offset
+
+    def _read_ticket_comments(self, ticket_id, wait_for_slot) -> List[dict]:
+        """Read every comment of one ticket, following cursor pagination."""
+        url = f"{self.base_url}/tickets/{ticket_id}/comments.json"
+        params = {"page[size]": 100}
+        records = []
+        while True:
+            wait_for_slot()
+            resp = self._get(url, params=params)
+            if resp.status_code == 404:
+                # The ticket was deleted after the tickets export saw it.
+                return records
+            if resp.status_code != 200:
+                raise Exception(
+                    f"Zendesk API error for ticket_comments: {resp.status_code} {resp.text}"
+                )
+
+            data = response_json(resp)
+            for comment in data.get("comments", []):
+                records.append(
+                    {
+                        **comment,
+                        "ticket_id": ticket_id,
+                        "updated_at": comment.get("created_at"),
+                        "event_type": "Comment",
+                    }
+                )
+
+            meta = data.get("meta") or {}
+            after_cursor = meta.get("after_cursor")
+            if not meta.get("has_more") or not after_cursor:
+                return records
+            params = {"page[size]": 100, "page[after]": after_cursor}
+
+    @staticmethod
+    def _rate_limiter(requests_per_minute: float):
+        """
+        Return a callable that blocks until the next request may be sent.
+
+        Requests are spaced evenly at `requests_per_minute` across all the
+        threads that share the callable. A non-positive rate disables pacing.
+        """
+        if requests_per_minute <= 0:
+            return lambda: None
 
-    def _read_incremental(self, table_name: str, config: dict, start_offset: dict):
-        """Read data from incremental API endpoints"""
+        interval = 60.0 / requests_per_minute
+        lock = threading.Lock()
+        next_slot = [time.monotonic()]
+
+        def wait_for_slot():
+            with lock:
+                now = time.monotonic()
+                slot = max(now, next_slot[0])
+                next_slot[0] = slot + interval
+            if slot > now:
+                time.sleep(slot - now)
+
+        return wait_for_slot
+
+    def _get(self, url: str, params: dict = None) -> requests.Response:
+        """
+        Issue a GET request, waiting out 429 responses.
+
+        Incremental exports are limited to 10 requests per minute, so a 429 is
+        expected during large syncs. Zendesk tells us how long to wait via the
+        Retry-After header; we honour it up to `max_retries` times before
+        handing the response back to the caller.
+        """
+        for attempt in range(self.max_retries + 1):
+            resp = self._session.get(url, params=params, timeout=60)
+            if resp.status_code != 429 or attempt == self.max_retries:
+                return resp
+            try:
+                retry_after = int(resp.headers.get("Retry-After", 60))
+            except (TypeError, ValueError):
+                retry_after = 60
+            self.metrics.record_retry()
+            time.sleep(max(1, retry_after))
+        return resp
+
+    def _read_incremental(
+        self,
+        table_name: str,
+        config: dict,
+        start_offset: dict,
+        sideload_buffers: Dict[str, list] = None,
+        max_records: int = None,
+    ):
+        """
+        Read data from incremental API endpoints.
+
+        The export is ordered by update time, so stopping after the page that
+        reaches `max_records` leaves only records updated at or after the
+        latest second read; the next batch restarts at that second and skips
+        the ids already emitted there (`boundary_ids`).
+        """
         start_time = 0
         if start_offset and "start_time" in start_offset:
             start_time = start_offset["start_time"]
+        boundary_ids = set((start_offset or {}).get("boundary_ids", []))
 
         endpoint = config["endpoint"]
         response_key = config["response_key"]
@@ -363,15 +684,16 @@ class LakeflowConnect:
         all_records = []
         next_page = url
         last_time = start_time
+        latest_seen = None
 
         while next_page:
-            resp = requests.get(next_page, headers=self.auth_header)
+            resp = self._get(next_page)
             if resp.status_code != 200:
                 raise Exception(
                     f"Zendesk API error for {table_name}: {resp.status_code} {resp.text}"
                 )
 
-            data = resp.json()
+            data = response_json(resp)
 
             # Handle ticket_comments specially
             if table_name == "ticket_comments":
@@ -390,86 +712,360 @@ class LakeflowConnect:
                                     **child,
                                 }
                                 all_records.append(comment_record)
-                    # Update last_time
-                    try:
-                        event_time = int(
-                            datetime.strptime(
-                                event.get("created_at", ""), "%Y-%m-%dT%H:%M:%SZ"
-                            ).timestamp()
-                        )
-                        if event_time > last_time:
-                            last_time = event_time
-                    except Exception:
-                        pass
+                    latest_seen = latest_iso8601(latest_seen, event.get("created_at"))
             else:
                 records = data.get(response_key, [])
                 all_records.extend(records)
+                self._collect_sideloads(data, sideload_buffers)
 
-                # Update last_time based on updated_at field
                 for record in records:
-                    try:
-                        record_time = int(
-                            datetime.strptime(
-                                record.get("updated_at", ""), "%Y-%m-%dT%H:%M:%SZ"
-                            ).timestamp()
-                        )
-                        if record_time > last_time:
-                            last_time = record_time
-                    except Exception:
-                        pass
+                    latest_seen = latest_iso8601(latest_seen, record.get("updated_at"))
 
             next_page = data.get("next_page")
             end_of_stream = data.get("end_of_stream", True)
 
             if end_of_stream or not next_page:
                 break
+            # Only count records the previous batch did not emit, so a page
+            # full of boundary-second repeats cannot stall the stream.
+            if max_records and (
+                len(self._dedupe_boundary(all_records, start_time, boundary_ids))
+                >= max_records
+            ):
+                break
 
-        return all_records, {"start_time": last_time}
+        # Cursor timestamps are compared as strings while paging and only the
+        # latest one is converted to epoch seconds.
+        last_time = max(last_time, self._parse_time(latest_seen) or 0)
 
-    def _read_paginated(self, table_name: str, config: dict, start_offset: dict):
-        """Read data from paginated API endpoints"""
-        endpoint = config["endpoint"]
-        response_key = config["response_key"]
+        if table_name == "ticket_comments":
+            return all_records, {"start_time": last_time}
 
-        # For paginated endpoints, use page number from offset
-        page = 1
-        if start_offset and "page" in start_offset:
-            page = start_offset["page"]
+        # The next batch restarts at `last_time` (inclusive), so drop whatever
+        # the previous batch already emitted at its boundary second.
+        all_records = self._dedupe_boundary(all_records, start_time, boundary_ids)
+        if not all_records and start_offset:
+            return all_records, start_offset
+        return all_records, self._incremental_offset(
+            all_records, last_time, start_time, boundary_ids
+        )
 
-        url = f"{self.base_url}/{endpoint}?page={page}&per_page=100"
+    def _read_incremental_cursor(
+        self,
+        table_name: str,
+        config: dict,
+        start_offset: dict,
+        table_options: Dict[str, str],
+        sideload_buffers: Dict[str, list] = None,
+        max_records: int = None,
+    ):
+        """
+        Read data from cursor-based incremental export endpoints.
+
+        The first request starts from `start_time`; every following request
+        passes the `after_cursor` of the previous page. That cursor is stored
+        in the offset after each batch, so the next batch resumes right after
+        the last page read rather than replaying everything from a timestamp.
+        Reads stop after `max_pages_per_batch` pages, leaving the remainder of
+        the stream for the next batch.
+        """
+        start_offset = start_offset or {}
+        cursor = start_offset.get("cursor")
+        start_time = start_offset.get("start_time", 0)
+        boundary_ids = set(start_offset.get("boundary_ids", []))
+
+        try:
+            per_page = int(table_options.get("per_page", 1000))
+        except (TypeError, ValueError):
+            per_page = 1000
+        per_page = max(1, min(per_page, 1000))
+
+        try:
+            max_pages_per_batch = int(table_options.get("max_pages_per_batch", 50))
+        except (TypeError, ValueError):
+            max_pages_per_batch = 50
+        max_pages_per_batch = max(1, max_pages_per_batch)
+
+        url = f"{self.base_url}/{config['cursor_endpoint']}"
+        response_key = config["response_key"]
 
         all_records = []
-        current_page = page
+        last_time = start_time
+        latest_seen = None
+        pages_fetched = 0
 
-        while True:
-            current_url = f"{self.base_url}/{endpoint}?page={current_page}&per_page=100"
-            resp = requests.get(current_url, headers=self.auth_header)
+        while pages_fetched < max_pages_per_batch:
+            params = {"per_page": per_page}
+            if cursor:
+                params["cursor"] = cursor
+            else:
+                params["start_time"] = start_time
+            if "include" in config:
+                params["include"] = config["include"]
 
+            resp = self._get(url, params=params)
             if resp.status_code != 200:
-                # Some endpoints might return 404 when no more pages
-                if resp.status_code == 404:
-                    break
                 raise Exception(
                     f"Zendesk API error for {table_name}: {resp.status_code} {resp.text}"
                 )
 
-            data = resp.json()
+            data = response_json(resp)
             records = data.get(response_key, [])
+            all_records.extend(records)
+            self._collect_sideloads(data, sideload_buffers)
+            pages_fetched += 1
 
-            if not records:
+            for record in records:
+                latest_seen = latest_iso8601(latest_seen, record.get("updated_at"))
+
+            after_cursor = data.get("after_cursor")
+            if after_cursor:
+                cursor = after_cursor
+            if data.get("end_of_stream", True) or not after_cursor:
+                break
+            if max_records and len(all_records) >= max_records:
                 break
 
-            all_records.extend(records)
+        last_time = max(last_time, self._parse_time(latest_seen) or 0)
 
-            # Check if there's a next page
-            next_page = data.get("next_page")
-            if not next_page:
+        # A record updated while the export is being paged can show up again
+        # on a later page, and the boundary second of the previous batch can
+        # be re-delivered after a restart from `start_time`.
+        all_records = self._dedupe_boundary(all_records, start_time, boundary_ids)
+        if not all_records and start_offset:
+            return all_records, start_offset
+
+        next_offset = self._incremental_offset(
+            all_records, last_time, start_time, boundary_ids
+        )
+        if cursor:
+            next_offset["cursor"] = cursor
+        return all_records, next_offset
+
+    @staticmethod
+    def _collect_sideloads(data: dict, sideload_buffers: Dict[str, list]) -> None:
+        """Append the sideloaded arrays of an export page to their buffers."""
+        if not sideload_buffers:
+            return
+        for name, buffer in sideload_buffers.items():
+            buffer.extend(data.get(name) or [])
+
+    @staticmethod
+    def _parse_time(value) -> int:
+        """Convert a Zendesk `YYYY-MM-DDTHH:MM:SSZ` UTC timestamp to epoch seconds."""
+        epoch = iso8601_to_epoch(value)
+        return int(epoch) if epoch is not None else None
+
+    def _dedupe_boundary(
+        self, records: List[dict], start_time: int, boundary_ids: set
+    ) -> List[dict]:
+        """
+        Drop duplicate deliveries from an incremental export batch.
+
+        A record is skipped when the same (id, updated_at) pair was already
+        seen earlier in the batch, or when it was updated exactly at
+        `start_time` and its id was emitted by the previous batch
+        (`boundary_ids`).
+        """
+        seen = set()
+        deduped = []
+        for record in records:
+            key = (record.get("id"), record.get("updated_at"))
+            if key in seen:
+                continue
+            if (
+                boundary_ids
+                and key[0] in boundary_ids
+                and self._parse_time(key[1]) == start_time
+            ):
+                continue
+            seen.add(key)
+            deduped.append(record)
+        return deduped
+
+    def _incremental_offset(
+        self,
+        records: List[dict],
+        last_time: int,
+        start_time: int,
+        previous_boundary_ids: set,
+    ) -> dict:
+        """
+        Build the offset for the next incremental batch.
+
+        Besides `start_time`, the ids updated exactly at `last_time` are kept
+        so the next batch can skip them when it re-reads that second. If the
+        batch did not move past the previous boundary second, the ids carried
+        over from the previous offset are kept as well.
+        """
+        offset = {"start_time": last_time}
+        boundary_ids = {
+            record.get("id")
+            for record in records
+            if record.get("id") is not None
+            and self._parse_time(record.get("updated_at")) == last_time
+        }
+        if last_time == start_time:
+            boundary_ids |= previous_boundary_ids
+        boundary_ids = sorted(boundary_ids)
+        if boundary_ids:
+            offset["boundary_ids"] = boundary_ids
+        return offset
+
+    def _read_paginated(
+        self,
+        table_name: str,
+        config: dict,
+        start_offset: dict,
+        table_options: Dict[str, str],
+    ):
+        """
+        Read data from paginated API endpoints.
+
+        Endpoints that support cursor pagination are read with `page[size]` /
+        `page[after]`. The rest use offset pagination, where the total `count`
+        from the first page tells us which pages exist so the remaining ones
+        can be fetched concurrently.
+
+        At most `max_pages_per_batch` pages are read per call. When the limit
+        cuts a read short the offset points at the first unread page;
+        otherwise it points at the last page so the next batch re-reads it and
+        picks up anything appended since.
+        """
+        try:
+            max_pages_per_batch = int(table_options.get("max_pages_per_batch", 1000))
+        except (TypeError, ValueError):
+            max_pages_per_batch = 1000
+        max_pages_per_batch = max(1, max_pages_per_batch)
+
+        pagination = table_options.get("pagination", config["pagination"])
+        if pagination == "cursor":
+            return self._read_cursor_paginated(
+                table_name, config, start_offset, max_pages_per_batch
+            )
+        if pagination != "offset":
+            raise ValueError(
+                f"Invalid pagination {pagination!r}; expected 'cursor' or 'offset'."
+            )
+
+        try:
+            max_workers = int(table_options.get("max_workers", 4))
+        except (TypeError, ValueError):
+            max_workers = 4
+        return self._read_offset_paginated(
+            table_name, config, start_offset, max_pages_per_batch, max(1, max_workers)
+        )
+
+    def _read_cursor_paginated(
+        self,
+        table_name: str,
+        config: dict,
+        start_offset: dict,
+        max_pages_per_batch: int,
+    ):
+        """Read a paginated endpoint using cursor pagination."""
+        url = f"{self.base_url}/{config['endpoint']}"
+        response_key = config["response_key"]
+
+        cursor = (start_offset or {}).get("cursor")
+        all_records = []
+        pages_fetched = 0
+
+        while True:
+            params = {"page[size]": 100}
+            if cursor:
+                params["page[after]"] = cursor
+
+            resp = self._get(url, params=params)
+            if resp.status_code != 200:
+                raise Exception(
+                    f"Zendesk API error for {table_name}: {resp.status_code} {resp.text}"
+                )
+
+            data = response_json(resp)
+            all_records.extend(data.get(response_key, []))
+            pages_fetched += 1
+
+            meta = data.get("meta") or {}
+            after_cursor = meta.get("after_cursor")
+            if not meta.get("has_more") or not after_cursor:
                 break
+            if pages_fetched >= max_pages_per_batch:
+                # Resume right after the last page read
+                cursor = after_cursor
+                break
+            cursor = after_cursor
+
+        return all_records, {"cursor": cursor} if cursor else {}
 
-            current_page += 1
+    def _read_offset_paginated(
+        self,
+        table_name: str,
+        config: dict,
+        start_offset: dict,
+        max_pages_per_batch: int,
+        max_workers: int,
+    ):
+        """Read a paginated endpoint using offset pagination."""
+        endpoint = config["endpoint"]
+        response_key = config["response_key"]
+        per_page = 100
 
-            # Optional: Add a reasonable limit to prevent infinite loops
-            if current_page > 1000:  # Adjust as needed
+        # For paginated endpoints, use page number from offset
+        page = 1
+        if start_offset and "page" in start_offset:
+            page = start_offset["page"]
+
+        def fetch_page(page_number: int):
+            resp = self._get(
+                f"{self.base_url}/{endpoint}",
+                params={"page": page_number, "per_page": per_page},
+            )
+            if resp.status_code == 404:
+                # Some endpoints return 404 when no more pages
+                return None
+            if resp.status_code != 200:
+                raise Exception(
+                    f"Zendesk API error for {table_name}: {resp.status_code} {resp.text}"
+                )
+            return response_json(resp)
+
+        first = fetch_page(page)
+        if first is None or not first.get(response_key):
+            return [], {"page": page}
+
+        all_records = list(first[response_key])
+        last_page = page
+
+        count = first.get("count")
+        if isinstance(count, int) and first.get("next_page"):
+            # The total count tells us exactly which pages remain; fetch them
+            # concurrently. executor.map yields results in page order, so the
+            # records are reassembled in the order the API serves them.
+            final_page = -(-count // per_page)
+            budget_end = page + max_pages_per_batch - 1
+            remaining = list(range(page + 1, min(final_page, budget_end) + 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for page_number, data in zip(remaining, executor.map(fetch_page, remaining)):
+                    records = (data or {}).get(response_key) or []
+                    if not records:
+                        break
+                    all_records.extend(records)
+                    last_page = page_number
+            if last_page >= budget_end and last_page < final_page:
+                return all_records, {"page": last_page + 1}
+            return all_records, {"page": last_page}
+
+        # Without a count, fall back to following next_page serially.
+        data = first
+        while data.get("next_page"):
+            if last_page - page + 1 >= max_pages_per_batch:
+                return all_records, {"page": last_page + 1}
+            data = fetch_page(last_page + 1)
+            records = (data or {}).get(response_key) or []
+            if not records:
                 break
+            all_records.extend(records)
+            last_page += 1
 
-        return all_records, {"page": current_page}
+        return all_records, {"page": last_page}
@@ -0,0 +1,416 @@
+"""
+Per-connector fixtures for the mock API server in tests/mock_api_server.py.
+
+Each fixture installs synthetic versions of the endpoints one connector reads
+for one table, and knows the connection and table options that point the
+connector at the server:
+
+    fixture = FIXTURES["zendesk.tickets"]
+    with MockAPIServer() as server:
+        fixture.install(server, records=5000)
+        connector = LakeflowConnect(fixture.options(server.base_url))
+        records, offset = connector.read_table(
+            fixture.table, {}, fixture.table_options
+        )
+
+Records are generated from a template built from the connector's own declared
+schema (every nested struct, array and map populated), with the identifier and
+cursor fields varied per record. Record `i` is a pure function of `i` and was
+last updated at `record_time(i)`, so datasets of any size are served without
+being held in memory and every run sees the same bytes.
+"""
+
+import copy
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict
+
+from pyspark.sql.types import (
+    ArrayType,
+    BooleanType,
+    DateType,
+    DecimalType,
+    DoubleType,
+    FloatType,
+    IntegerType,
+    LongType,
+    MapType,
+    StructType,
+    TimestampType,
+)
+
+from libs.utils import epoch_to_iso8601, iso8601_to_epoch
+from tests.mock_api_server import (
+    AfterTokenPagination,
+    HasMorePagination,
+    LinkHeaderPagination,
+    MetaCursorPagination,
+    MockAPIServer,
+    MockResponse,
+    NextPagePagination,
+    PageNumberPagination,
+)
+
+# Record `i` of every dataset was last updated at BASE_TIME + i * STEP_SECONDS.
+BASE_TIME = 1704067200  # 2024-01-01T00:00:00Z
+STEP_SECONDS = 60
+
+# Mixpanel events are spread over this many days, ending today.
+MIXPANEL_DAYS = 10
+
+# Comments served for every Zendesk ticket.
+ZENDESK_COMMENTS_PER_TICKET = 3
+
+# HubSpot contact properties served by the properties API, as (name, type).
+HUBSPOT_PROPERTIES = [
+    (f"{kind}_property_{index}", kind)
+    for kind in ("string", "number", "bool", "datetime", "enumeration")
+    for index in range(8)
+] + [("lastmodifieddate", "datetime"), ("createdate", "datetime")]
+
+
+def sample_value(data_type, name: str = ""):
+    """Return a JSON value of `data_type`, with nested types fully populated."""
+    if isinstance(data_type, StructType):
+        return {
+            field.name: sample_value(field.dataType, field.name)
+            for field in data_type.fields
+        }
+    if isinstance(data_type, ArrayType):
+        return [sample_value(data_type.elementType, name) for _ in range(2)]
+    if isinstance(data_type, MapType):
+        return {
+            f"{name}_key_{index}": sample_value(data_type.valueType, name)
+            for index in range(2)
+        }
+    if isinstance(data_type, BooleanType):
+        return True
+    if isinstance(data_type, (IntegerType, LongType)):
+        return 123456
+    if isinstance(data_type, (FloatType, DoubleType, DecimalType)):
+        return 1234.5
+    if isinstance(data_type, TimestampType) or name.endswith("_at"):
+        return "2024-01-01T00:00:00Z"
+    if isinstance(data_type, DateType):
+        return "2024-01-01"
+    if "url" in name:
+        return f"https://mock.invalid/{name}/123456"
+    return f"{name} sample value"
+
+
+def record_time(index: int) -> int:
+    return BASE_TIME + index * STEP_SECONDS
+
+
+def first_index_at(epoch_seconds) -> int:
+    """Index of the first record updated at or after `epoch_seconds`."""
+    if epoch_seconds is None:
+        return 0
+    offset = epoch_seconds - BASE_TIME
+    if offset <= 0:
+        return 0
+    return int(-(-offset // STEP_SECONDS))
+
+
+class SyntheticTable:
+    """A read-only sequence of `count` records: a template plus per-record fields."""
+
+    def __init__(self, template: dict, count: int, vary: Callable[[int], dict]):
+        self.template = template
+        self.count = count
+        self.vary = vary
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> dict:
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        record = copy.deepcopy(self.template)
+        record.update(self.vary(index))
+        return record
+
+
+def schema_template(connector_class, options: dict, table: str, drop=()) -> dict:
+    """A record with every field of the connector's schema for `table` populated."""
+    schema = connector_class(options).get_table_schema(table, {})
+    template = sample_value(schema)
+    for name in drop:
+        template.pop(name, None)
+    return template
+
+
+@dataclass
+class ConnectorFixture:
+    """Endpoints of one connector table and the options that point at them."""
+
+    connector: str
+    table: str
+    options: Callable[[str], Dict[str, str]]
+    install: Callable[[MockAPIServer, int], None]
+    table_options: Dict[str, Any] = field(default_factory=dict)
+
+
+def install_github_issues(server: MockAPIServer, records: int) -> None:
+    from sources.github.github import LakeflowConnect
+
+    template = schema_template(
+        LakeflowConnect,
+        {"token": "mock"},
+        "issues",
+        drop=("repository_owner", "repository_name"),
+    )
+
+    def issue(index):
+        return {
+            "id": index + 1,
+            "node_id": f"I_node{index + 1:010d}",
+            "number": index + 1,
+            "title": f"Issue {index + 1}",
+            "created_at": epoch_to_iso8601(record_time(index) - 86400),
+            "updated_at": epoch_to_iso8601(record_time(index)),
+        }
+
+    server.collection(
+        r"/repos/[^/]+/[^/]+/issues",
+        SyntheticTable(template, records, issue),
+        LinkHeaderPagination(),
+        start=lambda request: first_index_at(
+            iso8601_to_epoch(request.query.get("since"))
+        ),
+    )
+
+
+def install_stripe_customers(server: MockAPIServer, records: int) -> None:
+    from sources.stripe.stripe import LakeflowConnect
+
+    template = schema_template(LakeflowConnect, {"api_key": "mock"}, "customers")
+
+    def customer(index):
+        return {
+            "id": f"cus_{index:014d}",
+            "object": "customer",
+            "created": record_time(index),
+            "email": f"customer{index}@mock.invalid",
+        }
+
+    server.collection(
+        r"/v1/customers",
+        SyntheticTable(template, records, customer),
+        HasMorePagination(id_to_index=lambda customer_id: int(customer_id[4:])),
+        start=lambda request: first_index_at(
+            int(request.query.get("created[gte]", 0))
+        ),
+    )
+
+
+def install_hubspot_contacts(server: MockAPIServer, records: int) -> None:
+    def contact(index):
+        updated = f"{epoch_to_iso8601(record_time(index))[:-1]}.000Z"
+        values = {
+            "string": f"value {index}",
+            "number": str(index),
+            "bool": "true" if index % 2 else "false",
+            "datetime": updated,
+            "enumeration": "option_a;option_b",
+        }
+        properties = {name: values[kind] for name, kind in HUBSPOT_PROPERTIES}
+        properties["hs_object_id"] = str(index + 1)
+        return {
+            "id": str(index + 1),
+            "properties": properties,
+            "createdAt": updated,
+            "updatedAt": updated,
+            "archived": False,
+            "associations": {
+                "companies": {
+                    "results": [
+                        {"id": str(index % 500 + 1), "type": "contact_to_company"}
+                    ]
+                }
+            },
+        }
+
+    def search_start(request):
+        since_ms = 0
+        for group in request.json().get("filterGroups", []):
+            for condition in group.get("filters", []):
+                if condition.get("operator") == "GTE":
+                    since_ms = int(condition.get("value", 0))
+        return first_index_at(since_ms / 1000)
+
+    contacts = SyntheticTable({}, records, contact)
+    server.route(r"/crm/v3/schemas", {"results": []})
+    server.route(
+        r"/properties/v2/contacts/properties",
+        [{"name": name, "type": kind} for name, kind in HUBSPOT_PROPERTIES],
+    )
+    server.collection(r"/crm/v3/objects/contacts", contacts, AfterTokenPagination())
+    server.collection(
+        r"/crm/v3/objects/contacts/search",
+        contacts,
+        AfterTokenPagination(),
+        start=search_start,
+        methods=("POST",),
+    )
+
+
+def install_zendesk_tickets(server: MockAPIServer, records: int) -> None:
+    from sources.zendesk.zendesk import LakeflowConnect
+
+    template = schema_template(
+        LakeflowConnect,
+        {"subdomain": "mock", "email": "mock", "api_token": "mock"},
+        "tickets",
+        drop=("generated_timestamp",),
+    )
+
+    def ticket(index):
+        return {
+            "id": index + 1,
+            "subject": f"Ticket {index + 1}",
+            "status": "open",
+            "created_at": epoch_to_iso8601(record_time(index) - 86400),
+            "updated_at": epoch_to_iso8601(record_time(index)),
+        }
+
+    server.collection(
+        r"/api/v2/incremental/tickets\.json",
+        SyntheticTable(template, records, ticket),
+        NextPagePagination("tickets"),
+        start=lambda request: first_index_at(int(request.query.get("start_time", 0))),
+    )
+
+    pagination = MetaCursorPagination("comments")
+
+    def ticket_comments(request):
+        ticket_id = int(request.match.group(1))
+        if not 0 < ticket_id <= records:
+            return MockResponse({"error": "RecordNotFound"}, status=404)
+
+        def comment(index):
+            return {
+                "id": ticket_id * 1000 + index,
+                "type": "Comment",
+                "author_id": ticket_id % 100 + 1,
+                "body": f"Comment {index} on ticket {ticket_id}",
+                "public": True,
+                "created_at": epoch_to_iso8601(
+                    record_time(ticket_id - 1) - 3600 + index * 60
+                ),
+            }
+
+        comments = SyntheticTable({}, ZENDESK_COMMENTS_PER_TICKET, comment)
+        return pagination(request, comments, 0)
+
+    server.route(r"/api/v2/tickets/(\d+)/comments\.json", ticket_comments)
+
+
+def install_mixpanel_events(server: MockAPIServer, records: int) -> None:
+    import json
+
+    from sources.mixpanel.mixpanel import LakeflowConnect
+
+    template = schema_template(
+        LakeflowConnect, {"api_secret": "mock"}, "events", drop=("generated_timestamp",)
+    )
+    # The export API returns custom properties inline; the connector splits them out.
+    template["properties"].update(template["properties"].pop("custom_properties"))
+    events = SyntheticTable(template, records, lambda index: {"event": "Page Viewed"})
+    per_day = -(-records // MIXPANEL_DAYS)
+
+    def export(request):
+        first_day = date.today() - timedelta(days=MIXPANEL_DAYS - 1)
+        day = max(date.fromisoformat(request.query["from_date"]), first_day)
+        to_date = date.fromisoformat(request.query["to_date"])
+        lines = []
+        while day <= to_date:
+            day_start = int(
+                datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp()
+            )
+            low = (day - first_day).days * per_day
+            for index in range(low, min(low + per_day, records)):
+                event = events[index]
+                event["properties"].update(
+                    {
+                        "$insert_id": f"insert-{index:012d}",
+                        "time": day_start + (index - low) * 86400 // per_day,
+                        "distinct_id": f"user-{index % 1000}",
+                    }
+                )
+                lines.append(json.dumps(event))
+            day += timedelta(days=1)
+        return MockResponse("\n".join(lines) + "\n", content_type="text/plain")
+
+    server.route(r"/api/2\.0/export", export)
+
+
+def install_catapi_votes(server: MockAPIServer, records: int) -> None:
+    from sources.catapi.catapi import LakeflowConnect
+
+    template = schema_template(LakeflowConnect, {"api_key": "mock"}, "votes")
+
+    def vote(index):
+        return {
+            "id": index + 1,
+            "image_id": f"img{index:08d}",
+            "created_at": epoch_to_iso8601(record_time(index)),
+            "value": index % 2,
+        }
+
+    server.collection(
+        r"/v1/votes",
+        SyntheticTable(template, records, vote),
+        PageNumberPagination(),
+    )
+
+
+FIXTURES = {
+    "github.issues": ConnectorFixture(
+        "github",
+        "issues",
+        lambda url: {"token": "mock", "base_url": url},
+        install_github_issues,
+        {"owner": "mock", "repo": "mock"},
+    ),
+    "stripe.customers": ConnectorFixture(
+        "stripe",
+        "customers",
+        lambda url: {"api_key": "sk_test_mock", "base_url": f"{url}/v1"},
+        install_stripe_customers,
+    ),
+    "hubspot.contacts": ConnectorFixture(
+        "hubspot",
+        "contacts",
+        lambda url: {"access_token": "mock", "base_url": url},
+        install_hubspot_contacts,
+    ),
+    "zendesk.tickets": ConnectorFixture(
+        "zendesk",
+        "tickets",
+        lambda url: {
+            "subdomain": "mock",
+            "email": "mock@mock.invalid",
+            "api_token": "mock",
+            "base_url": f"{url}/api/v2",
+        },
+        install_zendesk_tickets,
+    ),
+    "mixpanel.events": ConnectorFixture(
+        "mixpanel",
+        "events",
+        lambda url: {
+            "api_secret": "mock",
+            "base_url": f"{url}/api/2.0",
+            "cohorts_base_url": f"{url}/api",
+            "historical_days": str(MIXPANEL_DAYS),
+        },
+        install_mixpanel_events,
+    ),
+    "catapi.votes": ConnectorFixture(
+        "catapi",
+        "votes",
+        lambda url: {"api_key": "mock", "base_url": f"{url}/v1"},
+        install_catapi_votes,
+    ),
+}
@@ -0,0 +1,494 @@
+"""
+In-process mock HTTP API server for exercising connectors without network access.
+
+A `MockAPIServer` runs a threaded HTTP server on a background thread and
+dispatches requests to registered routes. Routes either return a fixed
+response, call a handler, or serve a *collection*: an indexable sequence of
+records paginated in one of the styles used by real APIs:
+
+    LinkHeaderPagination     GitHub: `Link: <...>; rel="next"`, page numbers
+    HasMorePagination        Stripe: `{"data", "has_more"}` + `starting_after`
+    NextPagePagination       Zendesk exports: `{"next_page", "end_of_stream"}`
+    AfterTokenPagination     HubSpot: `{"results", "paging": {"next": {"after"}}}`
+    MetaCursorPagination     Zendesk cursor lists: `{"meta": {"has_more", "after_cursor"}}`
+    PageNumberPagination     CatAPI: bare lists with `limit` and `page`
+
+Faults can be injected to test retry, concurrency and streaming behaviour:
+a fixed or per-request latency, a number of upcoming requests answered with
+429 and `Retry-After`, or a token-bucket rate limit. The server counts
+requests, throttled responses and the highest number of requests in flight.
+
+Example:
+
+    records = [{"id": i} for i in range(250)]
+    with MockAPIServer(latency=0.01) as server:
+        server.collection("/items", records, PageNumberPagination())
+        server.throttle(2, retry_after=1)
+        requests.get(f"{server.base_url}/items?limit=100&page=0")
+"""
+
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from urllib.parse import parse_qs, urlencode, urlparse
+
+
+@dataclass
+class MockRequest:
+    """A request received by the mock server."""
+
+    method: str
+    path: str
+    query: Dict[str, str]
+    headers: Dict[str, str]
+    body: bytes
+    base_url: str
+    match: Optional[re.Match] = None
+
+    def json(self) -> Any:
+        return json.loads(self.body or b"null")
+
+    def url_with(self, **params) -> str:
+        """Absolute URL of this request with `params` replacing query parameters."""
+        query = urlencode({**self.query, **{k: str(v) for k, v in params.items()}})
+        return f"{self.base_url}{self.path}?{query}"
+
+
+@dataclass
+class MockResponse:
+    """A response to send; `body` is JSON-encoded unless it is already bytes or text."""
+
+    body: Any = None
+    status: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+    content_type: str = "application/json"
+
+    def encode(self) -> bytes:
+        if isinstance(self.body, bytes):
+            return self.body
+        if isinstance(self.body, str):
+            return self.body.encode()
+        return json.dumps(self.body).encode()
+
+
+def _int_param(request: MockRequest, name: str, default: int) -> int:
+    try:
+        return int(request.query.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class LinkHeaderPagination:
+    """Page-numbered lists with an RFC 8288 `Link` header to the next page."""
+
+    def __init__(self, size_param="per_page", page_param="page", default_size=30):
+        self.size_param = size_param
+        self.page_param = page_param
+        self.default_size = default_size
+
+    def __call__(self, request, records, start) -> MockResponse:
+        size = _int_param(request, self.size_param, self.default_size)
+        page = _int_param(request, self.page_param, 1)
+        low = start + (page - 1) * size
+        high = min(low + size, len(records))
+        headers = {}
+        if high < len(records):
+            next_url = request.url_with(**{self.page_param: page + 1})
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return MockResponse([records[i] for i in range(low, high)], headers=headers)
+
+
+class HasMorePagination:
+    """
+    Stripe-style lists: `{"data": [...], "has_more": bool}`, continued with
+    `starting_after=<id of the last record>`. Records are served newest
+    (highest index) first unless `newest_first` is False.
+    """
+
+    def __init__(
+        self,
+        id_to_index: Callable[[str], int],
+        limit_param="limit",
+        cursor_param="starting_after",
+        default_limit=10,
+        newest_first=True,
+    ):
+        self.id_to_index = id_to_index
+        self.limit_param = limit_param
+        self.cursor_param = cursor_param
+        self.default_limit = default_limit
+        self.newest_first = newest_first
+
+    def __call__(self, request, records, start) -> MockResponse:
+        limit = _int_param(request, self.limit_param, self.default_limit)
+        cursor = request.query.get(self.cursor_param)
+        if self.newest_first:
+            first = len(records) - 1
+            if cursor is not None:
+                first = self.id_to_index(cursor) - 1
+            indexes = range(first, max(first - limit, start - 1), -1)
+            has_more = first - limit >= start
+        else:
+            first = start if cursor is None else self.id_to_index(cursor) + 1
+            indexes = range(first, min(first + limit, len(records)))
+            has_more = first + limit < len(records)
+        return MockResponse(
+            {
+                "object": "list",
+                "url": request.path,
+                "data": [records[i] for i in indexes],
+                "has_more": has_more,
+            }
+        )
+
+
+class NextPagePagination:
+    """Zendesk-style exports: an absolute `next_page` URL and `end_of_stream`."""
+
+    def __init__(self, results_key: str, page_size=1000, page_param="page"):
+        self.results_key = results_key
+        self.page_size = page_size
+        self.page_param = page_param
+
+    def __call__(self, request, records, start) -> MockResponse:
+        page = _int_param(request, self.page_param, 1)
+        low = start + (page - 1) * self.page_size
+        high = min(low + self.page_size, len(records))
+        end_of_stream = high >= len(records)
+        return MockResponse(
+            {
+                self.results_key: [records[i] for i in range(low, high)],
+                "next_page": None
+                if end_of_stream
+                else request.url_with(**{self.page_param: page + 1}),
+                "end_of_stream": end_of_stream,
+                "count": max(high - low, 0),
+            }
+        )
+
+
+class AfterTokenPagination:
+    """
+    HubSpot-style lists: `{"results": [...], "paging": {"next": {"after"}}}`.
+    `limit` and `after` are read from the query string, or from the JSON body
+    of POST (search) requests.
+    """
+
+    def __init__(self, results_key="results", default_limit=10):
+        self.results_key = results_key
+        self.default_limit = default_limit
+
+    def __call__(self, request, records, start) -> MockResponse:
+        params = request.json() if request.body else request.query
+        limit = int(params.get("limit") or self.default_limit)
+        after = int(params.get("after") or 0)
+        low = start + after
+        high = min(low + limit, len(records))
+        body = {self.results_key: [records[i] for i in range(low, high)]}
+        if high < len(records):
+            body["paging"] = {"next": {"after": str(after + limit)}}
+        return MockResponse(body)
+
+
+class MetaCursorPagination:
+    """Zendesk cursor lists: `page[size]`/`page[after]` and a `meta` block."""
+
+    def __init__(self, results_key: str, default_size=100):
+        self.results_key = results_key
+        self.default_size = default_size
+
+    def __call__(self, request, records, start) -> MockResponse:
+        size = _int_param(request, "page[size]", self.default_size)
+        low = start + _int_param(request, "page[after]", 0)
+        high = min(low + size, len(records))
+        has_more = high < len(records)
+        return MockResponse(
+            {
+                self.results_key: [records[i] for i in range(low, high)],
+                "meta": {
+                    "has_more": has_more,
+                    "after_cursor": str(high - start) if has_more else None,
+                },
+            }
+        )
+
+
+class PageNumberPagination:
+    """Bare JSON lists paged with `limit` and a page number; `order=DESC` reverses."""
+
+    def __init__(self, limit_param="limit", page_param="page", first_page=0,
+                 default_limit=10):
+        self.limit_param = limit_param
+        self.page_param = page_param
+        self.first_page = first_page
+        self.default_limit = default_limit
+
+    def __call__(self, request, records, start) -> MockResponse:
+        limit = _int_param(request, self.limit_param, self.default_limit)
+        page = _int_param(request, self.page_param, self.first_page) - self.first_page
+        low = start + page * limit
+        positions = range(low, min(low + limit, len(records)))
+        if request.query.get("order", "ASC").upper() == "DESC":
+            # Newest first: position p is the p-th record from the end.
+            indexes = [len(records) - 1 - p + start for p in positions]
+        else:
+            indexes = list(positions)
+        return MockResponse([records[i] for i in indexes])
+
+
+@dataclass
+class _Route:
+    methods: tuple
+    pattern: re.Pattern
+    handler: Callable[[MockRequest], MockResponse]
+
+
+class _RateLimit:
+    """Token bucket answering 429 once more than `burst` requests arrive at once."""
+
+    def __init__(self, requests_per_second: float, burst: int, retry_after: int):
+        self.rate = requests_per_second
+        self.burst = burst
+        self.retry_after = retry_after
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class MockAPIServer:
+    """
+    A threaded HTTP server on 127.0.0.1 serving registered routes.
+
+    Args:
+        latency: seconds to wait before answering each request, or a callable
+            taking the `MockRequest` and returning seconds.
+        cache_responses: keep encoded responses per (method, URL, body) so that
+            repeated requests cost the server nothing (useful for benchmarks).
+    """
+
+    def __init__(
+        self,
+        latency: Union[float, Callable[[MockRequest], float]] = 0.0,
+        cache_responses: bool = False,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.cache_responses = cache_responses
+        self._routes: List[_Route] = []
+        self._lock = threading.Lock()
+        self._cache: Dict[tuple, tuple] = {}
+        self._pending_throttles: List[tuple] = []
+        self._rate_limit: Optional[_RateLimit] = None
+        self.request_count = 0
+        self.throttled_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests: List[tuple] = []
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # Registration -------------------------------------------------------
+
+    def route(
+        self,
+        path: str,
+        handler: Union[Callable[[MockRequest], MockResponse], Any],
+        methods: Sequence[str] = ("GET",),
+    ) -> None:
+        """
+        Serve `path` (a regular expression matched against the whole path)
+        with `handler`, a callable receiving the `MockRequest`. Any other value
+        is returned as a fixed JSON body.
+        """
+        if not callable(handler):
+            body = handler
+            handler = lambda request: MockResponse(body)  # noqa: E731
+        self._routes.append(
+            _Route(tuple(m.upper() for m in methods), re.compile(path), handler)
+        )
+
+    def collection(
+        self,
+        path: str,
+        records: Sequence[dict],
+        pagination: Callable[[MockRequest, Sequence[dict], int], MockResponse],
+        start: Optional[Callable[[MockRequest], int]] = None,
+        methods: Sequence[str] = ("GET",),
+    ) -> None:
+        """
+        Serve an indexable sequence of records with the given pagination.
+
+        `start` maps a request to the index of the first record it may see,
+        which is how incremental filters such as `since` are expressed; records
+        must therefore be ordered by their cursor.
+        """
+
+        def handler(request: MockRequest) -> MockResponse:
+            first = max(0, start(request)) if start is not None else 0
+            return pagination(request, records, first)
+
+        self.route(path, handler, methods)
+
+    # Fault injection ----------------------------------------------------
+
+    def throttle(self, count: int = 1, retry_after: int = 1, path: str = None) -> None:
+        """Answer the next `count` requests (matching `path`, if given) with 429."""
+        with self._lock:
+            pattern = re.compile(path) if path else None
+            self._pending_throttles.extend([(pattern, retry_after)] * count)
+
+    def rate_limit(self, requests_per_second: float, burst: int = 1,
+                   retry_after: int = 1) -> None:
+        """Answer 429 whenever requests arrive faster than `requests_per_second`."""
+        self._rate_limit = _RateLimit(requests_per_second, burst, retry_after)
+
+    # Lifecycle ----------------------------------------------------------
+
+    def start(self) -> "MockAPIServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    # Request handling ---------------------------------------------------
+
+    def _throttle_response(self, request: MockRequest) -> Optional[tuple]:
+        retry_after = None
+        with self._lock:
+            for index, (pattern, seconds) in enumerate(self._pending_throttles):
+                if pattern is None or pattern.fullmatch(request.path):
+                    del self._pending_throttles[index]
+                    retry_after = seconds
+                    break
+            if retry_after is None and self._rate_limit is not None:
+                if not self._rate_limit.take():
+                    retry_after = self._rate_limit.retry_after
+            if retry_after is None:
+                return None
+            self.throttled_count += 1
+        return (
+            429,
+            {"Retry-After": str(retry_after)},
+            "application/json",
+            b'{"error": "rate limited"}',
+        )
+
+    def _respond(self, request: MockRequest) -> tuple:
+        throttled = self._throttle_response(request)
+        if throttled is not None:
+            return throttled
+
+        key = (request.method, request.path, tuple(sorted(request.query.items())),
+               request.body)
+        if self.cache_responses:
+            with self._lock:
+                cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        for route in self._routes:
+            if request.method not in route.methods:
+                continue
+            match = route.pattern.fullmatch(request.path)
+            if match is not None:
+                request.match = match
+                response = route.handler(request)
+                break
+        else:
+            response = MockResponse({"error": "not found"}, status=404)
+
+        result = (response.status, response.headers, response.content_type,
+                  response.encode())
+        if self.cache_responses and response.status == 200:
+            with self._lock:
+                if len(self._cache) >= 4096:
+                    self._cache.clear()
+                self._cache[key] = result
+        return result
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                self._handle()
+
+            def do_POST(self):
+                self._handle()
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                parsed = urlparse(self.path)
+                request = MockRequest(
+                    method=self.command,
+                    path=parsed.path,
+                    query={k: v[-1] for k, v in parse_qs(parsed.query).items()},
+                    headers=dict(self.headers),
+                    body=body,
+                    base_url=server.base_url,
+                )
+                with server._lock:
+                    server.request_count += 1
+                    server.requests.append((request.method, self.path))
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    latency = server.latency
+                    delay = latency(request) if callable(latency) else latency
+                    if delay:
+                        time.sleep(delay)
+                    status, headers, content_type, payload = server._respond(request)
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
@@ -0,0 +1,218 @@
+"""
+Tests for the mock API server in tests/mock_api_server.py and the connector
+fixtures in tests/mock_api_fixtures.py.
+"""
+
+import importlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from tests.mock_api_fixtures import FIXTURES
+from tests.mock_api_server import (
+    AfterTokenPagination,
+    HasMorePagination,
+    LinkHeaderPagination,
+    MetaCursorPagination,
+    MockAPIServer,
+    MockResponse,
+    NextPagePagination,
+    PageNumberPagination,
+)
+
+RECORDS = [{"id": f"rec_{i:06d}", "index": i} for i in range(250)]
+
+
+@pytest.fixture
+def server():
+    with MockAPIServer() as server:
+        yield server
+
+
+def indexes(records):
+    return [record["index"] for record in records]
+
+
+class TestPagination:
+    def test_link_header(self, server):
+        server.collection("/items", RECORDS, LinkHeaderPagination())
+        seen = []
+        url = f"{server.base_url}/items?per_page=100"
+        while url:
+            response = requests.get(url)
+            seen.extend(indexes(response.json()))
+            url = response.links.get("next", {}).get("url")
+        assert seen == list(range(250))
+
+    def test_has_more_newest_first(self, server):
+        server.collection(
+            "/items",
+            RECORDS,
+            HasMorePagination(id_to_index=lambda record_id: int(record_id[4:])),
+        )
+        seen = []
+        params = {"limit": 100}
+        while True:
+            body = requests.get(f"{server.base_url}/items", params=params).json()
+            seen.extend(indexes(body["data"]))
+            if not body["has_more"]:
+                break
+            params["starting_after"] = body["data"][-1]["id"]
+        assert seen == list(range(249, -1, -1))
+
+    def test_next_page(self, server):
+        server.collection(
+            "/export", RECORDS, NextPagePagination("items", page_size=100)
+        )
+        seen = []
+        url = f"{server.base_url}/export?start_time=0"
+        while url:
+            body = requests.get(url).json()
+            seen.extend(indexes(body["items"]))
+            url = None if body["end_of_stream"] else body["next_page"]
+        assert seen == list(range(250))
+
+    def test_after_token_get_and_post(self, server):
+        server.collection("/objects", RECORDS, AfterTokenPagination())
+        server.collection(
+            "/objects/search",
+            RECORDS,
+            AfterTokenPagination(),
+            start=lambda request: request.json()["from"],
+            methods=("POST",),
+        )
+
+        seen = []
+        params = {"limit": 100}
+        while True:
+            body = requests.get(f"{server.base_url}/objects", params=params).json()
+            seen.extend(indexes(body["results"]))
+            after = body.get("paging", {}).get("next", {}).get("after")
+            if not after:
+                break
+            params["after"] = after
+        assert seen == list(range(250))
+
+        body = requests.post(
+            f"{server.base_url}/objects/search", json={"from": 200, "limit": 100}
+        ).json()
+        assert indexes(body["results"]) == list(range(200, 250))
+        assert "paging" not in body
+
+    def test_meta_cursor(self, server):
+        server.collection("/comments", RECORDS, MetaCursorPagination("comments"))
+        seen = []
+        params = {"page[size]": 100}
+        while True:
+            body = requests.get(f"{server.base_url}/comments", params=params).json()
+            seen.extend(indexes(body["comments"]))
+            if not body["meta"]["has_more"]:
+                break
+            params["page[after]"] = body["meta"]["after_cursor"]
+        assert seen == list(range(250))
+
+    def test_page_number_both_orders(self, server):
+        server.collection("/votes", RECORDS, PageNumberPagination())
+        ascending = []
+        descending = []
+        for page in range(3):
+            ascending += indexes(
+                requests.get(f"{server.base_url}/votes?limit=100&page={page}").json()
+            )
+            descending += indexes(
+                requests.get(
+                    f"{server.base_url}/votes?limit=100&page={page}&order=DESC"
+                ).json()
+            )
+        assert ascending == list(range(250))
+        assert descending == list(range(249, -1, -1))
+
+    def test_start_filter(self, server):
+        server.collection(
+            "/items",
+            RECORDS,
+            LinkHeaderPagination(),
+            start=lambda request: int(request.query.get("since", 0)),
+        )
+        body = requests.get(f"{server.base_url}/items?since=240&per_page=100").json()
+        assert indexes(body) == list(range(240, 250))
+
+
+class TestFaults:
+    def test_throttle_sends_retry_after(self, server):
+        server.route("/ping", {"ok": True})
+        server.throttle(2, retry_after=7)
+
+        responses = [requests.get(f"{server.base_url}/ping") for _ in range(3)]
+
+        assert [r.status_code for r in responses] == [429, 429, 200]
+        assert responses[0].headers["Retry-After"] == "7"
+        assert server.throttled_count == 2
+        assert server.request_count == 3
+
+    def test_throttle_only_matching_path(self, server):
+        server.route("/a", {"ok": True})
+        server.route("/b", {"ok": True})
+        server.throttle(1, path="/b")
+
+        assert requests.get(f"{server.base_url}/a").status_code == 200
+        assert requests.get(f"{server.base_url}/b").status_code == 429
+        assert requests.get(f"{server.base_url}/b").status_code == 200
+
+    def test_rate_limit(self, server):
+        server.route("/ping", {"ok": True})
+        server.rate_limit(requests_per_second=0.01, burst=3, retry_after=2)
+
+        statuses = [requests.get(f"{server.base_url}/ping").status_code for _ in range(5)]
+
+        assert statuses == [200, 200, 200, 429, 429]
+
+    def test_latency_and_concurrency(self):
+        with MockAPIServer(latency=0.2) as server:
+            server.route("/slow", {"ok": True})
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(
+                    lambda _: requests.get(f"{server.base_url}/slow"), range(4)
+                ))
+            assert server.max_in_flight == 4
+
+    def test_handler_and_unknown_route(self, server):
+        server.route(
+            r"/tickets/(\d+)",
+            lambda request: MockResponse({"id": int(request.match.group(1))}),
+        )
+        assert requests.get(f"{server.base_url}/tickets/42").json() == {"id": 42}
+        assert requests.get(f"{server.base_url}/missing").status_code == 404
+
+
+@pytest.mark.parametrize("case", sorted(FIXTURES))
+def test_fixture_drains_every_record(case, monkeypatch):
+    """Draining a fixture's stream from the initial offset yields every record."""
+    fixture = FIXTURES[case]
+    module = importlib.import_module(f"sources.{fixture.connector}.{fixture.connector}")
+    # Client-side pacing between pages only slows the test down.
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    record_count = 250
+
+    with MockAPIServer() as server:
+        fixture.install(server, record_count)
+        connector = module.LakeflowConnect(fixture.options(server.base_url))
+        primary_key = connector.read_table_metadata(
+            fixture.table, fixture.table_options
+        )["primary_keys"][0]
+
+        seen = set()
+        offset = {}
+        for _ in range(20):
+            records, next_offset = connector.read_table(
+                fixture.table, offset, fixture.table_options
+            )
+            records = list(records)
+            seen.update(record[primary_key] for record in records)
+            if not records or next_offset == offset:
+                break
+            offset = next_offset
+
+    assert len(seen) == record_count
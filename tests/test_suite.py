@@ -1,4 +1,6 @@
+import time
 import traceback
+import tracemalloc
 from typing import Any, Dict, List, Tuple, Iterator, Optional, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -37,6 +39,8 @@ class TestReport:
     failed_tests: int
     error_tests: int
     timestamp: str
+    # Per-table measurements from test_read_table_performance, if it ran.
+    performance: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     def success_rate(self) -> float:
         if self.total_tests == 0:
@@ -52,20 +56,42 @@ class TestFailedException(Exception):
         self.report = report
 
 
+# Defaults for the optional performance checks. A threshold set to None is
+# measured and reported but not enforced.
+DEFAULT_PERFORMANCE_THRESHOLDS = {
+    # Stop draining a table after this many records.
+    "max_records": 10000,
+    "max_time_to_first_record_seconds": None,
+    "min_records_per_second": None,
+    "max_peak_memory_mb": None,
+    # Fail tables whose records are all fetched before the first one is returned.
+    "require_lazy_iteration": False,
+}
+
+
 class LakeflowConnectTester:
     def __init__(
-        self, init_options: dict, table_configs: Dict[str, Dict[str, Any]] = {}
+        self,
+        init_options: dict,
+        table_configs: Dict[str, Dict[str, Any]] = {},
+        performance_config: Optional[Dict[str, Any]] = None,
     ):
         self._init_options = init_options
         # Per-table configuration passed as table_options into connector methods.
         # Keys are table names, values are dicts of options for that table.
         self._table_configs: Dict[str, Dict[str, Any]] = table_configs
+        # Thresholds for test_read_table_performance, which only runs when this
+        # is given. Top-level keys apply to every table; entries under "tables"
+        # override them for a single table. See DEFAULT_PERFORMANCE_THRESHOLDS.
+        self._performance_config = performance_config
         self.test_results: List[TestResult] = []
+        self.performance_results: Dict[str, Dict[str, Any]] = {}
 
     def run_all_tests(self) -> TestReport:
         """Run all available tests and return a comprehensive report"""
         # Reset results
         self.test_results = []
+        self.performance_results = {}
 
         # Test each function separately
         self.test_initialization()
@@ -76,6 +102,8 @@ class LakeflowConnectTester:
             self.test_get_table_schema()
             self.test_read_table_metadata()
             self.test_read_table()
+            if self._performance_config is not None:
+                self.test_read_table_performance()
 
             # Test write functionality if connector_test_utils is available
             if (
@@ -656,6 +684,216 @@ class LakeflowConnectTester:
                 )
             )
 
+    def test_read_table_performance(self):
+        """
+        Drain one batch of every table and check it against the performance thresholds.
+
+        Measures the time until the first record is returned (including the
+        read_table call itself), records per second, the peak memory traced by
+        tracemalloc while draining, and whether records are produced lazily:
+        a connector that fetches every page before returning its first record
+        holds the whole batch in memory. Rates are measured with tracemalloc
+        enabled, so they are lower than in production.
+        """
+        try:
+            tables = self.connector.list_tables()
+        except Exception as e:
+            self._add_result(
+                TestResult(
+                    test_name="test_read_table_performance",
+                    status=TestStatus.ERROR,
+                    message=f"Could not get tables for testing performance: {str(e)}",
+                    exception=e,
+                    traceback_str=traceback.format_exc(),
+                )
+            )
+            return
+
+        passed_tables = []
+        failed_tables = []
+        error_tables = []
+
+        for table_name in tables:
+            thresholds = self._get_performance_thresholds(table_name)
+            try:
+                measurement = self._measure_read_performance(
+                    table_name, thresholds["max_records"]
+                )
+            except Exception as e:
+                error_tables.append(
+                    {
+                        "table": table_name,
+                        "error": str(e),
+                        "traceback": traceback.format_exc(),
+                    }
+                )
+                continue
+
+            self.performance_results[table_name] = measurement
+            violations = self._check_performance(measurement, thresholds)
+            if violations:
+                failed_tables.append(
+                    {"table": table_name, "reason": "; ".join(violations), **measurement}
+                )
+            else:
+                passed_tables.append({"table": table_name, **measurement})
+
+        details = {
+            "total_tables": len(tables),
+            "passed_tables": passed_tables,
+            "failed_tables": failed_tables,
+            "error_tables": error_tables,
+        }
+        if error_tables:
+            status = TestStatus.ERROR
+            message = (
+                f"Measured {len(tables)} tables: {len(passed_tables)} passed, "
+                f"{len(failed_tables)} failed, {len(error_tables)} errors"
+            )
+        elif failed_tables:
+            status = TestStatus.FAILED
+            message = (
+                f"Measured {len(tables)} tables: {len(passed_tables)} passed, "
+                f"{len(failed_tables)} failed"
+            )
+        else:
+            status = TestStatus.PASSED
+            message = f"All {len(tables)} tables met the performance thresholds"
+        self._add_result(
+            TestResult(
+                test_name="test_read_table_performance",
+                status=status,
+                message=message,
+                details=details,
+            )
+        )
+
+    def _get_performance_thresholds(self, table_name: str) -> Dict[str, Any]:
+        """Merge the defaults, the connector-wide and the per-table thresholds."""
+        config = self._performance_config or {}
+        thresholds = dict(DEFAULT_PERFORMANCE_THRESHOLDS)
+        thresholds.update({k: v for k, v in config.items() if k != "tables"})
+        thresholds.update(config.get("tables", {}).get(table_name, {}))
+        return thresholds
+
+    def _measure_read_performance(
+        self, table_name: str, max_records: int
+    ) -> Dict[str, Any]:
+        """Read up to `max_records` records of a table from its initial offset."""
+        # Connectors exposing read metrics tell us how many requests were made
+        # before and after the first record was returned.
+        metrics = getattr(self.connector, "metrics", None)
+
+        def requests_made() -> Optional[int]:
+            return getattr(metrics, "requests", None)
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        # Before Python 3.9 the peak cannot be reset, so when tracing was
+        # already on it may include allocations made before this read.
+        baseline_memory, _ = tracemalloc.get_traced_memory()
+        requests_at_start = requests_made()
+        try:
+            started = time.perf_counter()
+            records, _ = self.connector.read_table(
+                table_name, {}, self._get_table_options(table_name)
+            )
+            iterator = iter(records)
+            # A list (or an iterator over one) has been fully built up front.
+            materialized = isinstance(records, (list, tuple)) or type(
+                iterator
+            ).__name__ in ("list_iterator", "tuple_iterator")
+
+            record_count = 0
+            time_to_first_record = None
+            requests_before_first_record = None
+            for _ in iterator:
+                if record_count == 0:
+                    time_to_first_record = time.perf_counter() - started
+                    requests_before_first_record = requests_made()
+                record_count += 1
+                if record_count >= max_records:
+                    break
+            elapsed = time.perf_counter() - started
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        requests_total = None
+        requests_after_first_record = None
+        if requests_at_start is not None:
+            requests_total = requests_made() - requests_at_start
+            if requests_before_first_record is not None:
+                requests_after_first_record = (
+                    requests_made() - requests_before_first_record
+                )
+
+        if materialized:
+            lazy = False
+        elif requests_after_first_record is not None and requests_total > 1:
+            # Paginated read: some pages must still be fetched after the first
+            # record was returned.
+            lazy = requests_after_first_record > 0
+        else:
+            # A generator over a single page (or no request counts): nothing
+            # shows that records were held back.
+            lazy = True
+
+        return {
+            "records": record_count,
+            "truncated": record_count >= max_records,
+            "time_to_first_record_seconds": (
+                round(time_to_first_record, 4)
+                if time_to_first_record is not None
+                else None
+            ),
+            "records_per_second": (
+                round(record_count / elapsed, 1) if elapsed > 0 else None
+            ),
+            "peak_memory_mb": round(
+                max(peak_memory - baseline_memory, 0) / (1024 * 1024), 3
+            ),
+            "requests": requests_total,
+            "requests_after_first_record": requests_after_first_record,
+            "lazy_iteration": lazy,
+        }
+
+    def _check_performance(
+        self, measurement: Dict[str, Any], thresholds: Dict[str, Any]
+    ) -> List[str]:
+        """Return a description of every threshold the measurement violates."""
+        violations = []
+        limit = thresholds.get("max_time_to_first_record_seconds")
+        value = measurement["time_to_first_record_seconds"]
+        if limit is not None and value is not None and value > limit:
+            violations.append(f"time to first record {value}s exceeds {limit}s")
+
+        limit = thresholds.get("min_records_per_second")
+        value = measurement["records_per_second"]
+        # A handful of records says nothing about throughput.
+        if (
+            limit is not None
+            and value is not None
+            and measurement["records"] >= 100
+            and value < limit
+        ):
+            violations.append(f"{value} records/s is below {limit} records/s")
+
+        limit = thresholds.get("max_peak_memory_mb")
+        value = measurement["peak_memory_mb"]
+        if limit is not None and value > limit:
+            violations.append(f"peak memory {value} MB exceeds {limit} MB")
+
+        if thresholds.get("require_lazy_iteration") and not measurement["lazy_iteration"]:
+            violations.append(
+                "all records were fetched before the first one was returned"
+            )
+        return violations
+
     def _field_exists_in_schema(self, field_path: str, schema) -> bool:
         """
         Check if a field path exists in the schema (supports nested paths).
@@ -1185,6 +1423,7 @@ class LakeflowConnectTester:
             failed_tests=failed,
             error_tests=errors,
             timestamp=datetime.now().isoformat(),
+            performance=self.performance_results,
         )
 
     def print_report(self, report: TestReport, show_details: bool = True):
@@ -1200,6 +1439,17 @@ class LakeflowConnectTester:
         print(f"  Errors: {report.error_tests}")
         print(f"  Success Rate: {report.success_rate():.1f}%")
 
+        if report.performance:
+            print(f"\nPERFORMANCE:")
+            for table_name, measurement in report.performance.items():
+                print(
+                    f"  {table_name}: {measurement['records']} records, "
+                    f"first after {measurement['time_to_first_record_seconds']}s, "
+                    f"{measurement['records_per_second']} records/s, "
+                    f"peak {measurement['peak_memory_mb']} MB, "
+                    f"lazy={measurement['lazy_iteration']}"
+                )
+
         if show_details:
             print(f"\nTEST RESULTS:")
             print(f"{'-' * 50}")